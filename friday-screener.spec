@@ -11,7 +11,7 @@ a = Analysis(
     ['src/main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('src/config/lexicon.json', 'src/config')],
     hiddenimports=[
         'click',
         'rich',
@@ -5,8 +5,10 @@ Analyzer ini melakukan analisis komprehensif terhadap data fundamental saham
 dan menghasilkan scoring serta rekomendasi berdasarkan kriteria yang ditentukan.
 """
 
-from typing import List
+from typing import List, Optional
 
+from src.analyzers.score_cache import ScoreCache, hash_config, stable_hash
+from src.analyzers.sector_stats import SectorStatistics
 from src.config.settings import (
     DEFAULT_CRITERIA,
     DEFAULT_WEIGHTS,
@@ -19,11 +21,16 @@ from src.models.screening_result import (
     ScreeningResult,
 )
 from src.models.stock_data import StockData
-from src.utils.helpers import is_growing_trend
+from src.utils.helpers import format_currency, is_growing_trend
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Minimum berita di window terpendek dan selisih rata-rata score untuk
+# insight perubahan tone berita
+MIN_SENTIMENT_NEWS = 3
+SENTIMENT_MOMENTUM_THRESHOLD = 0.5
+
 
 class FundamentalAnalyzer:
     """Analyzer untuk fundamental screening."""
@@ -32,6 +39,8 @@ class FundamentalAnalyzer:
         self,
         criteria: ScreeningCriteria = DEFAULT_CRITERIA,
         weights: ScoringWeights = DEFAULT_WEIGHTS,
+        cache: Optional[ScoreCache] = None,
+        sector_stats: Optional[SectorStatistics] = None,
     ):
         """
         Initialize fundamental analyzer.
@@ -39,9 +48,59 @@ class FundamentalAnalyzer:
         Args:
             criteria: Screening criteria thresholds
             weights: Scoring weights untuk setiap kategori
+            cache: Optional ScoreCache untuk skip re-analysis data yang sama
+            sector_stats: Statistik sektor untuk sector-relative scoring
+                (dipakai jika criteria.sector_relative.enabled)
         """
         self.criteria = criteria
         self.weights = weights
+        self.cache = cache
+        self.sector_stats = sector_stats
+
+    def fingerprint(self, stock_data: StockData) -> str:
+        """
+        Stable fingerprint dari semua input StockData yang dibaca analyzer.
+
+        Args:
+            stock_data: StockData object
+
+        Returns:
+            Hex digest SHA-256
+        """
+        return stable_hash(
+            {
+                'company': stock_data.company_info,
+                'data_quality_score': stock_data.data_quality_score,
+                'valuation': stock_data.valuation,
+                'profitability': stock_data.profitability,
+                'cash_flow': stock_data.cash_flow,
+                'leverage': stock_data.leverage,
+                'dividend': stock_data.dividend,
+                'current_price': stock_data.price.current_price,
+                'corporate_actions': [
+                    (a.action_type, a.event_date, a.ratio, a.amount)
+                    for a in stock_data.corporate_actions
+                ],
+                'sentiment_trend': stock_data.sentiment_trend,
+            }
+        )
+
+    def cache_key(self, stock_data: StockData) -> str:
+        """
+        Cache key = fingerprint data + hash criteria dan weights.
+
+        Args:
+            stock_data: StockData object
+
+        Returns:
+            Cache key string
+        """
+        parts = [self.fingerprint(stock_data), hash_config(self.criteria, self.weights)]
+        if self._sector_relative_active():
+            # Percentile berubah jika nilai anggota sektor berubah (digest isi,
+            # bukan counter version yang mulai dari nol di setiap process)
+            parts.append(self.sector_stats.digest(stock_data.company_info.sector))
+        return stable_hash(parts)
 
     def analyze(self, stock_data: StockData) -> ScreeningResult:
         """
@@ -53,6 +112,14 @@ class FundamentalAnalyzer:
         Returns:
             ScreeningResult dengan scoring dan insights
         """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache_key(stock_data)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached analysis for {stock_data.get_ticker()}")
+                return cached
+
         logger.info(f"Analyzing {stock_data.get_ticker()}...")
 
         # Initialize result
@@ -81,6 +148,8 @@ class FundamentalAnalyzer:
         )
         result.metrics.risk_score = self._analyze_risk(stock_data, result)
         result.metrics.dividend_score = self._analyze_dividend(stock_data, result)
+        self._analyze_corporate_actions(stock_data, result)
+        self._analyze_sentiment_trend(stock_data, result)
 
         # Calculate total score
         result.metrics.total_score = self._calculate_total_score(result.metrics)
@@ -96,6 +165,9 @@ class FundamentalAnalyzer:
             f"Score={result.metrics.total_score:.1f}, Rating={result.rating.value}"
         )
 
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
+
         return result
 
     def _analyze_valuation(
@@ -118,7 +190,14 @@ class FundamentalAnalyzer:
 
         # PE Ratio scoring (40 points)
         if pe is not None and pe > 0:
-            if pe <= self.criteria.valuation.pe_ratio_preferred:
+            percentile = self._sector_percentile(stock_data, 'pe_ratio', pe)
+            if percentile is not None:
+                self._score_sector_relative(
+                    score, result, "Valuation", "PE Ratio", pe, percentile,
+                    (40, 25, 10), lower_is_better=True,
+                )
+                details['pe_ratio_sector_percentile'] = percentile
+            elif pe <= self.criteria.valuation.pe_ratio_preferred:
                 score.score += 40
                 result.add_strength(f"PE Ratio sangat baik: {pe:.2f}")
             elif pe <= self.criteria.valuation.pe_ratio_max:
@@ -141,7 +220,14 @@ class FundamentalAnalyzer:
 
         # PBV scoring (40 points)
         if pbv is not None and pbv > 0:
-            if pbv <= self.criteria.valuation.pbv_preferred:
+            percentile = self._sector_percentile(stock_data, 'price_to_book', pbv)
+            if percentile is not None:
+                self._score_sector_relative(
+                    score, result, "Valuation", "PBV", pbv, percentile,
+                    (40, 25, 10), lower_is_better=True,
+                )
+                details['pbv_sector_percentile'] = percentile
+            elif pbv <= self.criteria.valuation.pbv_preferred:
                 score.score += 40
                 result.add_strength(f"PBV sangat baik: {pbv:.2f} (undervalued)")
             elif pbv <= self.criteria.valuation.pbv_max:
@@ -242,7 +328,14 @@ class FundamentalAnalyzer:
         gpm = stock_data.profitability.gross_margin
         if gpm is not None:
             gpm_pct = gpm * 100 if gpm <= 1 else gpm
-            if gpm_pct >= self.criteria.profitability.gpm_preferred:
+            percentile = self._sector_percentile(stock_data, 'gross_margin', gpm)
+            if percentile is not None:
+                self._score_sector_relative(
+                    score, result, "Profitability", "Gross margin", gpm_pct,
+                    percentile, (25, 15, 5), lower_is_better=False,
+                )
+                details['gross_margin_sector_percentile'] = percentile
+            elif gpm_pct >= self.criteria.profitability.gpm_preferred:
                 score.score += 25
                 result.add_strength(f"Gross margin excellent: {gpm_pct:.1f}%")
             elif gpm_pct >= self.criteria.profitability.gpm_min:
@@ -267,7 +360,14 @@ class FundamentalAnalyzer:
         roe = stock_data.profitability.roe
         if roe is not None:
             roe_pct = roe * 100 if roe <= 1 else roe
-            if roe_pct >= self.criteria.profitability.roe_preferred:
+            percentile = self._sector_percentile(stock_data, 'roe', roe)
+            if percentile is not None:
+                self._score_sector_relative(
+                    score, result, "Profitability", "ROE", roe_pct, percentile,
+                    (25, 15, 5), lower_is_better=False,
+                )
+                details['roe_sector_percentile'] = percentile
+            elif roe_pct >= self.criteria.profitability.roe_preferred:
                 score.score += 25
                 result.add_strength(f"ROE excellent: {roe_pct:.1f}%")
             elif roe_pct >= self.criteria.profitability.roe_min:
@@ -452,6 +552,144 @@ class FundamentalAnalyzer:
 
         return score
 
+    def _analyze_corporate_actions(
+        self, stock_data: StockData, result: ScreeningResult
+    ) -> None:
+        """
+        Tambahkan insights dari corporate action events (tidak mempengaruhi score).
+
+        Memakai event yang sudah diekstrak (StockData.corporate_actions), satu
+        insight per tipe dari event terbaru.
+        """
+        latest = {}
+        for action in stock_data.corporate_actions:
+            latest.setdefault(action.action_type, action)
+
+        for action_type, action in latest.items():
+            label = action_type.replace('_', ' ').title()
+            details = []
+            if action.ratio:
+                details.append(f"rasio {action.ratio}")
+            if action.amount is not None:
+                details.append(f"{format_currency(action.amount)} per saham")
+            if action.event_date:
+                details.append(f"tanggal {action.event_date:%Y-%m-%d}")
+            description = f"{label}: {', '.join(details)}" if details else label
+
+            if action_type == 'delisting':
+                result.add_red_flag(f"Rencana delisting - {action.title}")
+            elif action_type in ('rights_issue', 'reverse_split'):
+                result.add_weakness(f"{description} - potensi dilusi / tekanan harga")
+            elif action_type == 'buyback':
+                result.add_strength(f"{description} - buyback saham")
+            elif action_type == 'dividend':
+                result.add_insight(
+                    "Dividend", "positive", "Dividend announced", description, "Medium"
+                )
+            else:
+                result.add_insight(
+                    "Corporate Action", "neutral", label, description, "Low"
+                )
+
+    def _analyze_sentiment_trend(
+        self, stock_data: StockData, result: ScreeningResult
+    ) -> None:
+        """
+        Salin rolling sentiment ke result dan tandai perubahan tone berita.
+
+        Momentum = rata-rata score window terpendek dikurangi window
+        terpanjang; hanya dilaporkan jika window terpendek punya minimal
+        beberapa berita. Tidak mempengaruhi score.
+        """
+        result.sentiment_trend = list(stock_data.sentiment_trend)
+        if len(result.sentiment_trend) < 2:
+            return
+
+        short, long = result.sentiment_trend[0], result.sentiment_trend[-1]
+        if short.count < MIN_SENTIMENT_NEWS:
+            return
+
+        momentum = short.average_score - long.average_score
+        description = (
+            f"Rata-rata sentiment {short.days} hari {short.average_score:+.2f} "
+            f"vs {long.days} hari {long.average_score:+.2f} "
+            f"({short.count} berita)"
+        )
+        if momentum >= SENTIMENT_MOMENTUM_THRESHOLD:
+            result.add_insight(
+                "News", "positive", "News tone improving", description, "Low"
+            )
+        elif momentum <= -SENTIMENT_MOMENTUM_THRESHOLD:
+            result.add_insight(
+                "News", "warning", "News tone deteriorating", description, "Medium"
+            )
+
+    def _sector_relative_active(self) -> bool:
+        """Check apakah sector-relative scoring aktif."""
+        return self.criteria.sector_relative.enabled and self.sector_stats is not None
+
+    def _sector_percentile(
+        self, stock_data: StockData, metric: str, value: float
+    ) -> Optional[float]:
+        """
+        Get percentile metrik dalam sektor, atau None untuk absolute scoring.
+
+        None dikembalikan jika mode sector-relative tidak aktif atau data
+        sektor kurang dari min_sector_size.
+        """
+        if not self._sector_relative_active():
+            return None
+
+        sector = stock_data.company_info.sector
+        if (
+            self.sector_stats.sector_size(sector, metric)
+            < self.criteria.sector_relative.min_sector_size
+        ):
+            return None
+
+        return self.sector_stats.percentile(sector, metric, value)
+
+    def _score_sector_relative(
+        self,
+        score: CategoryScore,
+        result: ScreeningResult,
+        category: str,
+        label: str,
+        value: float,
+        percentile: float,
+        points: tuple,
+        lower_is_better: bool,
+    ) -> None:
+        """
+        Score satu metrik berdasarkan percentile dalam sektor.
+
+        Tier poin sama dengan absolute scoring; threshold-nya adalah
+        preferred/acceptable percentile dari criteria.sector_relative.
+        """
+        relative = self.criteria.sector_relative
+        # 0 = terbaik di sektor untuk kedua arah metrik
+        position = percentile if lower_is_better else 1 - percentile
+        description = (
+            f"{label} {value:.2f} di percentile {percentile * 100:.0f} "
+            f"sektor {result.sector}"
+        )
+
+        if position <= relative.preferred_percentile:
+            score.score += points[0]
+            result.add_strength(f"{label} termasuk terbaik di sektor: {description}")
+        elif position <= relative.acceptable_percentile:
+            score.score += points[1]
+            result.add_insight(
+                category,
+                "positive",
+                f"{label} sejalan dengan sektor",
+                description,
+                "Medium",
+            )
+        else:
+            score.score += points[2]
+            result.add_weakness(f"{label} kurang menarik dibanding sektor: {description}")
+
     def _calculate_total_score(self, metrics: ScreeningMetrics) -> float:
         """
         Calculate weighted total score.
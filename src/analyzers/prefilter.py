@@ -0,0 +1,215 @@
+"""
+Pre-filter murah untuk universe screening.
+
+Pre-filter ini menerapkan kriteria "hard" dari ScreeningCriteria (market cap
+minimum, wajib dividen, batas Debt-to-Equity) pada data yang paling murah
+tersedia (quote atau cache), sebelum fetch financial statements dan analisis
+lengkap dijalankan. Hanya emiten yang lolos yang diteruskan ke tahap mahal.
+"""
+
+from dataclasses import dataclass, field
+import operator
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.config.settings import DEFAULT_CRITERIA, ScreeningCriteria
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    '>=': operator.ge,
+    '>': operator.gt,
+    '<=': operator.le,
+    '<': operator.lt,
+}
+
+# Nama rule yang bisa diturunkan dari ScreeningCriteria
+PREFILTER_RULES = ('market_cap', 'dividend', 'debt_to_equity')
+
+
+@dataclass(frozen=True)
+class FilterRule:
+    """Satu rule deklaratif: `metric <op> threshold`."""
+
+    name: str
+    metric: str
+    op: str
+    threshold: float
+    keep_missing: bool = True  # Lolos jika metrik tidak tersedia
+
+    def __post_init__(self):
+        """Validate operator."""
+        if self.op not in _OPERATORS:
+            raise ValueError(f"Unsupported operator: {self.op}")
+
+    def passes(self, metrics: Dict[str, Optional[float]]) -> bool:
+        """Check apakah metrics memenuhi rule ini."""
+        value = metrics.get(self.metric)
+        if value is None:
+            return self.keep_missing
+        return _OPERATORS[self.op](value, self.threshold)
+
+    def describe(self) -> str:
+        """Human-readable description untuk reporting."""
+        return f"{self.metric} {self.op} {self.threshold:g}"
+
+
+@dataclass
+class PreFilterReport:
+    """Jumlah ticker yang dipangkas di setiap tahap universe run."""
+
+    total: int = 0
+    quote_failed: int = 0
+    pruned_by_rule: Dict[str, int] = field(default_factory=dict)
+    fetch_failed: int = 0
+    analyzed: int = 0
+
+    @property
+    def pruned(self) -> int:
+        """Total ticker yang dipangkas oleh rules."""
+        return sum(self.pruned_by_rule.values())
+
+    @property
+    def survivors(self) -> int:
+        """Ticker yang lolos pre-filter dan diteruskan ke fetch lengkap."""
+        return self.total - self.quote_failed - self.pruned
+
+    def stages(self) -> List[Tuple[str, int]]:
+        """Get (stage, jumlah pruned) dalam urutan eksekusi."""
+        stages = [("Quote unavailable", self.quote_failed)]
+        stages.extend(
+            (f"Pre-filter: {name}", count)
+            for name, count in self.pruned_by_rule.items()
+        )
+        stages.append(("Fetch failed", self.fetch_failed))
+        return stages
+
+
+class PreFilter:
+    """Evaluasi sekumpulan FilterRule terhadap metrik murah."""
+
+    def __init__(self, rules: Iterable[FilterRule]):
+        """
+        Initialize pre-filter.
+
+        Args:
+            rules: Rules yang dievaluasi berurutan (rule pertama yang gagal
+                menentukan alasan pruning)
+        """
+        self.rules = list(rules)
+
+    @classmethod
+    def from_criteria(
+        cls,
+        criteria: ScreeningCriteria = DEFAULT_CRITERIA,
+        rules: Iterable[str] = PREFILTER_RULES,
+    ) -> 'PreFilter':
+        """
+        Build pre-filter dari ScreeningCriteria.
+
+        Args:
+            criteria: Screening criteria sumber threshold
+            rules: Nama rule yang diaktifkan (subset dari PREFILTER_RULES)
+
+        Returns:
+            PreFilter instance
+        """
+        enabled = set(rules)
+        unknown = enabled - set(PREFILTER_RULES)
+        if unknown:
+            raise ValueError(f"Unknown pre-filter rules: {sorted(unknown)}")
+
+        built = []
+        if 'market_cap' in enabled:
+            built.append(
+                FilterRule(
+                    'market_cap',
+                    'market_cap',
+                    '>=',
+                    criteria.valuation.market_cap_min,
+                )
+            )
+        if 'dividend' in enabled and criteria.dividend.require_dividend:
+            # Yahoo tidak mengisi dividendYield untuk emiten tanpa dividen
+            built.append(
+                FilterRule('dividend', 'dividend_yield', '>', 0.0, keep_missing=False)
+            )
+        if 'debt_to_equity' in enabled:
+            built.append(
+                FilterRule(
+                    'debt_to_equity',
+                    'debt_to_equity',
+                    '<=',
+                    criteria.risk.debt_to_equity_max,
+                )
+            )
+
+        return cls(built)
+
+    def first_failure(
+        self, metrics: Dict[str, Optional[float]]
+    ) -> Optional[FilterRule]:
+        """
+        Get rule pertama yang tidak dipenuhi.
+
+        Args:
+            metrics: Dictionary metrik murah (lihat YahooFinanceService.get_quote)
+
+        Returns:
+            FilterRule yang gagal, atau None jika semua rule lolos
+        """
+        for rule in self.rules:
+            if not rule.passes(metrics):
+                return rule
+        return None
+
+    def run(
+        self,
+        tickers: Iterable[str],
+        finance_service,
+        on_pruned: Optional[Callable[[str, Optional[FilterRule]], None]] = None,
+    ) -> Tuple[List[str], PreFilterReport]:
+        """
+        Jalankan pre-filter atas daftar ticker.
+
+        Args:
+            tickers: Ticker symbols
+            finance_service: YahooFinanceService (dipakai get_quote dan
+                discard_quote)
+            on_pruned: Optional callback(ticker, rule) untuk setiap ticker
+                yang tidak lolos; rule None berarti quote tidak tersedia
+
+        Returns:
+            Tuple (ticker yang lolos, PreFilterReport)
+        """
+        tickers = list(tickers)
+        report = PreFilterReport(
+            total=len(tickers),
+            pruned_by_rule={rule.name: 0 for rule in self.rules},
+        )
+
+        if not self.rules:
+            return tickers, report
+
+        survivors = []
+        for ticker in tickers:
+            quote = finance_service.get_quote(ticker)
+            if quote is None:
+                report.quote_failed += 1
+                if on_pruned is not None:
+                    on_pruned(ticker, None)
+                continue
+
+            failed = self.first_failure(quote)
+            if failed is not None:
+                logger.info(f"{ticker} pruned by pre-filter {failed.describe()}")
+                report.pruned_by_rule[failed.name] += 1
+                # Ticker ini tidak di-fetch lengkap: info-nya tidak dipakai lagi
+                finance_service.discard_quote(ticker)
+                if on_pruned is not None:
+                    on_pruned(ticker, failed)
+                continue
+
+            survivors.append(ticker)
+
+        return survivors, report
@@ -0,0 +1,168 @@
+"""
+Analisis robustness ranking terhadap perubahan ScoringWeights.
+
+Category scores dihitung sekali per emiten, lalu ribuan weight vectors
+di-sample dari simplex di sekitar weights yang dikonfigurasi (Dirichlet).
+Total score seluruh universe untuk semua sample dihitung sebagai satu
+perkalian matrix (N x 4) @ (4 x K).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.analyzers.sweep import rank_columns
+from src.config.settings import DEFAULT_WEIGHTS, ScoringWeights
+from src.models.screening_result import ScreeningResult
+
+
+def weight_vector(weights: ScoringWeights) -> np.ndarray:
+    """Get weights sebagai array (valuation, profitability, risk, dividend)."""
+    return np.array(
+        [
+            weights.valuation_weight,
+            weights.profitability_weight,
+            weights.risk_weight,
+            weights.dividend_weight,
+        ]
+    )
+
+
+def category_matrix(results: Sequence[ScreeningResult]) -> np.ndarray:
+    """
+    Build matrix category scores dari hasil analisis.
+
+    Args:
+        results: ScreeningResult per emiten
+
+    Returns:
+        Array shape (N, 4)
+    """
+    return np.array(
+        [
+            [score.score for score in result.metrics.get_all_category_scores()]
+            for result in results
+        ],
+        dtype=float,
+    )
+
+
+def sample_weights(
+    base: ScoringWeights = DEFAULT_WEIGHTS,
+    samples: int = 5000,
+    concentration: float = 50.0,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Sample weight vectors pada simplex di sekitar base weights.
+
+    Dirichlet dengan alpha = base * concentration: mean sama dengan base,
+    concentration lebih besar berarti perturbasi lebih kecil.
+
+    Args:
+        base: Weights acuan
+        samples: Jumlah sample
+        concentration: Konsentrasi Dirichlet (> 0)
+        seed: Random seed untuk hasil reproducible
+
+    Returns:
+        Array shape (samples, 4), setiap baris berjumlah 1
+    """
+    if concentration <= 0:
+        raise ValueError("concentration must be positive")
+
+    alpha = np.clip(weight_vector(base), 1e-6, None) * concentration
+    return np.random.default_rng(seed).dirichlet(alpha, size=samples)
+
+
+@dataclass
+class RobustnessResult:
+    """Distribusi rank per emiten lintas weight samples."""
+
+    tickers: List[str]
+    base_ranks: np.ndarray  # (N,)
+    ranks: np.ndarray  # (K, N)
+    top_n: int
+
+    def top_probability(self) -> np.ndarray:
+        """Probabilitas setiap emiten masuk top-N, shape (N,)."""
+        return (self.ranks <= self.top_n).mean(axis=0)
+
+    def ticker_summary(self) -> List[Dict[str, Any]]:
+        """
+        Ringkasan distribusi rank per emiten.
+
+        Returns:
+            List per ticker, diurutkan berdasarkan probabilitas top-N lalu base rank
+        """
+        probability = self.top_probability()
+        mean = self.ranks.mean(axis=0)
+        p5, median, p95 = np.percentile(self.ranks, [5, 50, 95], axis=0)
+
+        summary = [
+            {
+                'ticker': ticker,
+                'base_rank': int(self.base_ranks[i]),
+                'mean_rank': float(mean[i]),
+                'median_rank': float(median[i]),
+                'p5_rank': float(p5[i]),
+                'p95_rank': float(p95[i]),
+                'top_probability': float(probability[i]),
+            }
+            for i, ticker in enumerate(self.tickers)
+        ]
+        summary.sort(key=lambda x: (-x['top_probability'], x['base_rank']))
+        return summary
+
+    def rank_histogram(self, ticker: str) -> Dict[int, int]:
+        """
+        Frekuensi setiap rank untuk satu emiten.
+
+        Args:
+            ticker: Ticker symbol
+
+        Returns:
+            Dictionary {rank: jumlah sample}
+        """
+        column = self.ranks[:, self.tickers.index(ticker)]
+        values, counts = np.unique(column, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist(), strict=True))
+
+
+def analyze_robustness(
+    tickers: Sequence[str],
+    scores: np.ndarray,
+    base: ScoringWeights = DEFAULT_WEIGHTS,
+    samples: int = 5000,
+    top_n: int = 10,
+    concentration: float = 50.0,
+    seed: Optional[int] = None,
+) -> RobustnessResult:
+    """
+    Hitung distribusi rank untuk weight samples di sekitar base weights.
+
+    Args:
+        tickers: Ticker symbols, urutan sama dengan baris scores
+        scores: Category scores shape (N, 4) (lihat category_matrix)
+        base: Weights acuan
+        samples: Jumlah weight samples
+        top_n: Ukuran top-N
+        concentration: Konsentrasi Dirichlet
+        seed: Random seed
+
+    Returns:
+        RobustnessResult
+    """
+    weights = sample_weights(base, samples, concentration, seed)
+
+    # (K, 4) @ (4, N) -> (K, N): satu matmul untuk semua sample
+    totals = np.round(weights @ scores.T, 2)
+    base_totals = np.round(scores @ weight_vector(base), 2)
+
+    return RobustnessResult(
+        tickers=list(tickers),
+        base_ranks=rank_columns(base_totals),
+        ranks=rank_columns(totals),
+        top_n=min(top_n, len(tickers)),
+    )
@@ -0,0 +1,168 @@
+"""
+Cache hasil analisis (ScreeningResult) berdasarkan fingerprint input.
+
+Key cache adalah gabungan fingerprint data yang dibaca analyzer dari
+StockData dan hash ScreeningCriteria + ScoringWeights, sehingga emiten yang
+datanya tidak berubah tidak perlu dianalisis ulang antar run.
+
+Cache memory bisa dibatasi dengan max_entries (LRU) untuk process yang
+berumur panjang seperti daemon dan HTTP API.
+"""
+
+from collections import OrderedDict
+import copy
+from dataclasses import asdict
+import hashlib
+import json
+from pathlib import Path
+import threading
+from typing import Any, Optional
+
+from src.models.screening_result import ScreeningResult
+from src.models.serialization import from_dict, to_dict
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def stable_hash(payload: Any) -> str:
+    """
+    Hash deterministik untuk struktur JSON-friendly.
+
+    Args:
+        payload: Dictionary/list/primitive (dataclass akan di-convert)
+
+    Returns:
+        Hex digest SHA-256
+    """
+    encoded = json.dumps(
+        to_dict(payload), sort_keys=True, default=str, separators=(',', ':')
+    )
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def hash_config(criteria, weights) -> str:
+    """
+    Hash ScreeningCriteria dan ScoringWeights.
+
+    Args:
+        criteria: ScreeningCriteria instance
+        weights: ScoringWeights instance
+
+    Returns:
+        Hex digest SHA-256
+    """
+    return stable_hash({'criteria': asdict(criteria), 'weights': asdict(weights)})
+
+
+class ScoreCache:
+    """In-memory cache ScreeningResult dengan persistence opsional ke disk."""
+
+    def __init__(
+        self, cache_dir: Optional[Path] = None, max_entries: Optional[int] = None
+    ):
+        """
+        Initialize score cache.
+
+        Args:
+            cache_dir: Direktori untuk persistence (None = memory only)
+            max_entries: Jumlah maksimum entry di memory; entry yang paling
+                lama tidak dipakai dibuang (None = tanpa batas)
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.memory: 'OrderedDict[str, ScreeningResult]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[ScreeningResult]:
+        """
+        Get cached result.
+
+        Args:
+            key: Cache key dari FundamentalAnalyzer.cache_key
+
+        Returns:
+            Copy dari ScreeningResult atau None jika tidak ada
+        """
+        with self._lock:
+            result = self.memory.get(key)
+            if result is not None:
+                self.memory.move_to_end(key)
+
+        if result is None and self.cache_dir:
+            result = self._load(key)
+            if result is not None:
+                self._remember(key, result)
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        # Copy supaya caller tidak mengubah entry di cache
+        return copy.deepcopy(result)
+
+    def put(self, key: str, result: ScreeningResult) -> None:
+        """
+        Store result ke cache.
+
+        Args:
+            key: Cache key
+            result: ScreeningResult yang akan di-cache
+        """
+        self._remember(key, copy.deepcopy(result))
+
+        if self.cache_dir:
+            try:
+                path = self._path(key)
+                tmp_path = path.with_suffix('.tmp')
+                tmp_path.write_text(json.dumps(to_dict(result)), encoding='utf-8')
+                tmp_path.replace(path)
+            except OSError as e:
+                logger.warning(f"Could not persist score cache entry: {str(e)}")
+
+    @property
+    def hit_rate(self) -> float:
+        """Cache hit rate (0-1)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Clear memory cache dan file di disk."""
+        with self._lock:
+            self.memory.clear()
+        if self.cache_dir:
+            for path in self.cache_dir.glob('*.json'):
+                path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, result: ScreeningResult) -> None:
+        """Simpan entry di memory dan buang entry LRU jika melebihi batas."""
+        with self._lock:
+            self.memory[key] = result
+            self.memory.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self.memory) > self.max_entries:
+                    self.memory.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        """Get path file untuk key."""
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[ScreeningResult]:
+        """Load entry dari disk."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            return from_dict(ScreeningResult, json.loads(path.read_text('utf-8')))
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Ignoring corrupt score cache entry {path.name}: {str(e)}")
+            return None
@@ -0,0 +1,175 @@
+"""
+Statistik per sektor untuk sector-relative percentile scoring.
+
+Setiap sektor menyimpan sorted array per metrik yang dibangun dari snapshot
+universe. Update satu emiten (refresh) hanya memindahkan nilainya di sorted
+array, dan lookup percentile adalah binary search O(log n) tanpa rescan
+universe.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models.stock_data import StockData
+
+# Metrik yang didukung: nama -> extractor dari StockData
+SECTOR_METRICS = {
+    'pe_ratio': lambda s: s.valuation.pe_ratio,
+    'price_to_book': lambda s: s.valuation.price_to_book,
+    'roe': lambda s: s.profitability.roe,
+    'gross_margin': lambda s: s.profitability.gross_margin,
+}
+
+# PE dan PBV negatif/nol tidak bermakna untuk ranking valuasi
+_POSITIVE_ONLY = {'pe_ratio', 'price_to_book'}
+
+
+def _metric_value(metric: str, stock_data: StockData) -> Optional[float]:
+    """Extract nilai metrik yang valid untuk statistik sektor."""
+    value = SECTOR_METRICS[metric](stock_data)
+    if value is None:
+        return None
+    if metric in _POSITIVE_ONLY and value <= 0:
+        return None
+    return value
+
+
+class SectorStatistics:
+    """Sorted arrays per (sektor, metrik) yang di-maintain secara incremental."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self._values: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        # ticker -> (sector, {metric: value}) untuk incremental update
+        self._members: Dict[str, Tuple[str, Dict[str, float]]] = {}
+        self._versions: Dict[str, int] = defaultdict(int)
+        # sector -> (version, digest), dihitung ulang hanya jika sektor berubah
+        self._digests: Dict[str, Tuple[int, str]] = {}
+
+    @classmethod
+    def from_universe(cls, stocks_data: Iterable[StockData]) -> 'SectorStatistics':
+        """
+        Build statistik dari snapshot universe.
+
+        Args:
+            stocks_data: StockData universe
+
+        Returns:
+            SectorStatistics instance
+        """
+        stats = cls()
+        for stock_data in stocks_data:
+            stats.update(stock_data)
+        return stats
+
+    def update(self, stock_data: StockData) -> None:
+        """
+        Insert atau refresh satu emiten.
+
+        Nilai lama emiten dihapus dari sorted arrays lalu nilai baru
+        di-insert, O(n) memmove per metrik tanpa re-sort.
+
+        Args:
+            stock_data: StockData terbaru
+        """
+        sector = stock_data.company_info.sector
+        if not sector:
+            return
+
+        self.remove(stock_data.get_ticker())
+
+        values = {}
+        for metric in SECTOR_METRICS:
+            value = _metric_value(metric, stock_data)
+            if value is not None:
+                insort(self._values[(sector, metric)], value)
+                values[metric] = value
+
+        self._members[stock_data.get_ticker()] = (sector, values)
+        self._versions[sector] += 1
+
+    def remove(self, ticker: str) -> None:
+        """
+        Remove emiten dari statistik.
+
+        Args:
+            ticker: Ticker symbol
+        """
+        member = self._members.pop(ticker, None)
+        if member is None:
+            return
+
+        sector, values = member
+        for metric, value in values.items():
+            array = self._values[(sector, metric)]
+            del array[bisect_left(array, value)]
+        self._versions[sector] += 1
+
+    def sector_size(self, sector: Optional[str], metric: str) -> int:
+        """Jumlah nilai metrik yang tersedia di sektor."""
+        if not sector:
+            return 0
+        return len(self._values.get((sector, metric), ()))
+
+    def percentile(
+        self, sector: Optional[str], metric: str, value: float
+    ) -> Optional[float]:
+        """
+        Percentile rank nilai dalam sektornya (0-1, mid-rank untuk ties).
+
+        Args:
+            sector: Nama sektor
+            metric: Nama metrik (lihat SECTOR_METRICS)
+            value: Nilai yang dicari
+
+        Returns:
+            Fraction nilai sektor yang lebih kecil dari value, atau None jika
+            sektor tidak punya data
+        """
+        array = self._values.get((sector, metric)) if sector else None
+        if not array:
+            return None
+
+        below = bisect_left(array, value)
+        equal = bisect_right(array, value) - below
+        return (below + 0.5 * equal) / len(array)
+
+    def version(self, sector: Optional[str]) -> int:
+        """Counter perubahan sektor (untuk invalidasi cache)."""
+        return self._versions.get(sector, 0) if sector else 0
+
+    def digest(self, sector: Optional[str]) -> str:
+        """
+        Hash isi sorted arrays sektor (untuk cache key lintas process).
+
+        Berbeda dengan version(), yang hanya counter dalam satu process,
+        digest sama jika dan hanya jika nilai metrik anggota sektor sama.
+
+        Args:
+            sector: Nama sektor
+
+        Returns:
+            Hex digest SHA-256 ('' jika sektor kosong)
+        """
+        if not sector:
+            return ''
+        version = self.version(sector)
+        cached = self._digests.get(sector)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        arrays = {
+            metric: self._values.get((sector, metric), []) for metric in SECTOR_METRICS
+        }
+        digest = hashlib.sha256(
+            json.dumps(arrays, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        self._digests[sector] = (version, digest)
+        return digest
+
+    def sectors(self) -> List[str]:
+        """Get daftar sektor yang diketahui."""
+        return sorted({sector for sector, _ in self._values})
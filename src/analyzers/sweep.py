@@ -0,0 +1,520 @@
+"""
+Criteria sweep engine untuk evaluasi banyak ScreeningCriteria/ScoringWeights.
+
+Alih-alih menjalankan FundamentalAnalyzer.analyze sekali per variant, sweep
+mengekstrak metrik universe sekali ke array, menghitung poin per metrik
+untuk setiap threshold unik (dipakai ulang oleh semua variant yang berbagi
+threshold tersebut), lalu mereduksi category scores dengan weights matrix
+dalam satu operasi vectorized. Aturan poin identik dengan FundamentalAnalyzer
+(mode absolute thresholds).
+"""
+
+import copy
+from dataclasses import asdict, dataclass, field, fields
+import itertools
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.config.settings import (
+    DEFAULT_CRITERIA,
+    DEFAULT_WEIGHTS,
+    ScoringWeights,
+    ScreeningCriteria,
+)
+from src.models.stock_data import StockData
+from src.utils.helpers import is_growing_trend
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CATEGORIES = ('valuation', 'profitability', 'risk', 'dividend')
+
+
+@dataclass
+class SweepVariant:
+    """Satu kombinasi criteria dan weights yang dievaluasi."""
+
+    name: str
+    criteria: ScreeningCriteria = field(default_factory=ScreeningCriteria)
+    weights: ScoringWeights = field(default_factory=ScoringWeights)
+
+    def weight_vector(self) -> List[float]:
+        """Get weights dalam urutan CATEGORIES."""
+        return [
+            self.weights.valuation_weight,
+            self.weights.profitability_weight,
+            self.weights.risk_weight,
+            self.weights.dividend_weight,
+        ]
+
+
+def _as_array(values: Sequence[Optional[float]]) -> np.ndarray:
+    """Convert list dengan None ke float array (None -> NaN)."""
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+def _as_percentage(values: np.ndarray) -> np.ndarray:
+    """Same rule as analyzer: nilai <= 1 dianggap desimal."""
+    return np.where(values <= 1, values * 100, values)
+
+
+class UniverseMatrix:
+    """Metrik universe dalam bentuk column arrays, diekstrak sekali."""
+
+    def __init__(self, stocks_data: Sequence[StockData]):
+        """
+        Extract metrik dari StockData.
+
+        Args:
+            stocks_data: StockData untuk setiap emiten dalam universe
+        """
+        self.tickers = [s.get_ticker() for s in stocks_data]
+
+        self.pe = _as_array([s.valuation.pe_ratio for s in stocks_data])
+        self.pbv = _as_array([s.valuation.price_to_book for s in stocks_data])
+        self.market_cap = _as_array([s.valuation.market_cap for s in stocks_data])
+        self.gpm_pct = _as_percentage(
+            _as_array([s.profitability.gross_margin for s in stocks_data])
+        )
+        self.roe_pct = _as_percentage(
+            _as_array([s.profitability.roe for s in stocks_data])
+        )
+        self.dte = _as_array([s.leverage.debt_to_equity for s in stocks_data])
+        self.beta = _as_array([s.leverage.beta for s in stocks_data])
+
+        div = _as_array([s.dividend.dividend_yield for s in stocks_data])
+        self.has_dividend = ~np.isnan(div) & (div > 0)
+        self.div_pct = _as_percentage(div)
+
+        # Poin yang tidak bergantung pada criteria dihitung sekali
+        self.eps_points = np.array(
+            [self._eps_points(s) for s in stocks_data], dtype=float
+        )
+        ocf = _as_array([s.cash_flow.operating_cash_flow for s in stocks_data])
+        fcf = _as_array([s.cash_flow.free_cash_flow for s in stocks_data])
+        self.cash_flow_points = 10.0 * (ocf > 0) + 10.0 * (fcf > 0)
+
+    def __len__(self) -> int:
+        """Jumlah emiten."""
+        return len(self.tickers)
+
+    @staticmethod
+    def _eps_points(stock_data: StockData) -> float:
+        """EPS growth points (sama dengan FundamentalAnalyzer)."""
+        eps_history = stock_data.profitability.eps_history
+        if len(eps_history) < 2:
+            return 0.0
+
+        eps_values = [eps_history[year] for year in sorted(eps_history)]
+        if is_growing_trend(eps_values, min_positive_years=3):
+            return 30.0
+        if eps_values[-1] > eps_values[-2]:
+            return 15.0
+        return 5.0
+
+
+def _tiered(
+    values: np.ndarray,
+    thresholds: Sequence[Tuple[float, float]],
+    points: Tuple[float, float, float],
+    lower_is_better: bool,
+    valid: np.ndarray,
+    missing_points: float = 0.0,
+) -> np.ndarray:
+    """
+    Hitung poin 3-tier untuk setiap pasangan threshold unik.
+
+    Perbandingan threshold dihitung sekali per pasangan unik, lalu di-gather
+    ke semua variant yang memakai pasangan tersebut.
+
+    Args:
+        values: Metrik universe, shape (N,)
+        thresholds: (preferred, acceptable) per variant, panjang V
+        points: Poin untuk (preferred, acceptable, lainnya)
+        lower_is_better: True untuk metrik seperti PE/PBV/D/E
+        valid: Mask emiten yang metriknya tersedia
+        missing_points: Poin untuk emiten dengan metrik tidak tersedia
+
+    Returns:
+        Array shape (V, N)
+    """
+    unique, inverse = np.unique(
+        np.array(thresholds, dtype=float).reshape(-1, 2), axis=0, return_inverse=True
+    )
+    preferred = unique[:, :1]
+    acceptable = unique[:, 1:]
+
+    if lower_is_better:
+        tier1 = values <= preferred
+        tier2 = values <= acceptable
+    else:
+        tier1 = values >= preferred
+        tier2 = values >= acceptable
+
+    scored = np.where(tier1, points[0], np.where(tier2, points[1], points[2]))
+    scored = np.where(valid, scored, missing_points)
+    return scored[inverse.reshape(-1)]
+
+
+@dataclass
+class SweepResult:
+    """Hasil sweep: total scores dan ranks untuk setiap variant."""
+
+    tickers: List[str]
+    variants: List[SweepVariant]
+    category_scores: np.ndarray  # (V, 4, N)
+    totals: np.ndarray  # (V, N)
+    ranks: np.ndarray  # (V, N), 1 = terbaik
+
+    def top(self, variant_index: int, n: int) -> List[str]:
+        """Get top-n tickers untuk variant tertentu."""
+        order = np.argsort(self.ranks[variant_index])[:n]
+        return [self.tickers[i] for i in order]
+
+    def rank_stability(self, top_n: int, baseline: int = 0) -> List[Dict[str, Any]]:
+        """
+        Bandingkan ranking setiap variant dengan baseline.
+
+        Args:
+            top_n: Ukuran top-N untuk overlap
+            baseline: Index variant acuan
+
+        Returns:
+            List per variant dengan spearman correlation dan top-N overlap
+        """
+        n = len(self.tickers)
+        top_n = min(top_n, n)
+        base_ranks = self.ranks[baseline]
+
+        if n > 1:
+            diff = self.ranks - base_ranks
+            spearman = 1 - 6 * (diff**2).sum(axis=1) / (n * (n**2 - 1))
+        else:
+            spearman = np.ones(len(self.variants))
+
+        in_top = self.ranks <= top_n
+        overlap = (in_top & in_top[baseline]).sum(axis=1) / max(top_n, 1)
+
+        return [
+            {
+                'variant': variant.name,
+                'spearman': float(spearman[i]),
+                'top_overlap': float(overlap[i]),
+                'top': self.top(i, top_n),
+            }
+            for i, variant in enumerate(self.variants)
+        ]
+
+    def ticker_stability(self, top_n: int) -> List[Dict[str, Any]]:
+        """
+        Statistik rank per ticker lintas semua variant.
+
+        Args:
+            top_n: Ukuran top-N
+
+        Returns:
+            List per ticker (diurutkan berdasarkan mean rank)
+        """
+        mean = self.ranks.mean(axis=0)
+        stats = [
+            {
+                'ticker': ticker,
+                'mean_rank': float(mean[i]),
+                'std_rank': float(self.ranks[:, i].std()),
+                'best_rank': int(self.ranks[:, i].min()),
+                'worst_rank': int(self.ranks[:, i].max()),
+                'top_frequency': float((self.ranks[:, i] <= top_n).mean()),
+            }
+            for i, ticker in enumerate(self.tickers)
+        ]
+        stats.sort(key=lambda x: x['mean_rank'])
+        return stats
+
+
+def rank_columns(totals: np.ndarray) -> np.ndarray:
+    """
+    Rank (1 = terbaik) per baris, tie dipecah sesuai urutan universe.
+
+    Args:
+        totals: Array shape (..., N)
+
+    Returns:
+        Array ranks dengan shape sama
+    """
+    order = np.argsort(-totals, axis=-1, kind='stable')
+    positions = np.broadcast_to(np.arange(1, totals.shape[-1] + 1), order.shape)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, positions, axis=-1)
+    return ranks
+
+
+def compute_category_scores(
+    universe: UniverseMatrix, variants: Sequence[SweepVariant]
+) -> np.ndarray:
+    """
+    Hitung category scores untuk semua variant.
+
+    Args:
+        universe: UniverseMatrix
+        variants: Variants yang dievaluasi
+
+    Returns:
+        Array shape (V, 4, N) dalam urutan CATEGORIES
+    """
+    crit = [v.criteria for v in variants]
+
+    pe_valid = ~np.isnan(universe.pe) & (universe.pe > 0)
+    pbv_valid = ~np.isnan(universe.pbv) & (universe.pbv > 0)
+    valuation = (
+        _tiered(
+            universe.pe,
+            [(c.valuation.pe_ratio_preferred, c.valuation.pe_ratio_max) for c in crit],
+            (40, 25, 10),
+            True,
+            pe_valid,
+        )
+        + _tiered(
+            universe.pbv,
+            [(c.valuation.pbv_preferred, c.valuation.pbv_max) for c in crit],
+            (40, 25, 10),
+            True,
+            pbv_valid,
+        )
+        + _tiered(
+            universe.market_cap,
+            [
+                (c.valuation.market_cap_preferred, c.valuation.market_cap_min)
+                for c in crit
+            ],
+            (20, 15, 5),
+            False,
+            ~np.isnan(universe.market_cap),
+        )
+    )
+
+    profitability = (
+        universe.eps_points
+        + _tiered(
+            universe.gpm_pct,
+            [(c.profitability.gpm_preferred, c.profitability.gpm_min) for c in crit],
+            (25, 15, 5),
+            False,
+            ~np.isnan(universe.gpm_pct),
+        )
+        + _tiered(
+            universe.roe_pct,
+            [(c.profitability.roe_preferred, c.profitability.roe_min) for c in crit],
+            (25, 15, 5),
+            False,
+            ~np.isnan(universe.roe_pct),
+        )
+        + universe.cash_flow_points
+    )
+
+    risk = _tiered(
+        universe.dte,
+        [
+            (c.risk.debt_to_equity_preferred, c.risk.debt_to_equity_max)
+            for c in crit
+        ],
+        (70, 45, 15),
+        True,
+        ~np.isnan(universe.dte),
+    ) + _tiered(
+        universe.beta,
+        [
+            (1.0, np.inf if c.risk.beta_max is None else c.risk.beta_max)
+            for c in crit
+        ],
+        (30, 20, 5),
+        True,
+        ~np.isnan(universe.beta),
+        missing_points=15,
+    )
+
+    dividend = _tiered(
+        universe.div_pct,
+        [
+            (c.dividend.dividend_yield_preferred, c.dividend.dividend_yield_min)
+            for c in crit
+        ],
+        (100, 60, 30),
+        False,
+        universe.has_dividend,
+    )
+    no_dividend_points = np.array(
+        [0.0 if c.dividend.require_dividend else 20.0 for c in crit]
+    )[:, None]
+    dividend = np.where(universe.has_dividend, dividend, no_dividend_points)
+
+    return np.stack([valuation, profitability, risk, dividend], axis=1)
+
+
+def run_sweep(
+    stocks_data: Sequence[StockData], variants: Sequence[SweepVariant]
+) -> SweepResult:
+    """
+    Evaluasi semua variant atas universe dalam satu pass vectorized.
+
+    Args:
+        stocks_data: StockData universe
+        variants: Variants (variant pertama dipakai sebagai baseline)
+
+    Returns:
+        SweepResult
+    """
+    if not variants:
+        raise ValueError("At least one sweep variant is required")
+
+    universe = UniverseMatrix(stocks_data)
+    category_scores = compute_category_scores(universe, variants)
+    weights = np.array([v.weight_vector() for v in variants])
+
+    totals = np.round(np.einsum('vc,vcn->vn', weights, category_scores), 2)
+
+    return SweepResult(
+        tickers=universe.tickers,
+        variants=list(variants),
+        category_scores=category_scores,
+        totals=totals,
+        ranks=rank_columns(totals),
+    )
+
+
+def _parse_value(raw: str, current: Any) -> Any:
+    """Parse nilai grid sesuai type field saat ini."""
+    if isinstance(current, bool):
+        return raw.strip().lower() in ('1', 'true', 'yes', 'y')
+    if isinstance(current, int):
+        return int(raw)
+    return float(raw)
+
+
+def _set_path(criteria: ScreeningCriteria, weights: ScoringWeights, path: str, raw):
+    """Set field berdasarkan path `category.field` atau `weights.field`."""
+    section, _, name = path.partition('.')
+    if section == 'weights':
+        target = weights
+    elif section in CATEGORIES:
+        target = getattr(criteria, section)
+    else:
+        raise ValueError(f"Unknown sweep parameter: {path}")
+
+    if name not in {f.name for f in fields(target)}:
+        raise ValueError(f"Unknown sweep parameter: {path}")
+
+    current = getattr(target, name)
+    value = _parse_value(raw, current) if isinstance(raw, str) else raw
+    setattr(target, name, value)
+
+
+def build_grid(
+    grid: Dict[str, Sequence[Any]],
+    base_criteria: ScreeningCriteria = DEFAULT_CRITERIA,
+    base_weights: ScoringWeights = DEFAULT_WEIGHTS,
+) -> Tuple[List[SweepVariant], int]:
+    """
+    Build variants dari cartesian product parameter grid.
+
+    Variant pertama selalu baseline (criteria/weights dasar). Kombinasi
+    weights yang tidak berjumlah 1.0 dilewati.
+
+    Args:
+        grid: {'valuation.pe_ratio_max': [10, 15, 20], 'weights.risk_weight': ...}
+        base_criteria: Criteria dasar
+        base_weights: Weights dasar
+
+    Returns:
+        Tuple (variants, jumlah kombinasi yang dilewati)
+    """
+    variants = [
+        SweepVariant(
+            'baseline', copy.deepcopy(base_criteria), copy.deepcopy(base_weights)
+        )
+    ]
+    skipped = 0
+
+    keys = list(grid)
+    for combo in itertools.product(*(grid[k] for k in keys)):
+        criteria = copy.deepcopy(base_criteria)
+        weights = copy.deepcopy(base_weights)
+        for key, raw in zip(keys, combo, strict=True):
+            _set_path(criteria, weights, key, raw)
+
+        try:
+            weights = ScoringWeights(**asdict(weights))  # re-validate sum
+        except ValueError:
+            skipped += 1
+            continue
+
+        name = ', '.join(f"{k}={v}" for k, v in zip(keys, combo, strict=True))
+        variants.append(SweepVariant(name, criteria, weights))
+
+    return variants, skipped
+
+
+def load_variants(
+    path: str,
+    base_criteria: ScreeningCriteria = DEFAULT_CRITERIA,
+    base_weights: ScoringWeights = DEFAULT_WEIGHTS,
+) -> List[SweepVariant]:
+    """
+    Load daftar variant dari file JSON.
+
+    Format: [{"name": "...", "criteria": {"valuation": {"pe_ratio_max": 20}},
+    "weights": {"valuation_weight": 0.3, ...}}, ...]. Field yang tidak disebut
+    memakai nilai dasar.
+
+    Args:
+        path: Path file JSON
+        base_criteria: Criteria dasar
+        base_weights: Weights dasar
+
+    Returns:
+        List of SweepVariant (baseline di index 0)
+    """
+    with open(path, encoding='utf-8') as f:
+        specs = json.load(f)
+
+    variants = [
+        SweepVariant(
+            'baseline', copy.deepcopy(base_criteria), copy.deepcopy(base_weights)
+        )
+    ]
+    for i, spec in enumerate(specs):
+        criteria = copy.deepcopy(base_criteria)
+        weights = copy.deepcopy(base_weights)
+
+        for section, values in spec.get('criteria', {}).items():
+            for name, value in values.items():
+                _set_path(criteria, weights, f"{section}.{name}", value)
+        for name, value in spec.get('weights', {}).items():
+            _set_path(criteria, weights, f"weights.{name}", value)
+
+        weights = ScoringWeights(**asdict(weights))  # re-validate sum
+        variants.append(
+            SweepVariant(spec.get('name', f"variant-{i + 1}"), criteria, weights)
+        )
+
+    return variants
+
+
+def parse_grid_options(options: Sequence[str]) -> Dict[str, List[str]]:
+    """
+    Parse opsi CLI `key=v1,v2,v3` menjadi grid dictionary.
+
+    Args:
+        options: List string opsi
+
+    Returns:
+        Dictionary grid
+    """
+    grid = {}
+    for option in options:
+        key, sep, values = option.partition('=')
+        if not sep or not values:
+            raise ValueError(f"Invalid grid option '{option}', expected key=v1,v2")
+        grid[key.strip()] = [v.strip() for v in values.split(',') if v.strip()]
+    return grid
@@ -0,0 +1,241 @@
+"""
+Checkpoint journal untuk batch (universe) run yang bisa dilanjutkan.
+
+Journal adalah file JSONL append-only: baris pertama header run, lalu satu
+record per ticker yang selesai diproses (StockData dan ScreeningResult
+ter-serialisasi), dipangkas pre-filter, atau gagal. Run yang terhenti di
+tengah jalan dilanjutkan dengan --resume: ticker yang sudah selesai atau
+dipangkas di-skip, ticker yang gagal diproses ulang.
+
+Setiap record di-flush segera, dan baris terakhir yang terpotong (proses
+mati saat menulis) diabaikan saat journal dibaca.
+"""
+
+from dataclasses import asdict, dataclass, field
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, TextIO, Tuple, Union
+
+from src.analyzers.score_cache import stable_hash
+from src.config.settings import get_data_dir
+from src.models.screening_result import ScreeningResult
+from src.models.serialization import from_dict, to_dict
+from src.models.stock_data import StockData
+from src.utils.helpers import normalize_ticker
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Naikkan jika format record berubah (journal lama tidak bisa di-resume)
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointMismatch(ValueError):
+    """Journal dibuat oleh run dengan universe atau opsi yang berbeda."""
+
+
+def checkpoint_run_id(
+    tickers: Iterable[str],
+    criteria,
+    prefilter_rules,
+    news_sources: Iterable[str] = (),
+) -> str:
+    """
+    Identitas run: universe, criteria, rule pre-filter dan sumber berita.
+
+    Args:
+        tickers: Ticker universe (urutan diabaikan)
+        criteria: ScreeningCriteria yang dipakai analyzer
+        prefilter_rules: FilterRule yang aktif
+        news_sources: Sumber berita jika batch --news (kosong = tanpa berita)
+
+    Returns:
+        Hex digest SHA-256
+    """
+    payload = {
+        'version': CHECKPOINT_VERSION,
+        'tickers': sorted({normalize_ticker(t) for t in tickers}),
+        'criteria': asdict(criteria),
+        'prefilter': [rule.describe() for rule in prefilter_rules],
+    }
+    news_sources = sorted(set(news_sources))
+    if news_sources:
+        # Hanya jika dipakai: run id tanpa --news tetap sama dengan journal lama
+        payload['news'] = news_sources
+    return stable_hash(payload)
+
+
+@dataclass
+class CheckpointState:
+    """Progress run yang dibaca dari journal."""
+
+    # ticker -> (StockData, ScreeningResult atau None jika belum dianalisis)
+    done: Dict[str, Tuple[StockData, Optional[ScreeningResult]]] = field(
+        default_factory=dict
+    )
+    pruned: Dict[str, str] = field(default_factory=dict)  # ticker -> nama rule
+    failed: Set[str] = field(default_factory=set)
+
+    def is_finished(self, ticker: str) -> bool:
+        """Apakah ticker tidak perlu diproses ulang saat resume."""
+        key = normalize_ticker(ticker)
+        return key in self.done or key in self.pruned
+
+
+class BatchCheckpoint:
+    """Journal JSONL append-only untuk satu batch run."""
+
+    def __init__(self, path: Union[str, Path], run_id: str):
+        """
+        Initialize checkpoint (file belum dibuka, lihat open()).
+
+        Args:
+            path: Path file journal
+            run_id: Identitas run (lihat checkpoint_run_id)
+        """
+        self.path = Path(path)
+        self.run_id = run_id
+        self._stream: Optional[TextIO] = None
+
+    @staticmethod
+    def default_path(run_id: str) -> Path:
+        """Path journal default: <data dir>/checkpoints/batch-<run id>.jsonl."""
+        return get_data_dir() / 'checkpoints' / f"batch-{run_id[:16]}.jsonl"
+
+    def __enter__(self) -> 'BatchCheckpoint':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def open(self, resume: bool = False) -> CheckpointState:
+        """
+        Buka journal untuk ditulis.
+
+        Args:
+            resume: Lanjutkan journal yang ada (jika tidak, journal dimulai
+                dari awal)
+
+        Returns:
+            CheckpointState dari journal (kosong jika tidak resume)
+
+        Raises:
+            CheckpointMismatch: Jika journal dibuat oleh run yang berbeda
+        """
+        state = CheckpointState()
+        if resume and self.path.exists():
+            state = self.load()
+            self._drop_partial_record()
+            self._stream = self.path.open('a', encoding='utf-8')
+            logger.info(
+                f"Resuming checkpoint {self.path}: {len(state.done)} done, "
+                f"{len(state.pruned)} pruned, {len(state.failed)} failed"
+            )
+            return state
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = self.path.open('w', encoding='utf-8')
+        self._append({'run_id': self.run_id, 'version': CHECKPOINT_VERSION})
+        return state
+
+    def _drop_partial_record(self) -> None:
+        """Potong record terakhir yang terpotong agar append mulai di baris baru."""
+        with self.path.open('r+b') as stream:
+            data = stream.read()
+            if data and not data.endswith(b'\n'):
+                stream.truncate(data.rfind(b'\n') + 1)
+
+    def load(self) -> CheckpointState:
+        """
+        Baca journal (record terakhir per ticker yang berlaku).
+
+        Returns:
+            CheckpointState
+
+        Raises:
+            CheckpointMismatch: Jika header tidak cocok dengan run_id
+        """
+        state = CheckpointState()
+        with self.path.open(encoding='utf-8') as stream:
+            header = self._parse(stream.readline())
+            if header is None or header.get('run_id') != self.run_id:
+                raise CheckpointMismatch(
+                    f"Checkpoint {self.path} belongs to a different run "
+                    "(tickers or options changed)"
+                )
+
+            for line in stream:
+                record = self._parse(line)
+                if record is None:
+                    continue
+                ticker = record['ticker']
+                state.done.pop(ticker, None)
+                state.pruned.pop(ticker, None)
+                state.failed.discard(ticker)
+
+                status = record['status']
+                if status == 'done':
+                    result = record.get('result')
+                    state.done[ticker] = (
+                        from_dict(StockData, record['stock_data']),
+                        from_dict(ScreeningResult, result) if result else None,
+                    )
+                elif status == 'pruned':
+                    state.pruned[ticker] = record['rule']
+                else:
+                    state.failed.add(ticker)
+        return state
+
+    def record_done(
+        self,
+        ticker: str,
+        stock_data: StockData,
+        result: Optional[ScreeningResult] = None,
+    ) -> None:
+        """Catat ticker yang selesai di-fetch (dan dianalisis)."""
+        self._append(
+            {
+                'ticker': normalize_ticker(ticker),
+                'status': 'done',
+                'stock_data': to_dict(stock_data),
+                'result': to_dict(result) if result is not None else None,
+            }
+        )
+
+    def record_pruned(self, ticker: str, rule: str) -> None:
+        """Catat ticker yang dipangkas rule pre-filter."""
+        self._append(
+            {'ticker': normalize_ticker(ticker), 'status': 'pruned', 'rule': rule}
+        )
+
+    def record_failed(self, ticker: str, stage: str) -> None:
+        """Catat ticker yang gagal (diproses ulang saat resume)."""
+        self._append(
+            {'ticker': normalize_ticker(ticker), 'status': 'failed', 'stage': stage}
+        )
+
+    def close(self) -> None:
+        """Tutup journal (file tetap ada untuk resume)."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def discard(self) -> None:
+        """Tutup dan hapus journal (run selesai)."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def _append(self, record: dict) -> None:
+        """Tulis satu record dan flush."""
+        self._stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._stream.flush()
+
+    def _parse(self, line: str) -> Optional[dict]:
+        """Parse satu baris; None untuk baris kosong atau terpotong."""
+        if not line.strip():
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            logger.warning(f"Ignoring truncated checkpoint record in {self.path}")
+            return None
@@ -4,168 +4,1732 @@ CLI commands untuk stock screening application.
 Module ini berisi semua command-line interface commands menggunakan Click.
 """
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+import copy
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+import json
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
 import click
 from rich.console import Console
+from rich.live import Live
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 from src.__version__ import __version__
-from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
-from src.services.news_scraper_service import NewsScraperService
+from src.analyzers.prefilter import PREFILTER_RULES, PreFilter
+from src.cli.formats import OUTPUT_FORMATS, open_writer
+from src.config.settings import DEFAULT_CRITERIA, get_data_dir, get_socket_path
+from src.services.news_sources import DEFAULT_NEWS_SOURCES, NEWS_SOURCES
 from src.services.yahoo_finance_service import YahooFinanceService
+from src.utils.corporate_actions import CORPORATE_ACTION_TYPES
 from src.utils.helpers import (
     format_currency,
     format_number,
     format_percentage,
     format_ratio,
     get_ticker_without_suffix,
+    load_tickers,
+    normalize_ticker,
+    parse_date_or_duration,
+    parse_duration,
 )
 from src.utils.logger import get_logger
 
-logger = get_logger(__name__)
-console = Console()
+if TYPE_CHECKING:
+    from src.cli.context import ServiceContext
+
+logger = get_logger(__name__)
+
+# Console pengganti per thread (lihat use_console)
+_thread_consoles = threading.local()
+
+
+class _ThreadConsole:
+    """Console module-level yang bisa diganti per thread lewat use_console()."""
+
+    def __init__(self, default: Console, slot: str):
+        self._default = default
+        self._slot = slot
+
+    def current(self) -> Console:
+        """Console milik thread ini (Live memakai console sebagai context manager)."""
+        return getattr(_thread_consoles, self._slot, None) or self._default
+
+    def __getattr__(self, name):
+        return getattr(self.current(), name)
+
+
+console = _ThreadConsole(Console(), 'output')
+err_console = _ThreadConsole(Console(stderr=True), 'errors')
+
+# compare: fetch paralel, tabel live di-refresh setiap LIVE_REFRESH_SECONDS
+# dan ticker yang belum selesai setelah SLOW_FETCH_SECONDS ditandai lambat
+COMPARE_WORKERS = 16
+LIVE_REFRESH_SECONDS = 0.25
+SLOW_FETCH_SECONDS = 5.0
+
+# batch: default jumlah fetch paralel di pipeline stage 2
+BATCH_FETCH_WORKERS = 4
+
+
+def _format_option(command):
+    """Option --format untuk command yang menghasilkan ScreeningResult."""
+    return click.option(
+        '--format',
+        'output_format',
+        type=click.Choice(OUTPUT_FORMATS),
+        default='table',
+        show_default=True,
+        help='Format output; json/ndjson/csv ditulis per hasil ke stdout (untuk pipe)',
+    )(command)
+
+
+def _parse_duration_option(ctx, param, value):
+    """Click callback: durasi singkat (30s, 5m, 1h) menjadi timedelta."""
+    if value is None:
+        return None
+    try:
+        return parse_duration(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+@click.group(invoke_without_command=True)
+@click.version_option(version=__version__, prog_name='Friday Screener')
+@click.pass_context
+def cli(ctx):
+    """
+    Friday Screener - Stock Screening Tool for Indonesian Market.
+
+    Professional-grade stock screening tool untuk analisis fundamental
+    emiten saham di Bursa Efek Indonesia.
+    """
+    if ctx.invoked_subcommand is None:
+        # Jika tidak ada subcommand, jalankan interactive mode
+        ctx.invoke(interactive)
+
+
+@cli.command()
+@click.argument('ticker')
+@click.option(
+    '--detailed',
+    '-d',
+    is_flag=True,
+    help='Show detailed analysis including all insights',
+)
+@click.option(
+    '--news/--no-news',
+    default=True,
+    help='Include news and corporate actions (default: yes)',
+)
+@click.option(
+    '--news-store',
+    is_flag=True,
+    help='Simpan berita di disk dan hanya fetch/klasifikasi item baru',
+)
+@click.option(
+    '--news-source',
+    'news_sources',
+    multiple=True,
+    type=click.Choice(list(NEWS_SOURCES)),
+    default=DEFAULT_NEWS_SOURCES,
+    show_default=True,
+    help='Sumber berita (di-query paralel, bisa diulang)',
+)
+@_format_option
+def screen(
+    ticker: str,
+    detailed: bool,
+    news: bool,
+    news_store: bool,
+    news_sources,
+    output_format: str,
+):
+    """
+    Screen a stock ticker untuk analisis fundamental.
+
+    TICKER: Kode emiten saham (contoh: BBCA, TLKM, ASII)
+
+    Contoh penggunaan:
+
+        friday-screener screen BBCA
+
+        friday-screener screen TLKM --detailed
+
+        friday-screener screen ASII --no-news
+
+        friday-screener screen BBCA --news-store
+
+        friday-screener screen BBCA --news-source yahoo --news-source idx
+
+        friday-screener screen BBCA --format json
+    """
+    if _forward_to_daemon('screen'):
+        return
+
+    # Output machine-readable: stdout hanya berisi record, status ke stderr
+    table = output_format == 'table'
+    ui = console if table else err_console
+    if table:
+        console.print(f"\n[bold cyan]Screening {ticker.upper()}...[/bold cyan]\n")
+
+    # Initialize services (interactive session memakai service bersama)
+    from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+
+    services = _shared_services()
+    if services is not None:
+        services.prefetch(ticker, news=news)
+        finance_service = services
+        analyzer = services.analyzer
+    else:
+        from src.services.news_scraper_service import NewsScraperService
+        from src.services.news_sources import build_sources
+        from src.services.news_store import NewsStore
+
+        finance_service = YahooFinanceService()
+        news_service = NewsScraperService(
+            max_news=10,
+            store=NewsStore() if news and news_store else None,
+            sources=build_sources(news_sources),
+        )
+        analyzer = FundamentalAnalyzer()
+
+    # Step 1: Fetch stock data
+    with ui.status(f"[bold green]Fetching data for {ticker}..."):
+        stock_data = finance_service.get_stock_data(ticker)
+
+    if stock_data is None:
+        ui.print(
+            f"[bold red]Error:[/bold red] Could not fetch data for {ticker}. "
+            "Please check the ticker symbol."
+        )
+        return
+
+    # Step 2: Fetch news if requested
+    news_items = []
+    corporate_actions = []
+    if news:
+        with ui.status("[bold green]Fetching news and corporate actions..."):
+            if services is not None:
+                news_service = services.news_service
+                news_items, corporate_actions, sentiment_trend = services.get_news(
+                    ticker
+                )
+            else:
+                news_items = news_service.get_news(ticker)
+                corporate_actions = news_service.get_corporate_actions(
+                    ticker, news_items
+                )
+                sentiment_trend = news_service.get_sentiment_trend(
+                    ticker, news_items
+                )
+
+        # Salinan dengan berita: StockData dari ServiceContext dipakai bersama
+        # oleh command berikutnya dalam session dan tidak boleh diubah
+        stock_data = replace(
+            stock_data,
+            news=news_items,
+            corporate_actions=corporate_actions,
+            sentiment_trend=sentiment_trend,
+        )
+
+    # Step 3: Analyze
+    with ui.status("[bold green]Analyzing fundamental metrics..."):
+        result = analyzer.analyze(stock_data)
+
+    if not table:
+        with open_writer(output_format, console.file) as writer:
+            writer.write(result)
+        return
+
+    # Display results
+    _display_company_info(stock_data)
+    _display_screening_summary(result)
+    _display_category_scores(result)
+
+    if detailed:
+        _display_key_metrics(result)
+        _display_insights(result)
+
+    if news:
+        _display_news_summary(
+            news_items, corporate_actions, news_service, result.sentiment_trend
+        )
+
+    _display_recommendation(result)
+
+
+@cli.command()
+@click.argument('tickers', nargs=-1, required=True)
+@click.option(
+    '--score-cache',
+    is_flag=True,
+    help='Reuse hasil analisis dari run sebelumnya jika data tidak berubah',
+)
+@_format_option
+def compare(tickers, score_cache, output_format):
+    """
+    Compare multiple stocks side by side.
+
+    TICKERS: Dua atau lebih kode emiten (contoh: BBCA BMRI BBNI)
+
+    Contoh penggunaan:
+
+        friday-screener compare BBCA BMRI BBNI
+
+        friday-screener compare BBCA BMRI BBNI --format ndjson
+    """
+    if _forward_to_daemon('compare'):
+        return
+
+    table = output_format == 'table'
+    ui = console if table else err_console
+
+    if len(tickers) < 2:
+        ui.print(
+            "[bold red]Error:[/bold red] Please provide at least 2 tickers to compare"
+        )
+        return
+
+    if table:
+        console.print(
+            f"\n[bold cyan]Comparing {len(tickers)} stocks...[/bold cyan]\n"
+        )
+
+    # Initialize services (interactive session memakai service bersama)
+    services = _shared_services()
+    executor = None
+    if services is not None:
+        from src.services.scheduler import WATCHLIST
+
+        futures = {
+            services.stock_future(ticker, WATCHLIST): ticker for ticker in tickers
+        }
+        cache = services.score_cache
+        analyzer = services.analyzer
+    else:
+        from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+
+        finance_service = YahooFinanceService()
+        cache = _build_score_cache(score_cache)
+        analyzer = FundamentalAnalyzer(cache=cache)
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(tickers), COMPARE_WORKERS),
+            thread_name_prefix='compare',
+        )
+        futures = {
+            executor.submit(finance_service.get_stock_data, ticker): ticker
+            for ticker in tickers
+        }
+
+    results = []
+    failed = []
+    pending = set(futures)
+    started = time.monotonic()
+    writer = open_writer(output_format, console.file)
+
+    def render():
+        return _comparison_table(
+            results,
+            pending=[t for f, t in futures.items() if f in pending],
+            failed=failed,
+            elapsed=time.monotonic() - started,
+        )
+
+    # Semua ticker di-fetch bersamaan; setiap hasil langsung dianalisis dan
+    # masuk ke tabel live (atau ditulis sebagai record jika --format). Tanpa
+    # terminal interaktif (pipe, daemon) hanya tabel akhir yang dicetak.
+    live = None
+    if table and console.is_interactive:
+        live = Live(
+            console=console.current(),
+            auto_refresh=False,
+            get_renderable=render,
+            redirect_stdout=False,
+            redirect_stderr=False,
+        )
+    try:
+        with live or nullcontext():
+            while pending:
+                done, pending = wait(
+                    pending, timeout=LIVE_REFRESH_SECONDS, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    ticker = futures[future]
+                    stock_data = _fetch_result(future, ticker)
+                    if stock_data is None:
+                        failed.append(ticker)
+                        if not table:
+                            ui.print(
+                                f"[bold yellow]Warning:[/bold yellow] Could not "
+                                f"fetch data for {ticker}, skipping..."
+                            )
+                        continue
+
+                    result = analyzer.analyze(stock_data)
+                    results.append(result)
+                    if writer is not None:
+                        writer.write(result)
+
+                if live is not None:
+                    live.refresh()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    if table and live is None:
+        console.print(render())
+
+    if writer is not None:
+        writer.close()
+        return
+
+    if not results:
+        console.print("[bold red]Error:[/bold red] No valid stocks to compare")
+        return
+
+    _display_cache_stats(cache)
+
+
+@cli.command()
+@click.argument('tickers', nargs=-1)
+@click.option(
+    '--file',
+    '-f',
+    'ticker_file',
+    type=click.Path(exists=True, dir_okay=False),
+    help='File berisi daftar ticker (satu per baris)',
+)
+@click.option(
+    '--top',
+    '-n',
+    default=20,
+    show_default=True,
+    help='Jumlah emiten teratas yang ditampilkan',
+)
+@click.option(
+    '--prefilter',
+    'prefilter_rules',
+    multiple=True,
+    type=click.Choice(PREFILTER_RULES),
+    default=('market_cap', 'dividend'),
+    show_default=True,
+    help='Hard criteria yang dicek dari quote sebelum fetch lengkap',
+)
+@click.option(
+    '--no-prefilter',
+    is_flag=True,
+    help='Skip pre-filter, fetch dan analisis semua ticker',
+)
+@click.option(
+    '--score-cache',
+    is_flag=True,
+    help='Reuse hasil analisis dari run sebelumnya jika data tidak berubah',
+)
+@click.option(
+    '--sector-relative',
+    is_flag=True,
+    help='Score PE/PBV/ROE/GPM sebagai percentile dalam sektor (antar emiten yang di-fetch)',
+)
+@click.option(
+    '--resume',
+    is_flag=True,
+    help='Lanjutkan run yang terhenti dari checkpoint (skip ticker yang selesai)',
+)
+@click.option(
+    '--checkpoint',
+    'checkpoint_path',
+    type=click.Path(dir_okay=False),
+    help='File checkpoint journal (default: <data dir>/checkpoints/)',
+)
+@click.option(
+    '--workers',
+    '-w',
+    type=click.IntRange(min=1),
+    default=BATCH_FETCH_WORKERS,
+    show_default=True,
+    help='Jumlah fetch paralel di pipeline batch',
+)
+@click.option(
+    '--pipeline-stats',
+    is_flag=True,
+    help='Tampilkan throughput dan kedalaman queue per stage pipeline',
+)
+@click.option(
+    '--news',
+    is_flag=True,
+    help='Fetch berita dan corporate actions per emiten (stage fetch_news)',
+)
+@click.option(
+    '--news-source',
+    'news_sources',
+    multiple=True,
+    type=click.Choice(list(NEWS_SOURCES)),
+    default=DEFAULT_NEWS_SOURCES,
+    show_default=True,
+    help='Sumber berita untuk --news (bisa diulang)',
+)
+@_format_option
+def batch(
+    tickers,
+    ticker_file,
+    top,
+    prefilter_rules,
+    no_prefilter,
+    score_cache,
+    sector_relative,
+    resume,
+    checkpoint_path,
+    workers,
+    pipeline_stats,
+    news,
+    news_sources,
+    output_format,
+):
+    """
+    Screen a universe of stocks dan tampilkan ranking top-N.
+
+    TICKERS: Kode emiten (opsional jika --file digunakan)
+
+    Contoh penggunaan:
+
+        friday-screener batch BBCA BMRI BBNI TLKM ASII
+
+        friday-screener batch --file universe.txt --top 10
+
+        friday-screener batch -f universe.txt --prefilter debt_to_equity
+
+        friday-screener batch -f universe.txt --format ndjson > results.ndjson
+
+        friday-screener batch -f universe.txt --resume
+
+        friday-screener batch -f universe.txt --workers 8 --pipeline-stats
+
+        friday-screener batch BBCA BMRI TLKM --news
+
+    Dengan --format json/ndjson/csv setiap hasil ditulis begitu dianalisis
+    (urutan proses, bukan ranking) dan --top tidak dipakai.
+
+    Progress dicatat di checkpoint journal per ticker; jika run terhenti,
+    jalankan ulang command yang sama dengan --resume untuk melanjutkan.
+    Journal dihapus setelah run selesai.
+    """
+    from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+    from src.analyzers.sector_stats import SectorStatistics
+    from src.cli.checkpoint import (
+        BatchCheckpoint,
+        CheckpointMismatch,
+        checkpoint_run_id,
+    )
+    from src.services.pipeline import build_screening_pipeline
+
+    table = output_format == 'table'
+    ui = console if table else err_console
+
+    tickers = list(tickers)
+    if ticker_file:
+        tickers.extend(t for t in load_tickers(ticker_file) if t not in tickers)
+
+    if not tickers:
+        ui.print(
+            "[bold red]Error:[/bold red] Please provide tickers or --file"
+        )
+        return
+
+    criteria = copy.deepcopy(DEFAULT_CRITERIA)
+    criteria.sector_relative.enabled = sector_relative
+
+    # Initialize services
+    finance_service = YahooFinanceService()
+    cache = _build_score_cache(score_cache)
+    analyzer = FundamentalAnalyzer(criteria=criteria, cache=cache)
+    prefilter = PreFilter.from_criteria(
+        criteria, rules=() if no_prefilter else prefilter_rules
+    )
+
+    # Berita di-fetch di worker thread pipeline: tanpa NewsStore (koneksi
+    # SQLite hanya boleh dipakai thread yang membuatnya)
+    news_service = None
+    if news:
+        from src.services.news_scraper_service import NewsScraperService
+        from src.services.news_sources import build_sources
+
+        news_service = NewsScraperService(
+            max_news=10, store=None, sources=build_sources(news_sources)
+        )
+
+    run_id = checkpoint_run_id(
+        tickers, criteria, prefilter.rules, news_sources if news else ()
+    )
+    checkpoint = BatchCheckpoint(
+        checkpoint_path or BatchCheckpoint.default_path(run_id), run_id
+    )
+    try:
+        restored = checkpoint.open(resume=resume)
+    except CheckpointMismatch as e:
+        ui.print(f"[bold red]Error:[/bold red] {e}")
+        return
+
+    remaining = [t for t in tickers if not restored.is_finished(t)]
+    if table:
+        console.print(
+            f"\n[bold cyan]Screening universe of {len(tickers)} stocks...[/bold cyan]\n"
+        )
+    if resume:
+        ui.print(
+            f"[dim]Resuming from checkpoint: {len(tickers) - len(remaining)} "
+            f"done, {len(remaining)} remaining[/dim]"
+        )
+
+    writer = open_writer(output_format, console.file)
+    results = []
+
+    def analyze(stock_data, result=None):
+        if result is None:
+            result = analyzer.analyze(stock_data)
+        results.append((stock_data, result))
+        if writer is not None:
+            writer.write(result)
+        return result
+
+    def record_pruned(ticker, rule):
+        if rule is None:
+            checkpoint.record_failed(ticker, 'quote')
+        else:
+            checkpoint.record_pruned(ticker, rule.name)
+
+    completed = False
+    try:
+        # Hasil dari checkpoint (sector-relative: dianalisis ulang di stage 3)
+        stocks_data = []
+        for ticker in dict.fromkeys(normalize_ticker(t) for t in tickers):
+            if ticker not in restored.done:
+                continue
+            stock_data, result = restored.done[ticker]
+            stocks_data.append(stock_data)
+            if not sector_relative:
+                analyze(stock_data, result)
+
+        # Stage 1: pre-filter dari quote murah
+        with ui.status("[bold green]Pre-filtering from quotes..."):
+            survivors, report = prefilter.run(
+                remaining, finance_service, on_pruned=record_pruned
+            )
+        report.total = len(tickers)
+        for rule_name in restored.pruned.values():
+            report.pruned_by_rule[rule_name] += 1
+
+        # Stage 2: fetch lengkap hanya untuk yang lolos, lewat pipeline dengan
+        # bounded queue (fetch paralel -> berita jika --news -> analisis ->
+        # sink). Tanpa sector-relative setiap emiten langsung dianalisis
+        # supaya hasilnya bisa di-stream; sink (journal dan writer) berjalan
+        # di satu thread.
+        processed = []
+        with ui.status("[bold green]Fetching stocks...") as status:
+
+            def sink(item):
+                if item.failed:
+                    report.fetch_failed += 1
+                    checkpoint.record_failed(item.ticker, 'fetch')
+                else:
+                    stocks_data.append(item.stock_data)
+                    checkpoint.record_done(
+                        item.ticker,
+                        item.stock_data,
+                        None
+                        if sector_relative
+                        else analyze(item.stock_data, item.result),
+                    )
+                processed.append(item.ticker)
+                status.update(
+                    f"[bold green]Fetched {len(processed)} of "
+                    f"{len(survivors)} stocks..."
+                )
+
+            pipeline = build_screening_pipeline(
+                finance_service,
+                sink,
+                analyzer=None if sector_relative else analyzer,
+                news_service=news_service,
+                fetch_workers=min(workers, max(len(survivors), 1)),
+            )
+            pipeline.run(survivors)
+        if pipeline_stats:
+            _display_pipeline_stats(pipeline.stats(), ui)
+
+        # Stage 3: analisis sector-relative (statistik sektor dibangun sekali
+        # dari snapshot seluruh universe)
+        if sector_relative:
+            analyzer.sector_stats = SectorStatistics.from_universe(stocks_data)
+            with ui.status("[bold green]Analyzing fundamental metrics..."):
+                for stock_data in stocks_data:
+                    analyze(stock_data)
+        completed = True
+    finally:
+        if completed:
+            checkpoint.discard()
+        else:
+            checkpoint.close()
+            err_console.print(
+                f"[yellow]Run interrupted; progress saved to {checkpoint.path}. "
+                "Re-run with --resume to continue.[/yellow]"
+            )
+
+    report.analyzed = len(results)
+    if writer is not None:
+        writer.close()
+        ui.print(
+            f"[dim]Analyzed {report.analyzed} of {len(tickers)} stocks "
+            f"({report.fetch_failed} fetch failed)[/dim]"
+        )
+        return
+
+    _display_prefilter_report(report, prefilter)
+
+    if not results:
+        console.print("[bold red]Error:[/bold red] No stocks passed screening")
+        return
+
+    results.sort(key=lambda x: x[1].metrics.total_score, reverse=True)
+    _display_comparison_table(results[:top])
+    _display_cache_stats(cache)
+
+
+@cli.command()
+@click.argument('tickers', nargs=-1, required=True)
+@click.option(
+    '--interval',
+    '-i',
+    default='5m',
+    show_default=True,
+    callback=_parse_duration_option,
+    help='Jarak antar tick; setiap tick hanya harga yang di-refresh',
+)
+@click.option(
+    '--fundamentals-every',
+    'fundamentals_interval',
+    default='6h',
+    show_default=True,
+    callback=_parse_duration_option,
+    help='Jarak antar fetch data fundamental lengkap',
+)
+@click.option(
+    '--news-every',
+    'news_interval',
+    default='30m',
+    show_default=True,
+    callback=_parse_duration_option,
+    help='Jarak antar refresh berita dan corporate actions',
+)
+@click.option(
+    '--threshold',
+    default=2.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help='Perubahan total score minimum yang dilaporkan',
+)
+@click.option(
+    '--news/--no-news',
+    default=True,
+    help='Pantau corporate actions dan sentiment dari berita (default: yes)',
+)
+@click.option(
+    '--news-store/--no-news-store',
+    default=True,
+    help='Simpan berita di NewsStore (default: yes)',
+)
+@click.option(
+    '--count',
+    '-c',
+    type=click.IntRange(min=1),
+    help='Berhenti setelah N tick (default: berjalan terus)',
+)
+def watch(
+    tickers,
+    interval,
+    fundamentals_interval,
+    news_interval,
+    threshold,
+    news,
+    news_store,
+    count,
+):
+    """
+    Pantau emiten secara berkala dan tampilkan perubahan saja.
+
+    Tick pertama menampilkan rating awal setiap ticker; tick berikutnya
+    hanya perubahan rating, pergerakan score di atas --threshold, red flag
+    baru dan corporate action baru.
+
+    Contoh penggunaan:
+
+        friday-screener watch BBCA BMRI TLKM --interval 5m
+
+        friday-screener watch BBCA --fundamentals-every 1d --no-news
+    """
+    from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+    from src.cli.watch import Watcher
+    from src.services.news_scraper_service import NewsScraperService
+    from src.services.news_store import NewsStore
+
+    news_service = None
+    if news:
+        news_service = NewsScraperService(
+            store=NewsStore() if news_store else None,
+            refresh_interval=news_interval,
+        )
+    watcher = Watcher(
+        tickers,
+        YahooFinanceService(),
+        FundamentalAnalyzer(),
+        news_service=news_service,
+        fundamentals_interval=fundamentals_interval,
+        news_interval=news_interval,
+        score_threshold=threshold,
+    )
+
+    console.print(
+        f"[bold cyan]Watching {len(watcher.tickers)} stocks every "
+        f"{_format_duration(interval)}[/bold cyan] [dim](Ctrl+C untuk berhenti)[/dim]"
+    )
+    ticks = 0
+    try:
+        while True:
+            started = time.monotonic()
+            for change in watcher.tick():
+                _display_watch_change(change)
+            ticks += 1
+            if count is not None and ticks >= count:
+                break
+            time.sleep(
+                max(0.0, interval.total_seconds() - (time.monotonic() - started))
+            )
+    except KeyboardInterrupt:
+        console.print("[bold cyan]Watch stopped[/bold cyan]")
+    finally:
+        if news_service is not None and news_service.store is not None:
+            news_service.store.close()
+
+
+@cli.command()
+@click.argument('tickers', nargs=-1)
+@click.option(
+    '--file',
+    '-f',
+    'ticker_file',
+    type=click.Path(exists=True, dir_okay=False),
+    help='File berisi daftar ticker (satu per baris)',
+)
+@click.option(
+    '--grid',
+    '-g',
+    'grid_options',
+    multiple=True,
+    help='Parameter grid, contoh: valuation.pe_ratio_max=10,15,20',
+)
+@click.option(
+    '--variants',
+    'variants_file',
+    type=click.Path(exists=True, dir_okay=False),
+    help='File JSON berisi daftar criteria/weights variants',
+)
+@click.option(
+    '--top',
+    '-n',
+    default=10,
+    show_default=True,
+    help='Ukuran top-N untuk rank stability',
+)
+def sweep(tickers, ticker_file, grid_options, variants_file, top):
+    """
+    Evaluate banyak criteria/weights variants atas satu universe sekaligus.
+
+    Data universe di-fetch sekali, lalu semua variant di-score dalam satu
+    pass vectorized dan dibandingkan dengan baseline.
+
+    Contoh penggunaan:
+
+        friday-screener sweep -f universe.txt -g valuation.pe_ratio_max=10,15,20
+
+        friday-screener sweep BBCA BMRI TLKM -g weights.valuation_weight=0.25,0.35 -g weights.profitability_weight=0.25,0.35
+
+        friday-screener sweep -f universe.txt --variants variants.json
+    """
+    from src.analyzers.sweep import (
+        build_grid,
+        load_variants,
+        parse_grid_options,
+        run_sweep,
+    )
+
+    tickers = list(tickers)
+    if ticker_file:
+        tickers.extend(t for t in load_tickers(ticker_file) if t not in tickers)
+
+    if not tickers:
+        console.print(
+            "[bold red]Error:[/bold red] Please provide tickers or --file"
+        )
+        return
+
+    try:
+        variants, skipped = build_grid(parse_grid_options(grid_options))
+        if variants_file:
+            variants.extend(load_variants(variants_file)[1:])
+    except (ValueError, OSError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return
+
+    finance_service = YahooFinanceService()
+    stocks_data = _fetch_universe(tickers, finance_service)
+
+    if not stocks_data:
+        console.print("[bold red]Error:[/bold red] No valid stocks to sweep")
+        return
+
+    with console.status(
+        f"[bold green]Scoring {len(variants)} variants x {len(stocks_data)} stocks..."
+    ):
+        result = run_sweep(stocks_data, variants)
+
+    if skipped:
+        console.print(
+            f"[yellow]Skipped {skipped} grid combinations whose weights do not sum to 1.0[/yellow]"
+        )
+    _display_sweep_result(result, top)
+
+
+@cli.command()
+@click.argument('tickers', nargs=-1)
+@click.option(
+    '--file',
+    '-f',
+    'ticker_file',
+    type=click.Path(exists=True, dir_okay=False),
+    help='File berisi daftar ticker (satu per baris)',
+)
+@click.option(
+    '--samples',
+    '-s',
+    default=5000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Jumlah weight vectors yang di-sample',
+)
+@click.option(
+    '--concentration',
+    default=50.0,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help='Konsentrasi Dirichlet (lebih besar = perturbasi lebih kecil)',
+)
+@click.option(
+    '--top',
+    '-n',
+    default=10,
+    show_default=True,
+    help='Ukuran top-N',
+)
+@click.option('--seed', type=int, default=None, help='Random seed')
+def robustness(tickers, ticker_file, samples, concentration, top, seed):
+    """
+    Ukur sensitivitas ranking top-N terhadap ScoringWeights.
+
+    Category scores dihitung sekali per emiten, lalu total score di-hitung
+    ulang untuk ribuan weight vectors di sekitar weights yang dikonfigurasi.
+
+    Contoh penggunaan:
+
+        friday-screener robustness -f universe.txt --samples 10000 --top 10
+    """
+    from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+    from src.analyzers.robustness import analyze_robustness, category_matrix
+
+    tickers = list(tickers)
+    if ticker_file:
+        tickers.extend(t for t in load_tickers(ticker_file) if t not in tickers)
+
+    if not tickers:
+        console.print(
+            "[bold red]Error:[/bold red] Please provide tickers or --file"
+        )
+        return
+
+    finance_service = YahooFinanceService()
+    analyzer = FundamentalAnalyzer()
+
+    stocks_data = _fetch_universe(tickers, finance_service)
+    if not stocks_data:
+        console.print("[bold red]Error:[/bold red] No valid stocks to analyze")
+        return
+
+    with console.status("[bold green]Computing category scores..."):
+        results = [analyzer.analyze(stock_data) for stock_data in stocks_data]
+
+    with console.status(f"[bold green]Sampling {samples} weight vectors..."):
+        robustness_result = analyze_robustness(
+            [result.ticker for result in results],
+            category_matrix(results),
+            base=analyzer.weights,
+            samples=samples,
+            top_n=top,
+            concentration=concentration,
+            seed=seed,
+        )
+
+    _display_robustness_result(robustness_result, samples)
+
+
+def _queue_path_option(command):
+    """Option --queue untuk command job queue."""
+    return click.option(
+        '--queue',
+        'queue_path',
+        type=click.Path(dir_okay=False),
+        help='File SQLite job queue (default: <data dir>/jobs.db)',
+    )(command)
+
+
+def _lease_timeout_option(command):
+    """Option --lease-timeout untuk worker job queue."""
+    return click.option(
+        '--lease-timeout',
+        default='2m',
+        show_default=True,
+        callback=_parse_duration_option,
+        help='Job yang tidak selesai dalam waktu ini diambil alih worker lain',
+    )(command)
+
+
+@cli.group(name='queue')
+def queue_group():
+    """Universe screening multi-worker lewat job queue SQLite."""
+
+
+@queue_group.command(name='run')
+@click.argument('tickers', nargs=-1)
+@click.option(
+    '--file',
+    '-f',
+    'ticker_file',
+    type=click.Path(exists=True, dir_okay=False),
+    help='File berisi daftar ticker (satu per baris)',
+)
+@click.option(
+    '--workers',
+    '-w',
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help='Jumlah worker process lokal (0 = worker di process ini)',
+)
+@click.option(
+    '--top',
+    '-n',
+    default=20,
+    show_default=True,
+    help='Jumlah emiten teratas yang ditampilkan',
+)
+@click.option(
+    '--max-attempts',
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Jumlah percobaan per ticker sebelum dianggap gagal',
+)
+@_lease_timeout_option
+@_queue_path_option
+@_format_option
+def queue_run(
+    tickers,
+    ticker_file,
+    workers,
+    top,
+    max_attempts,
+    lease_timeout,
+    queue_path,
+    output_format,
+):
+    """
+    Enqueue universe, jalankan worker, dan tampilkan ranking gabungan.
+
+    Worker tambahan (misalnya di host lain yang berbagi file queue) bisa
+    ikut memproses run yang sama dengan `queue work`.
+
+    Contoh penggunaan:
+
+        friday-screener queue run -f universe.txt --workers 8
+
+        friday-screener queue run -f universe.txt --format csv > ranked.csv
+    """
+    import multiprocessing
+
+    from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+    from src.services.job_queue import DONE, FAILED, JobQueue, run_worker, work
+
+    table = output_format == 'table'
+    ui = console if table else err_console
+
+    tickers = list(tickers)
+    if ticker_file:
+        tickers.extend(t for t in load_tickers(ticker_file) if t not in tickers)
+    if not tickers:
+        ui.print("[bold red]Error:[/bold red] Please provide tickers or --file")
+        return
+
+    timeout = lease_timeout.total_seconds()
+    with JobQueue(queue_path, lease_timeout=timeout) as queue:
+        run_id = queue.create_run(tickers, DEFAULT_CRITERIA, max_attempts)
+        ui.print(
+            f"[bold cyan]Run {run_id}:[/bold cyan] {len(tickers)} tickers queued "
+            f"in {queue.path}"
+        )
+
+        if workers == 0:
+            with ui.status("[bold green]Screening..."):
+                run_worker(
+                    queue,
+                    run_id,
+                    YahooFinanceService(),
+                    FundamentalAnalyzer(criteria=queue.criteria(run_id)),
+                )
+        else:
+            # spawn: worker tidak mewarisi state process coordinator
+            context = multiprocessing.get_context('spawn')
+            processes = [
+                context.Process(
+                    target=work, args=(queue.path, run_id, timeout), daemon=True
+                )
+                for _ in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            try:
+                with ui.status("[bold green]Screening...") as status:
+                    while not queue.is_finished(run_id):
+                        counts = queue.counts(run_id)
+                        status.update(
+                            f"[bold green]Screening... {counts[DONE]} done, "
+                            f"{counts[FAILED]} failed of {sum(counts.values())}"
+                        )
+                        if not any(p.is_alive() for p in processes):
+                            break
+                        time.sleep(0.5)
+            finally:
+                for process in processes:
+                    process.join(timeout=5)
+                    if process.is_alive():
+                        process.terminate()
+
+        results = queue.results(run_id)
+        failures = queue.failures(run_id)
+        unfinished = not queue.is_finished(run_id)
+
+    writer = open_writer(output_format, console.file)
+    if writer is not None:
+        with writer:
+            for result in results:
+                writer.write(result)
+    else:
+        if results:
+            console.print(_comparison_table(results[:top]))
+        else:
+            console.print("[bold red]Error:[/bold red] No stocks passed screening")
+
+    ui.print(
+        f"[dim]Analyzed {len(results)} of {len(tickers)} stocks "
+        f"({len(failures)} failed)[/dim]"
+    )
+    if unfinished:
+        ui.print(
+            f"[bold yellow]Warning:[/bold yellow] Workers exited before run "
+            f"{run_id} finished; continue with `queue work --run {run_id}`"
+        )
+
+
+@queue_group.command(name='work')
+@click.option(
+    '--run', 'run_id', help='Run ID (default: run terbaru yang belum selesai)'
+)
+@click.option(
+    '--workers',
+    '-w',
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Jumlah worker process',
+)
+@_lease_timeout_option
+@_queue_path_option
+def queue_work(run_id, workers, lease_timeout, queue_path):
+    """
+    Jalankan worker untuk run yang sudah di-enqueue.
+
+    Contoh penggunaan:
+
+        friday-screener queue work --workers 4
+
+        friday-screener queue work --queue /mnt/shared/jobs.db
+    """
+    import multiprocessing
+
+    from src.services.job_queue import JobQueue, work
+
+    with JobQueue(queue_path) as queue:
+        run_id = run_id or queue.latest_run()
+        path = queue.path
+    if run_id is None:
+        console.print("[bold yellow]No unfinished run in queue[/bold yellow]")
+        return
+
+    timeout = lease_timeout.total_seconds()
+    console.print(f"[bold cyan]Working on run {run_id}[/bold cyan]")
+    if workers == 1:
+        completed = work(path, run_id, timeout)
+    else:
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(workers) as pool:
+            completed = sum(pool.starmap(work, [(path, run_id, timeout)] * workers))
+    console.print(f"[dim]Completed {completed} jobs[/dim]")
+
+
+@queue_group.command(name='status')
+@click.option(
+    '--run', 'run_id', help='Run ID (default: run terbaru yang belum selesai)'
+)
+@_queue_path_option
+def queue_status(run_id, queue_path):
+    """Tampilkan progress run di job queue."""
+    from src.services.job_queue import JobQueue
+
+    with JobQueue(queue_path) as queue:
+        run_id = run_id or queue.latest_run()
+        if run_id is None:
+            console.print("[bold yellow]No unfinished run in queue[/bold yellow]")
+            return
+        counts = queue.counts(run_id)
+
+    console.print(
+        f"[bold cyan]Run {run_id}:[/bold cyan] "
+        + ", ".join(f"{count} {status}" for status, count in counts.items())
+    )
+
+
+@cli.group(name='news')
+def news_group():
+    """Tools untuk berita dan corporate action."""
 
 
-@click.group(invoke_without_command=True)
-@click.version_option(version=__version__, prog_name='Friday Screener')
-@click.pass_context
-def cli(ctx):
+@news_group.command(name='classify')
+@click.argument('headline_file', type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    '--output',
+    '-o',
+    type=click.File('w', encoding='utf-8'),
+    default='-',
+    help='File output JSONL (default: stdout)',
+)
+@click.option(
+    '--chunk-size',
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Jumlah headline per chunk',
+)
+@click.option(
+    '--workers',
+    '-w',
+    default=0,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help='Jumlah worker process (0 = tanpa process pool)',
+)
+def news_classify(headline_file, output, chunk_size, workers):
     """
-    Friday Screener - Stock Screening Tool for Indonesian Market.
+    Classify sentiment dan corporate action untuk corpus headline.
 
-    Professional-grade stock screening tool untuk analisis fundamental
-    emiten saham di Bursa Efek Indonesia.
+    HEADLINE_FILE: File .jsonl/.ndjson (field title, summary), .csv
+    (kolom title, summary), atau plain text (satu headline per baris)
+
+    Hasil ditulis sebagai JSONL, satu record per headline, sesuai urutan input.
+
+    Contoh penggunaan:
+
+        friday-screener news classify archive.jsonl -o labeled.jsonl
+
+        friday-screener news classify headlines.txt --workers 4
     """
-    if ctx.invoked_subcommand is None:
-        # Jika tidak ada subcommand, jalankan interactive mode
-        ctx.invoke(interactive)
+    from src.services.news_classifier import (
+        ClassificationStats,
+        classify_headlines,
+        read_headlines,
+    )
+
+    stats = ClassificationStats()
+    for record in classify_headlines(
+        read_headlines(headline_file),
+        chunk_size=chunk_size,
+        workers=workers,
+        stats=stats,
+    ):
+        output.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+    err_console.print(
+        f"[dim]Classified {stats.items} headlines in {stats.elapsed:.2f}s "
+        f"({stats.items_per_second:,.0f} items/s)[/dim]"
+    )
 
 
-@cli.command()
-@click.argument('ticker')
+def _parse_date_option(ctx, param, value):
+    """Click callback: tanggal ISO atau durasi relatif (30d, 12h)."""
+    if value is None:
+        return None
+    try:
+        parsed = parse_date_or_duration(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+    # --until 2024-03-31 berarti sampai akhir hari tersebut
+    if param.name == 'until' and len(value) == 10 and parsed.time() == parsed.min.time():
+        parsed += timedelta(days=1) - timedelta(microseconds=1)
+    return parsed
+
+
+@news_group.command(name='search')
+@click.argument('phrases', nargs=-1, required=True)
 @click.option(
-    '--detailed',
-    '-d',
-    is_flag=True,
-    help='Show detailed analysis including all insights',
+    '--since',
+    callback=_parse_date_option,
+    help='Tanggal awal (YYYY-MM-DD) atau durasi ke belakang (misalnya 90d)',
 )
 @click.option(
-    '--news/--no-news',
-    default=True,
-    help='Include news and corporate actions (default: yes)',
+    '--until',
+    callback=_parse_date_option,
+    help='Tanggal akhir (YYYY-MM-DD) atau durasi ke belakang',
+)
+@click.option(
+    '--ticker',
+    '-t',
+    'tickers',
+    multiple=True,
+    help='Batasi ke ticker tertentu (bisa diulang)',
+)
+@click.option(
+    '--limit',
+    default=50,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Maximum jumlah hasil',
 )
-def screen(ticker: str, detailed: bool, news: bool):
+def news_search(phrases, since, until, tickers, limit):
     """
-    Screen a stock ticker untuk analisis fundamental.
+    Full-text search berita yang tersimpan di news store.
 
-    TICKER: Kode emiten saham (contoh: BBCA, TLKM, ASII)
+    PHRASES: Satu atau lebih phrase (digabung dengan OR). Kata dalam satu
+    phrase harus muncul berurutan di judul atau summary.
 
-    Contoh penggunaan:
+    Berita masuk ke store saat screen dijalankan dengan --news --news-store.
 
-        friday-screener screen BBCA
+    Contoh penggunaan:
 
-        friday-screener screen TLKM --detailed
+        friday-screener news search "rights issue" --since 2023-01-01
 
-        friday-screener screen ASII --no-news
+        friday-screener news search "stock split" "pemecahan saham" -t BBCA --since 90d
     """
-    console.print(f"\n[bold cyan]Screening {ticker.upper()}...[/bold cyan]\n")
+    from src.services.news_store import NewsStore
+
+    with NewsStore() as store:
+        start = time.perf_counter()
+        results = store.search(
+            phrases,
+            since=since,
+            until=until,
+            tickers=[normalize_ticker(ticker) for ticker in tickers],
+            limit=limit,
+        )
+        elapsed = time.perf_counter() - start
 
-    # Initialize services
-    finance_service = YahooFinanceService()
-    news_service = NewsScraperService(max_news=10)
-    analyzer = FundamentalAnalyzer()
+    if not results:
+        console.print("[yellow]No matching news found[/yellow]")
+    else:
+        table = Table(title=f"News matching {' OR '.join(repr(p) for p in phrases)}")
+        table.add_column("Date", style="dim", no_wrap=True)
+        table.add_column("Ticker", style="cyan", no_wrap=True)
+        table.add_column("Title", style="white")
+        table.add_column("Source", style="dim")
+
+        for ticker, item in results:
+            table.add_row(
+                item.published_date.strftime('%Y-%m-%d') if item.published_date else '-',
+                get_ticker_without_suffix(ticker),
+                item.title,
+                item.source,
+            )
+        console.print(table)
 
-    # Step 1: Fetch stock data
-    with console.status(f"[bold green]Fetching data for {ticker}..."):
-        stock_data = finance_service.get_stock_data(ticker)
+    err_console.print(
+        f"[dim]{len(results)} result(s) in {elapsed * 1000:.1f} ms[/dim]"
+    )
 
-    if stock_data is None:
-        console.print(
-            f"[bold red]Error:[/bold red] Could not fetch data for {ticker}. "
-            "Please check the ticker symbol."
-        )
-        return
 
-    # Step 2: Fetch news if requested
-    news_items = []
-    corporate_actions = []
-    if news:
-        with console.status("[bold green]Fetching news and corporate actions..."):
-            news_items = news_service.get_news(ticker)
-            corporate_actions = news_service.get_corporate_actions(ticker)
+@news_group.command(name='calendar')
+@click.option(
+    '--from',
+    'start',
+    callback=_parse_date_option,
+    help='Tanggal awal (YYYY-MM-DD) atau durasi ke belakang (default: hari ini)',
+)
+@click.option(
+    '--days',
+    default=7,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Panjang periode dalam hari',
+)
+@click.option(
+    '--type',
+    'action_types',
+    multiple=True,
+    type=click.Choice(CORPORATE_ACTION_TYPES),
+    help='Filter tipe corporate action (bisa diulang)',
+)
+@click.option(
+    '--ticker',
+    '-t',
+    'tickers',
+    multiple=True,
+    help='Batasi ke ticker tertentu (bisa diulang)',
+)
+def news_calendar(start, days, action_types, tickers):
+    """
+    Calendar corporate action dari berita yang tersimpan di news store.
 
-        # Add to stock data
-        stock_data.news = news_items
-        stock_data.corporate_actions = corporate_actions
+    Event diurutkan berdasarkan tanggal event (ex/cum date, tanggal efektif,
+    atau tanggal pengumuman jika tidak ada tanggal di berita).
 
-    # Step 3: Analyze
-    with console.status("[bold green]Analyzing fundamental metrics..."):
-        result = analyzer.analyze(stock_data)
+    Contoh penggunaan:
 
-    # Display results
-    _display_company_info(stock_data)
-    _display_screening_summary(result)
-    _display_category_scores(result)
+        friday-screener news calendar --type dividend
 
-    if detailed:
-        _display_key_metrics(result)
-        _display_insights(result)
+        friday-screener news calendar --from 2024-03-01 --days 30 -t BBCA
+    """
+    if start is None:
+        start = datetime.combine(date.today(), datetime.min.time())
+    until = start + timedelta(days=days) - timedelta(microseconds=1)
+
+    from src.services.news_store import NewsStore
+
+    with NewsStore() as store:
+        events = store.corporate_actions(
+            since=start,
+            until=until,
+            action_types=action_types,
+            tickers=[normalize_ticker(ticker) for ticker in tickers],
+        )
 
-    if news:
-        _display_news_summary(news_items, corporate_actions, news_service)
+    period = f"{start:%Y-%m-%d} - {until:%Y-%m-%d}"
+    if not events:
+        console.print(f"[yellow]No corporate actions found ({period})[/yellow]")
+        return
 
-    _display_recommendation(result)
+    table = Table(title=f"Corporate Action Calendar ({period})")
+    table.add_column("Date", style="cyan", no_wrap=True)
+    table.add_column("Ticker", style="bold", no_wrap=True)
+    table.add_column("Type", style="magenta")
+    table.add_column("Detail", justify="right")
+    table.add_column("Title", style="white")
+
+    for event in events:
+        detail = []
+        if event.ratio:
+            detail.append(event.ratio)
+        if event.amount is not None:
+            detail.append(format_currency(event.amount))
+        table.add_row(
+            event.event_date.strftime('%Y-%m-%d'),
+            get_ticker_without_suffix(event.ticker),
+            _format_action_type(event.action_type),
+            ' '.join(detail) or '-',
+            event.title,
+        )
+    console.print(table)
 
 
 @cli.command()
-@click.argument('tickers', nargs=-1, required=True)
-def compare(tickers):
+@click.option(
+    '--socket',
+    'socket_path',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Path Unix socket (default: <data dir>/screener.sock)',
+)
+@click.option(
+    '--news-store/--no-news-store',
+    default=True,
+    help='Simpan berita di NewsStore (default: yes)',
+)
+@click.option(
+    '--ttl',
+    default='15m',
+    show_default=True,
+    callback=_parse_duration_option,
+    help='Umur data ticker sebelum di-fetch ulang (30s, 15m, 1h)',
+)
+@click.option('--status', is_flag=True, help='Cek apakah daemon berjalan')
+@click.option('--stop', is_flag=True, help='Hentikan daemon yang berjalan')
+def serve(socket_path, news_store, ttl, status, stop):
     """
-    Compare multiple stocks side by side.
+    Jalankan screener daemon di Unix domain socket.
 
-    TICKERS: Dua atau lebih kode emiten (contoh: BBCA BMRI BBNI)
+    Daemon memegang service, cache dan koneksi yang warm. Selama daemon
+    berjalan, `screen` dan `compare` otomatis dijalankan oleh daemon
+    (satu round trip socket) dan fallback ke eksekusi in-process jika tidak.
 
     Contoh penggunaan:
 
-        friday-screener compare BBCA BMRI BBNI
+        friday-screener serve
+
+        friday-screener serve --ttl 5m
+
+        friday-screener serve --status
+
+        friday-screener serve --stop
     """
-    if len(tickers) < 2:
+    from src.server.client import ping, shutdown
+
+    socket_path = socket_path or get_socket_path()
+
+    if status or stop:
+        info = ping(socket_path)
+        if info is None:
+            console.print(
+                f"[yellow]No screener daemon running at {socket_path}[/yellow]"
+            )
+            return
+        if stop:
+            shutdown(socket_path)
+            console.print(f"[green]Stopped screener daemon (pid {info['pid']})[/green]")
+        else:
+            console.print(
+                f"[green]Screener daemon running[/green] (pid {info['pid']}, "
+                f"version {info['version']}) at {info['socket']}"
+            )
+        return
+
+    import signal
+    import socket
+
+    if not hasattr(socket, 'AF_UNIX'):
         console.print(
-            "[bold red]Error:[/bold red] Please provide at least 2 tickers to compare"
+            "[bold red]Error:[/bold red] Unix domain sockets are not supported "
+            "on this platform"
         )
         return
 
+    from src.cli.context import ServiceContext
+    from src.server.daemon import DaemonAlreadyRunning, ScreenerDaemon
+
+    services = ServiceContext(news_store=news_store)
+    try:
+        server = ScreenerDaemon(socket_path, services, ttl=ttl.total_seconds())
+    except (DaemonAlreadyRunning, OSError) as e:
+        services.close()
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return
+
+    # SIGTERM diperlakukan seperti Ctrl+C supaya socket file dibersihkan
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
     console.print(
-        f"\n[bold cyan]Comparing {len(tickers)} stocks...[/bold cyan]\n"
+        f"[bold cyan]Screener daemon listening on {server.socket_path}[/bold cyan] "
+        "[dim](Ctrl+C untuk berhenti)[/dim]"
     )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    console.print("[bold cyan]Screener daemon stopped[/bold cyan]")
 
-    # Initialize services
-    finance_service = YahooFinanceService()
-    analyzer = FundamentalAnalyzer()
 
-    results = []
+@cli.command()
+@click.option('--host', default='127.0.0.1', show_default=True, help='Alamat bind')
+@click.option('--port', '-p', default=8765, show_default=True, help='Port HTTP')
+@click.option(
+    '--workers',
+    '-w',
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Jumlah fetch paralel ke Yahoo Finance',
+)
+@click.option(
+    '--ttl',
+    default='15m',
+    show_default=True,
+    callback=_parse_duration_option,
+    help='Umur data ticker sebelum di-fetch ulang (30s, 15m, 1h)',
+)
+@click.option(
+    '--news-store/--no-news-store',
+    default=True,
+    help='Simpan berita di NewsStore (default: yes)',
+)
+def api(host, port, workers, ttl, news_store):
+    """
+    Jalankan HTTP/JSON API untuk screening.
+
+    Endpoint: /screen/<ticker>, /compare?tickers=..., /batch (GET atau POST
+    JSON, hasil di-stream), /news/<ticker> dan /health.
+
+    Contoh penggunaan:
+
+        friday-screener api --port 8765
+
+        curl localhost:8765/screen/BBCA
+
+        curl 'localhost:8765/batch?tickers=BBCA,BMRI,TLKM&top=2'
+    """
+    import asyncio
+
+    from src.cli.context import ServiceContext
+    from src.server.http_api import ScreeningAPI, start_server
+
+    async def run():
+        with ServiceContext(news_store=news_store, workers=workers) as services:
+            server = await start_server(
+                ScreeningAPI(services, ttl=ttl.total_seconds()), host, port
+            )
+            address = server.sockets[0].getsockname()
+            console.print(
+                f"[bold cyan]Screening API listening on "
+                f"http://{address[0]}:{address[1]}[/bold cyan] "
+                "[dim](Ctrl+C untuk berhenti)[/dim]"
+            )
+            async with server:
+                await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except OSError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+    except KeyboardInterrupt:
+        console.print("[bold cyan]Screening API stopped[/bold cyan]")
+
 
-    # Fetch and analyze each stock
+def _format_action_type(action_type: str) -> str:
+    """'rights_issue' -> 'Rights Issue'."""
+    return action_type.replace('_', ' ').title()
+
+
+def _fetch_universe(tickers, finance_service):
+    """Fetch StockData untuk setiap ticker, skip yang gagal."""
+    stocks_data = []
     for ticker in tickers:
-        with console.status(f"[bold green]Processing {ticker}..."):
+        with console.status(f"[bold green]Fetching {ticker}..."):
             stock_data = finance_service.get_stock_data(ticker)
 
-            if stock_data is None:
-                console.print(
-                    f"[bold yellow]Warning:[/bold yellow] Could not fetch data for {ticker}, skipping..."
-                )
-                continue
+        if stock_data is None:
+            console.print(
+                f"[bold yellow]Warning:[/bold yellow] Could not fetch data for {ticker}, skipping..."
+            )
+            continue
+        stocks_data.append(stock_data)
 
-            result = analyzer.analyze(stock_data)
-            results.append((stock_data, result))
+    return stocks_data
+
+
+def _fetch_result(future, ticker: str):
+    """StockData dari fetch future; None jika fetch gagal."""
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error(f"Error fetching data for {ticker}: {e}")
+        return None
 
-    if not results:
-        console.print("[bold red]Error:[/bold red] No valid stocks to compare")
-        return
 
-    # Display comparison table
-    _display_comparison_table(results)
+def _shared_services() -> Optional['ServiceContext']:
+    """ServiceContext milik session yang sedang berjalan (interactive mode)."""
+    ctx = click.get_current_context(silent=True)
+    # Tanpa session module context belum pernah di-import (startup CLI)
+    context = sys.modules.get('src.cli.context')
+    if ctx is None or context is None:
+        return None
+    return ctx.find_object(context.ServiceContext)
+
+
+def _forward_to_daemon(command: str) -> bool:
+    """
+    Jalankan command di screener daemon jika sedang berjalan.
+
+    Tidak dipakai di dalam session yang sudah punya ServiceContext
+    (interactive mode dan daemon itu sendiri).
+
+    Args:
+        command: Nama command yang sedang berjalan
+
+    Returns:
+        True jika daemon sudah menjalankan command dan output sudah dicetak
+    """
+    if _shared_services() is not None:
+        return False
+
+    from src.server.client import run_remote
+
+    remote = run_remote(
+        command,
+        click.get_current_context().params,
+        width=console.width,
+        color_system=console.color_system,
+        terminal=console.is_terminal,
+    )
+    if remote is None:
+        return False
+    err_console.file.write(remote.errors)
+    err_console.file.flush()
+    console.file.write(remote.output)
+    console.file.flush()
+    return True
+
+
+@contextmanager
+def use_console(output: Console, errors: Optional[Console] = None):
+    """
+    Arahkan output command di thread ini ke console lain selama context aktif.
+
+    Dipakai daemon untuk me-render output command ke buffer per request;
+    command lain yang berjalan bersamaan di thread lain tidak terpengaruh.
+
+    Args:
+        output: Console pengganti `console` (stdout)
+        errors: Console pengganti `err_console` (default: output)
+    """
+    previous = (
+        getattr(_thread_consoles, 'output', None),
+        getattr(_thread_consoles, 'errors', None),
+    )
+    _thread_consoles.output, _thread_consoles.errors = output, errors or output
+    try:
+        yield output
+    finally:
+        _thread_consoles.output, _thread_consoles.errors = previous
+
+
+def _build_score_cache(enabled: bool):
+    """Build disk-backed ScoreCache jika diaktifkan."""
+    if not enabled:
+        return None
+    from src.analyzers.score_cache import ScoreCache
+
+    return ScoreCache(get_data_dir() / 'scores')
 
 
 def _display_company_info(stock_data):
@@ -322,17 +1886,20 @@ def _display_insights(result):
         console.print()
 
 
-def _display_news_summary(news_items, corporate_actions, news_service):
+def _display_news_summary(
+    news_items, corporate_actions, news_service, sentiment_trend=None
+):
     """Display news and corporate actions summary."""
     if corporate_actions:
         console.print("[bold]Recent Corporate Actions:[/bold]")
         for action in corporate_actions[:5]:
             date_str = (
-                action.published_date.strftime('%Y-%m-%d')
-                if action.published_date
-                else 'N/A'
+                action.event_date.strftime('%Y-%m-%d') if action.event_date else 'N/A'
+            )
+            console.print(
+                f"  [{date_str}] [cyan]{_format_action_type(action.action_type)}"
+                f"[/cyan] {action.title}"
             )
-            console.print(f"  [{date_str}] {action.title}")
         console.print()
 
     if news_items:
@@ -351,6 +1918,8 @@ def _display_news_summary(news_items, corporate_actions, news_service):
             f"{analysis['overall_sentiment'].upper()}"
             f"[/{_get_sentiment_color(analysis['overall_sentiment'])}]"
         )
+        if sentiment_trend:
+            console.print(f"  Sentiment Trend: {_format_sentiment_trend(sentiment_trend)}")
 
         # Display individual news items dengan detail
         console.print("\n[bold]Recent News:[/bold]")
@@ -397,6 +1966,22 @@ def _display_recommendation(result):
 
 def _display_comparison_table(results):
     """Display comparison table for multiple stocks."""
+    console.print(_comparison_table([result for _, result in results]))
+
+
+def _comparison_table(results, pending=(), failed=(), elapsed=0.0):
+    """
+    Build comparison table, diurutkan berdasarkan total score.
+
+    Args:
+        results: List ScreeningResult
+        pending: Ticker yang masih di-fetch (ditampilkan setelah hasil)
+        failed: Ticker yang gagal di-fetch
+        elapsed: Detik sejak fetch dimulai (untuk menandai fetch lambat)
+
+    Returns:
+        Rich Table
+    """
     table = Table(title="Stock Comparison", show_header=True)
 
     table.add_column("Ticker", style="cyan", no_wrap=True)
@@ -409,9 +1994,10 @@ def _display_comparison_table(results):
     table.add_column("D/E", justify="right")
     table.add_column("Div Yield", justify="right")
 
-    for stock_data, result in results:
-        ticker = get_ticker_without_suffix(stock_data.get_ticker())
-        company = stock_data.company_info.name[:20]  # Truncate long names
+    ranked = sorted(results, key=lambda r: r.metrics.total_score, reverse=True)
+    for result in ranked:
+        ticker = get_ticker_without_suffix(result.ticker)
+        company = result.company_name[:20]  # Truncate long names
         rating_str = str(result.rating).split()[0]  # Get first word
 
         # Get metrics
@@ -434,7 +2020,201 @@ def _display_comparison_table(results):
             ticker, company, rating_str, score_str, pe, pbv, roe, de, div_yield
         )
 
+    if elapsed >= SLOW_FETCH_SECONDS:
+        waiting = f"[yellow]slow ({elapsed:.0f}s)...[/yellow]"
+    else:
+        waiting = "[dim]fetching...[/dim]"
+    for ticker in pending:
+        table.add_row(get_ticker_without_suffix(normalize_ticker(ticker)), waiting)
+    for ticker in failed:
+        table.add_row(
+            get_ticker_without_suffix(normalize_ticker(ticker)),
+            "[red]fetch failed[/red]",
+        )
+
+    return table
+
+
+_WATCH_STYLES = {
+    'new': 'cyan',
+    'rating': 'bold magenta',
+    'score': 'yellow',
+    'red_flag': 'red',
+    'corporate_action': 'green',
+    'failed': 'dim red',
+}
+
+
+def _display_watch_change(change):
+    """Display satu perubahan watch dengan timestamp."""
+    style = _WATCH_STYLES.get(change.kind, 'white')
+    console.print(
+        f"[dim]{datetime.now():%Y-%m-%d %H:%M:%S}[/dim] "
+        f"[bold]{get_ticker_without_suffix(change.ticker):<6}[/bold] "
+        f"[{style}]{escape(change.message)}[/{style}]"
+    )
+
+
+def _format_duration(value: timedelta) -> str:
+    """timedelta -> '5m', '1h30m', '45s'."""
+    seconds = int(value.total_seconds())
+    parts = []
+    for unit, size in (('d', 86400), ('h', 3600), ('m', 60), ('s', 1)):
+        amount, seconds = divmod(seconds, size)
+        if amount:
+            parts.append(f"{amount}{unit}")
+    return ''.join(parts) or '0s'
+
+
+def _display_prefilter_report(report, prefilter):
+    """Display jumlah ticker yang dipangkas di setiap tahap."""
+    table = Table(title="Screening Funnel", show_header=True)
+    table.add_column("Stage", style="cyan")
+    table.add_column("Rule", style="dim")
+    table.add_column("Pruned", justify="right")
+
+    rules = {rule.name: rule.describe() for rule in prefilter.rules}
+    for stage, count in report.stages():
+        rule_name = stage.split(': ', 1)[-1]
+        table.add_row(stage, rules.get(rule_name, ""), str(count))
+
+    table.add_row("[bold]Analyzed[/bold]", "", f"[bold]{report.analyzed}[/bold]")
+
+    console.print(table)
+    console.print(
+        f"[dim]{report.total} tickers → {report.survivors} passed pre-filter → "
+        f"{report.analyzed} analyzed[/dim]"
+    )
+    console.print()
+
+
+def _display_pipeline_stats(stats, output=None):
+    """Display throughput, utilization dan kedalaman queue per stage."""
+    table = Table(title="Pipeline Stages", show_header=True)
+    table.add_column("Stage", style="cyan")
+    table.add_column("Workers", justify="right")
+    table.add_column("Items", justify="right")
+    table.add_column("Items/s", justify="right")
+    table.add_column("Busy", justify="right")
+    table.add_column("Queue (peak/size)", justify="right")
+
+    for stage in stats:
+        table.add_row(
+            stage.name,
+            str(stage.workers),
+            str(stage.processed),
+            f"{stage.throughput:.1f}",
+            f"{stage.utilization * 100:.0f}%",
+            f"{stage.peak_depth}/{stage.queue_size}",
+        )
+
+    (output or console).print(table)
+
+
+def _display_sweep_result(result, top, max_variants=25):
+    """Display rank stability per variant dan per ticker."""
+    table = Table(title=f"Sweep: Rank Stability vs Baseline (top {top})")
+    table.add_column("Variant", style="cyan")
+    table.add_column("Spearman", justify="right")
+    table.add_column("Top-N Overlap", justify="right")
+    table.add_column("Top 3", style="white")
+
+    stability = result.rank_stability(top)
+    for row in stability[:max_variants]:
+        table.add_row(
+            row['variant'],
+            f"{row['spearman']:.3f}",
+            f"{row['top_overlap'] * 100:.0f}%",
+            ", ".join(get_ticker_without_suffix(t) for t in row['top'][:3]),
+        )
+
+    console.print(table)
+    if len(stability) > max_variants:
+        console.print(f"[dim]... {len(stability) - max_variants} more variants[/dim]")
+    console.print()
+
+    table = Table(title="Ticker Rank Distribution Across Variants")
+    table.add_column("Ticker", style="cyan")
+    table.add_column("Mean Rank", justify="right")
+    table.add_column("Std", justify="right")
+    table.add_column("Best/Worst", justify="right")
+    table.add_column(f"In Top {top}", justify="right")
+
+    for row in result.ticker_stability(top)[:top]:
+        table.add_row(
+            get_ticker_without_suffix(row['ticker']),
+            f"{row['mean_rank']:.1f}",
+            f"{row['std_rank']:.2f}",
+            f"{row['best_rank']}/{row['worst_rank']}",
+            f"{row['top_frequency'] * 100:.0f}%",
+        )
+
+    console.print(table)
+    console.print()
+
+
+def _display_robustness_result(result, samples):
+    """Display distribusi rank dan probabilitas top-N per ticker."""
+    table = Table(
+        title=f"Rank Robustness ({samples} weight samples, top {result.top_n})"
+    )
+    table.add_column("Ticker", style="cyan")
+    table.add_column("Base Rank", justify="right")
+    table.add_column("Mean Rank", justify="right")
+    table.add_column("Rank 5-95%", justify="right")
+    table.add_column(f"P(Top {result.top_n})", justify="right")
+
+    for row in result.ticker_summary():
+        probability = row['top_probability']
+        if probability == 0 and row['base_rank'] > result.top_n:
+            continue
+
+        if probability >= 0.9:
+            color = "green"
+        elif probability >= 0.5:
+            color = "yellow"
+        else:
+            color = "red"
+
+        table.add_row(
+            get_ticker_without_suffix(row['ticker']),
+            str(row['base_rank']),
+            f"{row['mean_rank']:.1f}",
+            f"{row['p5_rank']:.0f}-{row['p95_rank']:.0f}",
+            f"[{color}]{probability * 100:.1f}%[/{color}]",
+        )
+
     console.print(table)
+    console.print()
+
+
+def _display_cache_stats(cache):
+    """Display score cache hit rate."""
+    if cache is None:
+        return
+
+    lookups = cache.hits + cache.misses
+    console.print(
+        f"[dim]Score cache: {cache.hits}/{lookups} hits "
+        f"({cache.hit_rate * 100:.0f}% hit rate)[/dim]"
+    )
+
+
+def _format_sentiment_trend(sentiment_trend):
+    """Format rolling sentiment: '7d +0.50 (4) | 30d ...'."""
+    parts = []
+    for window in sentiment_trend:
+        if window.count:
+            color = _get_sentiment_color(
+                'positive'
+                if window.score > 0
+                else 'negative' if window.score < 0 else 'neutral'
+            )
+            value = f"[{color}]{window.average_score:+.2f}[/{color}] ({window.count})"
+        else:
+            value = "[dim]-[/dim]"
+        parts.append(f"{window.days}d {value}")
+    return ' | '.join(parts)
 
 
 def _get_sentiment_color(sentiment: str) -> str:
@@ -452,7 +2232,9 @@ def interactive():
     """
     Interactive mode - prompt user untuk input.
 
-    Mode ini akan memandu user step-by-step untuk screening saham.
+    Mode ini akan memandu user step-by-step untuk screening saham. Service,
+    cache, NewsStore dan koneksi HTTP dipakai bersama selama session, dan
+    data mulai di-fetch di background begitu ticker dimasukkan.
     """
     # Welcome banner
     console.print()
@@ -466,6 +2248,14 @@ def interactive():
     )
     console.print()
 
+    from src.cli.context import ServiceContext
+
+    # Service, cache dan koneksi dipakai ulang di semua iterasi
+    ctx = click.get_current_context()
+    services = ServiceContext()
+    ctx.obj = services
+    ctx.call_on_close(services.close)
+
     while True:
         # Ask mode
         console.print("[bold]Pilih Mode:[/bold]")
@@ -515,6 +2305,11 @@ def _interactive_single_screen():
         console.print("[red]Ticker tidak boleh kosong![/red]")
         return
 
+    # Mulai fetch di background selagi user menjawab pertanyaan berikutnya
+    services = _shared_services()
+    if services is not None:
+        services.prefetch(ticker)
+
     # Options with colored prompts
     console.print()
     detailed_input = console.input("[bold yellow]Tampilkan detailed analysis?[/bold yellow] [dim](y/N)[/dim]: ").strip().lower()
@@ -550,6 +2345,13 @@ def _interactive_compare():
         console.print("[red]Error: Minimal 2 ticker untuk comparison[/red]")
         return
 
+    services = _shared_services()
+    if services is not None:
+        from src.services.scheduler import WATCHLIST
+
+        for ticker in tickers:
+            services.prefetch(ticker, news=False, priority=WATCHLIST)
+
     console.print()
 
     # Call compare function with context
@@ -0,0 +1,274 @@
+"""
+Service context yang dipakai bersama oleh beberapa command dalam satu session.
+
+Dalam interactive mode setiap iterasi memanggil command screen/compare.
+ServiceContext memegang service yang berumur panjang (YahooFinanceService
+dengan cache-nya, FundamentalAnalyzer dengan ScoreCache, NewsScraperService
+dengan NewsStore, dan requests.Session untuk sumber berita HTTP) sehingga
+lookup berulang dalam satu session tidak fetch ulang.
+
+Fetch dimulai di background lewat prefetch() segera setelah ticker
+diketahui. Semua fetch lewat FetchScheduler dengan kelas prioritas, sehingga
+lookup interactive tidak antri di belakang refresh background. Semua operasi
+berita berjalan di satu worker thread khusus karena koneksi SQLite NewsStore
+hanya boleh dipakai oleh thread yang membuatnya.
+"""
+
+from concurrent.futures import Future
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+from src.analyzers.score_cache import ScoreCache
+from src.analyzers.sector_stats import SectorStatistics
+from src.models.stock_data import (
+    CorporateAction,
+    NewsItem,
+    SentimentWindow,
+    StockData,
+)
+from src.services.news_scraper_service import NewsScraperService
+from src.services.news_sources import DEFAULT_NEWS_SOURCES, build_sources
+from src.services.news_store import NewsStore
+from src.services.scheduler import INTERACTIVE, ClassStats, FetchScheduler
+from src.services.yahoo_finance_service import YahooFinanceService
+from src.utils.helpers import normalize_ticker
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Jumlah hasil analisis yang disimpan di ScoreCache memory
+SCORE_CACHE_SIZE = 1024
+
+
+class NewsBundle(NamedTuple):
+    """Berita, corporate actions dan sentiment trend untuk satu ticker."""
+
+    news: List[NewsItem]
+    corporate_actions: List[CorporateAction]
+    sentiment_trend: List[SentimentWindow]
+
+
+class ServiceContext:
+    """Service berumur panjang dengan prefetch di background."""
+
+    def __init__(
+        self,
+        news_store: bool = True,
+        news_sources: Iterable[str] = DEFAULT_NEWS_SOURCES,
+        max_news: int = 10,
+        workers: int = 4,
+        sector_stats: Optional[SectorStatistics] = None,
+    ):
+        """
+        Initialize context (service berita dibuat lazy di news thread).
+
+        Args:
+            news_store: Simpan berita di NewsStore (default: <data dir>/news.db)
+            news_sources: Nama sumber berita
+            max_news: Maximum berita per ticker
+            workers: Jumlah thread untuk prefetch data saham
+            sector_stats: Statistik sektor untuk sector-relative scoring;
+                setiap fetch (termasuk refetch setelah invalidate) meng-update
+                emiten tersebut secara incremental
+        """
+        import requests
+
+        self.session = requests.Session()
+        self.finance_service = YahooFinanceService()
+        self.score_cache = ScoreCache(max_entries=SCORE_CACHE_SIZE)
+        self.analyzer = FundamentalAnalyzer(
+            cache=self.score_cache, sector_stats=sector_stats
+        )
+
+        self._news_store = news_store
+        self._news_sources = tuple(news_sources)
+        self._max_news = max_news
+        self._news_service: Optional[NewsScraperService] = None
+
+        self._stock_scheduler = FetchScheduler(
+            workers=workers, thread_name_prefix='prefetch'
+        )
+        self._news_scheduler = FetchScheduler(workers=1, thread_name_prefix='news')
+        self._stock_futures: Dict[str, Future] = {}
+        self._news_futures: Dict[str, Future] = {}
+        # ticker -> waktu (monotonic) fetch pertama sejak invalidate terakhir
+        self._fetched_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    def __enter__(self) -> 'ServiceContext':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def news_sources(self) -> Tuple[str, ...]:
+        """Nama sumber berita yang dipakai news service."""
+        return self._news_sources
+
+    @property
+    def news_store(self) -> bool:
+        """Apakah berita disimpan di NewsStore."""
+        return self._news_store
+
+    @property
+    def news_service(self) -> NewsScraperService:
+        """NewsScraperService session (dibuat di news thread jika belum ada)."""
+        if self._news_service is None:
+            self._news_scheduler.submit(
+                INTERACTIVE, self._get_news_service
+            ).result()
+        return self._news_service
+
+    def _get_news_service(self) -> NewsScraperService:
+        """Buat NewsScraperService (harus dipanggil di news thread)."""
+        if self._news_service is None:
+            self._news_service = NewsScraperService(
+                max_news=self._max_news,
+                store=NewsStore() if self._news_store else None,
+                sources=build_sources(self._news_sources, session=self.session),
+            )
+        return self._news_service
+
+    def prefetch(
+        self, ticker: str, news: bool = True, priority: str = INTERACTIVE
+    ) -> None:
+        """
+        Mulai fetch data saham (dan berita) di background.
+
+        Args:
+            ticker: Stock ticker symbol
+            news: Juga prefetch berita, corporate actions dan sentiment trend
+            priority: Kelas prioritas fetch (lihat src.services.scheduler)
+        """
+        self.stock_future(ticker, priority)
+        if news:
+            self.news_future(ticker, priority)
+
+    def get_stock_data(self, ticker: str) -> Optional[StockData]:
+        """
+        Get StockData, menunggu prefetch jika sedang berjalan.
+
+        Fetch yang gagal tidak di-cache sehingga bisa dicoba ulang.
+        """
+        key = normalize_ticker(ticker)
+        stock_data = self.stock_future(key).result()
+        if stock_data is None:
+            with self._lock:
+                self._stock_futures.pop(key, None)
+        return stock_data
+
+    def get_news(self, ticker: str) -> NewsBundle:
+        """Get berita, corporate actions dan sentiment trend (lihat prefetch)."""
+        key = normalize_ticker(ticker)
+        try:
+            return self.news_future(key).result()
+        except Exception:
+            with self._lock:
+                self._news_futures.pop(key, None)
+            raise
+
+    def stock_future(self, ticker: str, priority: str = INTERACTIVE) -> Future:
+        """
+        Future StockData untuk ticker (fetch dimulai jika belum ada).
+
+        Request bersamaan untuk ticker yang sama berbagi satu fetch. Fetch
+        yang masih di antrian dinaikkan ke priority jika lebih tinggi.
+        """
+        key = normalize_ticker(ticker)
+        with self._lock:
+            future = self._stock_futures.get(key)
+            if future is None:
+                future = self._stock_scheduler.submit(
+                    priority, self._fetch_stock, key
+                )
+                self._stock_futures[key] = future
+                self._fetched_at.setdefault(key, time.monotonic())
+            else:
+                self._stock_scheduler.promote(future, priority)
+            return future
+
+    def _fetch_stock(self, ticker: str) -> Optional[StockData]:
+        """Fetch StockData dan refresh emiten di statistik sektor analyzer."""
+        stock_data = self.finance_service.get_stock_data(ticker)
+        sector_stats = self.analyzer.sector_stats
+        if stock_data is not None and sector_stats is not None:
+            with self._stats_lock:
+                sector_stats.update(stock_data)
+        return stock_data
+
+    def news_future(self, ticker: str, priority: str = INTERACTIVE) -> Future:
+        """Future NewsBundle untuk ticker (lihat stock_future)."""
+        key = normalize_ticker(ticker)
+        with self._lock:
+            future = self._news_futures.get(key)
+            if future is None:
+                future = self._news_scheduler.submit(priority, self._fetch_news, key)
+                self._news_futures[key] = future
+                self._fetched_at.setdefault(key, time.monotonic())
+            else:
+                self._news_scheduler.promote(future, priority)
+            return future
+
+    def scheduler_stats(self) -> Dict[str, Dict[str, ClassStats]]:
+        """Antrian fetch per kelas prioritas: {'stock': ..., 'news': ...}."""
+        return {
+            'stock': self._stock_scheduler.stats(),
+            'news': self._news_scheduler.stats(),
+        }
+
+    def invalidate(self, ticker: str) -> None:
+        """Buang data ticker yang sudah di-fetch (lookup berikutnya fetch ulang)."""
+        key = normalize_ticker(ticker)
+        with self._lock:
+            self._stock_futures.pop(key, None)
+            self._news_futures.pop(key, None)
+            self._fetched_at.pop(key, None)
+        self.finance_service.cache.pop(key, None)
+
+    def expire(self, ticker: str, ttl: float) -> bool:
+        """
+        Invalidate data ticker yang di-fetch lebih dari ttl detik lalu.
+
+        Args:
+            ticker: Stock ticker symbol
+            ttl: Umur maksimum data dalam detik
+
+        Returns:
+            True jika data ticker dibuang (lookup berikutnya fetch ulang)
+        """
+        key = normalize_ticker(ticker)
+        with self._lock:
+            fetched_at = self._fetched_at.get(key)
+        if fetched_at is None or time.monotonic() - fetched_at <= ttl:
+            return False
+        self.invalidate(key)
+        return True
+
+    def _fetch_news(self, ticker: str) -> NewsBundle:
+        """Fetch semua data berita untuk ticker (berjalan di news thread)."""
+        service = self._get_news_service()
+        news_items = service.get_news(ticker)
+        return NewsBundle(
+            news=news_items,
+            corporate_actions=service.get_corporate_actions(ticker, news_items),
+            sentiment_trend=service.get_sentiment_trend(ticker, news_items),
+        )
+
+    def close(self) -> None:
+        """Hentikan worker, tutup NewsStore dan HTTP session."""
+        self._stock_scheduler.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            for future in self._news_futures.values():
+                future.cancel()
+
+        def close_store():
+            if self._news_service is not None and self._news_service.store:
+                self._news_service.store.close()
+
+        self._news_scheduler.submit(INTERACTIVE, close_store)
+        self._news_scheduler.shutdown(wait=True, cancel_futures=False)
+        self.session.close()
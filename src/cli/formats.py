@@ -0,0 +1,165 @@
+"""
+Output machine-readable (json, ndjson, csv) untuk hasil screening.
+
+Writer menulis satu record per ScreeningResult segera setelah hasilnya ada
+dan flush setiap record, sehingga proses downstream bisa membaca hasil
+secara incremental lewat pipe tanpa menunggu seluruh run selesai.
+"""
+
+import csv
+import json
+from typing import Any, Dict, Optional, TextIO
+
+from src.models.screening_result import ScreeningResult
+from src.models.serialization import to_dict
+
+# 'table' = output Rich (default), sisanya machine-readable
+OUTPUT_FORMATS = ('table', 'json', 'ndjson', 'csv')
+
+# Urutan kolom CSV; key_metrics mengikuti FundamentalAnalyzer
+CSV_COLUMNS = (
+    'ticker',
+    'company_name',
+    'sector',
+    'industry',
+    'rating',
+    'total_score',
+    'valuation_score',
+    'profitability_score',
+    'risk_score',
+    'dividend_score',
+    'data_completeness',
+    'pe_ratio',
+    'pbv',
+    'market_cap',
+    'roe',
+    'gross_margin',
+    'debt_to_equity',
+    'dividend_yield',
+    'current_price',
+    'eps',
+    'red_flags',
+    'screened_at',
+)
+
+
+def result_record(result: ScreeningResult) -> Dict[str, Any]:
+    """Record lengkap (JSON-friendly) untuk satu ScreeningResult."""
+    return to_dict(result)
+
+
+def flat_record(result: ScreeningResult) -> Dict[str, Any]:
+    """
+    Record datar untuk CSV: score per kategori dan key metrics.
+
+    Args:
+        result: ScreeningResult
+
+    Returns:
+        Dictionary dengan key sesuai CSV_COLUMNS
+    """
+    metrics = result.metrics
+    record = {
+        'ticker': result.ticker,
+        'company_name': result.company_name,
+        'sector': result.sector,
+        'industry': result.industry,
+        'rating': result.rating.value,
+        'total_score': metrics.total_score,
+        'valuation_score': metrics.valuation_score.score,
+        'profitability_score': metrics.profitability_score.score,
+        'risk_score': metrics.risk_score.score,
+        'dividend_score': metrics.dividend_score.score,
+        'data_completeness': result.data_completeness,
+        'red_flags': '; '.join(result.red_flags),
+        'screened_at': result.screened_at.isoformat(),
+    }
+    for column in CSV_COLUMNS:
+        if column not in record:
+            record[column] = result.key_metrics.get(column)
+    return record
+
+
+class RecordWriter:
+    """Base writer: satu record per hasil, flush setiap record."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.count = 0
+
+    def __enter__(self) -> 'RecordWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, result: ScreeningResult) -> None:
+        """Tulis satu hasil screening."""
+        self._write(result)
+        self.count += 1
+        self.stream.flush()
+
+    def _write(self, result: ScreeningResult) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Selesaikan output (misalnya penutup JSON array)."""
+        self.stream.flush()
+
+
+class NdjsonWriter(RecordWriter):
+    """Satu JSON object per baris."""
+
+    def _write(self, result: ScreeningResult) -> None:
+        self.stream.write(json.dumps(result_record(result), ensure_ascii=False))
+        self.stream.write('\n')
+
+
+class JsonWriter(RecordWriter):
+    """JSON array yang ditulis bertahap (satu element per baris)."""
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self._closed = False
+
+    def _write(self, result: ScreeningResult) -> None:
+        self.stream.write(',\n' if self.count else '[\n')
+        self.stream.write(json.dumps(result_record(result), ensure_ascii=False))
+
+    def close(self) -> None:
+        if not self._closed:
+            self.stream.write('\n]\n' if self.count else '[]\n')
+            self._closed = True
+        super().close()
+
+
+class CsvWriter(RecordWriter):
+    """CSV dengan header CSV_COLUMNS."""
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self._writer = csv.DictWriter(stream, fieldnames=CSV_COLUMNS)
+        self._writer.writeheader()
+
+    def _write(self, result: ScreeningResult) -> None:
+        self._writer.writerow(flat_record(result))
+
+
+_WRITERS = {'json': JsonWriter, 'ndjson': NdjsonWriter, 'csv': CsvWriter}
+
+
+def open_writer(output_format: str, stream: TextIO) -> Optional[RecordWriter]:
+    """
+    Buat writer untuk format output.
+
+    Args:
+        output_format: Salah satu OUTPUT_FORMATS
+        stream: Text stream tujuan (biasanya stdout)
+
+    Returns:
+        RecordWriter, atau None untuk format 'table'
+    """
+    if output_format == 'table':
+        return None
+    return _WRITERS[output_format](stream)
+
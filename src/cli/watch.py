@@ -0,0 +1,257 @@
+"""
+Watch mode: screening berkala yang hanya melaporkan perubahan.
+
+Setiap tick hanya blok harga yang di-fetch (satu request ringan per
+ticker); data fundamental dan berita di-refresh dengan cadence yang lebih
+lambat. Ticker yang input analisisnya tidak berubah (fingerprint
+FundamentalAnalyzer sama) tidak dianalisis ulang, dan state yang disimpan
+hanya snapshot terakhir per ticker sehingga memory tetap stabil meskipun
+watch berjalan berhari-hari.
+"""
+
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+from src.models.screening_result import ScreeningResult
+from src.models.stock_data import CorporateAction, StockData
+from src.services.news_scraper_service import NewsScraperService
+from src.services.yahoo_finance_service import YahooFinanceService
+from src.utils.helpers import normalize_ticker
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Jenis perubahan yang dilaporkan
+CHANGE_KINDS = ('new', 'rating', 'score', 'red_flag', 'corporate_action', 'failed')
+
+
+class WatchChange(NamedTuple):
+    """Satu perubahan yang dilaporkan watch untuk satu ticker."""
+
+    ticker: str
+    kind: str  # Salah satu CHANGE_KINDS
+    message: str
+
+
+@dataclass
+class _TickerState:
+    """Snapshot terakhir satu ticker."""
+
+    stock_data: StockData
+    fingerprint: str
+    result: ScreeningResult
+    fundamentals_at: datetime
+    news_at: Optional[datetime] = None
+
+
+def _action_key(action: CorporateAction) -> tuple:
+    """Identitas corporate action (sama dengan yang dibaca analyzer)."""
+    return (action.action_type, action.event_date, action.ratio, action.amount)
+
+
+def diff_results(
+    ticker: str,
+    old: Optional[ScreeningResult],
+    new: ScreeningResult,
+    old_actions: Iterable[CorporateAction] = (),
+    new_actions: Iterable[CorporateAction] = (),
+    score_threshold: float = 2.0,
+) -> List[WatchChange]:
+    """
+    Bandingkan dua hasil screening untuk ticker yang sama.
+
+    Args:
+        ticker: Normalized ticker symbol
+        old: Hasil sebelumnya (None = tick pertama)
+        new: Hasil terbaru
+        old_actions: Corporate actions sebelumnya
+        new_actions: Corporate actions terbaru
+        score_threshold: Perubahan total score minimum yang dilaporkan
+
+    Returns:
+        List WatchChange (kosong jika tidak ada perubahan berarti)
+    """
+    score = new.metrics.total_score
+    if old is None:
+        return [
+            WatchChange(ticker, 'new', f"{new.rating.value} (score {score:.1f})")
+        ]
+
+    changes = []
+    if new.rating != old.rating:
+        changes.append(
+            WatchChange(
+                ticker, 'rating', f"Rating {old.rating.value} -> {new.rating.value}"
+            )
+        )
+
+    delta = score - old.metrics.total_score
+    if abs(delta) >= score_threshold:
+        changes.append(
+            WatchChange(
+                ticker,
+                'score',
+                f"Score {old.metrics.total_score:.1f} -> {score:.1f} ({delta:+.1f})",
+            )
+        )
+
+    known_flags = set(old.red_flags)
+    for flag in new.red_flags:
+        if flag not in known_flags:
+            changes.append(WatchChange(ticker, 'red_flag', f"New red flag: {flag}"))
+
+    known_actions = {_action_key(action) for action in old_actions}
+    for action in new_actions:
+        if _action_key(action) not in known_actions:
+            label = action.title or action.action_type
+            changes.append(
+                WatchChange(
+                    ticker, 'corporate_action', f"New corporate action: {label}"
+                )
+            )
+
+    return changes
+
+
+class Watcher:
+    """Re-screen sekumpulan ticker secara berkala dan hasilkan perubahan."""
+
+    def __init__(
+        self,
+        tickers: Iterable[str],
+        finance_service: YahooFinanceService,
+        analyzer: FundamentalAnalyzer,
+        news_service: Optional[NewsScraperService] = None,
+        fundamentals_interval: timedelta = timedelta(hours=6),
+        news_interval: timedelta = timedelta(minutes=30),
+        score_threshold: float = 2.0,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            tickers: Ticker yang dipantau
+            finance_service: YahooFinanceService (harga dan fundamental)
+            analyzer: FundamentalAnalyzer (tanpa ScoreCache: state disimpan
+                per ticker oleh watcher)
+            news_service: Optional NewsScraperService untuk corporate actions
+                dan sentiment trend (None = tanpa berita)
+            fundamentals_interval: Jarak antar fetch data fundamental lengkap
+            news_interval: Jarak antar refresh berita
+            score_threshold: Perubahan total score minimum yang dilaporkan
+            clock: Sumber waktu (untuk testing)
+        """
+        self.tickers = list(dict.fromkeys(normalize_ticker(t) for t in tickers))
+        self.finance_service = finance_service
+        self.analyzer = analyzer
+        self.news_service = news_service
+        self.fundamentals_interval = fundamentals_interval
+        self.news_interval = news_interval
+        self.score_threshold = score_threshold
+        self.clock = clock
+
+        self.analyzed = 0  # Jumlah analisis yang benar-benar dijalankan
+        self._states: Dict[str, _TickerState] = {}
+        self._failed: set = set()
+
+    def result(self, ticker: str) -> Optional[ScreeningResult]:
+        """Hasil screening terakhir untuk ticker (None jika belum ada)."""
+        state = self._states.get(normalize_ticker(ticker))
+        return state.result if state else None
+
+    def tick(self) -> List[WatchChange]:
+        """
+        Refresh semua ticker sekali.
+
+        Returns:
+            Perubahan sejak tick sebelumnya (tick pertama: snapshot awal)
+        """
+        changes = []
+        for ticker in self.tickers:
+            changes.extend(self._refresh(ticker, self.clock()))
+        return changes
+
+    def _refresh(self, ticker: str, now: datetime) -> List[WatchChange]:
+        """Refresh satu ticker dan bandingkan dengan snapshot sebelumnya."""
+        state = self._states.get(ticker)
+        fundamentals_at = state.fundamentals_at if state else now
+
+        stock_data = None
+        if state is None or now - state.fundamentals_at >= self.fundamentals_interval:
+            stock_data = self.finance_service.get_stock_data(ticker, use_cache=False)
+            if stock_data is not None:
+                fundamentals_at = now
+        if stock_data is None and state is not None:
+            # Tick biasa (atau fetch fundamental gagal): cukup refresh harga
+            stock_data = self.finance_service.refresh_price(state.stock_data)
+
+        if stock_data is None:
+            if ticker in self._failed:
+                return []
+            self._failed.add(ticker)
+            return [WatchChange(ticker, 'failed', "Could not fetch data")]
+        self._failed.discard(ticker)
+
+        news_at = state.news_at if state else None
+        with_news = None
+        if self.news_service is not None and (
+            news_at is None or now - news_at >= self.news_interval
+        ):
+            # Fetch berita yang gagal dicoba lagi setelah interval berikutnya
+            with_news = self._with_news(ticker, stock_data)
+            news_at = now
+        if with_news is not None:
+            stock_data = with_news
+        elif state is not None:
+            stock_data = replace(
+                stock_data,
+                corporate_actions=state.stock_data.corporate_actions,
+                sentiment_trend=state.stock_data.sentiment_trend,
+            )
+
+        fingerprint = self.analyzer.fingerprint(stock_data)
+        if state is not None and fingerprint == state.fingerprint:
+            state.stock_data = stock_data
+            state.fundamentals_at = fundamentals_at
+            state.news_at = news_at
+            return []
+
+        result = self.analyzer.analyze(stock_data)
+        self.analyzed += 1
+        self._states[ticker] = _TickerState(
+            stock_data=stock_data,
+            fingerprint=fingerprint,
+            result=result,
+            fundamentals_at=fundamentals_at,
+            news_at=news_at,
+        )
+        return diff_results(
+            ticker,
+            state.result if state else None,
+            result,
+            state.stock_data.corporate_actions if state else (),
+            stock_data.corporate_actions,
+            self.score_threshold,
+        )
+
+    def _with_news(
+        self, ticker: str, stock_data: StockData
+    ) -> Optional[StockData]:
+        """StockData dengan corporate actions dan sentiment trend terbaru."""
+        try:
+            news_items = self.news_service.get_news(ticker)
+            return replace(
+                stock_data,
+                corporate_actions=self.news_service.get_corporate_actions(
+                    ticker, news_items
+                ),
+                sentiment_trend=self.news_service.get_sentiment_trend(
+                    ticker, news_items
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"Could not refresh news for {ticker}: {str(e)}")
+            return None
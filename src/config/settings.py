@@ -6,6 +6,8 @@ based on market conditions or user preferences.
 """
 
 from dataclasses import dataclass, field
+import os
+from pathlib import Path
 from typing import Optional
 
 
@@ -72,6 +74,22 @@ class DividendCriteria:
     require_dividend: bool = True
 
 
+@dataclass
+class SectorRelativeCriteria:
+    """Kriteria scoring relatif terhadap sektor (percentile dalam sektor)."""
+
+    # Jika aktif, PE, PBV, ROE dan Gross Margin di-score berdasarkan
+    # percentile dalam sektor, bukan threshold absolut
+    enabled: bool = False
+
+    # Percentile "terbaik" (PE/PBV termurah, ROE/GPM tertinggi)
+    preferred_percentile: float = 0.33
+    acceptable_percentile: float = 0.67
+
+    # Fallback ke threshold absolut jika data sektor terlalu sedikit
+    min_sector_size: int = 5
+
+
 @dataclass
 class ScreeningCriteria:
     """Gabungan semua kriteria screening."""
@@ -80,6 +98,9 @@ class ScreeningCriteria:
     profitability: ProfitabilityCriteria = field(default_factory=ProfitabilityCriteria)
     risk: RiskCriteria = field(default_factory=RiskCriteria)
     dividend: DividendCriteria = field(default_factory=DividendCriteria)
+    sector_relative: SectorRelativeCriteria = field(
+        default_factory=SectorRelativeCriteria
+    )
 
 
 # Default screening criteria instance
@@ -109,3 +130,44 @@ class ScoringWeights:
 
 
 DEFAULT_WEIGHTS = ScoringWeights()
+
+# Rolling window (hari) untuk agregat sentiment berita per ticker
+SENTIMENT_WINDOWS = (7, 30, 90)
+
+
+def get_data_dir() -> Path:
+    """
+    Get direktori data lokal (cache, store, dll).
+
+    Default `~/.friday-screener`, bisa di-override dengan environment
+    variable FRIDAY_SCREENER_HOME.
+    """
+    return Path(
+        os.environ.get('FRIDAY_SCREENER_HOME', Path.home() / '.friday-screener')
+    )
+
+
+def get_socket_path() -> Path:
+    """
+    Get path Unix domain socket screener daemon (`friday-screener serve`).
+
+    Default `<data dir>/screener.sock`, bisa di-override dengan environment
+    variable FRIDAY_SCREENER_SOCKET.
+    """
+    return Path(
+        os.environ.get('FRIDAY_SCREENER_SOCKET', get_data_dir() / 'screener.sock')
+    )
+
+
+def get_lexicon_path() -> Path:
+    """
+    Get path file lexicon untuk news sentiment dan corporate action.
+
+    Default `lexicon.json` yang dibundel di package ini, bisa di-override
+    dengan environment variable FRIDAY_SCREENER_LEXICON.
+    """
+    return Path(
+        os.environ.get(
+            'FRIDAY_SCREENER_LEXICON', Path(__file__).with_name('lexicon.json')
+        )
+    )
@@ -10,6 +10,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
+from src.models.stock_data import SentimentWindow
+
 
 class Rating(Enum):
     """Rating kategori untuk hasil screening (neutral, bukan rekomendasi)."""
@@ -114,6 +116,9 @@ class ScreeningResult:
     # Key metrics summary (untuk quick view)
     key_metrics: Dict[str, any] = field(default_factory=dict)
 
+    # Rolling sentiment berita (7/30/90 hari)
+    sentiment_trend: List[SentimentWindow] = field(default_factory=list)
+
     # Metadata
     screened_at: datetime = field(default_factory=datetime.now)
     data_completeness: float = 0.0  # 0-100%
@@ -0,0 +1,92 @@
+"""
+Serialisasi model dataclass ke/dari dictionary JSON-friendly.
+
+Dipakai untuk menyimpan StockData dan ScreeningResult ke disk (cache,
+checkpoint) maupun untuk output machine-readable.
+"""
+
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Type, TypeVar, Union, get_args, get_origin, get_type_hints
+
+T = TypeVar('T')
+
+
+def to_dict(obj: Any) -> Any:
+    """
+    Convert dataclass (rekursif) ke struktur JSON-friendly.
+
+    Enum menjadi value-nya, datetime menjadi ISO string.
+
+    Args:
+        obj: Dataclass instance atau value biasa
+
+    Returns:
+        Dictionary / list / primitive
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: to_dict(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, dict):
+        return {key: to_dict(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_dict(value) for value in obj]
+    return obj
+
+
+def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
+    """
+    Build dataclass dari dictionary hasil to_dict.
+
+    Args:
+        cls: Dataclass type tujuan
+        data: Dictionary sumber
+
+    Returns:
+        Instance dari cls
+    """
+    hints = get_type_hints(cls)
+    kwargs = {
+        f.name: _decode(hints.get(f.name, Any), data[f.name])
+        for f in fields(cls)
+        if f.init and f.name in data
+    }
+    return cls(**kwargs)
+
+
+def _decode(tp: Any, value: Any) -> Any:
+    """Decode satu value berdasarkan type annotation-nya."""
+    if value is None:
+        return None
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+
+    if origin is Union:
+        candidates = [arg for arg in args if arg is not type(None)]
+        return _decode(candidates[0], value) if len(candidates) == 1 else value
+    if origin in (list, tuple):
+        return [_decode(args[0] if args else Any, item) for item in value]
+    if origin is dict:
+        key_type, value_type = args if args else (Any, Any)
+        return {
+            _decode(key_type, key): _decode(value_type, item)
+            for key, item in value.items()
+        }
+    if not isinstance(tp, type):
+        return value
+    if is_dataclass(tp):
+        return from_dict(tp, value)
+    if issubclass(tp, Enum):
+        return tp(value)
+    if tp is datetime:
+        return datetime.fromisoformat(value)
+    if tp is date:
+        return date.fromisoformat(value)
+    if tp in (int, float) and isinstance(value, str):
+        return tp(value)
+    return value
@@ -6,7 +6,7 @@ Model ini merepresentasikan data saham yang diambil dari berbagai sumber
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict, List, Optional
 
 
@@ -121,6 +121,76 @@ class NewsItem:
     url: Optional[str] = None
     summary: Optional[str] = None
     sentiment: Optional[str] = None  # positive, negative, neutral
+    sentiment_score: Optional[float] = None  # Weighted score dari lexicon
+    # Tipe corporate action yang terdeteksi (None = belum diklasifikasi)
+    corporate_action_types: Optional[List[str]] = None
+    # Versi lexicon yang dipakai untuk klasifikasi (lihat src.utils.lexicon)
+    lexicon_version: Optional[str] = None
+    # ID stabil dari provider (UUID atau URL) untuk deduplikasi di NewsStore
+    item_id: Optional[str] = None
+
+    def weighted_sentiment(self) -> float:
+        """Weighted score lexicon; +1/-1/0 jika sentiment di-set tanpa score."""
+        if self.sentiment_score is not None:
+            return self.sentiment_score
+        return {'positive': 1.0, 'negative': -1.0}.get(self.sentiment, 0.0)
+
+
+@dataclass
+class CorporateAction:
+    """Event corporate action hasil ekstraksi dari satu NewsItem."""
+
+    ticker: str
+    action_type: str  # dividend, stock_split, reverse_split, rights_issue, ...
+    # Tanggal event untuk calendar (ex/cum/efektif, fallback tanggal publish)
+    event_date: Optional[datetime] = None
+    announced_date: Optional[datetime] = None
+    # Semua tanggal berlabel dalam berita (ex, cum, recording, payment, ...)
+    dates: Dict[str, datetime] = field(default_factory=dict)
+    ratio: Optional[str] = None  # Rasio split/rights issue, misalnya '1:5'
+    amount: Optional[float] = None  # Nilai per saham (Rp)
+    title: str = ''
+    source: Optional[str] = None
+    url: Optional[str] = None
+    item_id: Optional[str] = None
+
+
+@dataclass
+class DailySentiment:
+    """Jumlah berita per sentiment dan total weighted score dalam satu hari."""
+
+    day: date
+    positive: int = 0
+    negative: int = 0
+    neutral: int = 0
+    score: float = 0.0
+
+    @property
+    def count(self) -> int:
+        """Jumlah berita."""
+        return self.positive + self.negative + self.neutral
+
+
+@dataclass
+class SentimentWindow:
+    """Agregat sentiment berita dalam rolling window N hari."""
+
+    days: int
+    end_date: Optional[date] = None  # Hari terakhir window (inklusif)
+    positive: int = 0
+    negative: int = 0
+    neutral: int = 0
+    score: float = 0.0  # Total weighted score
+
+    @property
+    def count(self) -> int:
+        """Jumlah berita dalam window."""
+        return self.positive + self.negative + self.neutral
+
+    @property
+    def average_score(self) -> float:
+        """Rata-rata weighted score per berita (0 jika kosong)."""
+        return self.score / self.count if self.count else 0.0
 
 
 @dataclass
@@ -145,7 +215,9 @@ class StockData:
 
     # Additional info
     news: List[NewsItem] = field(default_factory=list)
-    corporate_actions: List[NewsItem] = field(default_factory=list)
+    corporate_actions: List[CorporateAction] = field(default_factory=list)
+    # Rolling sentiment (lihat SENTIMENT_WINDOWS), window terpendek lebih dulu
+    sentiment_trend: List[SentimentWindow] = field(default_factory=list)
 
     # Metadata
     last_updated: datetime = field(default_factory=datetime.now)
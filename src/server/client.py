@@ -0,0 +1,148 @@
+"""
+Thin client untuk screener daemon (lihat src.server.daemon).
+
+Protocol: satu request per koneksi, request dan response masing-masing satu
+baris JSON. Module ini hanya memakai stdlib supaya command yang diteruskan
+ke daemon cukup membayar satu round trip socket, bukan cold start.
+"""
+
+import json
+from pathlib import Path
+import socket
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+from src.config.settings import get_socket_path
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RemoteOutput(NamedTuple):
+    """Output command yang dijalankan daemon (stdout dan stderr)."""
+
+    output: str
+    errors: str = ''
+
+
+# Daemon yang hidup menerima koneksi hampir seketika; jika tidak, fallback
+CONNECT_TIMEOUT = 0.5
+
+
+def send_request(
+    request: Dict[str, Any], socket_path: Union[str, Path, None] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Kirim satu request ke daemon dan tunggu response-nya.
+
+    Args:
+        request: Request JSON (minimal berisi key 'action')
+        socket_path: Path socket (default: get_socket_path())
+
+    Returns:
+        Response dari daemon, atau None jika daemon tidak berjalan atau
+        koneksi terputus
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        # Platform tanpa Unix domain socket (Windows lama): selalu in-process
+        return None
+
+    path = str(socket_path or get_socket_path())
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(path)
+        except OSError:
+            # Tidak ada socket, daemon mati (stale socket), atau timeout
+            return None
+
+        # Command bisa berjalan lama (fetch data), tunggu tanpa timeout
+        sock.settimeout(None)
+        with sock.makefile('rwb') as stream:
+            stream.write(json.dumps(request).encode('utf-8') + b'\n')
+            stream.flush()
+            line = stream.readline()
+    except OSError as e:
+        logger.warning(f"Screener daemon connection failed: {e}")
+        return None
+    finally:
+        sock.close()
+
+    if not line:
+        logger.warning("Screener daemon closed the connection without response")
+        return None
+    return json.loads(line)
+
+
+def ping(socket_path: Union[str, Path, None] = None) -> Optional[Dict[str, Any]]:
+    """
+    Cek apakah daemon berjalan.
+
+    Returns:
+        Info daemon (version, pid, socket), atau None jika tidak berjalan
+    """
+    response = send_request({'action': 'ping'}, socket_path)
+    return response if response and response.get('ok') else None
+
+
+def shutdown(socket_path: Union[str, Path, None] = None) -> bool:
+    """
+    Minta daemon berhenti.
+
+    Returns:
+        True jika daemon menerima request
+    """
+    response = send_request({'action': 'shutdown'}, socket_path)
+    return bool(response and response.get('ok'))
+
+
+def run_remote(
+    command: str,
+    params: Dict[str, Any],
+    width: int = 80,
+    color_system: Optional[str] = None,
+    terminal: bool = False,
+    socket_path: Union[str, Path, None] = None,
+) -> Optional[RemoteOutput]:
+    """
+    Jalankan CLI command di daemon.
+
+    Output di-render oleh daemon dengan lebar dan color system terminal
+    client sehingga hasilnya sama dengan eksekusi in-process.
+
+    Args:
+        command: Nama command (misalnya 'screen')
+        params: Parameter command (ctx.params)
+        width: Lebar terminal client
+        color_system: Color system Rich client (None = tanpa warna)
+        terminal: Apakah output client adalah terminal
+        socket_path: Path socket (default: get_socket_path())
+
+    Returns:
+        RemoteOutput, atau None jika daemon tidak tersedia, gagal, atau
+        opsi command tidak cocok dengan konfigurasi daemon (caller fallback
+        ke eksekusi in-process)
+    """
+    response = send_request(
+        {
+            'action': 'run',
+            'command': command,
+            'params': params,
+            'width': width,
+            'color_system': color_system,
+            'terminal': terminal,
+        },
+        socket_path,
+    )
+    if response is None:
+        return None
+    if response.get('fallback'):
+        # Opsi command tidak cocok dengan konfigurasi daemon
+        logger.info(f"Running {command} in-process: {response.get('error')}")
+        return None
+    if not response.get('ok'):
+        logger.warning(
+            f"Screener daemon failed to run {command}: {response.get('error')}"
+        )
+        return None
+    return RemoteOutput(response['output'], response.get('errors', ''))
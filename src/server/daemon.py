@@ -0,0 +1,241 @@
+"""
+Screener daemon: proses resident yang melayani CLI lewat Unix domain socket.
+
+Daemon memegang satu ServiceContext (YahooFinanceService dengan cache-nya,
+FundamentalAnalyzer + ScoreCache, NewsScraperService + NewsStore dan
+requests.Session) selama berjalan. Command `screen`/`compare` meneruskan
+parameternya ke daemon (lihat src.server.client) dan daemon menjalankan
+command yang sama dengan service yang sudah warm, lalu mengembalikan output
+yang di-render sesuai terminal client. Data ticker yang lebih tua dari ttl
+di-fetch ulang sebelum command dijalankan, sehingga daemon yang berjalan
+berhari-hari tidak terus menjawab dengan fetch pertama.
+
+Command dengan opsi yang bergantung pada konfigurasi service (sumber berita,
+NewsStore, score cache di disk) yang berbeda dari konfigurasi daemon ditolak
+dengan response 'fallback', dan client menjalankannya in-process.
+
+Setiap koneksi dilayani di thread sendiri dan command berjalan bersamaan:
+output di-render ke console milik thread request (lihat
+commands.use_console), dan fetch semua command lewat FetchScheduler
+ServiceContext yang sama, sehingga `screen` interactive tidak menunggu
+`compare` yang sedang berjalan.
+"""
+
+from io import StringIO
+import json
+import os
+from pathlib import Path
+import socketserver
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.__version__ import __version__
+from src.cli.context import ServiceContext
+from src.config.settings import get_socket_path
+from src.server import client
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Command CLI yang boleh dijalankan lewat daemon
+REMOTE_COMMANDS = ('screen', 'compare')
+
+# Umur maksimum data ticker sebelum di-fetch ulang (sama dengan default API)
+DEFAULT_TTL_SECONDS = 900.0
+
+
+class DaemonAlreadyRunning(RuntimeError):
+    """Daemon lain sudah listen di socket yang sama."""
+
+
+class UnsupportedParams(ValueError):
+    """Parameter command membutuhkan konfigurasi service yang berbeda."""
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Satu koneksi = satu request JSON + satu response JSON."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = {'ok': False, 'error': 'invalid request'}
+        else:
+            response = self.server.dispatch(request)
+        self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+
+
+class ScreenerDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server yang menjalankan command CLI dengan service warm."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Union[str, Path, None] = None,
+        services: Optional[ServiceContext] = None,
+        ttl: float = DEFAULT_TTL_SECONDS,
+    ):
+        """
+        Bind socket daemon.
+
+        Socket stale (sisa daemon yang mati) dihapus; jika daemon lain
+        masih menjawab, DaemonAlreadyRunning di-raise.
+
+        Args:
+            socket_path: Path socket (default: get_socket_path())
+            services: ServiceContext yang dipakai (default: ServiceContext())
+            ttl: Umur maksimum data ticker (detik) sebelum di-fetch ulang
+        """
+        self.socket_path = Path(socket_path or get_socket_path())
+        if self.socket_path.exists():
+            if client.ping(self.socket_path) is not None:
+                raise DaemonAlreadyRunning(
+                    f"Screener daemon already running at {self.socket_path}"
+                )
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Socket hanya bisa diakses user yang menjalankan daemon
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+        self.services = services or ServiceContext()
+        self.ttl = ttl
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Proses satu request.
+
+        Args:
+            request: Request JSON dengan key 'action' (ping, run, shutdown)
+
+        Returns:
+            Response JSON dengan key 'ok'
+        """
+        action = request.get('action')
+        if action == 'ping':
+            return {
+                'ok': True,
+                'version': __version__,
+                'pid': os.getpid(),
+                'socket': str(self.socket_path),
+            }
+        if action == 'shutdown':
+            # shutdown() menunggu serve_forever selesai, jangan di thread ini
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {'ok': True}
+        if action == 'run':
+            try:
+                output, errors = self.run_command(**_run_args(request))
+                return {'ok': True, 'output': output, 'errors': errors}
+            except UnsupportedParams as e:
+                return {'ok': False, 'fallback': True, 'error': str(e)}
+            except Exception as e:
+                logger.error(f"Daemon failed to run {request.get('command')}: {e}")
+                return {'ok': False, 'error': str(e)}
+        return {'ok': False, 'error': f'unknown action: {action}'}
+
+    def run_command(
+        self,
+        command: str,
+        params: Dict[str, Any],
+        width: int = 80,
+        color_system: Optional[str] = None,
+        terminal: bool = False,
+    ) -> Tuple[str, str]:
+        """
+        Jalankan command CLI dengan ServiceContext daemon.
+
+        Args:
+            command: Nama command (lihat REMOTE_COMMANDS)
+            params: Parameter command
+            width: Lebar terminal client
+            color_system: Color system Rich client (None = tanpa warna)
+            terminal: Apakah output client adalah terminal
+
+        Returns:
+            Tuple (stdout, stderr) command yang sudah di-render
+
+        Raises:
+            UnsupportedParams: Jika params membutuhkan sumber berita, NewsStore
+                atau score cache yang tidak dipakai daemon
+        """
+        # Import di sini: commands meng-import client, bukan daemon
+        import click
+        from rich.console import Console
+
+        from src.cli import commands
+
+        if command not in REMOTE_COMMANDS:
+            raise ValueError(f"command not available in daemon: {command}")
+        self.check_params(params)
+
+        output, errors = (
+            Console(
+                file=StringIO(),
+                width=width,
+                force_terminal=terminal,
+                force_interactive=False,
+                color_system=color_system,
+            )
+            for _ in range(2)
+        )
+        with commands.use_console(output, errors):
+            for ticker in _param_tickers(params):
+                self.services.expire(ticker, self.ttl)
+            with click.Context(commands.cli, obj=self.services) as ctx:
+                ctx.invoke(commands.cli.commands[command], **params)
+        return output.file.getvalue(), errors.file.getvalue()
+
+    def check_params(self, params: Dict[str, Any]) -> None:
+        """
+        Pastikan params bisa dijalankan dengan ServiceContext daemon.
+
+        Raises:
+            UnsupportedParams: Jika hasilnya akan berbeda dari eksekusi
+                in-process (sumber berita lain, --news-store tanpa NewsStore
+                di daemon, atau compare --score-cache yang memakai disk)
+        """
+        if params.get('news', True) and 'news_sources' in params:
+            requested = set(params['news_sources'] or ())
+            if requested != set(self.services.news_sources):
+                raise UnsupportedParams(
+                    f"daemon uses news sources "
+                    f"{', '.join(self.services.news_sources)}"
+                )
+        if params.get('news_store') and not self.services.news_store:
+            raise UnsupportedParams("daemon runs without a news store")
+        if params.get('score_cache'):
+            raise UnsupportedParams("daemon does not use the on-disk score cache")
+
+    def server_close(self) -> None:
+        """Tutup socket, hapus socket file dan tutup service."""
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+        self.services.close()
+
+
+def _param_tickers(params: Dict[str, Any]) -> List[str]:
+    """Ticker dari parameter screen (ticker) atau compare (tickers)."""
+    tickers = list(params.get('tickers') or [])
+    if params.get('ticker'):
+        tickers.append(params['ticker'])
+    return tickers
+
+
+def _run_args(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Ambil argument run_command dari request."""
+    return {
+        'command': request['command'],
+        'params': request.get('params') or {},
+        'width': int(request.get('width') or 80),
+        'color_system': request.get('color_system'),
+        'terminal': bool(request.get('terminal')),
+    }
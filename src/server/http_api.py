@@ -0,0 +1,505 @@
+"""
+HTTP/JSON API untuk screening (asyncio, stdlib saja).
+
+Endpoint:
+    GET  /health
+    GET  /screen/<ticker>[?news=1]
+    GET  /compare?tickers=BBCA,BMRI,BBNI
+    GET  /batch?tickers=BBCA,BMRI,...&top=20
+    POST /batch  dengan body JSON {"tickers": [...], "top": 20}
+    GET  /news/<ticker>
+
+Semua fetch lewat ServiceContext: request bersamaan untuk ticker yang sama
+berbagi satu Future (request coalescing), jumlah fetch paralel dibatasi
+jumlah worker ServiceContext, dan operasi berita berjalan di news thread-nya.
+Fetch dijadwalkan per kelas prioritas: /screen dan /news interactive,
+/compare watchlist, /batch background, sehingga batch besar tidak menahan
+lookup satu emiten. Data dan berita di-fetch ulang setelah ttl.
+
+Response screen/compare/batch memakai ETag dari StockData.last_updated:
+client yang mengirim If-None-Match mendapat 304 tanpa body, dan hasil
+analisis di-cache per ETag sehingga request berulang tidak dianalisis ulang.
+Hasil batch di-stream sebagai chunked JSON array, satu hasil per chunk.
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import replace
+import hashlib
+from http import HTTPStatus
+import json
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src.cli.context import NewsBundle, ServiceContext
+from src.models.screening_result import ScreeningResult
+from src.models.serialization import to_dict
+from src.models.stock_data import StockData
+from src.services.scheduler import BACKGROUND, INTERACTIVE, WATCHLIST
+from src.utils.helpers import normalize_ticker
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Batas untuk melindungi server dari request yang terlalu besar
+MAX_BODY_BYTES = 1 << 20
+MAX_HEADERS = 100
+MAX_BATCH_TICKERS = 2000
+KEEP_ALIVE_TIMEOUT = 30.0
+
+
+class HTTPError(Exception):
+    """Error yang dikembalikan ke client sebagai response JSON."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Request(NamedTuple):
+    """HTTP request yang sudah di-parse."""
+
+    method: str
+    path: str
+    query: Dict[str, List[str]]
+    headers: Dict[str, str]
+    body: bytes
+
+    def param(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Get query parameter (nilai terakhir jika diulang)."""
+        values = self.query.get(name)
+        return values[-1] if values else default
+
+
+class Response(NamedTuple):
+    """HTTP response; body berupa bytes atau iterator chunk (streaming)."""
+
+    status: int
+    body: Any = b''
+    etag: Optional[str] = None
+
+    @property
+    def streaming(self) -> bool:
+        return not isinstance(self.body, bytes)
+
+
+class _ScreenEntry(NamedTuple):
+    """Hasil analisis yang di-cache per ETag."""
+
+    result: ScreeningResult
+    body: bytes
+
+
+def _etag(*parts: Any) -> str:
+    """Strong ETag dari komponen yang menentukan isi response."""
+    digest = hashlib.sha1('|'.join(map(str, parts)).encode('utf-8')).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _parse_tickers(values: Iterable[str]) -> List[str]:
+    """Parse ticker dari daftar string (dipisah koma), urutan dipertahankan."""
+    tickers: Dict[str, None] = {}
+    for value in values:
+        for ticker in str(value).split(','):
+            if ticker.strip():
+                tickers[normalize_ticker(ticker.strip())] = None
+    return list(tickers)
+
+
+def _parse_int(value: Optional[str], name: str, default: int) -> int:
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise HTTPError(400, f"{name} must be an integer")
+    if number < 1:
+        raise HTTPError(400, f"{name} must be positive")
+    return number
+
+
+def _parse_bool(value: Optional[str]) -> bool:
+    return (value or '').lower() in ('1', 'true', 'yes')
+
+
+def _matches(request: Request, etag: str) -> bool:
+    """Cek If-None-Match terhadap ETag."""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix('W/') for tag in header.split(',')}
+    return etag in candidates or '*' in candidates
+
+
+class ScreeningAPI:
+    """Handler endpoint di atas ServiceContext (berjalan di event loop)."""
+
+    def __init__(
+        self,
+        services: ServiceContext,
+        ttl: float = 900.0,
+        cache_size: int = 1024,
+    ):
+        """
+        Initialize API.
+
+        Args:
+            services: ServiceContext (finance, analyzer, news)
+            ttl: Umur maksimum data ticker dalam detik sebelum di-fetch ulang
+            cache_size: Jumlah hasil analisis yang di-cache per ETag
+        """
+        self.services = services
+        self.ttl = ttl
+        self.cache_size = cache_size
+        self._results: 'OrderedDict[str, _ScreenEntry]' = OrderedDict()
+
+    async def handle(self, request: Request) -> Response:
+        """
+        Route request ke endpoint.
+
+        Raises:
+            HTTPError: Untuk request yang tidak valid atau data tidak ada
+        """
+        parts = [unquote(part) for part in request.path.strip('/').split('/')]
+        route = parts[0] if parts else ''
+
+        if request.method == 'POST' and route == 'batch' and len(parts) == 1:
+            return await self.batch(request)
+        if request.method != 'GET':
+            raise HTTPError(405, f"method not allowed: {request.method}")
+
+        if route == 'health' and len(parts) == 1:
+            return Response(200, _dumps({'status': 'ok'}))
+        if route == 'screen' and len(parts) == 2:
+            return await self.screen(request, parts[1])
+        if route == 'compare' and len(parts) == 1:
+            return await self.compare(request)
+        if route == 'batch' and len(parts) == 1:
+            return await self.batch(request)
+        if route == 'news' and len(parts) == 2:
+            return await self.news(request, parts[1])
+        raise HTTPError(404, f"not found: {request.path}")
+
+    async def screen(self, request: Request, ticker: str) -> Response:
+        """GET /screen/<ticker>: ScreeningResult satu emiten."""
+        etag, entry = await self._screen(
+            ticker, _parse_bool(request.param('news')), INTERACTIVE
+        )
+        if _matches(request, etag):
+            return Response(304, etag=etag)
+        return Response(200, entry.body, etag)
+
+    async def compare(self, request: Request) -> Response:
+        """GET /compare?tickers=...: hasil beberapa emiten, urut total score."""
+        tickers = _parse_tickers(request.query.get('tickers', []))
+        if len(tickers) < 2:
+            raise HTTPError(400, "provide at least 2 tickers")
+
+        etags, ranked, failed = await self._rank(tickers, WATCHLIST)
+        etag = _etag('compare', *etags)
+        if _matches(request, etag):
+            return Response(304, etag=etag)
+
+        body = b''.join(
+            [
+                b'{"results":[',
+                b','.join(entry.body for entry in ranked),
+                b'],"failed":',
+                _dumps(failed),
+                b'}',
+            ]
+        )
+        return Response(200, body, etag)
+
+    async def batch(self, request: Request) -> Response:
+        """
+        GET/POST /batch: ranking top-N universe, di-stream per hasil.
+
+        Ticker dari query `tickers` atau body JSON {"tickers": [...], "top": N}.
+        """
+        payload: Dict[str, Any] = {}
+        if request.body:
+            try:
+                payload = json.loads(request.body)
+            except ValueError:
+                raise HTTPError(400, "invalid JSON body")
+            if not isinstance(payload, dict):
+                raise HTTPError(400, "JSON body must be an object")
+
+        tickers = _parse_tickers(
+            list(payload.get('tickers') or []) + request.query.get('tickers', [])
+        )
+        if not tickers:
+            raise HTTPError(400, "provide tickers")
+        if len(tickers) > MAX_BATCH_TICKERS:
+            raise HTTPError(400, f"at most {MAX_BATCH_TICKERS} tickers per batch")
+        top = _parse_int(
+            str(payload['top']) if 'top' in payload else request.param('top'),
+            'top',
+            len(tickers),
+        )
+
+        etags, ranked, failed = await self._rank(tickers, BACKGROUND)
+        etag = _etag('batch', top, *etags)
+        if _matches(request, etag):
+            return Response(304, etag=etag)
+
+        chunks = self._stream_batch(ranked[:top], len(ranked), failed)
+        return Response(200, chunks, etag)
+
+    @staticmethod
+    def _stream_batch(
+        ranked: Sequence[_ScreenEntry], analyzed: int, failed: List[str]
+    ) -> Iterator[bytes]:
+        """Chunk JSON {"analyzed", "failed", "results": [...]}, satu hasil per chunk."""
+        yield b'{"analyzed":%d,"failed":%s,"results":[' % (analyzed, _dumps(failed))
+        for index, entry in enumerate(ranked):
+            yield (b',' if index else b'') + entry.body
+        yield b']}'
+
+    async def news(self, request: Request, ticker: str) -> Response:
+        """GET /news/<ticker>: berita, corporate actions dan sentiment trend."""
+        bundle = await self._news(ticker, INTERACTIVE)
+        body = _dumps(
+            {
+                'ticker': normalize_ticker(ticker),
+                'news': to_dict(bundle.news),
+                'corporate_actions': to_dict(bundle.corporate_actions),
+                'sentiment_trend': to_dict(bundle.sentiment_trend),
+            }
+        )
+        etag = _etag('news', hashlib.sha1(body).hexdigest())
+        if _matches(request, etag):
+            return Response(304, etag=etag)
+        return Response(200, body, etag)
+
+    async def _rank(
+        self, tickers: Sequence[str], priority: str
+    ) -> Tuple[List[str], List[_ScreenEntry], List[str]]:
+        """
+        Analisis banyak ticker secara bersamaan.
+
+        Args:
+            tickers: Normalized ticker symbols
+            priority: Kelas prioritas fetch
+
+        Returns:
+            Tuple (ETag per ticker, hasil urut total score, ticker yang gagal)
+        """
+        outcomes = await asyncio.gather(
+            *(self._screen(ticker, False, priority) for ticker in tickers),
+            return_exceptions=True,
+        )
+        etags, entries, failed = [], [], []
+        for ticker, outcome in zip(tickers, outcomes, strict=True):
+            if isinstance(outcome, HTTPError):
+                failed.append(ticker)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                etags.append(outcome[0])
+                entries.append(outcome[1])
+        entries.sort(key=lambda e: e.result.metrics.total_score, reverse=True)
+        return etags, entries, failed
+
+    async def _screen(
+        self, ticker: str, news: bool, priority: str
+    ) -> Tuple[str, _ScreenEntry]:
+        """Get (ETag, hasil analisis), menganalisis hanya jika ETag baru."""
+        stock_data = await self._stock_data(ticker, priority)
+        parts: List[Any] = ['screen', stock_data.get_ticker(), stock_data.last_updated]
+        if news:
+            bundle = await self._news(ticker, priority)
+            stock_data = replace(
+                stock_data,
+                news=bundle.news,
+                corporate_actions=bundle.corporate_actions,
+                sentiment_trend=bundle.sentiment_trend,
+            )
+            parts.extend(item.item_id or item.title for item in bundle.news)
+        etag = _etag(*parts)
+
+        entry = self._results.get(etag)
+        if entry is None:
+            # Analisis dan serialisasi CPU-bound: jangan tahan event loop
+            entry = await asyncio.get_running_loop().run_in_executor(
+                None, self._analyze, stock_data
+            )
+            self._results[etag] = entry
+            if len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        else:
+            self._results.move_to_end(etag)
+        return etag, entry
+
+    def _analyze(self, stock_data: StockData) -> _ScreenEntry:
+        """Analisis StockData (berjalan di executor thread)."""
+        result = self.services.analyzer.analyze(stock_data)
+        return _ScreenEntry(result, _dumps(to_dict(result)))
+
+    async def _stock_data(self, ticker: str, priority: str) -> StockData:
+        """StockData dari ServiceContext (di-fetch ulang setelah ttl)."""
+        key = normalize_ticker(ticker)
+        self.services.expire(key, self.ttl)
+        stock_data = await asyncio.wrap_future(
+            self.services.stock_future(key, priority)
+        )
+        if stock_data is None:
+            # Fetch yang gagal tidak di-cache supaya request berikutnya mencoba ulang
+            self.services.invalidate(key)
+            raise HTTPError(404, f"could not fetch data for {key}")
+        return stock_data
+
+    async def _news(self, ticker: str, priority: str) -> NewsBundle:
+        """NewsBundle dari ServiceContext (di-fetch ulang setelah ttl)."""
+        key = normalize_ticker(ticker)
+        self.services.expire(key, self.ttl)
+        try:
+            return await asyncio.wrap_future(
+                self.services.news_future(key, priority)
+            )
+        except Exception as e:
+            self.services.invalidate(key)
+            raise HTTPError(502, f"could not fetch news for {key}: {e}")
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """
+    Baca satu request HTTP/1.1.
+
+    Returns:
+        Request, atau None jika koneksi ditutup client
+    """
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, _version = line.decode('latin-1').split()
+    except ValueError:
+        raise HTTPError(400, "malformed request line")
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise HTTPError(431, "too many headers")
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    body = b''
+    try:
+        length = int(headers.get('content-length') or 0)
+    except ValueError:
+        raise HTTPError(400, "invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, "request body too large")
+    if length:
+        body = await reader.readexactly(length)
+
+    url = urlsplit(target)
+    return Request(method.upper(), url.path, parse_qs(url.query), headers, body)
+
+
+async def _write_response(
+    writer: asyncio.StreamWriter, response: Response, keep_alive: bool
+) -> None:
+    """Tulis response (chunked jika streaming), dengan backpressure via drain()."""
+    head = [f'HTTP/1.1 {response.status} {HTTPStatus(response.status).phrase}']
+    if response.status != 304:
+        head.append('Content-Type: application/json; charset=utf-8')
+    if response.etag:
+        head.extend([f'ETag: {response.etag}', 'Cache-Control: no-cache'])
+    head.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+
+    if response.streaming:
+        head.append('Transfer-Encoding: chunked')
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+        for chunk in response.body:
+            writer.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            await writer.drain()
+        writer.write(b'0\r\n\r\n')
+    else:
+        head.append(f'Content-Length: {len(response.body)}')
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+        writer.write(response.body)
+    await writer.drain()
+
+
+async def _handle_connection(
+    api: ScreeningAPI, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Layani satu koneksi (keep-alive) sampai ditutup atau idle."""
+    try:
+        while True:
+            try:
+                request = await asyncio.wait_for(
+                    _read_request(reader), KEEP_ALIVE_TIMEOUT
+                )
+            except HTTPError as e:
+                await _write_response(writer, _error(e), keep_alive=False)
+                break
+            if request is None:
+                break
+
+            keep_alive = request.headers.get('connection', '').lower() != 'close'
+            try:
+                response = await api.handle(request)
+            except HTTPError as e:
+                response = _error(e)
+            except Exception as e:
+                logger.error(f"Error handling {request.method} {request.path}: {e}")
+                response = _error(HTTPError(500, 'internal server error'))
+
+            await _write_response(writer, response, keep_alive)
+            if not keep_alive:
+                break
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _error(error: HTTPError) -> Response:
+    return Response(error.status, _dumps({'error': error.message}))
+
+
+async def start_server(
+    api: ScreeningAPI, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+) -> asyncio.AbstractServer:
+    """
+    Start HTTP server di event loop yang sedang berjalan.
+
+    Args:
+        api: ScreeningAPI yang melayani request
+        host: Alamat bind
+        port: Port (0 = pilih port bebas)
+
+    Returns:
+        asyncio Server (lihat server.sockets untuk port yang dipakai)
+    """
+    return await asyncio.start_server(
+        lambda reader, writer: _handle_connection(api, reader, writer),
+        host,
+        port,
+        backlog=1024,
+    )
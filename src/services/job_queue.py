@@ -0,0 +1,421 @@
+"""
+Job queue berbasis SQLite untuk universe screening multi-worker.
+
+Coordinator membuat satu run (universe + criteria) dan meng-enqueue satu job
+per ticker. Worker (process lain di host yang sama, atau host lain yang
+berbagi file queue) me-lease job, fetch dan analisis, lalu menulis
+ScreeningResult kembali ke queue. Lease punya batas waktu: job milik worker
+yang mati atau macet dikembalikan ke antrian setelah lease habis dan
+diambil worker lain. Job yang gagal dicoba ulang sampai max_attempts; job
+yang lease-nya habis setelah percobaan terakhir (mis. ticker yang selalu
+membuat worker crash) ditandai failed.
+
+Queue memakai rollback journal SQLite biasa (bukan WAL) supaya file tetap
+bisa dipakai bersama lewat network filesystem yang mendukung file locking.
+"""
+
+from dataclasses import asdict
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import socket
+import sqlite3
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+import uuid
+
+from src.config.settings import ScreeningCriteria, get_data_dir
+from src.models.screening_result import ScreeningResult
+from src.models.serialization import from_dict, to_dict
+from src.utils.helpers import normalize_ticker
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Status job
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    criteria TEXT NOT NULL,
+    max_attempts INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    run_id TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    PRIMARY KEY (run_id, ticker)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status
+    ON jobs (run_id, status, lease_expires);
+"""
+
+
+class Job(NamedTuple):
+    """Satu ticker yang di-lease oleh worker."""
+
+    run_id: str
+    ticker: str
+    attempts: int
+
+
+def worker_id() -> str:
+    """Identitas worker unik: host, pid dan suffix acak."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class JobQueue:
+    """File-backed job queue untuk screening per ticker."""
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        lease_timeout: float = 120.0,
+        busy_timeout: float = 30.0,
+    ):
+        """
+        Open (atau buat) job queue.
+
+        Args:
+            path: Path file SQLite (default: <data dir>/jobs.db)
+            lease_timeout: Detik sebelum job yang di-lease dianggap macet dan
+                boleh diambil worker lain
+            busy_timeout: Detik menunggu lock database dari process lain
+        """
+        if path is None:
+            path = get_data_dir() / 'jobs.db'
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = str(path)
+        self.lease_timeout = lease_timeout
+        # isolation_level=None: transaksi diatur eksplisit (BEGIN IMMEDIATE)
+        self._conn = sqlite3.connect(
+            self.path, timeout=busy_timeout, isolation_level=None
+        )
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close koneksi database."""
+        self._conn.close()
+
+    def __enter__(self) -> 'JobQueue':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def create_run(
+        self,
+        tickers: Iterable[str],
+        criteria: ScreeningCriteria,
+        max_attempts: int = 3,
+    ) -> str:
+        """
+        Buat run baru dan enqueue satu job per ticker.
+
+        Args:
+            tickers: Ticker universe (duplikat diabaikan)
+            criteria: ScreeningCriteria yang dipakai semua worker
+            max_attempts: Jumlah percobaan sebelum job dianggap gagal
+
+        Returns:
+            Run ID
+        """
+        run_id = datetime.now().strftime('%Y%m%d-%H%M%S-') + uuid.uuid4().hex[:6]
+        unique = list(dict.fromkeys(normalize_ticker(t) for t in tickers))
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._conn.execute(
+                'INSERT INTO runs VALUES (?, ?, ?, ?)',
+                (
+                    run_id,
+                    datetime.now().isoformat(),
+                    json.dumps(asdict(criteria)),
+                    max_attempts,
+                ),
+            )
+            self._conn.executemany(
+                'INSERT INTO jobs (run_id, ticker, position, status) '
+                'VALUES (?, ?, ?, ?)',
+                [(run_id, ticker, i, PENDING) for i, ticker in enumerate(unique)],
+            )
+            self._conn.execute('COMMIT')
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+        logger.info(f"Enqueued {len(unique)} jobs for run {run_id}")
+        return run_id
+
+    def latest_run(self) -> Optional[str]:
+        """Run terbaru yang masih punya job belum selesai (None jika tidak ada)."""
+        row = self._conn.execute(
+            """
+            SELECT runs.run_id FROM runs
+            WHERE EXISTS (
+                SELECT 1 FROM jobs
+                WHERE jobs.run_id = runs.run_id AND status IN (?, ?)
+            )
+            ORDER BY created_at DESC LIMIT 1
+            """,
+            (PENDING, LEASED),
+        ).fetchone()
+        return row[0] if row else None
+
+    def criteria(self, run_id: str) -> ScreeningCriteria:
+        """
+        ScreeningCriteria milik run.
+
+        Raises:
+            KeyError: Jika run tidak ada
+        """
+        row = self._conn.execute(
+            'SELECT criteria FROM runs WHERE run_id = ?', (run_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown run: {run_id}")
+        return from_dict(ScreeningCriteria, json.loads(row[0]))
+
+    def lease(self, run_id: str, worker: str, limit: int = 1) -> List[Job]:
+        """
+        Lease job yang pending atau yang lease-nya sudah habis.
+
+        Job yang lease-nya habis dan sudah mencapai max_attempts run ditandai
+        failed, tidak di-lease ulang.
+
+        Args:
+            run_id: Run ID
+            worker: Identitas worker (lihat worker_id)
+            limit: Jumlah job maksimum
+
+        Returns:
+            List Job (kosong jika tidak ada yang bisa diambil)
+        """
+        now = time.time()
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._conn.execute(
+                """
+                UPDATE jobs SET status = ?, error = ?, lease_expires = NULL
+                WHERE run_id = ? AND status = ? AND lease_expires < ?
+                    AND attempts >= (
+                        SELECT max_attempts FROM runs WHERE run_id = jobs.run_id
+                    )
+                """,
+                (FAILED, 'lease expired', run_id, LEASED, now),
+            )
+            rows = self._conn.execute(
+                """
+                SELECT ticker, attempts FROM jobs
+                WHERE run_id = ?
+                    AND (status = ? OR (status = ? AND lease_expires < ?))
+                ORDER BY position LIMIT ?
+                """,
+                (run_id, PENDING, LEASED, now, limit),
+            ).fetchall()
+            self._conn.executemany(
+                """
+                UPDATE jobs SET status = ?, worker = ?, lease_expires = ?,
+                    attempts = attempts + 1
+                WHERE run_id = ? AND ticker = ?
+                """,
+                [
+                    (LEASED, worker, now + self.lease_timeout, run_id, ticker)
+                    for ticker, _ in rows
+                ],
+            )
+            self._conn.execute('COMMIT')
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+        return [Job(run_id, ticker, attempts + 1) for ticker, attempts in rows]
+
+    def complete(self, job: Job, worker: str, result: ScreeningResult) -> bool:
+        """
+        Simpan hasil job.
+
+        Hasil dari worker yang lease-nya sudah diambil alih worker lain
+        diabaikan.
+
+        Returns:
+            True jika hasil disimpan
+        """
+        cursor = self._conn.execute(
+            """
+            UPDATE jobs SET status = ?, result = ?, error = NULL,
+                lease_expires = NULL
+            WHERE run_id = ? AND ticker = ? AND worker = ? AND status = ?
+            """,
+            (DONE, json.dumps(to_dict(result)), job.run_id, job.ticker, worker, LEASED),
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job: Job, worker: str, error: str) -> bool:
+        """
+        Catat job yang gagal; dikembalikan ke antrian jika masih ada jatah.
+
+        Kegagalan dari worker yang lease-nya sudah diambil alih worker lain
+        diabaikan.
+
+        Returns:
+            True jika job dikembalikan ke antrian untuk dicoba ulang
+        """
+        max_attempts = self._conn.execute(
+            'SELECT max_attempts FROM runs WHERE run_id = ?', (job.run_id,)
+        ).fetchone()[0]
+        retry = job.attempts < max_attempts
+        cursor = self._conn.execute(
+            """
+            UPDATE jobs SET status = ?, error = ?, lease_expires = NULL
+            WHERE run_id = ? AND ticker = ? AND worker = ? AND status = ?
+            """,
+            (
+                PENDING if retry else FAILED,
+                error,
+                job.run_id,
+                job.ticker,
+                worker,
+                LEASED,
+            ),
+        )
+        return cursor.rowcount == 1 and retry
+
+    def counts(self, run_id: str) -> Dict[str, int]:
+        """Jumlah job per status (pending, leased, done, failed)."""
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update(
+            self._conn.execute(
+                'SELECT status, COUNT(*) FROM jobs WHERE run_id = ? GROUP BY status',
+                (run_id,),
+            ).fetchall()
+        )
+        return counts
+
+    def is_finished(self, run_id: str) -> bool:
+        """Apakah semua job sudah done atau failed."""
+        counts = self.counts(run_id)
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+    def results(self, run_id: str) -> List[ScreeningResult]:
+        """
+        Hasil semua job yang selesai, diurutkan berdasarkan total score.
+
+        Returns:
+            List ScreeningResult (ranking tertinggi lebih dulu)
+        """
+        results = [
+            from_dict(ScreeningResult, json.loads(row[0]))
+            for row in self._conn.execute(
+                'SELECT result FROM jobs WHERE run_id = ? AND status = ?',
+                (run_id, DONE),
+            )
+        ]
+        results.sort(key=lambda r: r.metrics.total_score, reverse=True)
+        return results
+
+    def failures(self, run_id: str) -> Dict[str, Optional[str]]:
+        """Ticker yang gagal permanen beserta error terakhirnya."""
+        return dict(
+            self._conn.execute(
+                'SELECT ticker, error FROM jobs WHERE run_id = ? AND status = ? '
+                'ORDER BY position',
+                (run_id, FAILED),
+            ).fetchall()
+        )
+
+
+def run_worker(
+    queue: JobQueue,
+    run_id: str,
+    finance_service,
+    analyzer,
+    worker: Optional[str] = None,
+    batch_size: int = 1,
+    poll_interval: float = 1.0,
+) -> int:
+    """
+    Proses job dari queue sampai run selesai.
+
+    Jika tidak ada job yang bisa di-lease tetapi masih ada job milik worker
+    lain, worker menunggu poll_interval lalu mencoba lagi (lease yang habis
+    akan diambil alih).
+
+    Args:
+        queue: JobQueue
+        run_id: Run ID
+        finance_service: YahooFinanceService
+        analyzer: FundamentalAnalyzer (dengan criteria milik run)
+        worker: Identitas worker (default: worker_id())
+        batch_size: Jumlah job per lease
+        poll_interval: Detik menunggu saat semua job sedang di-lease
+
+    Returns:
+        Jumlah job yang diselesaikan worker ini
+    """
+    worker = worker or worker_id()
+    completed = 0
+    while True:
+        jobs = queue.lease(run_id, worker, limit=batch_size)
+        if not jobs:
+            if queue.is_finished(run_id):
+                return completed
+            time.sleep(poll_interval)
+            continue
+
+        for job in jobs:
+            try:
+                stock_data = finance_service.get_stock_data(job.ticker)
+                if stock_data is None:
+                    raise RuntimeError('fetch failed')
+                result = analyzer.analyze(stock_data)
+            except Exception as e:
+                logger.warning(f"Job {job.ticker} failed on {worker}: {e}")
+                queue.fail(job, worker, str(e))
+                continue
+
+            if queue.complete(job, worker, result):
+                completed += 1
+            else:
+                logger.warning(f"Lease for {job.ticker} expired, result discarded")
+
+
+def work(
+    queue_path: Union[str, Path],
+    run_id: str,
+    lease_timeout: float = 120.0,
+    batch_size: int = 1,
+) -> int:
+    """
+    Entry point worker process: buka queue dan service sendiri.
+
+    Args:
+        queue_path: Path file queue
+        run_id: Run ID
+        lease_timeout: Lihat JobQueue
+        batch_size: Jumlah job per lease
+
+    Returns:
+        Jumlah job yang diselesaikan
+    """
+    from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+    from src.services.yahoo_finance_service import YahooFinanceService
+
+    with JobQueue(queue_path, lease_timeout=lease_timeout) as queue:
+        return run_worker(
+            queue,
+            run_id,
+            YahooFinanceService(),
+            FundamentalAnalyzer(criteria=queue.criteria(run_id)),
+            batch_size=batch_size,
+        )
@@ -0,0 +1,195 @@
+"""
+Batch classification untuk corpus headline berita.
+
+Headline di-stream dari iterable atau file (JSONL, CSV, atau plain text),
+diproses per chunk, lalu hasilnya di-yield kembali sesuai urutan input.
+Memory hanya sebanding dengan ukuran chunk x jumlah chunk in-flight, bukan
+ukuran corpus. Klasifikasi memakai lexicon yang sama dengan
+NewsScraperService, dan record yang sudah diklasifikasi dengan versi lexicon
+yang sama di-pass through tanpa diklasifikasi ulang.
+"""
+
+from collections import deque
+import csv
+from dataclasses import dataclass
+from itertools import islice
+import json
+from pathlib import Path
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from src.utils.lexicon import LexiconClassifier, get_classifier
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+HeadlineRecord = Union[str, Dict[str, Any]]
+
+# Classifier per process (dibuat lazy di worker)
+_classifier: Optional[LexiconClassifier] = None
+
+
+@dataclass
+class ClassificationStats:
+    """Statistik throughput batch classification."""
+
+    items: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        """Throughput dalam items per detik."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.items / self.elapsed
+
+
+def read_headlines(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream headline records dari file.
+
+    Format ditentukan dari extension:
+    - .jsonl / .ndjson: satu JSON object per baris (minimal field 'title')
+    - .csv: header dengan kolom 'title' dan opsional 'summary'
+    - lainnya: satu headline per baris
+
+    Args:
+        path: Path ke file
+
+    Yields:
+        Dictionary record
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    with open(path, encoding='utf-8', newline='') as f:
+        if suffix == '.csv':
+            yield from csv.DictReader(f)
+            return
+
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            if suffix not in ('.jsonl', '.ndjson'):
+                yield {'title': line}
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping invalid JSON at {path}:{line_number}: {e}")
+                continue
+
+            if isinstance(record, dict):
+                yield record
+            else:
+                logger.warning(f"Skipping non-object record at {path}:{line_number}")
+
+
+def classify_record(record: HeadlineRecord) -> Dict[str, Any]:
+    """
+    Klasifikasi satu headline record.
+
+    Args:
+        record: Headline string atau dict dengan 'title' dan opsional 'summary'
+
+    Returns:
+        Copy record ditambah 'sentiment', 'sentiment_score',
+        'corporate_action_types' dan 'lexicon_version'
+    """
+    global _classifier
+    if _classifier is None:
+        _classifier = get_classifier()
+
+    if isinstance(record, str):
+        record = {'title': record}
+
+    version = _classifier.version
+    if record.get('lexicon_version') == version and 'sentiment' in record:
+        return dict(record)
+
+    text = f"{record.get('title') or ''} {record.get('summary') or ''}"
+    result = _classifier.classify(text)
+
+    return {
+        **record,
+        'sentiment': result.sentiment,
+        'sentiment_score': result.score,
+        'corporate_action_types': result.corporate_action_types,
+        'lexicon_version': version,
+    }
+
+
+def classify_chunk(chunk: List[HeadlineRecord]) -> List[Dict[str, Any]]:
+    """Klasifikasi satu chunk (unit kerja untuk process pool)."""
+    return [classify_record(record) for record in chunk]
+
+
+def _chunked(
+    records: Iterable[HeadlineRecord], size: int
+) -> Iterator[List[HeadlineRecord]]:
+    """Potong iterable menjadi list berukuran maksimal size."""
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def classify_headlines(
+    records: Iterable[HeadlineRecord],
+    chunk_size: int = 1000,
+    workers: int = 0,
+    stats: Optional[ClassificationStats] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream klasifikasi untuk banyak headline.
+
+    Dengan workers > 1, chunk diproses di process pool dengan jumlah chunk
+    in-flight dibatasi (2 x workers), sehingga input dibaca hanya secepat
+    hasil dikonsumsi. Output selalu mengikuti urutan input.
+
+    Args:
+        records: Iterable headline string atau dict
+        chunk_size: Jumlah record per chunk
+        workers: Jumlah worker process (0/1 = proses di process ini)
+        stats: Optional ClassificationStats yang di-update selama streaming
+
+    Yields:
+        Record hasil klasifikasi (lihat classify_record)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    stats = stats if stats is not None else ClassificationStats()
+    start = time.perf_counter()
+    chunks = _chunked(records, chunk_size)
+
+    def emit(results: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        stats.chunks += 1
+        for result in results:
+            stats.items += 1
+            yield result
+        stats.elapsed = time.perf_counter() - start
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from emit(classify_chunk(chunk))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    max_in_flight = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(classify_chunk, chunk))
+            if len(pending) >= max_in_flight:
+                yield from emit(pending.popleft().result())
+
+        while pending:
+            yield from emit(pending.popleft().result())
@@ -5,14 +5,22 @@ Service ini mengambil berita dari berbagai sumber dan melakukan
 sentiment analysis sederhana untuk identify positive/negative news.
 """
 
-from datetime import datetime
-from typing import List
-
-import yfinance as yf
-
-from src.models.stock_data import NewsItem
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from src.config.settings import SENTIMENT_WINDOWS
+from src.models.stock_data import CorporateAction, NewsItem, SentimentWindow
+from src.services.news_sources import NewsSource, build_sources, fetch_concurrently
+from src.services.news_store import SENTIMENTS, NewsStore
+from src.utils.corporate_actions import extract_corporate_actions
 from src.utils.helpers import normalize_ticker
+from src.utils.lexicon import LexiconClassifier, get_classifier
 from src.utils.logger import get_logger
+from src.utils.near_duplicates import (
+    DEFAULT_THRESHOLD,
+    MinHasher,
+    NearDuplicateDetector,
+)
 
 logger = get_logger(__name__)
 
@@ -20,79 +28,38 @@ logger = get_logger(__name__)
 class NewsScraperService:
     """Service untuk scraping berita dan corporate action."""
 
-    # Keywords untuk sentiment analysis
-    POSITIVE_KEYWORDS = [
-        'profit',
-        'revenue',
-        'growth',
-        'increase',
-        'gain',
-        'positive',
-        'expand',
-        'acquisition',
-        'partnership',
-        'dividend',
-        'buyback',
-        'upgrade',
-        'beat',
-        'exceed',
-        'strong',
-        'laba',
-        'naik',
-        'tumbuh',
-        'positif',
-        'dividen',
-    ]
-
-    NEGATIVE_KEYWORDS = [
-        'loss',
-        'decline',
-        'decrease',
-        'fall',
-        'drop',
-        'negative',
-        'weak',
-        'downgrade',
-        'miss',
-        'below',
-        'concern',
-        'risk',
-        'fraud',
-        'lawsuit',
-        'investigation',
-        'rugi',
-        'turun',
-        'merosot',
-        'negatif',
-        'penurunan',
-    ]
-
-    CORPORATE_ACTION_KEYWORDS = [
-        'stock split',
-        'reverse split',
-        'dividend',
-        'rights issue',
-        'buyback',
-        'merger',
-        'acquisition',
-        'ipo',
-        'delisting',
-        'bonus share',
-        'stock dividend',
-        'pemecahan saham',
-        'right issue',
-        'akuisisi',
-        'penggabungan',
-    ]
-
-    def __init__(self, max_news: int = 10):
+    def __init__(
+        self,
+        max_news: int = 10,
+        classifier: Optional[LexiconClassifier] = None,
+        store: Optional[NewsStore] = None,
+        refresh_interval: timedelta = timedelta(minutes=15),
+        sources: Optional[Sequence[NewsSource]] = None,
+        duplicate_threshold: float = DEFAULT_THRESHOLD,
+    ):
         """
         Initialize news scraper service.
 
         Args:
             max_news: Maximum number of news items to fetch
+            classifier: Optional LexiconClassifier (default: lexicon bawaan)
+            store: Optional NewsStore untuk incremental fetching
+            refresh_interval: Jarak minimum antar fetch ke sumber berita
+                per ticker jika store digunakan
+            sources: Sumber berita yang di-query secara paralel
+                (default: DEFAULT_NEWS_SOURCES)
+            duplicate_threshold: Minimum kemiripan judul (estimasi Jaccard)
+                untuk dianggap near-duplicate
         """
         self.max_news = max_news
+        self.classifier = classifier or get_classifier()
+        self.store = store
+        self.refresh_interval = refresh_interval
+        self.sources = list(sources) if sources is not None else build_sources()
+        self.duplicate_threshold = duplicate_threshold
+        self.hasher = MinHasher()
+        # Detector per ticker yang berisi seluruh corpus di store
+        self._stored_detectors: Dict[str, NearDuplicateDetector] = {}
 
     def get_news(self, ticker: str) -> List[NewsItem]:
         """
@@ -105,17 +72,12 @@ class NewsScraperService:
             List of NewsItem
         """
         normalized_ticker = normalize_ticker(ticker)
-        logger.info(f"Fetching news for {normalized_ticker}...")
+        if self.store is not None:
+            return self._get_stored_news(normalized_ticker)
 
-        news_items = []
-
-        # Get news from Yahoo Finance
-        yahoo_news = self._get_yahoo_finance_news(normalized_ticker)
-        news_items.extend(yahoo_news)
+        logger.info(f"Fetching news for {normalized_ticker}...")
 
-        # Could add more sources here:
-        # - idx_news = self._get_idx_news(ticker)
-        # - investing_news = self._get_investing_com_news(ticker)
+        news_items = self._fetch_news(normalized_ticker)
 
         # Sort by date (most recent first)
         news_items.sort(
@@ -128,94 +90,266 @@ class NewsScraperService:
         logger.info(f"Found {len(news_items)} news items for {normalized_ticker}")
         return news_items
 
-    def _get_yahoo_finance_news(self, ticker: str) -> List[NewsItem]:
+    def _get_stored_news(self, ticker: str) -> List[NewsItem]:
         """
-        Get news dari Yahoo Finance.
+        Get news dari store, refresh dari sumber jika sudah lewat interval.
+
+        Hanya item yang lebih baru dari high-water mark yang diklasifikasi
+        dan disimpan; item tersimpan dengan versi lexicon lama
+        diklasifikasi ulang.
 
         Args:
-            ticker: Stock ticker symbol
+            ticker: Normalized ticker symbol
 
         Returns:
-            List of NewsItem
+            List of NewsItem, terbaru lebih dulu
         """
-        news_items = []
+        now = datetime.now()
+        last_refresh = self.store.last_refresh(ticker)
+
+        if last_refresh is None or now - last_refresh >= self.refresh_interval:
+            logger.info(f"Refreshing news for {ticker}...")
+            since = self.store.high_water_mark(ticker)
+            detector = self._get_stored_detector(ticker)
+            fresh = self._fetch_news(
+                ticker,
+                since=since,
+                known_ids=self.store.item_ids_at(ticker, since) if since else set(),
+                detector=detector,
+            )
+            signatures = {
+                news.item_id: detector.signature(news.item_id).tobytes()
+                for news in fresh
+                if news.item_id in detector
+            }
+            added = self.store.add(
+                ticker, fresh, refreshed_at=now, signatures=signatures
+            )
+            logger.info(f"Stored {added} new news items for {ticker}")
 
-        try:
-            stock = yf.Ticker(ticker)
-            news_data = stock.news
+        news_items = self.store.get(ticker, limit=self.max_news)
 
-            if not news_data:
-                logger.warning(f"No news found for {ticker}")
-                return news_items
+        stale = [n for n in news_items if n.lexicon_version != self.classifier.version]
+        if stale:
+            for news in stale:
+                self._classify_item(news)
+            self.store.update_classification(ticker, stale)
 
-            for item in news_data[: self.max_news]:
-                # Parse timestamp
-                published_date = None
-                if 'providerPublishTime' in item:
-                    published_date = datetime.fromtimestamp(
-                        item['providerPublishTime']
-                    )
+        return news_items
 
-                # Create NewsItem
-                news_item = NewsItem(
-                    title=item.get('title', ''),
-                    source=item.get('publisher', 'Yahoo Finance'),
-                    published_date=published_date,
-                    url=item.get('link'),
-                    summary=item.get('summary'),
-                    sentiment=self._analyze_sentiment(
-                        item.get('title', '') + ' ' + item.get('summary', '')
+    def _get_stored_detector(self, ticker: str) -> NearDuplicateDetector:
+        """Get detector near-duplicate berisi corpus tersimpan untuk ticker."""
+        detector = self._stored_detectors.get(ticker)
+        if detector is None:
+            import numpy as np
+
+            detector = self._new_detector()
+            for item_id, title, signature in self.store.signatures(ticker):
+                detector.add(
+                    item_id,
+                    detector.fingerprint(
+                        title, np.frombuffer(signature, dtype=np.uint32)
                     ),
                 )
+            self._stored_detectors[ticker] = detector
+        return detector
+
+    def _new_detector(self) -> NearDuplicateDetector:
+        """Create detector near-duplicate kosong."""
+        return NearDuplicateDetector(self.duplicate_threshold, self.hasher)
+
+    def _is_near_duplicate(
+        self, key, title: str, detector: NearDuplicateDetector
+    ) -> bool:
+        """
+        Check near-duplicate berdasarkan judul, lalu daftarkan item baru.
+
+        Judul dipakai sebagai fingerprint karena summary dari sumber berbeda
+        untuk berita yang sama biasanya berbeda atau tidak ada.
+        """
+        if key in detector:
+            return True
+
+        fingerprint = detector.fingerprint(title)
+        if fingerprint is None:
+            return False
+
+        duplicate_of = detector.find(fingerprint)
+        if duplicate_of is not None:
+            logger.debug(f"Skipping near-duplicate of {duplicate_of}: {title}")
+            return True
+
+        detector.add(key, fingerprint)
+        return False
+
+    def _fetch_news(
+        self,
+        ticker: str,
+        since: Optional[datetime] = None,
+        known_ids: Set[str] = frozenset(),
+        detector: Optional[NearDuplicateDetector] = None,
+    ) -> List[NewsItem]:
+        """
+        Fetch dari semua sumber secara paralel dan klasifikasi item baru.
+
+        Item diklasifikasi saat hasil sumbernya tiba. Duplikat antar sumber
+        (item_id sama atau judul near-duplicate) dibuang sebelum klasifikasi.
+
+        Args:
+            ticker: Normalized ticker symbol
+            since: Optional high-water mark; item yang lebih lama dilewati
+                sebelum diklasifikasi
+            known_ids: ID item yang sudah tersimpan tepat pada high-water mark
+            detector: Optional detector berisi corpus yang sudah ada
+
+        Returns:
+            List of NewsItem
+        """
+        news_items = []
+        seen = set(known_ids)
+        detector = detector if detector is not None else self._new_detector()
 
-                news_items.append(news_item)
+        for source, items in fetch_concurrently(self.sources, ticker, self.max_news):
+            for news in items:
+                if news.item_id in seen:
+                    continue
+                if since and news.published_date and news.published_date < since:
+                    continue
 
-        except Exception as e:
-            logger.error(f"Error fetching Yahoo Finance news: {str(e)}")
+                seen.add(news.item_id)
+                if self._is_near_duplicate(news.item_id, news.title, detector):
+                    continue
+                news_items.append(self._classify_item(news))
+
+            logger.debug(f"Received {len(items)} news items from {source.name}")
 
         return news_items
 
-    def get_corporate_actions(self, ticker: str) -> List[NewsItem]:
+    def collapse_duplicates(self, news_items: List[NewsItem]) -> List[NewsItem]:
         """
-        Get corporate actions dari news.
+        Buang near-duplicate dari list, item pertama yang dipertahankan.
 
-        Filter news yang mengandung corporate action keywords.
+        Args:
+            news_items: List of news items
+
+        Returns:
+            List tanpa near-duplicate (urutan dipertahankan)
+        """
+        detector = self._new_detector()
+        return [
+            news
+            for index, news in enumerate(news_items)
+            if not self._is_near_duplicate(index, news.title, detector)
+        ]
+
+    def get_corporate_actions(
+        self, ticker: str, news_items: Optional[List[NewsItem]] = None
+    ) -> List[CorporateAction]:
+        """
+        Get corporate action events dari news.
+
+        Dengan store, event sudah diekstrak saat berita disimpan dan dibaca
+        dari calendar; tanpa store, event diekstrak dari berita yang baru
+        di-fetch.
 
         Args:
             ticker: Stock ticker symbol
+            news_items: Optional berita yang sudah di-fetch (default: get_news,
+                yang tanpa store berarti query ulang semua sumber)
 
         Returns:
-            List of NewsItem yang merupakan corporate actions
+            List of CorporateAction, urut sesuai berita (terbaru lebih dulu)
         """
-        all_news = self.get_news(ticker)
-
-        corporate_actions = []
-        for news in all_news:
-            if self._is_corporate_action(news):
-                corporate_actions.append(news)
+        normalized_ticker = normalize_ticker(ticker)
+        all_news = news_items if news_items is not None else self.get_news(ticker)
+
+        if self.store is not None:
+            order = {news.item_id: index for index, news in enumerate(all_news)}
+            corporate_actions = sorted(
+                (
+                    action
+                    for action in self.store.corporate_actions(
+                        tickers=[normalized_ticker]
+                    )
+                    if action.item_id in order
+                ),
+                key=lambda action: order[action.item_id],
+            )
+        else:
+            corporate_actions = [
+                action
+                for news in all_news
+                if self._is_corporate_action(news)
+                for action in extract_corporate_actions(normalized_ticker, news)
+            ]
 
         logger.info(
-            f"Found {len(corporate_actions)} corporate action items for {ticker}"
+            f"Found {len(corporate_actions)} corporate action events for {ticker}"
         )
         return corporate_actions
 
+    def get_sentiment_trend(
+        self,
+        ticker: str,
+        news_items: Optional[List[NewsItem]] = None,
+        as_of: Optional[date] = None,
+    ) -> List[SentimentWindow]:
+        """
+        Get agregat sentiment rolling window (SENTIMENT_WINDOWS) untuk ticker.
+
+        Dengan store, agregat dibaca dari time series yang di-update
+        incremental saat berita disimpan (mencakup seluruh histori). Tanpa
+        store, agregat dihitung dari news_items (atau get_news).
+
+        Args:
+            ticker: Stock ticker symbol
+            news_items: Optional berita yang sudah di-fetch (mode tanpa store)
+            as_of: Hari terakhir window (default: hari ini)
+
+        Returns:
+            List of SentimentWindow, window terpendek lebih dulu
+        """
+        as_of = as_of or date.today()
+        if self.store is not None:
+            return self.store.sentiment_trend(normalize_ticker(ticker), as_of=as_of)
+
+        if news_items is None:
+            news_items = self.get_news(ticker)
+
+        windows = [
+            SentimentWindow(days=days, end_date=as_of) for days in SENTIMENT_WINDOWS
+        ]
+        for news in news_items:
+            if news.published_date is None or news.sentiment not in SENTIMENTS:
+                continue
+            age = (as_of - news.published_date.date()).days
+            for window in windows:
+                if 0 <= age < window.days:
+                    count = getattr(window, news.sentiment)
+                    setattr(window, news.sentiment, count + 1)
+                    window.score += news.weighted_sentiment()
+        return windows
+
     def _is_corporate_action(self, news: NewsItem) -> bool:
         """
         Check apakah news item adalah corporate action.
 
+        Memakai hasil klasifikasi yang tersimpan di NewsItem jika dibuat
+        dengan versi lexicon yang sama.
+
         Args:
             news: NewsItem to check
 
         Returns:
             True if news is about corporate action
         """
-        text = (news.title + ' ' + (news.summary or '')).lower()
+        if (
+            news.corporate_action_types is None
+            or news.lexicon_version != self.classifier.version
+        ):
+            self._classify_item(news)
 
-        for keyword in self.CORPORATE_ACTION_KEYWORDS:
-            if keyword.lower() in text:
-                return True
-
-        return False
+        return bool(news.corporate_action_types)
 
     def _analyze_sentiment(self, text: str) -> str:
         """
@@ -227,86 +361,42 @@ class NewsScraperService:
         Returns:
             'positive', 'negative', or 'neutral'
         """
-        if not text:
-            return 'neutral'
-
-        text_lower = text.lower()
-
-        positive_count = sum(
-            1 for keyword in self.POSITIVE_KEYWORDS if keyword in text_lower
-        )
-        negative_count = sum(
-            1 for keyword in self.NEGATIVE_KEYWORDS if keyword in text_lower
-        )
-
-        if positive_count > negative_count:
-            return 'positive'
-        elif negative_count > positive_count:
-            return 'negative'
-        else:
-            return 'neutral'
+        sentiment, _ = self._classify_text(text)
+        return sentiment
 
-    def _get_idx_news(self, ticker: str) -> List[NewsItem]:
+    def _classify_text(self, text: str) -> Tuple[str, List[str]]:
         """
-        Get news dari idx.co.id (Indonesia Stock Exchange).
-
-        Note: This is a placeholder for future implementation.
-        IDX website structure might require specific scraping logic.
+        Klasifikasi sentiment dan tipe corporate action dalam satu pass.
 
         Args:
-            ticker: Stock ticker (without .JK suffix)
+            text: Text to analyze
 
         Returns:
-            List of NewsItem
+            Tuple (sentiment, list tipe corporate action)
         """
-        news_items = []
-
-        try:
-            # This would require specific implementation based on IDX website structure
-            # Example structure (not actual implementation):
-            # ticker_clean = ticker.replace('.JK', '')
-            # url = f"https://www.idx.co.id/perusahaan-tercatat/profil-perusahaan-tercatat/?kodeEmiten={ticker_clean}"
-            # response = requests.get(url, timeout=10)
-            # Parse HTML and extract news
-
-            logger.info(
-                "IDX news scraping not yet implemented - placeholder only"
-            )
-
-        except Exception as e:
-            logger.error(f"Error fetching IDX news: {str(e)}")
+        result = self.classifier.classify(text)
+        return result.sentiment, result.corporate_action_types
 
-        return news_items
-
-    def _get_investing_com_news(self, ticker: str) -> List[NewsItem]:
+    def _classify_item(self, news: NewsItem) -> NewsItem:
         """
-        Get news dari Investing.com.
+        Klasifikasi NewsItem dan simpan hasilnya di item tersebut.
 
-        Note: This is a placeholder for future implementation.
-        Investing.com might have anti-scraping measures.
+        Sentiment yang di-set dari luar (tanpa lexicon_version) tidak ditimpa;
+        hasil klasifikasi dengan versi lexicon lain dianggap stale.
 
         Args:
-            ticker: Stock ticker
+            news: NewsItem to classify
 
         Returns:
-            List of NewsItem
+            NewsItem yang sama
         """
-        news_items = []
-
-        try:
-            # This would require:
-            # 1. Mapping ticker to Investing.com stock ID
-            # 2. Proper headers to avoid anti-scraping
-            # 3. Parsing their HTML structure
-
-            logger.info(
-                "Investing.com news scraping not yet implemented - placeholder only"
-            )
-
-        except Exception as e:
-            logger.error(f"Error fetching Investing.com news: {str(e)}")
-
-        return news_items
+        result = self.classifier.classify(news.title + ' ' + (news.summary or ''))
+        if news.sentiment is None or news.lexicon_version is not None:
+            news.sentiment = result.sentiment
+            news.sentiment_score = result.score
+        news.corporate_action_types = result.corporate_action_types
+        news.lexicon_version = self.classifier.version
+        return news
 
     def analyze_news_impact(self, news_items: List[NewsItem]) -> dict:
         """
@@ -322,7 +412,11 @@ class NewsScraperService:
             - neutral_count
             - overall_sentiment
             - key_events: List of important events
+            - duplicates_collapsed: Jumlah near-duplicate yang tidak dihitung
         """
+        total = len(news_items)
+        news_items = self.collapse_duplicates(news_items)
+
         positive = sum(1 for n in news_items if n.sentiment == 'positive')
         negative = sum(1 for n in news_items if n.sentiment == 'negative')
         neutral = sum(1 for n in news_items if n.sentiment == 'neutral')
@@ -349,4 +443,5 @@ class NewsScraperService:
             'overall_sentiment': overall,
             'key_events': key_events[:5],  # Top 5 key events
             'total_news': len(news_items),
+            'duplicates_collapsed': total - len(news_items),
         }
@@ -0,0 +1,362 @@
+"""
+Registry sumber berita dan aggregator concurrent.
+
+Setiap sumber berita adalah plugin (subclass NewsSource) yang didaftarkan
+dengan @register_source. Aggregator menjalankan semua sumber secara paralel,
+masing-masing dengan deadline sendiri, dan mengembalikan hasil sesuai urutan
+selesai. Latency total dibatasi oleh deadline sumber paling lambat, bukan
+jumlah latency semua sumber.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+import hashlib
+import time
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from src.models.stock_data import NewsItem
+from src.utils.helpers import get_ticker_without_suffix
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    import requests
+
+logger = get_logger(__name__)
+
+NEWS_SOURCES: Dict[str, Type['NewsSource']] = {}
+
+# Sumber yang dipakai jika tidak dikonfigurasi
+DEFAULT_NEWS_SOURCES = ('yahoo',)
+
+_USER_AGENT = 'Mozilla/5.0 (compatible; FridayScreener)'
+
+
+def register_source(name: str):
+    """
+    Decorator untuk mendaftarkan NewsSource.
+
+    Args:
+        name: Nama sumber (dipakai di CLI dan konfigurasi)
+    """
+
+    def decorator(cls: Type['NewsSource']) -> Type['NewsSource']:
+        cls.name = name
+        NEWS_SOURCES[name] = cls
+        return cls
+
+    return decorator
+
+
+def stable_item_id(title: str, published_date: Optional[datetime]) -> str:
+    """ID fallback untuk item tanpa UUID/URL: hash title + tanggal."""
+    key = f"{title}|{published_date.isoformat() if published_date else ''}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+class NewsSource:
+    """Base class untuk plugin sumber berita."""
+
+    name = ''
+    default_timeout = 10.0
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Initialize source.
+
+        Args:
+            timeout: Deadline fetch dalam detik (default: default_timeout)
+        """
+        self.timeout = timeout if timeout is not None else self.default_timeout
+
+    def fetch(self, ticker: str, limit: int) -> List[NewsItem]:
+        """
+        Fetch berita (belum diklasifikasi) untuk ticker.
+
+        Args:
+            ticker: Normalized ticker symbol (dengan suffix .JK)
+            limit: Maximum jumlah item
+
+        Returns:
+            List of NewsItem dengan item_id terisi
+        """
+        raise NotImplementedError
+
+
+class HttpNewsSource(NewsSource):
+    """Base class untuk sumber berbasis HTTP dengan base URL yang bisa diganti."""
+
+    base_url = ''
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        base_url: Optional[str] = None,
+        session: Optional['requests.Session'] = None,
+    ):
+        """
+        Initialize source.
+
+        Args:
+            timeout: Deadline fetch dalam detik
+            base_url: Override base URL (misalnya untuk testing)
+            session: Optional requests.Session untuk reuse koneksi
+        """
+        super().__init__(timeout)
+        if base_url is not None:
+            self.base_url = base_url.rstrip('/')
+        self.session = session
+
+    def _get(self, path: str, **params) -> 'requests.Response':
+        """GET request dengan timeout source."""
+        import requests
+
+        response = (self.session or requests).get(
+            f'{self.base_url}{path}',
+            params=params or None,
+            headers={'User-Agent': _USER_AGENT},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response
+
+
+@register_source('yahoo')
+class YahooFinanceSource(NewsSource):
+    """Berita dari Yahoo Finance (via yfinance)."""
+
+    def fetch(self, ticker: str, limit: int) -> List[NewsItem]:
+        import yfinance as yf
+
+        news_data = yf.Ticker(ticker).news
+        if not news_data:
+            logger.warning(f"No news found for {ticker}")
+            return []
+
+        news_items = []
+        for item in news_data[:limit]:
+            published_date = None
+            if 'providerPublishTime' in item:
+                published_date = datetime.fromtimestamp(item['providerPublishTime'])
+
+            title = item.get('title', '')
+            news_items.append(
+                NewsItem(
+                    title=title,
+                    source=item.get('publisher', 'Yahoo Finance'),
+                    published_date=published_date,
+                    url=item.get('link'),
+                    summary=item.get('summary'),
+                    item_id=(
+                        item.get('uuid')
+                        or item.get('link')
+                        or stable_item_id(title, published_date)
+                    ),
+                )
+            )
+
+        return news_items
+
+
+@register_source('idx')
+class IdxSource(HttpNewsSource):
+    """Keterbukaan informasi (pengumuman emiten) dari idx.co.id."""
+
+    base_url = 'https://www.idx.co.id'
+
+    def fetch(self, ticker: str, limit: int) -> List[NewsItem]:
+        data = self._get(
+            '/primary/ListedCompany/GetAnnouncement',
+            kodeEmiten=get_ticker_without_suffix(ticker),
+            emitenType='*',
+            indexFrom=0,
+            pageSize=limit,
+            lang='id',
+        ).json()
+
+        news_items = []
+        for reply in (data.get('Replies') or [])[:limit]:
+            announcement = reply.get('pengumuman') or {}
+            title = (announcement.get('JudulPengumuman') or '').strip()
+            if not title:
+                continue
+
+            published_date = None
+            if announcement.get('TglPengumuman'):
+                try:
+                    published_date = datetime.fromisoformat(
+                        announcement['TglPengumuman']
+                    )
+                except ValueError:
+                    pass
+
+            attachments = reply.get('attachments') or []
+            url = attachments[0].get('FullSavePath') if attachments else None
+
+            news_items.append(
+                NewsItem(
+                    title=title,
+                    source='IDX',
+                    published_date=published_date,
+                    url=url,
+                    summary=announcement.get('PerihalPengumuman'),
+                    item_id=(
+                        f"idx:{announcement['Id2']}"
+                        if announcement.get('Id2')
+                        else url or stable_item_id(title, published_date)
+                    ),
+                )
+            )
+
+        return news_items
+
+
+@register_source('investing')
+class InvestingSource(HttpNewsSource):
+    """Berita dari halaman news emiten di Investing.com."""
+
+    base_url = 'https://id.investing.com'
+    default_timeout = 8.0
+
+    def fetch(self, ticker: str, limit: int) -> List[NewsItem]:
+        symbol = get_ticker_without_suffix(ticker).lower()
+        from bs4 import BeautifulSoup
+
+        html = self._get(f'/equities/{symbol}-news').text
+        soup = BeautifulSoup(html, 'html.parser')
+
+        news_items = []
+        for article in soup.find_all('article'):
+            link = article.find('a', href=True)
+            if link is None or not link.get_text(strip=True):
+                continue
+
+            url = link['href']
+            if url.startswith('/'):
+                url = f'{self.base_url}{url}'
+
+            published_date = None
+            time_tag = article.find('time')
+            if time_tag is not None and time_tag.get('datetime'):
+                try:
+                    published_date = datetime.fromisoformat(
+                        time_tag['datetime'].replace('Z', '')
+                    )
+                except ValueError:
+                    pass
+
+            summary_tag = article.find('p')
+            news_items.append(
+                NewsItem(
+                    title=link.get_text(strip=True),
+                    source='Investing.com',
+                    published_date=published_date,
+                    url=url,
+                    summary=summary_tag.get_text(strip=True) if summary_tag else None,
+                    item_id=url,
+                )
+            )
+            if len(news_items) >= limit:
+                break
+
+        return news_items
+
+
+def build_sources(
+    names: Iterable[str] = DEFAULT_NEWS_SOURCES,
+    timeouts: Optional[Dict[str, float]] = None,
+    session: Optional['requests.Session'] = None,
+) -> List[NewsSource]:
+    """
+    Instantiate sources dari registry.
+
+    Args:
+        names: Nama sumber (lihat NEWS_SOURCES)
+        timeouts: Optional override deadline per sumber
+        session: Optional requests.Session yang dipakai bersama oleh sumber HTTP
+
+    Returns:
+        List of NewsSource
+
+    Raises:
+        ValueError: Jika nama sumber tidak dikenal
+    """
+    timeouts = timeouts or {}
+    sources = []
+    for name in names:
+        if name not in NEWS_SOURCES:
+            raise ValueError(
+                f"Unknown news source '{name}'. Available: {', '.join(NEWS_SOURCES)}"
+            )
+        source_class = NEWS_SOURCES[name]
+        if issubclass(source_class, HttpNewsSource):
+            sources.append(source_class(timeout=timeouts.get(name), session=session))
+        else:
+            sources.append(source_class(timeout=timeouts.get(name)))
+    return sources
+
+
+def fetch_concurrently(
+    sources: Iterable[NewsSource], ticker: str, limit: int
+) -> Iterator[Tuple[NewsSource, List[NewsItem]]]:
+    """
+    Jalankan semua sources secara paralel dan yield hasil saat tersedia.
+
+    Sumber yang gagal di-log dan dilewati. Sumber yang melewati deadline-nya
+    ditinggalkan (tidak ditunggu) dan hasilnya diabaikan.
+
+    Args:
+        sources: NewsSource yang akan di-query
+        ticker: Normalized ticker symbol
+        limit: Maximum jumlah item per sumber
+
+    Yields:
+        Tuple (source, items) sesuai urutan selesai
+    """
+    sources = list(sources)
+    if not sources:
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=len(sources), thread_name_prefix='news-source'
+    )
+    start = time.monotonic()
+    pending = {
+        executor.submit(source.fetch, ticker, limit): (source, start + source.timeout)
+        for source in sources
+    }
+
+    try:
+        while pending:
+            now = time.monotonic()
+            for future in [f for f, (_, deadline) in pending.items() if deadline <= now]:
+                source, _ = pending.pop(future)
+                future.cancel()
+                logger.warning(
+                    f"News source {source.name} timed out after {source.timeout}s"
+                )
+            if not pending:
+                break
+
+            next_deadline = min(deadline for _, deadline in pending.values())
+            done, _ = wait(
+                pending, timeout=max(next_deadline - now, 0), return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                source, _ = pending.pop(future)
+                try:
+                    items = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching {source.name} news: {str(e)}")
+                    continue
+                yield source, items
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,903 @@
+"""
+Persistent news store berbasis SQLite.
+
+Berita disimpan per (ticker, item_id) beserta hasil klasifikasinya. Setiap
+ticker punya high-water mark (tanggal publish terbaru yang sudah disimpan)
+dan waktu refresh terakhir, sehingga NewsScraperService hanya perlu
+mengklasifikasi item baru dan bisa membaca hasil gabungan secara lokal.
+
+Store juga memelihara inverted index (token -> postings ticker/tanggal/
+item/posisi) yang di-update setiap item baru disimpan, untuk full-text
+search dengan phrase dan date-range tanpa scan seluruh berita.
+
+Corporate action diekstrak sekali per item saat disimpan (atau saat
+diklasifikasi ulang) ke tabel calendar yang di-index per tanggal event,
+sehingga query seperti "semua dividen minggu depan" adalah range scan.
+
+Sentiment per ticker disimpan sebagai time series harian plus agregat
+rolling window (SENTIMENT_WINDOWS). Setiap item baru meng-update bucket
+harian dan setiap window dalam O(1); saat window bergeser maju, hanya hari
+yang keluar dari window yang dikurangkan (amortized O(1) per item).
+"""
+
+from datetime import date, datetime, timedelta
+import json
+from pathlib import Path
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from src.config.settings import SENTIMENT_WINDOWS, get_data_dir
+from src.models.stock_data import (
+    CorporateAction,
+    DailySentiment,
+    NewsItem,
+    SentimentWindow,
+)
+from src.utils.corporate_actions import extract_corporate_actions
+from src.utils.logger import get_logger
+from src.utils.near_duplicates import normalize_text
+
+logger = get_logger(__name__)
+
+SENTIMENTS = ('positive', 'negative', 'neutral')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS news (
+    ticker TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    source TEXT NOT NULL,
+    published_date TEXT,
+    url TEXT,
+    summary TEXT,
+    sentiment TEXT,
+    sentiment_score REAL,
+    corporate_action_types TEXT,
+    lexicon_version TEXT,
+    signature BLOB,
+    PRIMARY KEY (ticker, item_id)
+);
+CREATE INDEX IF NOT EXISTS idx_news_ticker_date ON news (ticker, published_date);
+CREATE TABLE IF NOT EXISTS postings (
+    token TEXT NOT NULL,
+    published_date TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    positions TEXT NOT NULL,
+    PRIMARY KEY (token, published_date, ticker, item_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS corporate_actions (
+    ticker TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    action_type TEXT NOT NULL,
+    event_date TEXT,
+    announced_date TEXT,
+    dates TEXT,
+    ratio TEXT,
+    amount REAL,
+    PRIMARY KEY (ticker, item_id, action_type)
+);
+CREATE INDEX IF NOT EXISTS idx_actions_date
+    ON corporate_actions (event_date, action_type);
+CREATE INDEX IF NOT EXISTS idx_actions_ticker_date
+    ON corporate_actions (ticker, event_date);
+CREATE TABLE IF NOT EXISTS sentiment_daily (
+    ticker TEXT NOT NULL,
+    day TEXT NOT NULL,
+    positive INTEGER NOT NULL,
+    negative INTEGER NOT NULL,
+    neutral INTEGER NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (ticker, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sentiment_windows (
+    ticker TEXT NOT NULL,
+    days INTEGER NOT NULL,
+    end_day TEXT NOT NULL,
+    positive INTEGER NOT NULL,
+    negative INTEGER NOT NULL,
+    neutral INTEGER NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (ticker, days)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    ticker TEXT PRIMARY KEY,
+    last_published TEXT,
+    last_refresh TEXT
+);
+"""
+
+_COLUMNS = (
+    'item_id',
+    'title',
+    'source',
+    'published_date',
+    'url',
+    'summary',
+    'sentiment',
+    'sentiment_score',
+    'corporate_action_types',
+    'lexicon_version',
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Token untuk inverted index (lowercase, tanpa tanda baca)."""
+    return normalize_text(text).split()
+
+
+def _postings(ticker: str, item: NewsItem) -> List[tuple]:
+    """
+    Postings untuk satu item: satu row per token dengan daftar posisinya.
+
+    Token summary diberi jarak satu posisi dari token judul supaya phrase
+    tidak match melintasi judul dan summary. Item tanpa tanggal disimpan
+    dengan tanggal '' (di luar semua date range).
+    """
+    title_tokens = tokenize(item.title)
+    positioned = list(enumerate(title_tokens)) + [
+        (len(title_tokens) + 1 + i, token)
+        for i, token in enumerate(tokenize(item.summary))
+    ]
+
+    positions: Dict[str, List[int]] = {}
+    for position, token in positioned:
+        positions.setdefault(token, []).append(position)
+
+    published = _to_text(item.published_date) or ''
+    return [
+        (token, published, ticker, item.item_id, ','.join(map(str, token_positions)))
+        for token, token_positions in positions.items()
+    ]
+
+
+def _contains_phrase(tokens: List[str], positions: Dict[str, Set[int]]) -> bool:
+    """Check apakah tokens muncul berurutan berdasarkan posisi."""
+    return any(
+        all(start + i in positions[token] for i, token in enumerate(tokens[1:], 1))
+        for start in positions[tokens[0]]
+    )
+
+
+def _sentiment_delta(
+    item: NewsItem, sign: int = 1
+) -> Optional[Tuple[int, int, int, float]]:
+    """
+    Kontribusi item ke agregat sentiment: (positive, negative, neutral, score).
+
+    Item tanpa sentiment atau tanggal tidak dihitung.
+    """
+    if item.sentiment not in SENTIMENTS or item.published_date is None:
+        return None
+    return (
+        sign * (item.sentiment == 'positive'),
+        sign * (item.sentiment == 'negative'),
+        sign * (item.sentiment == 'neutral'),
+        sign * item.weighted_sentiment(),
+    )
+
+
+def _to_text(value: Optional[datetime]) -> Optional[str]:
+    """Datetime ke ISO string (sortable di SQLite)."""
+    return value.isoformat() if value else None
+
+
+def _from_text(value: Optional[str]) -> Optional[datetime]:
+    """ISO string ke datetime."""
+    return datetime.fromisoformat(value) if value else None
+
+
+class NewsStore:
+    """On-disk store untuk NewsItem per ticker."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open (atau buat) news store.
+
+        Args:
+            path: Path file SQLite (default: <data dir>/news.db).
+                ':memory:' untuk store sementara.
+        """
+        if path is None:
+            path = get_data_dir() / 'news.db'
+        if str(path) != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path)
+        tables = {
+            row[0]
+            for row in self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        self._conn.executescript(_SCHEMA)
+        self._migrate(tables)
+
+    def _migrate(self, tables: Set[str]) -> None:
+        """
+        Upgrade database yang dibuat versi sebelumnya.
+
+        Args:
+            tables: Nama tabel yang sudah ada sebelum schema dijalankan
+        """
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(news)')}
+        if 'signature' not in columns:
+            with self._conn:
+                self._conn.execute('ALTER TABLE news ADD COLUMN signature BLOB')
+        if 'sentiment_score' not in columns:
+            with self._conn:
+                self._conn.execute('ALTER TABLE news ADD COLUMN sentiment_score REAL')
+
+        has_news = self._conn.execute(
+            'SELECT EXISTS (SELECT 1 FROM news)'
+        ).fetchone()[0]
+        has_postings = self._conn.execute(
+            'SELECT EXISTS (SELECT 1 FROM postings)'
+        ).fetchone()[0]
+        if has_news and not has_postings:
+            self.reindex()
+        if has_news and 'corporate_actions' not in tables:
+            self.rebuild_corporate_actions()
+        if has_news and 'sentiment_daily' not in tables:
+            self.rebuild_sentiment()
+
+    def reindex(self) -> None:
+        """Bangun ulang inverted index dari semua berita tersimpan."""
+        logger.info("Rebuilding news search index...")
+        rows = self._conn.execute(
+            f"SELECT ticker, {', '.join(_COLUMNS)} FROM news"
+        ).fetchall()
+        with self._conn:
+            self._conn.execute('DELETE FROM postings')
+            for row in rows:
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO postings VALUES (?, ?, ?, ?, ?)',
+                    _postings(row[0], self._item(row[1:])),
+                )
+
+    def rebuild_corporate_actions(self) -> None:
+        """Ekstrak ulang calendar corporate action dari semua berita tersimpan."""
+        logger.info("Rebuilding corporate action calendar...")
+        rows = self._conn.execute(
+            f"SELECT ticker, {', '.join(_COLUMNS)} FROM news "
+            'WHERE corporate_action_types IS NOT NULL'
+        ).fetchall()
+        with self._conn:
+            self._conn.execute('DELETE FROM corporate_actions')
+            for row in rows:
+                self._store_actions(row[0], self._item(row[1:]))
+
+    def rebuild_sentiment(self) -> None:
+        """Bangun ulang time series dan rolling window sentiment."""
+        logger.info("Rebuilding news sentiment time series...")
+        rows = self._conn.execute(
+            f"SELECT ticker, {', '.join(_COLUMNS)} FROM news "
+            'ORDER BY ticker, published_date'
+        ).fetchall()
+        with self._conn:
+            self._conn.execute('DELETE FROM sentiment_daily')
+            self._conn.execute('DELETE FROM sentiment_windows')
+            for row in rows:
+                self._apply_sentiment(row[0], self._item(row[1:]))
+
+    def _apply_sentiment(self, ticker: str, item: NewsItem, sign: int = 1) -> None:
+        """
+        Tambahkan (sign=1) atau kurangkan (sign=-1) item dari agregat sentiment.
+
+        Bucket harian di-upsert, lalu setiap rolling window di-update:
+        item di dalam window ditambahkan langsung; item yang lebih baru dari
+        akhir window menggeser window maju dengan mengurangkan hari yang
+        keluar; item yang lebih lama dari window diabaikan.
+        """
+        delta = _sentiment_delta(item, sign)
+        if delta is None:
+            return
+
+        day = item.published_date.date()
+        self._conn.execute(
+            """
+            INSERT INTO sentiment_daily VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (ticker, day) DO UPDATE SET
+                positive = positive + excluded.positive,
+                negative = negative + excluded.negative,
+                neutral = neutral + excluded.neutral,
+                score = score + excluded.score
+            """,
+            (ticker, day.isoformat(), *delta),
+        )
+
+        for days in SENTIMENT_WINDOWS:
+            row = self._conn.execute(
+                'SELECT end_day, positive, negative, neutral, score '
+                'FROM sentiment_windows WHERE ticker = ? AND days = ?',
+                (ticker, days),
+            ).fetchone()
+
+            if row is None:
+                end_day, totals = day, delta
+            else:
+                end_day = date.fromisoformat(row[0])
+                totals = row[1:]
+                if day > end_day:
+                    window = timedelta(days=days)
+                    evicted = self._daily_totals(
+                        ticker, end_day - window, day - window
+                    )
+                    totals = [t - e for t, e in zip(totals, evicted, strict=True)]
+                    end_day = day
+                elif day <= end_day - timedelta(days=days):
+                    continue
+                totals = [t + d for t, d in zip(totals, delta, strict=True)]
+
+            self._conn.execute(
+                'INSERT OR REPLACE INTO sentiment_windows VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (ticker, days, end_day.isoformat(), *totals),
+            )
+
+    def _daily_totals(
+        self, ticker: str, after: date, through: date
+    ) -> Tuple[int, int, int, float]:
+        """Total bucket harian untuk hari dalam (after, through]."""
+        row = self._conn.execute(
+            'SELECT COALESCE(SUM(positive), 0), COALESCE(SUM(negative), 0), '
+            'COALESCE(SUM(neutral), 0), COALESCE(SUM(score), 0.0) '
+            'FROM sentiment_daily WHERE ticker = ? AND day > ? AND day <= ?',
+            (ticker, after.isoformat(), through.isoformat()),
+        ).fetchone()
+        return tuple(row)
+
+    def _store_actions(self, ticker: str, item: NewsItem) -> None:
+        """Ganti event corporate action untuk satu item (dalam transaksi caller)."""
+        self._conn.execute(
+            'DELETE FROM corporate_actions WHERE ticker = ? AND item_id = ?',
+            (ticker, item.item_id),
+        )
+        self._conn.executemany(
+            'INSERT INTO corporate_actions VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [
+                (
+                    ticker,
+                    item.item_id,
+                    action.action_type,
+                    _to_text(action.event_date),
+                    _to_text(action.announced_date),
+                    json.dumps(
+                        {label: _to_text(d) for label, d in action.dates.items()}
+                    ),
+                    action.ratio,
+                    action.amount,
+                )
+                for action in extract_corporate_actions(ticker, item)
+            ],
+        )
+
+    def close(self) -> None:
+        """Close koneksi database."""
+        self._conn.close()
+
+    def __enter__(self) -> 'NewsStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def high_water_mark(self, ticker: str) -> Optional[datetime]:
+        """
+        Get tanggal publish terbaru yang sudah disimpan untuk ticker.
+
+        Args:
+            ticker: Normalized ticker symbol
+
+        Returns:
+            Datetime atau None jika belum ada item
+        """
+        row = self._conn.execute(
+            'SELECT last_published FROM watermarks WHERE ticker = ?', (ticker,)
+        ).fetchone()
+        return _from_text(row[0]) if row else None
+
+    def last_refresh(self, ticker: str) -> Optional[datetime]:
+        """Get waktu refresh terakhir dari sumber berita untuk ticker."""
+        row = self._conn.execute(
+            'SELECT last_refresh FROM watermarks WHERE ticker = ?', (ticker,)
+        ).fetchone()
+        return _from_text(row[0]) if row else None
+
+    def add(
+        self,
+        ticker: str,
+        items: Iterable[NewsItem],
+        refreshed_at: Optional[datetime] = None,
+        signatures: Optional[Dict[str, bytes]] = None,
+    ) -> int:
+        """
+        Simpan items baru dan update high-water mark.
+
+        Item yang (ticker, item_id)-nya sudah ada tidak diubah. Item tanpa
+        item_id dilewati.
+
+        Args:
+            ticker: Normalized ticker symbol
+            items: NewsItem yang sudah diklasifikasi
+            refreshed_at: Waktu refresh (default: sekarang)
+            signatures: Optional {item_id: near-duplicate signature}
+
+        Returns:
+            Jumlah item yang baru disimpan
+        """
+        items = list(items)
+        signatures = signatures or {}
+        rows = [
+            (ticker, *self._row(item), signatures.get(item.item_id))
+            for item in items
+            if item.item_id
+        ]
+        latest = max(
+            (item.published_date for item in items if item.published_date),
+            default=None,
+        )
+
+        insert = (
+            f"INSERT OR IGNORE INTO news (ticker, {', '.join(_COLUMNS)}, signature) "
+            f"VALUES ({', '.join('?' * (len(_COLUMNS) + 2))})"
+        )
+
+        with self._conn:
+            added = 0
+            for item, row in zip((item for item in items if item.item_id), rows, strict=True):
+                if self._conn.execute(insert, row).rowcount:
+                    added += 1
+                    self._conn.executemany(
+                        'INSERT OR IGNORE INTO postings VALUES (?, ?, ?, ?, ?)',
+                        _postings(ticker, item),
+                    )
+                    self._store_actions(ticker, item)
+                    self._apply_sentiment(ticker, item)
+
+            self._conn.execute(
+                """
+                INSERT INTO watermarks (ticker, last_published, last_refresh)
+                VALUES (?, ?, ?)
+                ON CONFLICT (ticker) DO UPDATE SET
+                    last_published = CASE
+                        WHEN last_published IS NULL
+                            OR excluded.last_published > last_published
+                        THEN excluded.last_published
+                        ELSE last_published
+                    END,
+                    last_refresh = excluded.last_refresh
+                """,
+                (
+                    ticker,
+                    _to_text(latest),
+                    _to_text(refreshed_at or datetime.now()),
+                ),
+            )
+
+        return added
+
+    def update_classification(self, ticker: str, items: Iterable[NewsItem]) -> None:
+        """
+        Update hasil klasifikasi item yang sudah tersimpan.
+
+        Event corporate action item tersebut diekstrak ulang dan agregat
+        sentiment dikoreksi (klasifikasi lama dikurangkan, yang baru
+        ditambahkan).
+
+        Args:
+            ticker: Normalized ticker symbol
+            items: NewsItem yang sudah diklasifikasi ulang
+        """
+        items = [item for item in items if item.item_id]
+        with self._conn:
+            for item in items:
+                row = self._conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM news "
+                    'WHERE ticker = ? AND item_id = ?',
+                    (ticker, item.item_id),
+                ).fetchone()
+                if row is None:
+                    continue
+
+                self._apply_sentiment(ticker, self._item(row), sign=-1)
+                self._conn.execute(
+                    """
+                    UPDATE news
+                    SET sentiment = ?, sentiment_score = ?,
+                        corporate_action_types = ?, lexicon_version = ?
+                    WHERE ticker = ? AND item_id = ?
+                    """,
+                    (
+                        item.sentiment,
+                        item.sentiment_score,
+                        json.dumps(item.corporate_action_types),
+                        item.lexicon_version,
+                        ticker,
+                        item.item_id,
+                    ),
+                )
+                self._apply_sentiment(ticker, item)
+                self._store_actions(ticker, item)
+
+    def get(
+        self,
+        ticker: str,
+        limit: Optional[int] = None,
+        since: Optional[datetime] = None,
+    ) -> List[NewsItem]:
+        """
+        Get items tersimpan, terbaru lebih dulu.
+
+        Args:
+            ticker: Normalized ticker symbol
+            limit: Maximum jumlah item
+            since: Hanya item yang dipublish pada/setelah waktu ini
+
+        Returns:
+            List of NewsItem
+        """
+        query = f"SELECT {', '.join(_COLUMNS)} FROM news WHERE ticker = ?"
+        params: list = [ticker]
+        if since is not None:
+            query += ' AND published_date >= ?'
+            params.append(_to_text(since))
+        query += ' ORDER BY published_date IS NULL, published_date DESC, item_id'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        return [self._item(row) for row in self._conn.execute(query, params)]
+
+    def search(
+        self,
+        phrases: Iterable[str],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        tickers: Optional[Iterable[str]] = None,
+        limit: Optional[int] = 100,
+    ) -> List[Tuple[str, NewsItem]]:
+        """
+        Full-text search berita tersimpan lewat inverted index.
+
+        Setiap phrase harus muncul berurutan (judul atau summary); beberapa
+        phrase digabung dengan OR.
+
+        Args:
+            phrases: Phrase yang dicari (misalnya ['rights issue', 'right issue'])
+            since: Optional batas bawah tanggal publish (inklusif)
+            until: Optional batas atas tanggal publish (inklusif)
+            tickers: Optional filter normalized ticker
+            limit: Maximum jumlah hasil (None = tanpa batas)
+
+        Returns:
+            List of (ticker, NewsItem), terbaru lebih dulu
+        """
+        tickers = set(tickers or [])
+        matches: Set[Tuple[str, str]] = set()
+        for phrase in phrases:
+            tokens = tokenize(phrase)
+            if tokens:
+                matches |= self._phrase_matches(tokens, since, until, tickers)
+
+        if not matches:
+            return []
+
+        # Temp table untuk join hasil ke news tanpa batas jumlah parameter
+        with self._conn:
+            self._conn.execute(
+                'CREATE TEMP TABLE IF NOT EXISTS search_hits '
+                '(ticker TEXT, item_id TEXT, PRIMARY KEY (ticker, item_id))'
+            )
+            self._conn.execute('DELETE FROM search_hits')
+            self._conn.executemany('INSERT INTO search_hits VALUES (?, ?)', matches)
+
+        query = (
+            f"SELECT n.ticker, {', '.join('n.' + c for c in _COLUMNS)} "
+            'FROM search_hits h JOIN news n '
+            'ON n.ticker = h.ticker AND n.item_id = h.item_id '
+            'ORDER BY n.published_date IS NULL, n.published_date DESC, '
+            'n.ticker, n.item_id'
+        )
+        params: list = []
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        return [
+            (row[0], self._item(row[1:])) for row in self._conn.execute(query, params)
+        ]
+
+    def _phrase_matches(
+        self,
+        tokens: List[str],
+        since: Optional[datetime],
+        until: Optional[datetime],
+        tickers: Set[str],
+    ) -> Set[Tuple[str, str]]:
+        """
+        Cari (ticker, item_id) yang mengandung phrase.
+
+        Token paling jarang menjadi anchor (range scan pada index token +
+        tanggal), token lain di-join lewat primary key, lalu urutan posisi
+        diverifikasi dari daftar posisi.
+        """
+        unique = list(dict.fromkeys(tokens))
+        frequencies = {token: self._token_frequency(token) for token in unique}
+        if not all(frequencies.values()):
+            return set()
+
+        anchor = min(unique, key=frequencies.get)
+        others = [token for token in unique if token != anchor]
+
+        columns = ['a.ticker', 'a.item_id', 'a.positions']
+        joins = []
+        params: list = []
+        for i, token in enumerate(others):
+            columns.append(f'p{i}.positions')
+            joins.append(
+                f'JOIN postings p{i} ON p{i}.token = ?'
+                f' AND p{i}.published_date = a.published_date'
+                f' AND p{i}.ticker = a.ticker AND p{i}.item_id = a.item_id'
+            )
+            params.append(token)
+
+        conditions = ['a.token = ?']
+        params.append(anchor)
+        if since is not None:
+            conditions.append('a.published_date >= ?')
+            params.append(_to_text(since))
+        if until is not None:
+            conditions.append("a.published_date <= ? AND a.published_date != ''")
+            params.append(_to_text(until))
+
+        query = (
+            f"SELECT {', '.join(columns)} FROM postings a {' '.join(joins)} "
+            f"WHERE {' AND '.join(conditions)}"
+        )
+
+        matches = set()
+        for row in self._conn.execute(query, params):
+            ticker, item_id = row[0], row[1]
+            if tickers and ticker not in tickers:
+                continue
+            if len(tokens) > 1:
+                positions = {
+                    token: {int(p) for p in value.split(',')}
+                    for token, value in zip([anchor, *others], row[2:], strict=True)
+                }
+                if not _contains_phrase(tokens, positions):
+                    continue
+            matches.add((ticker, item_id))
+
+        return matches
+
+    def _token_frequency(self, token: str) -> int:
+        """Jumlah item yang mengandung token (index-only count)."""
+        return self._conn.execute(
+            'SELECT COUNT(*) FROM postings WHERE token = ?', (token,)
+        ).fetchone()[0]
+
+    def corporate_actions(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        action_types: Optional[Iterable[str]] = None,
+        tickers: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[CorporateAction]:
+        """
+        Query calendar corporate action berdasarkan tanggal event.
+
+        Args:
+            since: Optional batas bawah event_date (inklusif)
+            until: Optional batas atas event_date (inklusif)
+            action_types: Optional filter tipe (misalnya ['dividend'])
+            tickers: Optional filter normalized ticker
+            limit: Maximum jumlah event
+
+        Returns:
+            List of CorporateAction, urut event_date lalu ticker
+        """
+        conditions = ['a.event_date IS NOT NULL']
+        params: list = []
+        if since is not None:
+            conditions.append('a.event_date >= ?')
+            params.append(_to_text(since))
+        if until is not None:
+            conditions.append('a.event_date <= ?')
+            params.append(_to_text(until))
+        for column, values in (('a.action_type', action_types), ('a.ticker', tickers)):
+            values = list(values or [])
+            if values:
+                conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+
+        query = (
+            'SELECT a.ticker, a.action_type, a.event_date, a.announced_date, a.dates, '
+            'a.ratio, a.amount, n.title, n.source, n.url, a.item_id '
+            'FROM corporate_actions a JOIN news n '
+            'ON n.ticker = a.ticker AND n.item_id = a.item_id '
+            f"WHERE {' AND '.join(conditions)} "
+            'ORDER BY a.event_date, a.ticker, a.action_type, a.item_id'
+        )
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        return [
+            CorporateAction(
+                ticker=row[0],
+                action_type=row[1],
+                event_date=_from_text(row[2]),
+                announced_date=_from_text(row[3]),
+                dates={
+                    label: _from_text(value)
+                    for label, value in json.loads(row[4] or '{}').items()
+                },
+                ratio=row[5],
+                amount=row[6],
+                title=row[7],
+                source=row[8],
+                url=row[9],
+                item_id=row[10],
+            )
+            for row in self._conn.execute(query, params)
+        ]
+
+    def sentiment_series(
+        self,
+        ticker: str,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+    ) -> List[DailySentiment]:
+        """
+        Time series sentiment harian untuk ticker.
+
+        Args:
+            ticker: Normalized ticker symbol
+            since: Optional hari pertama (inklusif)
+            until: Optional hari terakhir (inklusif)
+
+        Returns:
+            List of DailySentiment, urut tanggal (hari tanpa berita dilewati)
+        """
+        query = (
+            'SELECT day, positive, negative, neutral, score '
+            'FROM sentiment_daily WHERE ticker = ?'
+        )
+        params: list = [ticker]
+        if since is not None:
+            query += ' AND day >= ?'
+            params.append(since.isoformat())
+        if until is not None:
+            query += ' AND day <= ?'
+            params.append(until.isoformat())
+        query += ' ORDER BY day'
+
+        return [
+            DailySentiment(date.fromisoformat(row[0]), *row[1:])
+            for row in self._conn.execute(query, params)
+        ]
+
+    def sentiment_trend(
+        self, ticker: str, as_of: Optional[date] = None
+    ) -> List[SentimentWindow]:
+        """
+        Agregat sentiment rolling window per SENTIMENT_WINDOWS.
+
+        Window tersimpan berakhir di hari berita terakhir; untuk as_of yang
+        lebih baru, hari yang sudah keluar dari window dikurangkan tanpa
+        mengubah data tersimpan.
+
+        Args:
+            ticker: Normalized ticker symbol
+            as_of: Hari terakhir window (default: hari ini)
+
+        Returns:
+            List of SentimentWindow, window terpendek lebih dulu
+        """
+        as_of = as_of or date.today()
+        stored = {
+            row[0]: (date.fromisoformat(row[1]), row[2:])
+            for row in self._conn.execute(
+                'SELECT days, end_day, positive, negative, neutral, score '
+                'FROM sentiment_windows WHERE ticker = ?',
+                (ticker,),
+            )
+        }
+
+        windows = []
+        for days in SENTIMENT_WINDOWS:
+            start = as_of - timedelta(days=days)
+            if days not in stored:
+                totals = (0, 0, 0, 0.0)
+            else:
+                end_day, totals = stored[days]
+                if as_of >= end_day:
+                    evicted = self._daily_totals(
+                        ticker, end_day - timedelta(days=days), min(start, end_day)
+                    )
+                    totals = tuple(t - e for t, e in zip(totals, evicted, strict=True))
+                else:
+                    # Query historis: hitung langsung dari bucket harian
+                    totals = self._daily_totals(ticker, start, as_of)
+
+            positive, negative, neutral, score = totals
+            windows.append(
+                SentimentWindow(
+                    days=days,
+                    end_date=as_of,
+                    positive=positive,
+                    negative=negative,
+                    neutral=neutral,
+                    score=round(score, 6),
+                )
+            )
+        return windows
+
+    def signatures(self, ticker: str) -> List[Tuple[str, str, bytes]]:
+        """
+        Get near-duplicate signatures yang tersimpan untuk ticker.
+
+        Args:
+            ticker: Normalized ticker symbol
+
+        Returns:
+            List of (item_id, title, signature bytes)
+        """
+        rows = self._conn.execute(
+            'SELECT item_id, title, signature FROM news '
+            'WHERE ticker = ? AND signature IS NOT NULL',
+            (ticker,),
+        )
+        return list(rows)
+
+    def item_ids_at(self, ticker: str, published_date: datetime) -> Set[str]:
+        """Get item_id yang dipublish tepat pada waktu tertentu."""
+        rows = self._conn.execute(
+            'SELECT item_id FROM news WHERE ticker = ? AND published_date = ?',
+            (ticker, _to_text(published_date)),
+        )
+        return {row[0] for row in rows}
+
+    def count(self, ticker: Optional[str] = None) -> int:
+        """Jumlah item tersimpan (untuk satu ticker atau semua)."""
+        if ticker is None:
+            row = self._conn.execute('SELECT COUNT(*) FROM news').fetchone()
+        else:
+            row = self._conn.execute(
+                'SELECT COUNT(*) FROM news WHERE ticker = ?', (ticker,)
+            ).fetchone()
+        return row[0]
+
+    @staticmethod
+    def _row(item: NewsItem) -> tuple:
+        """NewsItem ke row values (urutan _COLUMNS)."""
+        return (
+            item.item_id,
+            item.title,
+            item.source,
+            _to_text(item.published_date),
+            item.url,
+            item.summary,
+            item.sentiment,
+            item.sentiment_score,
+            (
+                json.dumps(item.corporate_action_types)
+                if item.corporate_action_types is not None
+                else None
+            ),
+            item.lexicon_version,
+        )
+
+    @staticmethod
+    def _item(row: tuple) -> NewsItem:
+        """Row (urutan _COLUMNS) ke NewsItem."""
+        values = dict(zip(_COLUMNS, row, strict=True))
+        values['published_date'] = _from_text(values['published_date'])
+        if values['corporate_action_types'] is not None:
+            values['corporate_action_types'] = json.loads(
+                values['corporate_action_types']
+            )
+        return NewsItem(**values)
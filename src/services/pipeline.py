@@ -0,0 +1,369 @@
+"""
+Pipeline bertahap dengan bounded queue dan backpressure.
+
+Setiap stage punya worker thread sendiri dan membaca dari bounded queue
+yang diisi stage sebelumnya. Jika stage lambat (mis. sink yang menulis ke
+disk atau terminal), queue di depannya penuh dan stage sebelumnya menunggu,
+sehingga jumlah item yang tertahan di memory dibatasi total ukuran queue,
+bukan ukuran universe. Stage yang cepat tetap bekerja selama queue di
+depannya berisi.
+
+Stage yang melempar exception menghentikan pipeline: input yang belum
+diambil stage pertama dibuang, item yang sudah di tengah jalan diselesaikan
+(supaya hasil yang sudah di-fetch tetap sampai ke sink), lalu exception
+pertama di-raise ulang oleh run(). Ctrl-C di thread pemanggil diperlakukan
+sama.
+
+build_screening_pipeline() menyusun stage screening: fetch fundamentals,
+fetch news, build model, analyze dan sink.
+"""
+
+from dataclasses import dataclass, field, replace
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Sequence
+
+from src.models.screening_result import ScreeningResult
+from src.models.stock_data import (
+    CorporateAction,
+    NewsItem,
+    SentimentWindow,
+    StockData,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Nama stage screening
+FETCH_FUNDAMENTALS = 'fetch_fundamentals'
+FETCH_NEWS = 'fetch_news'
+BUILD_MODEL = 'build_model'
+ANALYZE = 'analyze'
+SINK = 'sink'
+
+# Interval cek stop saat menunggu queue (detik)
+_POLL_SECONDS = 0.1
+
+_END = object()  # Sentinel akhir input
+
+
+@dataclass
+class Stage:
+    """Satu stage pipeline."""
+
+    name: str
+    # Proses satu item; hasilnya diteruskan ke stage berikutnya (None = buang)
+    fn: Callable[[Any], Any]
+    workers: int = 1
+    queue_size: Optional[int] = None  # Ukuran input queue (default 2x workers)
+
+
+class StageStats(NamedTuple):
+    """Throughput dan kedalaman queue satu stage."""
+
+    name: str
+    workers: int
+    processed: int
+    dropped: int  # fn mengembalikan None
+    failed: int  # fn melempar exception
+    queue_depth: int
+    queue_size: int
+    peak_depth: int
+    busy_seconds: float
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Item per detik sejak pipeline dimulai."""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Porsi waktu worker stage yang terpakai (0-1)."""
+        capacity = self.elapsed * self.workers
+        return min(self.busy_seconds / capacity, 1.0) if capacity > 0 else 0.0
+
+
+@dataclass
+class _StageState:
+    """Counter satu stage (diubah di bawah Pipeline._lock)."""
+
+    queue: queue.Queue
+    active: int
+    processed: int = 0
+    dropped: int = 0
+    failed: int = 0
+    peak_depth: int = 0
+    busy_seconds: float = 0.0
+
+
+class Pipeline:
+    """Stage berurutan yang dihubungkan bounded queue."""
+
+    def __init__(self, stages: Sequence[Stage]):
+        """
+        Initialize pipeline (thread dimulai oleh run()).
+
+        Args:
+            stages: Stage berurutan; output stage terakhir dibuang
+        """
+        if not stages:
+            raise ValueError("pipeline needs at least one stage")
+        for stage in stages:
+            if stage.workers < 1:
+                raise ValueError(f"stage '{stage.name}' needs at least 1 worker")
+
+        self.stages = list(stages)
+        self._states = [
+            _StageState(
+                queue=queue.Queue(maxsize=stage.queue_size or 2 * stage.workers),
+                active=stage.workers,
+            )
+            for stage in self.stages
+        ]
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def run(self, items: Iterable[Any]) -> None:
+        """
+        Alirkan items lewat semua stage dan tunggu sampai selesai.
+
+        Items dibaca lazy: iterator input ikut tertahan oleh backpressure.
+
+        Raises:
+            Exception pertama dari stage (atau KeyboardInterrupt)
+        """
+        if self._started is not None:
+            raise RuntimeError("pipeline can only run once")
+        self._started = time.perf_counter()
+        threads = [
+            threading.Thread(
+                target=self._work,
+                args=(index,),
+                name=f"{stage.name}_{worker}",
+                daemon=True,
+            )
+            for index, stage in enumerate(self.stages)
+            for worker in range(stage.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            for item in items:
+                if self._stop.is_set() or not self._put(0, item):
+                    break
+        except BaseException as e:
+            self._fail(e, 'input')
+        finally:
+            self._end(0)
+            self._join(threads)
+            self._finished = time.perf_counter()
+
+        if self._error is not None:
+            raise self._error
+
+    def stats(self) -> List[StageStats]:
+        """Statistik per stage (bisa dipanggil selagi pipeline berjalan)."""
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished or time.perf_counter()) - self._started
+        with self._lock:
+            return [
+                StageStats(
+                    name=stage.name,
+                    workers=stage.workers,
+                    processed=state.processed,
+                    dropped=state.dropped,
+                    failed=state.failed,
+                    queue_depth=state.queue.qsize(),
+                    queue_size=state.queue.maxsize,
+                    peak_depth=state.peak_depth,
+                    busy_seconds=state.busy_seconds,
+                    elapsed=elapsed,
+                )
+                for stage, state in zip(self.stages, self._states, strict=True)
+            ]
+
+    def _put(self, index: int, item: Any) -> bool:
+        """
+        Masukkan item ke input queue stage (menunggu jika penuh).
+
+        Returns:
+            False jika input dibatalkan karena pipeline berhenti
+        """
+        state = self._states[index]
+        while True:
+            try:
+                state.queue.put(item, timeout=_POLL_SECONDS)
+                break
+            except queue.Full:
+                # Stage setelah yang pertama tetap dikuras, jadi put di sana
+                # selalu selesai; hanya input baru yang dibatalkan
+                if index == 0 and self._stop.is_set():
+                    return False
+        depth = state.queue.qsize()
+        with self._lock:
+            state.peak_depth = max(state.peak_depth, depth)
+        return True
+
+    def _end(self, index: int) -> None:
+        """Kirim sentinel akhir input ke setiap worker stage."""
+        for _ in range(self.stages[index].workers):
+            self._states[index].queue.put(_END)
+
+    def _work(self, index: int) -> None:
+        """Loop worker thread untuk stage index."""
+        stage, state = self.stages[index], self._states[index]
+        last = index == len(self.stages) - 1
+        while True:
+            item = state.queue.get()
+            if item is _END:
+                break
+            if index == 0 and self._stop.is_set():
+                continue  # Pipeline berhenti: input yang belum diproses dibuang
+
+            started = time.perf_counter()
+            output, failed = None, False
+            try:
+                output = stage.fn(item)
+            except BaseException as e:
+                failed = True
+                self._fail(e, stage.name)
+            with self._lock:
+                state.busy_seconds += time.perf_counter() - started
+                state.processed += 1
+                if failed:
+                    state.failed += 1
+                elif output is None:
+                    state.dropped += 1
+
+            if output is not None and not last:
+                self._put(index + 1, output)
+
+        with self._lock:
+            state.active -= 1
+            finished = state.active == 0
+        if finished and not last:
+            self._end(index + 1)
+
+    def _fail(self, error: BaseException, stage: str) -> None:
+        """Catat exception dan hentikan input baru."""
+        with self._lock:
+            first = self._error is None
+            if first:
+                self._error = error
+        if first:
+            logger.error(f"Pipeline stage {stage} failed: {error!r}")
+        else:
+            logger.warning(f"Pipeline stage {stage} failed again: {error!r}")
+        self._stop.set()
+
+    def _join(self, threads: List[threading.Thread]) -> None:
+        """Tunggu semua worker; Ctrl-C saat menunggu menghentikan pipeline."""
+        for thread in threads:
+            while thread.is_alive():
+                try:
+                    thread.join(_POLL_SECONDS)
+                except BaseException as e:
+                    self._fail(e, 'input')
+
+
+@dataclass
+class ScreeningItem:
+    """Satu ticker yang mengalir lewat pipeline screening."""
+
+    ticker: str
+    stock_data: Optional[StockData] = None
+    news: List[NewsItem] = field(default_factory=list)
+    corporate_actions: List[CorporateAction] = field(default_factory=list)
+    sentiment_trend: List[SentimentWindow] = field(default_factory=list)
+    result: Optional[ScreeningResult] = None
+
+    @property
+    def failed(self) -> bool:
+        """Fetch fundamental gagal (item tetap diteruskan ke sink)."""
+        return self.stock_data is None
+
+
+def build_screening_pipeline(
+    finance_service,
+    sink: Callable[[ScreeningItem], None],
+    analyzer=None,
+    news_service=None,
+    fetch_workers: int = 4,
+    news_workers: int = 2,
+    analyze_workers: int = 1,
+    queue_size: Optional[int] = None,
+) -> Pipeline:
+    """
+    Susun pipeline screening; input run() adalah ticker.
+
+    Stages: fetch_fundamentals -> fetch_news -> build_model -> analyze -> sink.
+    fetch_news dan build_model hanya ada jika news_service diberikan, analyze
+    hanya jika analyzer diberikan (mis. sector-relative yang menganalisis
+    setelah seluruh universe di-fetch). Ticker yang gagal di-fetch tetap
+    sampai ke sink dengan stock_data None.
+
+    Args:
+        finance_service: YahooFinanceService (atau ServiceContext)
+        sink: Dipanggil sekali per ticker di satu thread, sesuai urutan selesai
+        analyzer: Optional FundamentalAnalyzer
+        news_service: Optional NewsScraperService tanpa NewsStore (koneksi
+            SQLite tidak bisa dipakai dari worker thread)
+        fetch_workers: Worker fetch fundamental paralel
+        news_workers: Worker fetch berita paralel
+        analyze_workers: Worker analisis
+        queue_size: Ukuran setiap input queue (default 2x worker stage)
+
+    Returns:
+        Pipeline yang siap di-run
+    """
+
+    def fetch_fundamentals(ticker: str) -> ScreeningItem:
+        return ScreeningItem(ticker, finance_service.get_stock_data(ticker))
+
+    def fetch_news(item: ScreeningItem) -> ScreeningItem:
+        if item.failed:
+            return item
+        try:
+            item.news = news_service.get_news(item.ticker)
+            item.corporate_actions = news_service.get_corporate_actions(
+                item.ticker, item.news
+            )
+            item.sentiment_trend = news_service.get_sentiment_trend(
+                item.ticker, item.news
+            )
+        except Exception as e:
+            # Berita opsional: screening tetap jalan tanpa berita
+            logger.warning(f"Could not fetch news for {item.ticker}: {str(e)}")
+        return item
+
+    def build_model(item: ScreeningItem) -> ScreeningItem:
+        if not item.failed:
+            item.stock_data = replace(
+                item.stock_data,
+                news=item.news,
+                corporate_actions=item.corporate_actions,
+                sentiment_trend=item.sentiment_trend,
+            )
+        return item
+
+    def analyze(item: ScreeningItem) -> ScreeningItem:
+        if not item.failed:
+            item.result = analyzer.analyze(item.stock_data)
+        return item
+
+    stages = [Stage(FETCH_FUNDAMENTALS, fetch_fundamentals, fetch_workers, queue_size)]
+    if news_service is not None:
+        stages.append(Stage(FETCH_NEWS, fetch_news, news_workers, queue_size))
+        stages.append(Stage(BUILD_MODEL, build_model, 1, queue_size))
+    if analyzer is not None:
+        stages.append(Stage(ANALYZE, analyze, analyze_workers, queue_size))
+    stages.append(Stage(SINK, sink, 1, queue_size))
+    return Pipeline(stages)
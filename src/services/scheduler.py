@@ -0,0 +1,230 @@
+"""
+Scheduler fetch dengan prioritas untuk service yang dipakai bersama.
+
+Setiap fetch masuk ke salah satu kelas prioritas: interactive (user sedang
+menunggu, mis. `screen BBCA`), watchlist (compare atau refresh daftar
+pantauan) dan background (refresh universe). Worker selalu mengambil task
+dari kelas tertinggi yang masih punya jatah, sehingga fetch interactive
+tidak antri di belakang ratusan fetch background.
+
+Setiap kelas punya share: porsi maksimum worker yang boleh dipakai kelas
+itu secara bersamaan. Dengan share background di bawah 1.0 selalu ada
+worker (dan budget rate limit sumber data) yang tersisa untuk fetch
+interactive, sementara background tetap memakai kapasitas yang menganggur.
+Fetch yang sedang berjalan tidak dihentikan; preemption terjadi di antrian.
+"""
+
+from collections import deque
+from concurrent.futures import Future
+import threading
+from typing import Callable, Deque, Dict, List, Mapping, NamedTuple, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Kelas prioritas, dari yang tertinggi
+INTERACTIVE = 'interactive'
+WATCHLIST = 'watchlist'
+BACKGROUND = 'background'
+PRIORITY_CLASSES = (INTERACTIVE, WATCHLIST, BACKGROUND)
+
+# Porsi maksimum worker per kelas
+DEFAULT_SHARES = {INTERACTIVE: 1.0, WATCHLIST: 0.75, BACKGROUND: 0.5}
+
+
+class ClassStats(NamedTuple):
+    """Jumlah task satu kelas prioritas."""
+
+    queued: int
+    running: int
+    completed: int
+
+
+class _Task:
+    """Satu fetch yang menunggu di antrian."""
+
+    __slots__ = ('future', 'fn', 'args', 'priority')
+
+    def __init__(self, future: Future, fn: Callable, args: tuple, priority: str):
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.priority = priority
+
+
+def _check_priority(priority: str) -> str:
+    if priority not in PRIORITY_CLASSES:
+        raise ValueError(
+            f"Unknown priority '{priority}' "
+            f"(expected one of: {', '.join(PRIORITY_CLASSES)})"
+        )
+    return priority
+
+
+class FetchScheduler:
+    """Thread pool dengan antrian per kelas prioritas dan concurrency share."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        shares: Optional[Mapping[str, float]] = None,
+        thread_name_prefix: str = 'fetch',
+    ):
+        """
+        Initialize scheduler dan start worker threads.
+
+        Args:
+            workers: Jumlah worker thread
+            shares: Porsi worker per kelas (0-1], default DEFAULT_SHARES.
+                Setiap kelas selalu boleh memakai minimal satu worker.
+            thread_name_prefix: Prefix nama thread
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        shares = {**DEFAULT_SHARES, **(shares or {})}
+        for priority, share in shares.items():
+            _check_priority(priority)
+            if not 0 < share <= 1:
+                raise ValueError(f"share for '{priority}' must be in (0, 1]")
+
+        self.workers = workers
+        self.limits = {
+            priority: max(1, int(workers * shares[priority]))
+            for priority in PRIORITY_CLASSES
+        }
+        self._queues: Dict[str, Deque[_Task]] = {
+            priority: deque() for priority in PRIORITY_CLASSES
+        }
+        self._tasks: Dict[Future, _Task] = {}  # Task yang masih di antrian
+        self._running = dict.fromkeys(PRIORITY_CLASSES, 0)
+        self._completed = dict.fromkeys(PRIORITY_CLASSES, 0)
+        self._condition = threading.Condition()
+        self._shutdown = False
+
+        self._threads: List[threading.Thread] = []
+        for index in range(workers):
+            thread = threading.Thread(
+                target=self._work,
+                name=f"{thread_name_prefix}_{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, priority: str, fn: Callable, *args) -> Future:
+        """
+        Jadwalkan fn(*args) di kelas prioritas.
+
+        Args:
+            priority: Salah satu PRIORITY_CLASSES
+            fn: Callable yang dijalankan di worker thread
+            *args: Argumen untuk fn
+
+        Returns:
+            Future hasil fn
+
+        Raises:
+            RuntimeError: Jika scheduler sudah di-shutdown
+        """
+        _check_priority(priority)
+        future: Future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new fetches after shutdown")
+            task = _Task(future, fn, args, priority)
+            self._queues[priority].append(task)
+            self._tasks[future] = task
+            self._condition.notify()
+        return future
+
+    def promote(self, future: Future, priority: str) -> bool:
+        """
+        Naikkan prioritas task yang masih di antrian.
+
+        Args:
+            future: Future dari submit()
+            priority: Kelas prioritas baru (diabaikan jika tidak lebih tinggi)
+
+        Returns:
+            True jika task dipindah ke kelas yang lebih tinggi
+        """
+        _check_priority(priority)
+        rank = PRIORITY_CLASSES.index
+        with self._condition:
+            task = self._tasks.get(future)
+            if task is None or rank(priority) >= rank(task.priority):
+                return False
+            self._queues[task.priority].remove(task)
+            task.priority = priority
+            self._queues[priority].append(task)
+            self._condition.notify()
+            return True
+
+    def stats(self) -> Dict[str, ClassStats]:
+        """Jumlah task per kelas prioritas (queued, running, completed)."""
+        with self._condition:
+            return {
+                priority: ClassStats(
+                    len(self._queues[priority]),
+                    self._running[priority],
+                    self._completed[priority],
+                )
+                for priority in PRIORITY_CLASSES
+            }
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """
+        Hentikan scheduler.
+
+        Args:
+            wait: Tunggu sampai worker selesai
+            cancel_futures: Batalkan task yang masih di antrian (jika tidak,
+                antrian dihabiskan dulu)
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for queue in self._queues.values():
+                    for task in queue:
+                        task.future.cancel()
+                    queue.clear()
+                self._tasks.clear()
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _next_task(self) -> Optional[_Task]:
+        """Task dari kelas tertinggi yang belum mencapai batas (None = selesai)."""
+        with self._condition:
+            while True:
+                for priority in PRIORITY_CLASSES:
+                    queue = self._queues[priority]
+                    if queue and self._running[priority] < self.limits[priority]:
+                        task = queue.popleft()
+                        del self._tasks[task.future]
+                        self._running[priority] += 1
+                        return task
+                if self._shutdown and not any(self._queues.values()):
+                    return None
+                self._condition.wait()
+
+    def _work(self) -> None:
+        """Loop worker thread."""
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+            try:
+                if task.future.set_running_or_notify_cancel():
+                    try:
+                        task.future.set_result(task.fn(*task.args))
+                    except BaseException as e:
+                        task.future.set_exception(e)
+            finally:
+                with self._condition:
+                    self._running[task.priority] -= 1
+                    self._completed[task.priority] += 1
+                    # Slot kelas ini terbuka lagi: worker lain mungkin menunggu
+                    self._condition.notify_all()
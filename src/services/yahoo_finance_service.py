@@ -5,12 +5,11 @@ Service ini menggunakan yfinance library untuk fetch data fundamental,
 harga, dan informasi lainnya dari Yahoo Finance API.
 """
 
+from dataclasses import replace
 from datetime import datetime
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 import warnings
 
-import yfinance as yf
-
 from src.models.stock_data import (
     CashFlowMetrics,
     CompanyInfo,
@@ -24,12 +23,25 @@ from src.models.stock_data import (
 from src.utils.helpers import normalize_ticker, safe_float, safe_int
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import yfinance as yf
+
 # Suppress yfinance deprecation warnings
 warnings.filterwarnings('ignore', category=DeprecationWarning)
 warnings.simplefilter('ignore')
 
 logger = get_logger(__name__)
 
+# Rasio valuasi yang berbanding lurus dengan harga saham
+_PRICE_SCALED_VALUATION = (
+    'market_cap',
+    'pe_ratio',
+    'forward_pe',
+    'peg_ratio',
+    'price_to_book',
+    'price_to_sales',
+)
+
 
 class YahooFinanceService:
     """Service untuk fetch data dari Yahoo Finance."""
@@ -37,6 +49,8 @@ class YahooFinanceService:
     def __init__(self):
         """Initialize Yahoo Finance service."""
         self.cache: Dict[str, StockData] = {}
+        # Raw `info` dari get_quote, dipakai ulang oleh get_stock_data
+        self.info_cache: Dict[str, dict] = {}
 
     def get_stock_data(
         self, ticker: str, use_cache: bool = True
@@ -61,11 +75,16 @@ class YahooFinanceService:
         logger.info(f"Fetching data for {normalized_ticker} from Yahoo Finance...")
 
         try:
+            # Import yfinance (dan pandas) hanya saat benar-benar fetch
+            import yfinance as yf
+
             # Create yfinance Ticker object
             stock = yf.Ticker(normalized_ticker)
 
-            # Fetch all data
-            info = stock.info
+            # Reuse info dari get_quote jika ada, supaya tidak fetch dua kali
+            info = self.info_cache.pop(normalized_ticker, None) if use_cache else None
+            if info is None:
+                info = stock.info
             if not info or 'symbol' not in info:
                 logger.error(f"Failed to fetch data for {normalized_ticker}")
                 return None
@@ -83,8 +102,155 @@ class YahooFinanceService:
             logger.error(f"Error fetching data for {normalized_ticker}: {str(e)}")
             return None
 
+    def get_quote(
+        self, ticker: str, use_cache: bool = True
+    ) -> Optional[Dict[str, Optional[float]]]:
+        """
+        Fetch quote ringan untuk pre-filter (satu network call, tanpa statements).
+
+        Jika StockData lengkap sudah ada di cache, quote diambil dari sana
+        tanpa network call sama sekali.
+
+        Args:
+            ticker: Stock ticker symbol (akan dinormalisasi otomatis)
+            use_cache: Whether to use cached data if available
+
+        Returns:
+            Dictionary metrik murah (market_cap, dividend_yield, debt_to_equity,
+            current_price) atau None jika fetch gagal
+        """
+        normalized_ticker = normalize_ticker(ticker)
+
+        if use_cache and normalized_ticker in self.cache:
+            stock_data = self.cache[normalized_ticker]
+            return {
+                'market_cap': stock_data.valuation.market_cap,
+                'dividend_yield': stock_data.dividend.dividend_yield,
+                'debt_to_equity': stock_data.leverage.debt_to_equity,
+                'current_price': stock_data.price.current_price,
+            }
+
+        info = self.info_cache.get(normalized_ticker) if use_cache else None
+        if info is None:
+            try:
+                import yfinance as yf
+
+                info = yf.Ticker(normalized_ticker).info
+            except Exception as e:
+                logger.error(f"Error fetching quote for {normalized_ticker}: {str(e)}")
+                return None
+
+            if not info or 'symbol' not in info:
+                logger.error(f"Failed to fetch quote for {normalized_ticker}")
+                return None
+
+            self.info_cache[normalized_ticker] = info
+
+        return {
+            'market_cap': safe_float(info.get('marketCap')),
+            'dividend_yield': safe_float(info.get('dividendYield')),
+            'debt_to_equity': safe_float(info.get('debtToEquity')),
+            'current_price': safe_float(info.get('currentPrice')),
+        }
+
+    def discard_quote(self, ticker: str) -> None:
+        """
+        Buang raw `info` dari get_quote untuk ticker yang tidak akan di-fetch.
+
+        Hanya get_stock_data yang memakai (dan mengeluarkan) entry info_cache,
+        jadi ticker yang dipangkas pre-filter harus dibuang di sini supaya
+        cache tidak terus tumbuh di process yang berumur panjang.
+        """
+        self.info_cache.pop(normalize_ticker(ticker), None)
+
+    def get_price(self, ticker: str) -> Optional[PriceMetrics]:
+        """
+        Fetch blok harga saja (fast_info, tanpa info dan statements).
+
+        Args:
+            ticker: Stock ticker symbol (akan dinormalisasi otomatis)
+
+        Returns:
+            PriceMetrics atau None jika fetch gagal
+        """
+        normalized_ticker = normalize_ticker(ticker)
+
+        try:
+            import yfinance as yf
+
+            fast_info = yf.Ticker(normalized_ticker).fast_info
+            price = PriceMetrics(
+                current_price=safe_float(fast_info.last_price),
+                previous_close=safe_float(fast_info.previous_close),
+                open_price=safe_float(fast_info.open),
+                day_high=safe_float(fast_info.day_high),
+                day_low=safe_float(fast_info.day_low),
+                fifty_two_week_high=safe_float(fast_info.year_high),
+                fifty_two_week_low=safe_float(fast_info.year_low),
+                volume=safe_int(fast_info.last_volume),
+                avg_volume=safe_int(fast_info.three_month_average_volume),
+            )
+        except Exception as e:
+            logger.error(f"Error fetching price for {normalized_ticker}: {str(e)}")
+            return None
+
+        if price.current_price is None:
+            logger.error(f"Failed to fetch price for {normalized_ticker}")
+            return None
+        return price
+
+    def refresh_price(self, stock_data: StockData) -> Optional[StockData]:
+        """
+        Refresh harga StockData tanpa fetch ulang data fundamental.
+
+        Rasio valuasi yang bergantung pada harga (PE, PBV, PS, market cap,
+        dividend yield) disesuaikan dengan perubahan harga; data fundamental
+        lain tidak berubah. StockData asli tidak dimodifikasi.
+
+        Args:
+            stock_data: StockData hasil get_stock_data
+
+        Returns:
+            StockData baru, atau None jika fetch harga gagal
+        """
+        price = self.get_price(stock_data.get_ticker())
+        if price is None:
+            return None
+
+        old_price = stock_data.price.current_price
+        valuation = stock_data.valuation
+        dividend = stock_data.dividend
+        if old_price:
+            ratio = price.current_price / old_price
+            valuation = replace(
+                valuation,
+                **{
+                    name: getattr(valuation, name) * ratio
+                    for name in _PRICE_SCALED_VALUATION
+                    if getattr(valuation, name) is not None
+                },
+            )
+            if valuation.enterprise_value is not None and valuation.market_cap:
+                valuation.enterprise_value += (
+                    valuation.market_cap - stock_data.valuation.market_cap
+                )
+            if dividend.dividend_yield is not None:
+                dividend = replace(
+                    dividend, dividend_yield=dividend.dividend_yield / ratio
+                )
+
+        refreshed = replace(
+            stock_data,
+            valuation=valuation,
+            dividend=dividend,
+            price=price,
+            last_updated=datetime.now(),
+        )
+        self.cache[refreshed.get_ticker()] = refreshed
+        return refreshed
+
     def _build_stock_data(
-        self, stock: yf.Ticker, info: dict, ticker: str
+        self, stock: 'yf.Ticker', info: dict, ticker: str
     ) -> StockData:
         """
         Build StockData object dari yfinance data.
@@ -195,7 +361,7 @@ class YahooFinanceService:
 
         return stock_data
 
-    def _get_eps_history(self, stock: yf.Ticker) -> Dict[int, float]:
+    def _get_eps_history(self, stock: 'yf.Ticker') -> Dict[int, float]:
         """
         Get EPS history untuk 5 tahun terakhir.
 
@@ -293,6 +459,7 @@ class YahooFinanceService:
     def clear_cache(self) -> None:
         """Clear cached stock data."""
         self.cache.clear()
+        self.info_cache.clear()
         logger.info("Cache cleared")
 
     def get_multiple_stocks(
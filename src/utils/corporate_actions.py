@@ -0,0 +1,264 @@
+"""
+Ekstraksi event corporate action terstruktur dari berita.
+
+Tipe corporate action sudah ditentukan oleh LexiconClassifier
+(NewsItem.corporate_action_types); module ini menambahkan detail yang
+dibutuhkan calendar: tanggal-tanggal berlabel (cum, ex, recording, payment,
+efektif, RUPS), rasio (split, rights issue) dan nilai per saham (dividen,
+harga pelaksanaan). Tanggal dikenali dalam format ISO, numerik day-first
+(15/03/2024) dan nama bulan Indonesia/Inggris (15 Maret 2024, March 15, 2024).
+"""
+
+from datetime import datetime
+import re
+from typing import Dict, List, Optional, Tuple
+
+from src.models.stock_data import CorporateAction, NewsItem
+
+# Tipe corporate action (nilai 'action' di lexicon)
+CORPORATE_ACTION_TYPES = (
+    'dividend',
+    'stock_dividend',
+    'bonus_share',
+    'stock_split',
+    'reverse_split',
+    'rights_issue',
+    'buyback',
+    'merger',
+    'acquisition',
+    'tender_offer',
+    'ipo',
+    'delisting',
+)
+
+# fmt: off
+_MONTHS = {
+    'januari': 1, 'january': 1, 'jan': 1,
+    'februari': 2, 'february': 2, 'feb': 2,
+    'maret': 3, 'march': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'mei': 5, 'may': 5,
+    'juni': 6, 'june': 6, 'jun': 6,
+    'juli': 7, 'july': 7, 'jul': 7,
+    'agustus': 8, 'august': 8, 'agu': 8, 'agt': 8, 'aug': 8,
+    'september': 9, 'sept': 9, 'sep': 9,
+    'oktober': 10, 'october': 10, 'okt': 10, 'oct': 10,
+    'november': 11, 'nopember': 11, 'nov': 11,
+    'desember': 12, 'december': 12, 'des': 12, 'dec': 12,
+}
+# fmt: on
+
+_MONTH_NAMES = '|'.join(sorted(_MONTHS, key=len, reverse=True))
+
+_DATE = re.compile(
+    r'\b(?:'
+    r'(?P<iso_y>\d{4})-(?P<iso_m>\d{1,2})-(?P<iso_d>\d{1,2})'
+    r'|(?P<num_d>\d{1,2})[/.-](?P<num_m>\d{1,2})[/.-](?P<num_y>\d{4})'
+    rf'|(?P<txt_d>\d{{1,2}})\s+(?P<txt_m>{_MONTH_NAMES})\.?\s+(?P<txt_y>\d{{4}})'
+    rf'|(?P<en_m>{_MONTH_NAMES})\.?\s+(?P<en_d>\d{{1,2}}),?\s+(?P<en_y>\d{{4}})'
+    r')\b',
+    re.IGNORECASE,
+)
+
+# Label tanggal, dicari di text sebelum tanggal (urutan = prioritas event_date)
+_DATE_LABELS: Tuple[Tuple[str, str], ...] = (
+    ('ex', r'ex(?:\s*-?\s*date|\s+dividen|\s+dividend)?|tanggal\s+ex'),
+    ('cum', r'cum(?:\s*-?\s*date|\s+dividen|\s+dividend)?|tanggal\s+cum'),
+    ('effective', r'effective(?:\s+date)?|efektif|berlaku'),
+    (
+        'recording',
+        r'recording(?:\s+date)?|tanggal\s+pencatatan|daftar\s+pemegang\s+saham|dps',
+    ),
+    ('payment', r'payment(?:\s+date)?|pembayaran|dibayarkan|paid|payable'),
+    ('trading', r'perdagangan|trading|periode\s+pelaksanaan|exercise'),
+    ('meeting', r'rupslb|rupst|rups|egm|agm|rapat\s+umum'),
+)
+_LABEL = re.compile(
+    '|'.join(rf'\b(?P<{label}>{pattern})\b' for label, pattern in _DATE_LABELS),
+    re.IGNORECASE,
+)
+_LABEL_WINDOW = 40
+
+_RATIO = re.compile(
+    r'\b(\d{1,5})\s*(?::|-for-|\s+for\s+|\s+banding\s+)\s*(\d{1,5})\b(?!\s*[:.]\d)',
+    re.IGNORECASE,
+)
+# Jam ('pukul 10:30', '10:30 WIB') bukan rasio
+_CLOCK_BEFORE = re.compile(r'\b(?:pukul|pkl|jam|at)\.?\s*$', re.IGNORECASE)
+_CLOCK_AFTER = re.compile(r'^\s*(?:wib|wita|wit|am|pm)\b', re.IGNORECASE)
+_AMOUNT = re.compile(
+    r'\b(?:rp|idr)\.?\s*(\d[\d.,]*\d|\d)'
+    r'(?P<magnitude>\s*(?:ribu|juta|miliar|milyar|triliun'
+    r'|thousand|million|billion|trillion|[kmbt])\b)?'
+    r'(?P<per_share>\s*(?:per|/)\s*(?:lembar\s+)?(?:saham|share|lembar))?',
+    re.IGNORECASE,
+)
+
+# Tipe yang memakai rasio / nilai per saham
+_RATIO_TYPES = {
+    'stock_split',
+    'reverse_split',
+    'rights_issue',
+    'bonus_share',
+    'stock_dividend',
+}
+_AMOUNT_TYPES = {'dividend', 'rights_issue', 'buyback', 'tender_offer', 'ipo'}
+
+# Tipe yang lebih spesifik menggantikan tipe umum yang ikut match
+# ('reverse stock split' juga match 'stock split')
+_SUBSUMES = {
+    'reverse_split': {'stock_split', 'merger'},
+    'stock_dividend': {'dividend'},
+}
+
+
+def _parse_date(match: re.Match) -> Optional[datetime]:
+    """Match _DATE ke datetime (None jika tanggal tidak valid)."""
+    groups = match.groupdict()
+    for prefix in ('iso', 'num', 'txt', 'en'):
+        if groups[f'{prefix}_y'] is None:
+            continue
+        month = groups[f'{prefix}_m']
+        month = int(month) if month.isdigit() else _MONTHS[month.lower()]
+        try:
+            return datetime(
+                int(groups[f'{prefix}_y']), month, int(groups[f'{prefix}_d'])
+            )
+        except ValueError:
+            return None
+    return None
+
+
+def extract_dates(text: str) -> Dict[str, datetime]:
+    """
+    Tanggal berlabel dalam text.
+
+    Label diambil dari kata kunci terakhir dalam beberapa karakter sebelum
+    tanggal (dan setelah tanggal sebelumnya). Tanggal tanpa label diberi
+    label 'date'.
+
+    Args:
+        text: Judul + summary berita
+
+    Returns:
+        Dictionary {label: tanggal}; tanggal pertama per label yang dipakai
+    """
+    dates: Dict[str, datetime] = {}
+    previous_end = 0
+    for match in _DATE.finditer(text):
+        parsed = _parse_date(match)
+        window_start = max(previous_end, match.start() - _LABEL_WINDOW)
+        previous_end = match.end()
+        if parsed is None:
+            continue
+
+        labels = list(_LABEL.finditer(text, window_start, match.start()))
+        label = labels[-1].lastgroup if labels else 'date'
+        dates.setdefault(label, parsed)
+    return dates
+
+
+def _parse_amount(value: str) -> Optional[float]:
+    """Parse angka dengan separator Indonesia (1.250,5) atau Inggris (1,250.5)."""
+    if ',' in value and '.' in value:
+        decimal = max(value.rfind(','), value.rfind('.'))
+        integer = re.sub(r'[.,]', '', value[:decimal])
+        value = f'{integer}.{value[decimal + 1:]}'
+    elif ',' in value or '.' in value:
+        separator = ',' if ',' in value else '.'
+        parts = value.split(separator)
+        if len(parts) > 2 or len(parts[-1]) == 3:
+            value = ''.join(parts)  # separator ribuan
+        else:
+            value = '.'.join(parts)
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def extract_amount(text: str) -> Optional[float]:
+    """
+    Nilai per saham (Rupiah) dalam text.
+
+    Nominal dengan 'per saham' diprioritaskan; nominal dengan satuan besar
+    (juta, miliar, ...) dianggap total, bukan per saham.
+
+    Args:
+        text: Judul + summary berita
+
+    Returns:
+        Nilai per saham atau None
+    """
+    candidates = []
+    for match in _AMOUNT.finditer(text):
+        if match.group('magnitude'):
+            continue
+        amount = _parse_amount(match.group(1))
+        if amount is None:
+            continue
+        if match.group('per_share'):
+            return amount
+        candidates.append(amount)
+    return candidates[0] if candidates else None
+
+
+def extract_ratio(text: str) -> Optional[str]:
+    """Rasio seperti '1:5' (juga '1-for-5', '1 banding 5') dalam text."""
+    for match in _RATIO.finditer(text):
+        if ':' in match.group(0) and (
+            _CLOCK_BEFORE.search(text, 0, match.start())
+            or _CLOCK_AFTER.match(text[match.end() :])
+        ):
+            continue
+        return f'{match.group(1)}:{match.group(2)}'
+    return None
+
+
+def extract_corporate_actions(ticker: str, news: NewsItem) -> List[CorporateAction]:
+    """
+    Event corporate action dari satu NewsItem yang sudah diklasifikasi.
+
+    Satu event dibuat per tipe corporate action. event_date adalah tanggal
+    berlabel dengan prioritas tertinggi (ex, cum, efektif, ...), fallback ke
+    tanggal tanpa label lalu tanggal publish berita.
+
+    Args:
+        ticker: Normalized ticker symbol
+        news: NewsItem dengan corporate_action_types terisi
+
+    Returns:
+        List of CorporateAction (kosong jika bukan corporate action)
+    """
+    action_types = list(news.corporate_action_types or [])
+    for specific, general in _SUBSUMES.items():
+        if specific in action_types:
+            action_types = [t for t in action_types if t not in general]
+    if not action_types:
+        return []
+
+    text = f"{news.title or ''} {news.summary or ''}"
+    dates = extract_dates(text)
+    event_date = next(
+        (dates[label] for label, _ in _DATE_LABELS if label in dates),
+        dates.get('date', news.published_date),
+    )
+    ratio = extract_ratio(text) if _RATIO_TYPES.intersection(action_types) else None
+    amount = extract_amount(text) if _AMOUNT_TYPES.intersection(action_types) else None
+
+    return [
+        CorporateAction(
+            ticker=ticker,
+            action_type=action_type,
+            event_date=event_date,
+            announced_date=news.published_date,
+            dates=dates,
+            ratio=ratio if action_type in _RATIO_TYPES else None,
+            amount=amount if action_type in _AMOUNT_TYPES else None,
+            title=news.title,
+            source=news.source,
+            url=news.url,
+            item_id=news.item_id,
+        )
+        for action_type in action_types
+    ]
@@ -4,8 +4,19 @@ Helper utilities untuk berbagai operasi umum.
 Module ini berisi fungsi-fungsi helper yang digunakan di berbagai bagian aplikasi.
 """
 
+from datetime import datetime, timedelta
+import re
 from typing import Any, Optional
 
+_DURATION = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*$', re.IGNORECASE)
+_DURATION_UNITS = {
+    's': 'seconds',
+    'm': 'minutes',
+    'h': 'hours',
+    'd': 'days',
+    'w': 'weeks',
+}
+
 
 def safe_float(value: Any, default: Optional[float] = None) -> Optional[float]:
     """
@@ -244,3 +255,73 @@ def get_ticker_without_suffix(ticker: str) -> str:
     if '.' in ticker:
         return ticker.split('.')[0]
     return ticker
+
+
+def load_tickers(path: str) -> list[str]:
+    """
+    Load daftar ticker dari file teks.
+
+    Satu ticker per baris (atau dipisah spasi/koma). Baris kosong dan
+    komentar yang diawali '#' diabaikan, duplikat dibuang dengan urutan tetap.
+
+    Args:
+        path: Path ke file universe
+
+    Returns:
+        List of ticker symbols (uppercase)
+    """
+    tickers = []
+    seen = set()
+
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0]
+            for token in line.replace(',', ' ').split():
+                ticker = token.strip().upper()
+                if ticker and ticker not in seen:
+                    seen.add(ticker)
+                    tickers.append(ticker)
+
+    return tickers
+
+
+def parse_duration(value: str) -> timedelta:
+    """
+    Parse durasi singkat seperti '30s', '15m', '12h', '30d' atau '2w'.
+
+    Args:
+        value: String durasi (angka + unit s/m/h/d/w)
+
+    Returns:
+        timedelta
+
+    Raises:
+        ValueError: Jika format tidak valid
+    """
+    match = _DURATION.match(value or '')
+    if not match:
+        raise ValueError(
+            f"Invalid duration '{value}' (use e.g. 30s, 15m, 12h, 30d, 2w)"
+        )
+    amount, unit = match.groups()
+    return timedelta(**{_DURATION_UNITS[unit.lower()]: float(amount)})
+
+
+def parse_date_or_duration(value: str, now: Optional[datetime] = None) -> datetime:
+    """
+    Parse tanggal ISO (2024-01-31) atau durasi relatif ke belakang (30d).
+
+    Args:
+        value: Tanggal ISO atau durasi (lihat parse_duration)
+        now: Waktu acuan untuk durasi (default: sekarang)
+
+    Returns:
+        datetime
+
+    Raises:
+        ValueError: Jika format tidak valid
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return (now or datetime.now()) - parse_duration(value)
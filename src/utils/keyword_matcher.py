@@ -0,0 +1,150 @@
+"""
+Multi-pattern keyword matcher berbasis satu compiled regex.
+
+Semua term dari beberapa lexicon (misalnya positive, negative, corporate
+action) digabung menjadi satu regex alternation dengan word boundary di awal
+kata, sehingga satu pass atas text cukup untuk mengklasifikasikan semua
+lexicon sekaligus. Biaya scan sebanding dengan panjang text, bukan
+panjang text x jumlah keyword.
+
+Secara default term cocok sebagai prefix kata ('concern' cocok dengan
+'concerns'). Label yang diberi daftar suffix hanya cocok dengan kata utuh
+plus salah satu suffix tersebut ('miss' cocok dengan 'missed' tetapi tidak
+dengan 'mission').
+"""
+
+from collections import defaultdict
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class KeywordMatcher:
+    """Immutable matcher untuk beberapa lexicon sekaligus."""
+
+    def __init__(
+        self,
+        lexicons: Dict[str, Iterable[str]],
+        suffixes: Optional[Dict[str, Iterable[str]]] = None,
+    ):
+        """
+        Compile lexicons menjadi satu regex.
+
+        Args:
+            lexicons: {label: terms}. Satu term boleh muncul di beberapa label.
+            suffixes: Optional {label: suffixes}. Term di label ini harus
+                berakhir di batas kata setelah suffix opsional; label tanpa
+                entry memakai prefix matching.
+
+        Raises:
+            ValueError: Jika satu term berada di label dengan aturan suffix berbeda
+        """
+        suffixes = suffixes or {}
+        term_labels: Dict[str, Set[str]] = defaultdict(set)
+        for label, terms in lexicons.items():
+            for term in terms:
+                term_labels[term.lower()].add(label)
+
+        self.labels = tuple(lexicons)
+        self._term_labels = {
+            term: tuple(sorted(labels)) for term, labels in term_labels.items()
+        }
+
+        # Kelompokkan term berdasarkan aturan suffix-nya
+        groups: Dict[Optional[Tuple[str, ...]], List[str]] = defaultdict(list)
+        for term, labels in self._term_labels.items():
+            rules = {
+                tuple(sorted(suffixes[label])) if label in suffixes else None
+                for label in labels
+            }
+            if len(rules) > 1:
+                raise ValueError(f"Conflicting suffix rules for term '{term}'")
+            groups[rules.pop()].append(term)
+
+        # Longest-first supaya 'stock dividend' menang atas 'stock'. Lookahead
+        # membuat setiap awal kata dicoba, jadi 'dividend' di dalam
+        # 'stock dividend' tetap terdeteksi sebagai term sendiri.
+        branches = []
+        for rule, terms in groups.items():
+            branch = f'({_alternation(terms)})'
+            if rule is not None:
+                if rule:
+                    branch += f'(?:{_alternation(rule)})?'
+                branch += r'\b'
+            branches.append(branch)
+
+        self._regex = re.compile(rf'\b(?={"|".join(branches)})', re.IGNORECASE)
+
+    def scan(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Iterate setiap kemunculan term dalam text.
+
+        Args:
+            text: Text yang akan di-scan
+
+        Yields:
+            Tuple (posisi awal, term lowercase)
+        """
+        if not text or not self._term_labels:
+            return
+
+        for match in self._regex.finditer(text):
+            yield match.start(), match.group(match.lastindex).lower()
+
+    def labels_for(self, term: str) -> Tuple[str, ...]:
+        """Get label-label untuk term (hasil dari scan)."""
+        return self._term_labels.get(term, ())
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """
+        Cari semua term dalam text.
+
+        Args:
+            text: Text yang akan di-scan
+
+        Returns:
+            {label: [term unik sesuai urutan kemunculan]} untuk setiap label
+        """
+        found: Dict[str, List[str]] = {label: [] for label in self.labels}
+
+        seen = set()
+        for _, term in self.scan(text):
+            if term in seen:
+                continue
+            seen.add(term)
+            for label in self._term_labels[term]:
+                found[label].append(term)
+
+        return found
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    """
+    Regex alternation dalam bentuk trie (prefix yang sama di-factor out).
+
+    Engine `re` mencoba alternatives satu per satu, jadi alternation datar
+    berisi ratusan term mahal di setiap posisi. Dalam bentuk trie setiap
+    karakter hanya memilih di antara cabang yang mungkin. Optional group
+    greedy membuat match terpanjang dicoba lebih dulu.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ''
+
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if '' in node:
+            pattern = f'(?:{pattern})?'
+        return pattern
+
+    return build(trie)
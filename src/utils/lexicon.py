@@ -0,0 +1,229 @@
+"""
+Lexicon untuk news sentiment dan corporate action detection.
+
+Lexicon dibaca dari file JSON (lihat src/config/lexicon.json) dengan bobot
+per term, tag bahasa (id/en), tipe corporate action, dan daftar kata negasi.
+Versi lexicon adalah hash dari isi file, sehingga hasil klasifikasi yang
+disimpan dengan versi lain bisa dikenali sebagai stale.
+
+Format file:
+
+    {
+      "suffixes": ["s", "ed", "nya", ...],
+      "negation_window": 3,
+      "negations": [{"term": "tidak", "lang": "id"}, ...],
+      "terms": [
+        {"term": "laba", "lang": "id", "weight": 1.0},
+        {"term": "dividend", "lang": "en", "weight": 0.5, "action": "dividend"},
+        ...
+      ]
+    }
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import json
+from pathlib import Path
+import re
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from src.config.settings import get_lexicon_path
+from src.utils.keyword_matcher import KeywordMatcher
+
+_WORD = re.compile(r'\w+')
+
+LANGUAGES = ('id', 'en')
+
+
+@dataclass(frozen=True)
+class LexiconTerm:
+    """Satu term di lexicon."""
+
+    term: str
+    lang: str
+    weight: float = 0.0  # > 0 positif, < 0 negatif
+    action: Optional[str] = None  # tipe corporate action
+
+
+@dataclass(frozen=True)
+class Lexicon:
+    """Lexicon immutable beserta versinya."""
+
+    terms: Tuple[LexiconTerm, ...]
+    negations: Tuple[LexiconTerm, ...] = ()
+    suffixes: Tuple[str, ...] = ()
+    negation_window: int = 3
+    version: str = ''
+
+    @classmethod
+    def from_dict(cls, data: dict, version: str = '') -> 'Lexicon':
+        """
+        Build lexicon dari dictionary (isi file JSON).
+
+        Raises:
+            ValueError: Jika ada entry yang tidak valid
+        """
+
+        def parse(entries: Iterable[dict]) -> Tuple[LexiconTerm, ...]:
+            parsed = []
+            for entry in entries:
+                term = str(entry.get('term', '')).strip().lower()
+                lang = entry.get('lang')
+                if not term:
+                    raise ValueError(f"Lexicon entry without term: {entry}")
+                if lang not in LANGUAGES:
+                    raise ValueError(f"Invalid lang for '{term}': {lang}")
+                parsed.append(
+                    LexiconTerm(
+                        term=term,
+                        lang=lang,
+                        weight=float(entry.get('weight', 0.0)),
+                        action=entry.get('action'),
+                    )
+                )
+            return tuple(parsed)
+
+        return cls(
+            terms=parse(data.get('terms', [])),
+            negations=parse(data.get('negations', [])),
+            suffixes=tuple(data.get('suffixes', [])),
+            negation_window=int(data.get('negation_window', 3)),
+            version=version,
+        )
+
+    def filter_languages(self, languages: Iterable[str]) -> 'Lexicon':
+        """Get lexicon yang hanya berisi term untuk bahasa tertentu."""
+        languages = set(languages)
+        return Lexicon(
+            terms=tuple(t for t in self.terms if t.lang in languages),
+            negations=tuple(t for t in self.negations if t.lang in languages),
+            suffixes=self.suffixes,
+            negation_window=self.negation_window,
+            version=f"{self.version}:{','.join(sorted(languages))}",
+        )
+
+
+def load_lexicon(path: Optional[Union[str, Path]] = None) -> Lexicon:
+    """
+    Load lexicon dari file JSON.
+
+    Args:
+        path: Path file (default: get_lexicon_path())
+
+    Returns:
+        Lexicon dengan version = hash isi file
+    """
+    raw = Path(path or get_lexicon_path()).read_bytes()
+    version = hashlib.sha256(raw).hexdigest()[:12]
+    return Lexicon.from_dict(json.loads(raw), version=version)
+
+
+class Classification(NamedTuple):
+    """Hasil klasifikasi satu text."""
+
+    sentiment: str
+    score: float
+    corporate_action_types: List[str]
+
+
+class LexiconClassifier:
+    """
+    Classifier sentiment dan corporate action dari satu Lexicon.
+
+    Semua term dan kata negasi di-compile menjadi satu KeywordMatcher. Term
+    yang didahului kata negasi dalam `negation_window` kata dibalik bobotnya,
+    dan corporate action yang dinegasikan tidak dihitung.
+    """
+
+    def __init__(self, lexicon: Lexicon):
+        """
+        Compile lexicon.
+
+        Args:
+            lexicon: Lexicon yang akan dipakai
+        """
+        self.lexicon = lexicon
+        self._entries = {t.term: t for t in lexicon.terms}
+        self._matcher = KeywordMatcher(
+            {
+                'term': self._entries,
+                'negation': [t.term for t in lexicon.negations],
+            },
+            suffixes={'term': lexicon.suffixes, 'negation': ()},
+        )
+
+    @property
+    def version(self) -> str:
+        """Versi lexicon."""
+        return self.lexicon.version
+
+    def _is_negated(self, text: str, start: int, negation_ends: List[int]) -> bool:
+        """Check apakah kata negasi terakhir masih dalam window sebelum start."""
+        if not negation_ends:
+            return False
+        words_between = len(_WORD.findall(text, negation_ends[-1], start))
+        return words_between < self.lexicon.negation_window
+
+    def classify(self, text: Optional[str]) -> Classification:
+        """
+        Klasifikasi text dalam satu pass.
+
+        Setiap term (dan status negasinya) dihitung sekali, sehingga term yang
+        diulang-ulang tidak mendominasi score.
+
+        Args:
+            text: Text yang akan diklasifikasi
+
+        Returns:
+            Classification
+        """
+        score = 0.0
+        action_types: List[str] = []
+        negation_ends: List[int] = []
+        seen = set()
+
+        for start, term in self._matcher.scan(text or ''):
+            entry = self._entries.get(term)
+            if entry is None:
+                negation_ends.append(start + len(term))
+                continue
+
+            negated = self._is_negated(text, start, negation_ends)
+            if (term, negated) in seen:
+                continue
+            seen.add((term, negated))
+
+            score += -entry.weight if negated else entry.weight
+            if entry.action and not negated and entry.action not in action_types:
+                action_types.append(entry.action)
+
+        score = round(score, 6)
+        if score > 0:
+            sentiment = 'positive'
+        elif score < 0:
+            sentiment = 'negative'
+        else:
+            sentiment = 'neutral'
+
+        return Classification(sentiment, score, action_types)
+
+
+@lru_cache(maxsize=8)
+def get_classifier(
+    path: Optional[str] = None, languages: Optional[Tuple[str, ...]] = None
+) -> LexiconClassifier:
+    """
+    Get classifier untuk file lexicon, di-load dan di-compile sekali per process.
+
+    Args:
+        path: Path file lexicon (default: get_lexicon_path())
+        languages: Optional subset bahasa (misalnya ('id',))
+
+    Returns:
+        LexiconClassifier
+    """
+    lexicon = load_lexicon(path)
+    if languages:
+        lexicon = lexicon.filter_languages(languages)
+    return LexiconClassifier(lexicon)
@@ -18,7 +18,8 @@ def get_logger(name: str, level: int = logging.WARNING) -> logging.Logger:
     logger.setLevel(level)
 
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
+        # stderr supaya tidak tercampur output machine-readable di stdout
+        handler = logging.StreamHandler(sys.stderr)
         formatter = logging.Formatter(
             '[%(asctime)s] [%(levelname)s] %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S',
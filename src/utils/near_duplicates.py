@@ -0,0 +1,280 @@
+"""
+Near-duplicate detection untuk text pendek (headline berita).
+
+Text dinormalisasi lalu dipecah menjadi character shingles. MinHash
+signature mengestimasi Jaccard similarity antar shingle sets, dan
+MinHashIndex memakai LSH banding: signature dipotong menjadi beberapa band
+dan setiap band menjadi key dictionary, sehingga lookup hanya membandingkan
+kandidat yang berbagi minimal satu band (O(jumlah band)), bukan seluruh
+corpus.
+
+Angka dalam headline biasanya membedakan berita ('laba naik 10%' vs
+'laba naik 12%', 'Q3' vs 'Q4'), jadi NearDuplicateDetector hanya
+menganggap dua text duplikat jika angka-angkanya sama.
+"""
+
+from collections import defaultdict
+import re
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+import zlib
+
+if TYPE_CHECKING:
+    import numpy as np
+
+K = TypeVar('K', bound=Hashable)
+
+_NON_WORD = re.compile(r'[\W_]+')
+_NUMBER = re.compile(r'\d+')
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = 0xFFFFFFFF
+
+# Default: 64 permutations = 16 band x 4 rows. Pasangan dengan Jaccard 0.7
+# menjadi kandidat dengan probabilitas ~99%, Jaccard 0.3 hanya ~12%.
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.7
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase, buang tanda baca, dan rapikan whitespace."""
+    return _NON_WORD.sub(' ', (text or '').lower()).strip()
+
+
+def shingles(text: str, size: int = 4) -> Set[str]:
+    """
+    Character shingles dari text yang sudah dinormalisasi.
+
+    Args:
+        text: Text ternormalisasi
+        size: Panjang shingle
+
+    Returns:
+        Set shingle (text lebih pendek dari size menjadi satu shingle)
+    """
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHasher:
+    """MinHash dengan permutasi deterministik (stabil antar process)."""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1):
+        """
+        Initialize hasher.
+
+        Args:
+            num_perm: Jumlah permutasi (panjang signature)
+            seed: Seed permutasi; signature hanya bisa dibandingkan jika
+                num_perm dan seed sama
+        """
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: Optional[str]) -> Optional['np.ndarray']:
+        """
+        MinHash signature dari text.
+
+        Args:
+            text: Text mentah (akan dinormalisasi)
+
+        Returns:
+            Array uint32 shape (num_perm,), atau None jika text kosong
+        """
+        shingle_set = shingles(normalize_text(text))
+        if not shingle_set:
+            return None
+
+        import numpy as np
+
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode('utf-8')) for s in shingle_set),
+            dtype=np.uint64,
+            count=len(shingle_set),
+        )
+        # (P, 1) * (1, S) -> (P, S), lalu minimum per permutasi
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % np.uint64(
+            _MERSENNE_PRIME
+        )
+        return (permuted & np.uint64(_MAX_HASH)).min(axis=1).astype(np.uint32)
+
+
+def similarity(sig_a: 'np.ndarray', sig_b: 'np.ndarray') -> float:
+    """Estimasi Jaccard similarity dari dua signature."""
+    import numpy as np
+
+    return float(np.mean(sig_a == sig_b))
+
+
+class MinHashIndex(Generic[K]):
+    """LSH index untuk mencari near-duplicate dari signature."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            threshold: Minimum estimasi Jaccard untuk dianggap duplikat
+            num_perm: Panjang signature
+            bands: Jumlah band (num_perm harus habis dibagi bands)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self._rows = num_perm // bands
+        self._bands = bands
+        self._buckets: Dict[Tuple[int, bytes], List[K]] = defaultdict(list)
+        self._signatures: Dict[K, 'np.ndarray'] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: 'np.ndarray') -> Iterator[Tuple[int, bytes]]:
+        for band in range(self._bands):
+            rows = signature[band * self._rows : (band + 1) * self._rows]
+            yield band, rows.tobytes()
+
+    def signature(self, key: K) -> Optional['np.ndarray']:
+        """Get signature yang tersimpan untuk key."""
+        return self._signatures.get(key)
+
+    def add(self, key: K, signature: 'np.ndarray') -> None:
+        """
+        Tambahkan signature ke index.
+
+        Args:
+            key: Identifier item
+            signature: MinHash signature
+        """
+        if key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].append(key)
+
+    def query(self, signature: 'np.ndarray') -> Optional[K]:
+        """
+        Cari item paling mirip di atas threshold.
+
+        Args:
+            signature: MinHash signature
+
+        Returns:
+            Key item duplikat, atau None
+        """
+        # dict menjaga urutan insert supaya hasil deterministik
+        candidates: Dict[K, None] = {}
+        for band_key in self._band_keys(signature):
+            candidates.update(dict.fromkeys(self._buckets.get(band_key, ())))
+
+        best_key, best_score = None, 0.0
+        for key in candidates:
+            score = similarity(signature, self._signatures[key])
+            if score >= self.threshold and score > best_score:
+                best_key, best_score = key, score
+        return best_key
+
+
+class Fingerprint(NamedTuple):
+    """Fingerprint text untuk near-duplicate detection."""
+
+    numbers: Tuple[str, ...]
+    signature: 'np.ndarray'
+
+
+class NearDuplicateDetector(Generic[K]):
+    """MinHash LSH index per kombinasi angka dalam text."""
+
+    def __init__(
+        self, threshold: float = DEFAULT_THRESHOLD, hasher: Optional[MinHasher] = None
+    ):
+        """
+        Initialize detector.
+
+        Args:
+            threshold: Minimum estimasi Jaccard untuk dianggap duplikat
+            hasher: Optional MinHasher (default: permutasi standar)
+        """
+        self.threshold = threshold
+        self.hasher = hasher or MinHasher()
+        self._indexes: Dict[Tuple[str, ...], MinHashIndex[K]] = {}
+        self._numbers: Dict[K, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._numbers
+
+    @staticmethod
+    def numbers(text: Optional[str]) -> Tuple[str, ...]:
+        """Angka unik dalam text (urut)."""
+        return tuple(sorted(set(_NUMBER.findall(text or ''))))
+
+    def fingerprint(
+        self, text: Optional[str], signature: Optional['np.ndarray'] = None
+    ) -> Optional[Fingerprint]:
+        """
+        Fingerprint text.
+
+        Args:
+            text: Text mentah
+            signature: Optional signature yang sudah dihitung sebelumnya
+
+        Returns:
+            Fingerprint, atau None jika text kosong
+        """
+        if signature is None:
+            signature = self.hasher.signature(text)
+        if signature is None:
+            return None
+        return Fingerprint(self.numbers(text), signature)
+
+    def add(self, key: K, fingerprint: Fingerprint) -> None:
+        """Tambahkan fingerprint ke index."""
+        if key in self._numbers:
+            return
+        index = self._indexes.get(fingerprint.numbers)
+        if index is None:
+            index = MinHashIndex(self.threshold, num_perm=self.hasher.num_perm)
+            self._indexes[fingerprint.numbers] = index
+        index.add(key, fingerprint.signature)
+        self._numbers[key] = fingerprint.numbers
+
+    def find(self, fingerprint: Fingerprint) -> Optional[K]:
+        """Cari key item yang merupakan near-duplicate dari fingerprint."""
+        index = self._indexes.get(fingerprint.numbers)
+        return index.query(fingerprint.signature) if index is not None else None
+
+    def signature(self, key: K) -> Optional['np.ndarray']:
+        """Get signature yang tersimpan untuk key."""
+        numbers = self._numbers.get(key)
+        if numbers is None:
+            return None
+        return self._indexes[numbers].signature(key)
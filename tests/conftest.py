@@ -0,0 +1,50 @@
+"""
+Helper bersama untuk test suite.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from src.models.stock_data import (
+    CompanyInfo,
+    PriceMetrics,
+    ProfitabilityMetrics,
+    StockData,
+    ValuationMetrics,
+)
+from src.utils.helpers import normalize_ticker
+
+
+def make_stock_data(
+    ticker: str,
+    pe_ratio: Optional[float] = 8.0,
+    price_to_book: Optional[float] = 1.2,
+    roe: Optional[float] = None,
+    gross_margin: Optional[float] = None,
+    current_price: Optional[float] = None,
+    last_updated: Optional[datetime] = None,
+) -> StockData:
+    """
+    StockData minimal untuk test (pengganti hasil fetch Yahoo Finance).
+
+    Args:
+        ticker: Ticker symbol (dinormalisasi ke suffix .JK)
+        pe_ratio: PE ratio
+        price_to_book: Price to book value
+        roe: Return on equity
+        gross_margin: Gross margin
+        current_price: Harga terakhir
+        last_updated: Waktu fetch (default: sekarang)
+
+    Returns:
+        StockData
+    """
+    stock_data = StockData(
+        company_info=CompanyInfo(ticker=normalize_ticker(ticker), name=ticker),
+        valuation=ValuationMetrics(pe_ratio=pe_ratio, price_to_book=price_to_book),
+        profitability=ProfitabilityMetrics(roe=roe, gross_margin=gross_margin),
+        price=PriceMetrics(current_price=current_price),
+    )
+    if last_updated is not None:
+        stock_data.last_updated = last_updated
+    return stock_data
@@ -0,0 +1,142 @@
+"""
+Tests untuk checkpoint journal batch run (src.cli.checkpoint).
+"""
+
+import json
+
+import pytest
+
+from src.analyzers.prefilter import PreFilter
+from src.cli.checkpoint import (
+    BatchCheckpoint,
+    CheckpointMismatch,
+    checkpoint_run_id,
+)
+from src.config.settings import ScreeningCriteria
+from src.models.screening_result import Rating, ScreeningMetrics, ScreeningResult
+from tests.conftest import make_stock_data
+
+
+def make_result(ticker):
+    return ScreeningResult(
+        ticker=ticker,
+        company_name=ticker,
+        rating=Rating.STRONG,
+        metrics=ScreeningMetrics(total_score=72.5),
+    )
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return tmp_path / 'checkpoints' / 'run.jsonl'
+
+
+class TestBatchCheckpoint:
+    """Test suite untuk BatchCheckpoint."""
+
+    def test_round_trip(self, journal):
+        with BatchCheckpoint(journal, 'run-1') as checkpoint:
+            assert checkpoint.open().done == {}
+            checkpoint.record_done(
+                'BBCA', make_stock_data('BBCA.JK'), make_result('BBCA.JK')
+            )
+            checkpoint.record_done('BMRI', make_stock_data('BMRI.JK'))
+            checkpoint.record_pruned('TINY', 'market_cap')
+            checkpoint.record_failed('XXXX', 'fetch')
+
+        state = BatchCheckpoint(journal, 'run-1').load()
+
+        stock_data, result = state.done['BBCA.JK']
+        assert stock_data.valuation.pe_ratio == 8.0
+        assert result.rating == Rating.STRONG
+        assert result.metrics.total_score == 72.5
+        assert state.done['BMRI.JK'][1] is None
+        assert state.pruned == {'TINY.JK': 'market_cap'}
+        assert state.failed == {'XXXX.JK'}
+        assert state.is_finished('tiny') and not state.is_finished('XXXX')
+
+    def test_resume_appends_and_last_record_wins(self, journal):
+        with BatchCheckpoint(journal, 'run-1') as checkpoint:
+            checkpoint.open()
+            checkpoint.record_failed('BBCA', 'fetch')
+
+        with BatchCheckpoint(journal, 'run-1') as checkpoint:
+            state = checkpoint.open(resume=True)
+            assert state.failed == {'BBCA.JK'}
+            checkpoint.record_done('BBCA', make_stock_data('BBCA.JK'))
+
+        state = BatchCheckpoint(journal, 'run-1').load()
+        assert list(state.done) == ['BBCA.JK']
+        assert state.failed == set()
+
+    def test_truncated_last_record_ignored(self, journal):
+        with BatchCheckpoint(journal, 'run-1') as checkpoint:
+            checkpoint.open()
+            checkpoint.record_pruned('TINY', 'market_cap')
+        with journal.open('a') as stream:
+            stream.write('{"ticker": "BBCA.JK", "status": "do')
+
+        state = BatchCheckpoint(journal, 'run-1').load()
+
+        assert state.pruned == {'TINY.JK': 'market_cap'}
+        assert state.done == {}
+
+    def test_resume_after_truncated_record_keeps_new_records(self, journal):
+        with BatchCheckpoint(journal, 'run-1') as checkpoint:
+            checkpoint.open()
+            checkpoint.record_pruned('TINY', 'market_cap')
+        with journal.open('a') as stream:
+            stream.write('{"ticker": "BBCA.JK", "status": "do')
+
+        with BatchCheckpoint(journal, 'run-1') as checkpoint:
+            checkpoint.open(resume=True)
+            checkpoint.record_failed('BMRI', 'fetch')
+
+        state = BatchCheckpoint(journal, 'run-1').load()
+        assert state.pruned == {'TINY.JK': 'market_cap'}
+        assert state.failed == {'BMRI.JK'}
+
+    def test_other_run_rejected(self, journal):
+        with BatchCheckpoint(journal, 'run-1') as checkpoint:
+            checkpoint.open()
+
+        with pytest.raises(CheckpointMismatch):
+            BatchCheckpoint(journal, 'run-2').open(resume=True)
+
+    def test_open_without_resume_starts_over(self, journal):
+        with BatchCheckpoint(journal, 'run-1') as checkpoint:
+            checkpoint.open()
+            checkpoint.record_pruned('TINY', 'market_cap')
+
+        with BatchCheckpoint(journal, 'run-1') as checkpoint:
+            assert checkpoint.open().pruned == {}
+
+        lines = journal.read_text().splitlines()
+        assert [json.loads(line)['run_id'] for line in lines] == ['run-1']
+
+    def test_discard(self, journal):
+        checkpoint = BatchCheckpoint(journal, 'run-1')
+        checkpoint.open()
+        checkpoint.discard()
+
+        assert not journal.exists()
+
+
+class TestRunId:
+    """Test suite untuk checkpoint_run_id."""
+
+    def test_depends_on_universe_and_options(self):
+        criteria = ScreeningCriteria()
+        rules = PreFilter.from_criteria(criteria).rules
+        base = checkpoint_run_id(['BBCA', 'BMRI'], criteria, rules)
+
+        assert checkpoint_run_id(['bmri.jk', 'BBCA'], criteria, rules) == base
+        assert checkpoint_run_id(['BBCA'], criteria, rules) != base
+        assert checkpoint_run_id(['BBCA', 'BMRI'], criteria, []) != base
+
+        assert checkpoint_run_id(['BBCA', 'BMRI'], criteria, rules, ()) == base
+        with_news = checkpoint_run_id(['BBCA', 'BMRI'], criteria, rules, ['yahoo'])
+        assert with_news != base
+
+        criteria.sector_relative.enabled = True
+        assert checkpoint_run_id(['BBCA', 'BMRI'], criteria, rules) != base
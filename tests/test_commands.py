@@ -2,35 +2,52 @@
 Unit tests untuk CLI commands.
 """
 
+import csv
 from datetime import datetime
+import io
+import json
+import threading
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from click.testing import CliRunner
+from rich.console import Console
 
 from src.cli.commands import (
     _display_category_scores,
     _display_company_info,
+    _comparison_table,
     _display_comparison_table,
     _display_insights,
     _display_key_metrics,
     _display_news_summary,
+    _format_sentiment_trend,
     _display_recommendation,
     _display_screening_summary,
     _get_sentiment_color,
+    batch,
     cli,
+    robustness,
+    sweep,
+    watch,
     compare,
     interactive,
+    news_group,
     screen,
 )
+from src.config.settings import ScreeningCriteria
 from src.models.screening_result import Rating, ScreeningResult, ScreeningMetrics, CategoryScore
 from src.models.stock_data import (
     CompanyInfo,
+    CorporateAction,
     NewsItem,
+    SentimentWindow,
     StockData,
     ValuationMetrics,
     ProfitabilityMetrics,
 )
+from src.services.news_store import NewsStore
 
 
 class TestCLI:
@@ -58,8 +75,8 @@ class TestScreenCommand:
     """Tests untuk screen command."""
 
     @patch('src.cli.commands.YahooFinanceService')
-    @patch('src.cli.commands.NewsScraperService')
-    @patch('src.cli.commands.FundamentalAnalyzer')
+    @patch('src.services.news_scraper_service.NewsScraperService')
+    @patch('src.analyzers.fundamental_analyzer.FundamentalAnalyzer')
     def test_screen_success(self, mock_analyzer, mock_news_service, mock_finance_service):
         """Test screen command dengan success."""
         runner = CliRunner()
@@ -91,8 +108,8 @@ class TestScreenCommand:
         assert 'Error' in result.output or 'Could not fetch' in result.output
 
     @patch('src.cli.commands.YahooFinanceService')
-    @patch('src.cli.commands.NewsScraperService')
-    @patch('src.cli.commands.FundamentalAnalyzer')
+    @patch('src.services.news_scraper_service.NewsScraperService')
+    @patch('src.analyzers.fundamental_analyzer.FundamentalAnalyzer')
     def test_screen_with_detailed(self, mock_analyzer, mock_news_service, mock_finance_service):
         """Test screen command dengan --detailed flag."""
         runner = CliRunner()
@@ -110,8 +127,8 @@ class TestScreenCommand:
         assert result.exit_code == 0
 
     @patch('src.cli.commands.YahooFinanceService')
-    @patch('src.cli.commands.NewsScraperService')
-    @patch('src.cli.commands.FundamentalAnalyzer')
+    @patch('src.services.news_scraper_service.NewsScraperService')
+    @patch('src.analyzers.fundamental_analyzer.FundamentalAnalyzer')
     def test_screen_no_news(self, mock_analyzer, mock_news_service, mock_finance_service):
         """Test screen command dengan --no-news flag."""
         runner = CliRunner()
@@ -159,7 +176,7 @@ class TestCompareCommand:
     """Tests untuk compare command."""
 
     @patch('src.cli.commands.YahooFinanceService')
-    @patch('src.cli.commands.FundamentalAnalyzer')
+    @patch('src.analyzers.fundamental_analyzer.FundamentalAnalyzer')
     def test_compare_success(self, mock_analyzer, mock_finance_service):
         """Test compare command dengan success."""
         runner = CliRunner()
@@ -198,6 +215,36 @@ class TestCompareCommand:
 
         assert result.exit_code == 0
 
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_compare_fetches_concurrently(self, mock_finance_service):
+        """Test semua ticker di-fetch bersamaan, ranking dan gagal inline."""
+        in_flight = threading.Barrier(3, timeout=5)
+
+        def fetch(ticker):
+            # Hanya lolos jika ketiga fetch berjalan pada waktu yang sama
+            in_flight.wait()
+            if ticker == 'XXXX':
+                return None
+            pe_ratio = {'BBCA': 30.0, 'BMRI': 5.0}[ticker]
+            return StockData(
+                company_info=CompanyInfo(ticker=f'{ticker}.JK', name=ticker),
+                valuation=ValuationMetrics(pe_ratio=pe_ratio, price_to_book=1.0),
+                profitability=ProfitabilityMetrics(roe=0.2),
+            )
+
+        mock_finance_service.return_value.get_stock_data.side_effect = fetch
+
+        result = CliRunner().invoke(compare, ['BBCA', 'XXXX', 'BMRI'])
+
+        assert result.exit_code == 0
+        rows = [
+            line.split('│')
+            for line in result.output.splitlines()
+            if '│' in line and line.split('│')[1].strip()
+        ]
+        assert [row[1].strip() for row in rows] == ['BMRI', 'BBCA', 'XXXX']
+        assert rows[-1][2].strip() == 'fetch'  # 'fetch failed' (wrapped)
+
     def _create_mock_stock_data(self, ticker='BBCA'):
         """Create mock stock data."""
         company_info = CompanyInfo(
@@ -219,6 +266,343 @@ class TestCompareCommand:
         )
 
 
+class TestBatchCommand:
+    """Tests untuk batch command."""
+
+    @pytest.fixture(autouse=True)
+    def data_dir(self, tmp_path, monkeypatch):
+        """Checkpoint journal di direktori sementara."""
+        monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+        return tmp_path
+
+    @patch('src.cli.commands.YahooFinanceService')
+    @patch('src.analyzers.fundamental_analyzer.FundamentalAnalyzer')
+    def test_batch_prefilter_prunes_before_fetch(
+        self, mock_analyzer, mock_finance_service
+    ):
+        """Test ticker yang gagal pre-filter tidak di-fetch lengkap."""
+        runner = CliRunner()
+
+        quotes = {
+            'BBCA': {'market_cap': 5e14, 'dividend_yield': 0.03},
+            'TINY': {'market_cap': 1e9, 'dividend_yield': 0.03},
+        }
+        service = mock_finance_service.return_value
+        service.get_quote.side_effect = lambda t: quotes[t]
+        service.get_stock_data.return_value = StockData(
+            company_info=CompanyInfo(ticker='BBCA.JK', name='Bank BCA')
+        )
+        mock_analyzer.return_value.criteria = ScreeningCriteria()
+        mock_analyzer.return_value.analyze.return_value = ScreeningResult(
+            ticker='BBCA', company_name='Bank BCA'
+        )
+
+        result = runner.invoke(batch, ['BBCA', 'TINY'])
+
+        assert result.exit_code == 0
+        service.get_stock_data.assert_called_once_with('BBCA')
+        assert 'Screening Funnel' in result.output
+
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_batch_resume_after_interrupt(self, mock_finance_service, data_dir):
+        """Test run yang terhenti dilanjutkan tanpa fetch ulang ticker selesai."""
+        service = mock_finance_service.return_value
+        service.get_quote.side_effect = lambda t: (
+            None if t == 'XXXX' else {'market_cap': 5e14, 'dividend_yield': 0.03}
+        )
+
+        interrupt_at = {'TLKM'}
+        fetched = []
+
+        def fetch(ticker):
+            if ticker in interrupt_at:
+                # Fetch lain yang sedang berjalan tetap diselesaikan pipeline
+                while len(fetched) < 2:
+                    time.sleep(0.01)
+                raise KeyboardInterrupt
+            fetched.append(ticker)
+            return StockData(
+                company_info=CompanyInfo(ticker=f'{ticker}.JK', name=ticker),
+                valuation=ValuationMetrics(pe_ratio=8.0, price_to_book=1.2),
+            )
+
+        service.get_stock_data.side_effect = fetch
+        args = ['BBCA', 'XXXX', 'BMRI', 'TLKM']
+
+        result = CliRunner().invoke(batch, args)
+        assert result.exit_code != 0
+        assert 'Re-run with --resume' in result.stderr
+        assert len(list((data_dir / 'checkpoints').glob('*.jsonl'))) == 1
+
+        service.get_quote.reset_mock()
+        service.get_stock_data.reset_mock()
+        interrupt_at.clear()
+
+        result = CliRunner().invoke(batch, args + ['--resume', '--format', 'ndjson'])
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [r['ticker'] for r in records] == ['BBCA.JK', 'BMRI.JK', 'TLKM.JK']
+        # Ticker yang gagal quote dan yang belum selesai diproses ulang
+        assert [c.args[0] for c in service.get_quote.call_args_list] == ['XXXX', 'TLKM']
+        service.get_stock_data.assert_called_once_with('TLKM')
+        # Journal dihapus setelah run selesai
+        assert list((data_dir / 'checkpoints').glob('*.jsonl')) == []
+
+    def test_batch_resume_rejects_other_run(self, data_dir):
+        journal = data_dir / 'run.jsonl'
+        journal.write_text('{"run_id": "other", "version": 1}\n')
+
+        result = CliRunner().invoke(
+            batch, ['BBCA', '--resume', '--checkpoint', str(journal)]
+        )
+
+        assert result.exit_code == 0
+        assert 'different run' in result.output
+
+    def test_batch_without_tickers(self):
+        """Test batch tanpa ticker."""
+        runner = CliRunner()
+        result = runner.invoke(batch, [])
+
+        assert result.exit_code == 0
+        assert 'Error' in result.output
+
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_batch_fetches_concurrently_with_stats(self, mock_finance_service):
+        """Test fetch stage 2 paralel dan --pipeline-stats per stage."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(ticker):
+            barrier.wait()
+            return StockData(
+                company_info=CompanyInfo(ticker=f'{ticker}.JK', name=ticker),
+                valuation=ValuationMetrics(pe_ratio=8.0, price_to_book=1.2),
+            )
+
+        service = mock_finance_service.return_value
+        service.get_stock_data.side_effect = fetch
+
+        result = CliRunner().invoke(
+            batch,
+            ['BBCA', 'BMRI', 'TLKM', '--no-prefilter', '--workers', '3']
+            + ['--pipeline-stats'],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert 'Pipeline Stages' in result.output
+        for stage in ('fetch_fundamentals', 'analyze', 'sink'):
+            assert stage in result.output
+        assert '3 tickers → 3 passed pre-filter → 3 analyzed' in result.output
+
+    @patch('src.services.news_scraper_service.NewsScraperService')
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_batch_news_stage(self, mock_finance_service, mock_news_service):
+        """Test --news menambah stage fetch_news dan berita ikut dianalisis."""
+        service = mock_finance_service.return_value
+        service.get_stock_data.side_effect = lambda t: StockData(
+            company_info=CompanyInfo(ticker=f'{t}.JK', name=t),
+            valuation=ValuationMetrics(pe_ratio=8.0, price_to_book=1.2),
+        )
+        news_service = mock_news_service.return_value
+        news_service.get_news.return_value = []
+        news_service.get_corporate_actions.side_effect = lambda t, news: [
+            CorporateAction(ticker=t, action_type='dividend')
+        ]
+        news_service.get_sentiment_trend.return_value = []
+
+        result = CliRunner().invoke(
+            batch,
+            ['BBCA', 'BMRI', '--no-prefilter', '--news', '--pipeline-stats']
+            + ['--format', 'ndjson'],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert mock_news_service.call_args.kwargs['store'] is None
+        assert sorted(c.args[0] for c in news_service.get_news.call_args_list) == [
+            'BBCA',
+            'BMRI',
+        ]
+        for stage in ('fetch_news', 'build_model'):
+            assert stage in result.stderr
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert all('Dividend announced' in json.dumps(r['insights']) for r in records)
+
+
+class TestOutputFormats:
+    """Tests untuk --format json/ndjson/csv."""
+
+    @pytest.fixture(autouse=True)
+    def data_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+
+    @staticmethod
+    def _stock_data(ticker):
+        return StockData(
+            company_info=CompanyInfo(ticker=f'{ticker}.JK', name=f'Company {ticker}'),
+            valuation=ValuationMetrics(pe_ratio=8.0, price_to_book=1.2),
+        )
+
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_screen_json(self, mock_finance_service):
+        mock_finance_service.return_value.get_stock_data.return_value = (
+            self._stock_data('BBCA')
+        )
+
+        result = CliRunner().invoke(screen, ['BBCA', '--no-news', '--format', 'json'])
+
+        assert result.exit_code == 0
+        (record,) = json.loads(result.stdout)
+        assert record['ticker'] == 'BBCA.JK'
+        assert record['key_metrics']['pe_ratio'] == 8.0
+        assert 'Screening' not in result.stdout
+
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_compare_ndjson_streams_each_result(self, mock_finance_service):
+        """Test setiap hasil ditulis begitu fetch-nya selesai (tidak menunggu)."""
+        out = io.StringIO()
+        streamed = threading.Event()
+
+        def fetch(ticker):
+            if ticker == 'BBCA':
+                # Fetch lambat: BMRI sudah harus tertulis sebelum BBCA selesai
+                for _ in range(200):
+                    if out.getvalue().count('\n') == 1:
+                        streamed.set()
+                        break
+                    time.sleep(0.01)
+            return None if ticker == 'XXXX' else self._stock_data(ticker)
+
+        mock_finance_service.return_value.get_stock_data.side_effect = fetch
+        with patch('src.cli.commands.console', Console(file=out)):
+            result = CliRunner().invoke(
+                compare, ['BBCA', 'XXXX', 'BMRI', '--format', 'ndjson']
+            )
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [r['ticker'] for r in records] == ['BMRI.JK', 'BBCA.JK']
+        assert streamed.is_set()
+        assert 'Could not fetch data for XXXX' in result.stderr
+
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_batch_csv(self, mock_finance_service):
+        service = mock_finance_service.return_value
+        service.get_quote.return_value = {'market_cap': 5e14, 'dividend_yield': 0.03}
+        service.get_stock_data.side_effect = self._stock_data
+
+        result = CliRunner().invoke(batch, ['BBCA', 'BMRI', '--format', 'csv'])
+
+        assert result.exit_code == 0
+        rows = list(csv.DictReader(io.StringIO(result.stdout)))
+        assert [row['ticker'] for row in rows] == ['BBCA.JK', 'BMRI.JK']
+        assert rows[0]['pe_ratio'] == '8.0'
+        assert 'Analyzed 2 of 2 stocks' in result.stderr
+
+
+class TestWatchCommand:
+    """Tests untuk watch command."""
+
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_watch_single_tick(self, mock_finance_service):
+        mock_finance_service.return_value.get_stock_data.side_effect = (
+            lambda ticker, use_cache=True: StockData(
+                company_info=CompanyInfo(ticker=ticker, name=ticker),
+                valuation=ValuationMetrics(pe_ratio=8.0, price_to_book=1.2),
+            )
+        )
+
+        result = CliRunner().invoke(
+            watch, ['BBCA', 'BMRI', '--no-news', '--count', '1', '--interval', '1m']
+        )
+
+        assert result.exit_code == 0
+        assert 'Watching 2 stocks every 1m' in result.output
+        assert 'BBCA' in result.output and 'BMRI' in result.output
+        mock_finance_service.return_value.get_stock_data.assert_any_call(
+            'BBCA.JK', use_cache=False
+        )
+
+    def test_watch_invalid_interval(self):
+        result = CliRunner().invoke(watch, ['BBCA', '--interval', 'soon'])
+
+        assert result.exit_code != 0
+        assert 'Invalid duration' in result.output
+
+
+class TestSweepCommand:
+    """Tests untuk sweep command."""
+
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_sweep_grid(self, mock_finance_service):
+        """Test sweep dengan grid option."""
+        runner = CliRunner()
+        mock_finance_service.return_value.get_stock_data.side_effect = [
+            StockData(
+                company_info=CompanyInfo(ticker=f'{t}.JK', name=t),
+                valuation=ValuationMetrics(pe_ratio=pe),
+            )
+            for t, pe in [('BBCA', 8.0), ('BMRI', 12.0)]
+        ]
+
+        result = runner.invoke(
+            sweep, ['BBCA', 'BMRI', '-g', 'valuation.pe_ratio_max=10,20']
+        )
+
+        assert result.exit_code == 0
+        assert 'Rank Stability' in result.output
+        assert 'valuation.pe_ratio_max=20' in result.output
+
+    def test_sweep_invalid_grid(self):
+        """Test sweep dengan grid option tidak valid."""
+        runner = CliRunner()
+        result = runner.invoke(sweep, ['BBCA', '-g', 'nope'])
+
+        assert result.exit_code == 0
+        assert 'Error' in result.output
+
+
+class TestRobustnessCommand:
+    """Tests untuk robustness command."""
+
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_robustness(self, mock_finance_service):
+        """Test robustness menampilkan probabilitas top-N."""
+        runner = CliRunner()
+        mock_finance_service.return_value.get_stock_data.side_effect = [
+            StockData(
+                company_info=CompanyInfo(ticker=f'{t}.JK', name=t),
+                valuation=ValuationMetrics(pe_ratio=pe, price_to_book=pbv),
+            )
+            for t, pe, pbv in [('BBCA', 4.0, 0.8), ('BMRI', 12.0, 1.5)]
+        ]
+
+        result = runner.invoke(
+            robustness, ['BBCA', 'BMRI', '--samples', '200', '--top', '1', '--seed', '1']
+        )
+
+        assert result.exit_code == 0
+        assert 'Rank Robustness' in result.output
+        assert 'BBCA' in result.output
+
+
+class TestNewsClassifyCommand:
+    """Tests untuk news classify command."""
+
+    def test_news_classify(self, tmp_path):
+        """Test classify menulis JSONL berlabel."""
+        runner = CliRunner()
+        source = tmp_path / 'headlines.txt'
+        source.write_text('BBCA profit naik\nTLKM rugi besar\n')
+        output = tmp_path / 'labeled.jsonl'
+
+        result = runner.invoke(news_group, ['classify', str(source), '-o', str(output)])
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [r['sentiment'] for r in records] == ['positive', 'negative']
+
+
 class TestDisplayFunctions:
     """Tests untuk display helper functions."""
 
@@ -409,6 +793,17 @@ class TestDisplayFunctions:
             _display_news_summary(news_items, corporate_actions, mock_service)
             assert mock_console.print.called
 
+    def test_format_sentiment_trend(self):
+        """Test format rolling sentiment untuk screen output."""
+        trend = [
+            SentimentWindow(days=7, positive=2, negative=1, score=1.5),
+            SentimentWindow(days=30),
+        ]
+
+        assert _format_sentiment_trend(trend) == (
+            "7d [green]+0.50[/green] (3) | 30d [dim]-[/dim]"
+        )
+
     def test_display_recommendation_strong(self):
         """Test _display_recommendation untuk strong fundamentals."""
         metrics = ScreeningMetrics(total_score=80.0)
@@ -467,6 +862,17 @@ class TestDisplayFunctions:
             _display_comparison_table(results)
             assert mock_console.print.called
 
+    def test_comparison_table_marks_pending(self):
+        """Test ticker yang belum selesai ditandai lambat setelah threshold."""
+        out = io.StringIO()
+        render = Console(file=out, width=120)
+
+        render.print(_comparison_table([], pending=['BBCA'], elapsed=1.0))
+        render.print(_comparison_table([], pending=['BBCA'], elapsed=12.0))
+
+        assert 'fetching...' in out.getvalue()
+        assert 'slow (12s)' in out.getvalue()
+
     def test_get_sentiment_color(self):
         """Test _get_sentiment_color."""
         assert _get_sentiment_color('positive') == 'green'
@@ -487,3 +893,87 @@ class TestInteractiveCommand:
         # Full testing would require more complex mocking
         assert callable(interactive)
 
+
+
+class TestNewsSearchCommand:
+    """Tests untuk news search command."""
+
+    def test_news_search(self, tmp_path, monkeypatch):
+        """Test search membaca news store di data dir."""
+        monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+        with NewsStore() as store:
+            store.add(
+                'BBCA.JK',
+                [
+                    NewsItem(
+                        title='BBCA umumkan stock split',
+                        source='IDX',
+                        published_date=datetime(2024, 3, 31, 15),
+                        item_id='a',
+                    ),
+                    NewsItem(
+                        title='Stock split TLKM',
+                        source='IDX',
+                        published_date=datetime(2024, 4, 2),
+                        item_id='b',
+                    ),
+                ],
+            )
+
+        runner = CliRunner()
+        result = runner.invoke(
+            news_group,
+            ['search', 'stock split', '--until', '2024-03-31', '-t', 'bbca'],
+        )
+
+        assert result.exit_code == 0
+        assert 'BBCA umumkan stock split' in result.output
+        assert 'TLKM' not in result.output
+
+    def test_news_search_invalid_date(self, tmp_path, monkeypatch):
+        """Test tanggal tidak valid ditolak."""
+        monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+        runner = CliRunner()
+
+        result = runner.invoke(news_group, ['search', 'dividen', '--since', 'kemarin'])
+
+        assert result.exit_code != 0
+        assert 'Invalid duration' in result.output
+
+
+class TestNewsCalendarCommand:
+    """Tests untuk news calendar command."""
+
+    def test_news_calendar(self, tmp_path, monkeypatch):
+        """Test calendar menampilkan event dalam periode."""
+        monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+        with NewsStore() as store:
+            store.add(
+                'BBCA.JK',
+                [
+                    NewsItem(
+                        title='BBCA dividen Rp 150 per saham, cum date 2024-03-15',
+                        source='IDX',
+                        published_date=datetime(2024, 3, 1),
+                        corporate_action_types=['dividend'],
+                        item_id='a',
+                    ),
+                    NewsItem(
+                        title='BBCA dividen interim, cum date 2024-04-15',
+                        source='IDX',
+                        published_date=datetime(2024, 3, 2),
+                        corporate_action_types=['dividend'],
+                        item_id='b',
+                    ),
+                ],
+            )
+
+        runner = CliRunner()
+        result = runner.invoke(
+            news_group, ['calendar', '--from', '2024-03-11', '--type', 'dividend']
+        )
+
+        assert result.exit_code == 0
+        assert '2024-03-15' in result.output
+        assert 'Rp 150' in result.output
+        assert '2024-04-15' not in result.output
@@ -0,0 +1,223 @@
+"""
+Tests untuk ServiceContext (service bersama interactive mode).
+"""
+
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+import pytest
+
+from src.analyzers.sector_stats import SectorStatistics
+from src.cli.commands import compare, screen
+from src.cli.context import SCORE_CACHE_SIZE, ServiceContext
+from src.services.news_store import NewsStore
+from src.services.scheduler import BACKGROUND, INTERACTIVE
+from tests.conftest import make_stock_data
+
+
+@pytest.fixture
+def services(tmp_path, monkeypatch):
+    """ServiceContext dengan NewsStore di direktori sementara."""
+    monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+    with ServiceContext() as services:
+        yield services
+
+
+@pytest.fixture
+def yahoo_news():
+    """Mock yfinance Ticker dengan satu berita."""
+    ticker = MagicMock()
+    ticker.news = [
+        {
+            'uuid': 'a',
+            'title': 'BBCA bagikan dividen Rp 150 per saham',
+            'publisher': 'Reuters',
+            'providerPublishTime': 1704067200,
+        }
+    ]
+    with patch('yfinance.Ticker', return_value=ticker) as mock:
+        yield mock
+
+
+class TestServiceContext:
+    """Test suite untuk ServiceContext."""
+
+    def test_repeat_lookup_fetches_once(self, services):
+        """Test prefetch dan lookup berulang hanya fetch sekali."""
+        with patch.object(
+            services.finance_service,
+            'get_stock_data',
+            side_effect=make_stock_data,
+        ) as fetch:
+            services.prefetch('bbca', news=False)
+            first = services.get_stock_data('BBCA')
+            second = services.get_stock_data('BBCA.JK')
+
+        assert first is second
+        fetch.assert_called_once_with('BBCA.JK')
+
+    def test_prefetch_runs_in_background(self, services):
+        """Test prefetch tidak memblok caller."""
+        release = threading.Event()
+
+        def slow_fetch(ticker):
+            release.wait(5)
+            return make_stock_data('BBCA')
+
+        with patch.object(
+            services.finance_service, 'get_stock_data', side_effect=slow_fetch
+        ):
+            services.prefetch('BBCA', news=False)
+            release.set()
+            assert services.get_stock_data('BBCA').get_ticker() == 'BBCA.JK'
+
+    def test_failed_fetch_is_retried(self, services):
+        """Test fetch yang gagal tidak di-cache."""
+        with patch.object(
+            services.finance_service,
+            'get_stock_data',
+            side_effect=[None, make_stock_data('BBCA')],
+        ) as fetch:
+            assert services.get_stock_data('BBCA') is None
+            assert services.get_stock_data('BBCA') is not None
+
+        assert fetch.call_count == 2
+
+    def test_refetch_updates_sector_stats(self, tmp_path, monkeypatch):
+        """Test refetch setelah invalidate me-refresh statistik sektor."""
+        monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+        peer = make_stock_data('BMRI')
+        peer.company_info.sector = 'Financial Services'
+        stats = SectorStatistics.from_universe([peer])
+        pe_ratios = iter([6.0, 12.0])
+
+        def fetch(ticker):
+            stock_data = make_stock_data(ticker)
+            stock_data.company_info.sector = 'Financial Services'
+            stock_data.valuation.pe_ratio = next(pe_ratios)
+            return stock_data
+
+        with ServiceContext(sector_stats=stats) as services, patch.object(
+            services.finance_service, 'get_stock_data', side_effect=fetch
+        ):
+            services.get_stock_data('BBCA')
+            assert stats.percentile('Financial Services', 'pe_ratio', 7.0) == 0.5
+
+            services.invalidate('BBCA')
+            services.get_stock_data('BBCA')
+
+        assert services.analyzer.sector_stats is stats
+        assert stats.sector_size('Financial Services', 'pe_ratio') == 2
+        assert stats.percentile('Financial Services', 'pe_ratio', 7.0) == 0.0
+
+    def test_interactive_lookup_preempts_background(self, tmp_path, monkeypatch):
+        """Test lookup interactive menaikkan prefetch background yang antri."""
+        monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+        started, release = threading.Event(), threading.Event()
+        fetched = []
+
+        def fetch(ticker):
+            if ticker == 'HOLD.JK':
+                started.set()
+                release.wait(5)
+            fetched.append(ticker)
+            return make_stock_data(ticker)
+
+        with ServiceContext(workers=1) as services, patch.object(
+            services.finance_service, 'get_stock_data', side_effect=fetch
+        ):
+            services.prefetch('HOLD', news=False, priority=BACKGROUND)
+            assert started.wait(5)
+            for ticker in ['ASII', 'TLKM', 'BBCA']:
+                services.prefetch(ticker, news=False, priority=BACKGROUND)
+            future = services.stock_future('BBCA')
+            stats = services.scheduler_stats()['stock']
+            release.set()
+            future.result(5)
+            services.get_stock_data('TLKM')
+
+        assert stats[INTERACTIVE].queued == 1
+        assert fetched == ['HOLD.JK', 'BBCA.JK', 'ASII.JK', 'TLKM.JK']
+
+    def test_news_bundle_uses_store_in_news_thread(self, services, yahoo_news):
+        """Test berita, corporate actions dan trend di-fetch sekali per session."""
+        with patch.object(
+            services.finance_service, 'get_stock_data', side_effect=make_stock_data
+        ):
+            services.prefetch('BBCA')
+            bundle = services.get_news('BBCA')
+            again = services.get_news('BBCA')
+
+        assert again is bundle
+        assert [n.item_id for n in bundle.news] == ['a']
+        assert [a.action_type for a in bundle.corporate_actions] == ['dividend']
+        assert [w.days for w in bundle.sentiment_trend] == [7, 30, 90]
+        assert yahoo_news.call_count == 1
+        with NewsStore() as store:
+            assert store.count() == 1
+
+
+    def test_news_bundle_without_store_fetches_once(
+        self, tmp_path, monkeypatch, yahoo_news
+    ):
+        """Test corporate actions diambil dari berita yang sama tanpa query ulang."""
+        monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+        with ServiceContext(news_store=False, news_sources=('yahoo',)) as services:
+            bundle = services.get_news('BBCA')
+
+        assert [a.action_type for a in bundle.corporate_actions] == ['dividend']
+        assert yahoo_news.call_count == 1
+
+
+class TestCommandsWithServiceContext:
+    """Test command memakai ServiceContext dari click context."""
+
+    def test_screen_reuses_services(self, services, yahoo_news):
+        """Test screen berulang dalam satu session tidak fetch ulang."""
+        runner = CliRunner()
+        with patch.object(
+            services.finance_service,
+            'get_stock_data',
+            side_effect=make_stock_data,
+        ) as fetch:
+            for _ in range(2):
+                result = runner.invoke(screen, ['BBCA'], obj=services)
+                assert result.exit_code == 0, result.output
+                assert 'Recent Corporate Actions' in result.output
+
+        fetch.assert_called_once_with('BBCA.JK')
+        assert yahoo_news.call_count == 1
+
+    def test_screen_does_not_mutate_shared_stock_data(self, services, yahoo_news):
+        """Test berita screen sebelumnya tidak bocor ke command berikutnya."""
+        runner = CliRunner()
+        with patch.object(
+            services.finance_service,
+            'get_stock_data',
+            side_effect=make_stock_data,
+        ):
+            runner.invoke(screen, ['BBCA'], obj=services)
+            result = runner.invoke(
+                screen, ['BBCA', '--no-news', '--format', 'json'], obj=services
+            )
+
+        assert result.exit_code == 0, result.output
+        assert services.get_stock_data('BBCA').corporate_actions == []
+        assert not any('ividen' in i for i in json.loads(result.stdout)[0]['insights'])
+
+    def test_compare_uses_shared_score_cache(self, services):
+        """Test compare memakai analyzer dan ScoreCache session."""
+        runner = CliRunner()
+        with patch.object(
+            services.finance_service,
+            'get_stock_data',
+            side_effect=make_stock_data,
+        ):
+            runner.invoke(compare, ['BBCA', 'BMRI'], obj=services)
+            result = runner.invoke(compare, ['BBCA', 'BMRI'], obj=services)
+
+        assert result.exit_code == 0
+        assert services.score_cache.hits == 2
+        assert services.score_cache.max_entries == SCORE_CACHE_SIZE
@@ -0,0 +1,148 @@
+"""
+Tests untuk ekstraksi corporate action events.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models.stock_data import NewsItem
+from src.utils.corporate_actions import (
+    extract_amount,
+    extract_corporate_actions,
+    extract_dates,
+    extract_ratio,
+)
+
+
+def make_news(title, summary=None, types=None):
+    """NewsItem yang sudah diklasifikasi."""
+    return NewsItem(
+        title=title,
+        source='IDX',
+        published_date=datetime(2024, 3, 1),
+        summary=summary,
+        corporate_action_types=types,
+        item_id='idx:1',
+    )
+
+
+class TestExtractDates:
+    """Tests untuk extract_dates."""
+
+    @pytest.mark.parametrize(
+        'text',
+        [
+            'tanggal 2024-03-15',
+            'tanggal 15/03/2024',
+            'tanggal 15 Maret 2024',
+            'on March 15, 2024',
+            'on 15 Mar. 2024',
+        ],
+    )
+    def test_formats(self, text):
+        assert list(extract_dates(text).values()) == [datetime(2024, 3, 15)]
+
+    def test_labels(self):
+        text = (
+            'Cum date 15 Maret 2024, ex date 18 Maret 2024, '
+            'pembayaran dividen pada 5 April 2024'
+        )
+
+        assert extract_dates(text) == {
+            'cum': datetime(2024, 3, 15),
+            'ex': datetime(2024, 3, 18),
+            'payment': datetime(2024, 4, 5),
+        }
+
+    def test_invalid_date_skipped(self):
+        assert extract_dates('tanggal 31/02/2024') == {}
+
+
+class TestExtractDetails:
+    """Tests untuk extract_amount dan extract_ratio."""
+
+    @pytest.mark.parametrize(
+        'text,expected',
+        [
+            ('dividen Rp 150 per saham', 150.0),
+            ('dividen Rp1.250 per saham', 1250.0),
+            ('dividen Rp 12,5/saham', 12.5),
+            ('dividend of IDR 1,250.50 per share', 1250.5),
+            ('buyback Rp 2 triliun, harga maksimal Rp 9.000', 9000.0),
+            ('total Rp 1 miliar', None),
+        ],
+    )
+    def test_amount(self, text, expected):
+        assert extract_amount(text) == expected
+
+    def test_per_share_amount_preferred(self):
+        assert extract_amount('harga Rp 9.000, dividen Rp 150 per saham') == 150.0
+
+    @pytest.mark.parametrize(
+        'text,expected',
+        [
+            ('stock split 1:5', '1:5'),
+            ('reverse split 10 : 1', '10:1'),
+            ('a 1-for-4 split', '1:4'),
+            ('rasio 2 banding 1', '2:1'),
+            ('tanpa rasio', None),
+            ('pukul 10:30', None),
+            ('RUPSLB pukul 14:00 WIB, stock split 1:5', '1:5'),
+            ('paparan publik 09:30 WIB', None),
+        ],
+    )
+    def test_ratio(self, text, expected):
+        assert extract_ratio(text) == expected
+
+
+class TestExtractCorporateActions:
+    """Tests untuk extract_corporate_actions."""
+
+    def test_dividend_event(self):
+        news = make_news(
+            'BBCA bagikan dividen Rp 150 per saham',
+            'Cum date 15 Maret 2024, ex date 18 Maret 2024',
+            types=['dividend'],
+        )
+
+        (action,) = extract_corporate_actions('BBCA.JK', news)
+
+        assert action.ticker == 'BBCA.JK'
+        assert action.action_type == 'dividend'
+        assert action.event_date == datetime(2024, 3, 18)
+        assert action.announced_date == datetime(2024, 3, 1)
+        assert action.amount == 150.0
+        assert action.ratio is None
+        assert action.item_id == 'idx:1'
+
+    def test_falls_back_to_published_date(self):
+        news = make_news('TLKM umumkan buyback', types=['buyback'])
+
+        (action,) = extract_corporate_actions('TLKM.JK', news)
+
+        assert action.event_date == datetime(2024, 3, 1)
+        assert action.dates == {}
+
+    def test_one_event_per_type(self):
+        news = make_news(
+            'BBRI rights issue 1:3 dan akuisisi', types=['rights_issue', 'acquisition']
+        )
+
+        actions = extract_corporate_actions('BBRI.JK', news)
+
+        assert [(a.action_type, a.ratio) for a in actions] == [
+            ('rights_issue', '1:3'),
+            ('acquisition', None),
+        ]
+
+    def test_specific_type_subsumes_general(self):
+        news = make_news('Reverse stock split 5:1', types=['reverse_split', 'stock_split'])
+
+        assert [a.action_type for a in extract_corporate_actions('X.JK', news)] == [
+            'reverse_split'
+        ]
+
+    def test_not_corporate_action(self):
+        assert extract_corporate_actions('X.JK', make_news('Laba naik', types=[])) == []
+        assert extract_corporate_actions('X.JK', make_news('Laba naik')) == []
@@ -0,0 +1,252 @@
+"""
+Tests untuk screener daemon (Unix socket) dan thin client-nya.
+"""
+
+import json
+import socket
+import threading
+from unittest.mock import patch
+
+from click.testing import CliRunner
+import pytest
+
+from src.cli.commands import compare, screen, serve
+from src.cli.context import ServiceContext
+from src.server import client
+from src.server.daemon import DaemonAlreadyRunning, ScreenerDaemon
+from tests.conftest import make_stock_data
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, 'AF_UNIX'), reason='Unix domain socket tidak tersedia'
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    """Socket dan data dir daemon di direktori sementara."""
+    monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+    path = tmp_path / 'd.sock'
+    monkeypatch.setenv('FRIDAY_SCREENER_SOCKET', str(path))
+    return path
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """ScreenerDaemon yang berjalan di background thread."""
+    server = ScreenerDaemon(socket_path, ServiceContext(news_store=False))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join(5)
+    server.server_close()
+
+
+class TestClient:
+    """Test suite untuk thin client."""
+
+    def test_no_daemon(self, socket_path):
+        """Test client mengembalikan None jika daemon tidak berjalan."""
+        assert client.ping(socket_path) is None
+        assert client.run_remote('screen', {'ticker': 'BBCA'}) is None
+
+    def test_stale_socket(self, socket_path):
+        """Test socket file tanpa daemon dianggap tidak berjalan."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        assert client.ping(socket_path) is None
+
+    def test_ping(self, daemon, socket_path):
+        info = client.ping()
+
+        assert info['socket'] == str(socket_path)
+        assert 'pid' in info
+
+    def test_unknown_command_rejected(self, daemon):
+        """Test daemon hanya menjalankan command yang diizinkan."""
+        assert client.run_remote('serve', {}) is None
+        assert client.send_request({'action': 'nope'})['ok'] is False
+
+
+class TestScreenerDaemon:
+    """Test suite untuk ScreenerDaemon."""
+
+    def test_screen_runs_in_daemon_with_warm_services(self, daemon):
+        """Test screen diteruskan ke daemon dan cache daemon dipakai ulang."""
+        runner = CliRunner()
+        with patch.object(
+            daemon.services.finance_service,
+            'get_stock_data',
+            side_effect=make_stock_data,
+        ) as fetch, patch('src.cli.commands.YahooFinanceService') as local:
+            for _ in range(2):
+                result = runner.invoke(screen, ['BBCA', '--no-news'])
+                assert result.exit_code == 0, result.output
+                assert 'Screening BBCA' in result.output
+                assert 'Company Information' in result.output
+
+        fetch.assert_called_once_with('BBCA.JK')
+        local.assert_not_called()
+
+    def test_stale_data_refetched_after_ttl(self, daemon):
+        """Test data yang lebih tua dari ttl di-fetch ulang oleh daemon."""
+        with patch.object(
+            daemon.services.finance_service,
+            'get_stock_data',
+            side_effect=make_stock_data,
+        ) as fetch:
+            daemon.run_command('screen', {'ticker': 'BBCA', 'news': False})
+            daemon.run_command('screen', {'ticker': 'BBCA', 'news': False})
+            assert fetch.call_count == 1
+
+            daemon.ttl = -1  # Semua data dianggap kedaluwarsa
+            daemon.run_command('compare', {'tickers': ['BBCA', 'BMRI']})
+
+        assert fetch.call_count == 3
+
+    def test_commands_run_concurrently(self, daemon):
+        """Test screen tidak menunggu command lain yang fetch-nya lambat."""
+        gate, started = threading.Event(), threading.Event()
+
+        def fetch(ticker):
+            if ticker == 'BBCA.JK':
+                started.set()
+                gate.wait(5)
+            return make_stock_data(ticker)
+
+        slow = {}
+        with patch.object(
+            daemon.services.finance_service, 'get_stock_data', side_effect=fetch
+        ):
+            thread = threading.Thread(
+                target=lambda: slow.update(
+                    output=daemon.run_command(
+                        'screen', {'ticker': 'BBCA', 'news': False}
+                    )[0]
+                )
+            )
+            thread.start()
+            try:
+                assert started.wait(5)
+                output, _ = daemon.run_command(
+                    'screen', {'ticker': 'BMRI', 'news': False}
+                )
+                assert thread.is_alive()  # BBCA masih menunggu fetch
+            finally:
+                gate.set()
+                thread.join(5)
+
+        assert 'Screening BMRI' in output and 'BBCA' not in output
+        assert 'Screening BBCA' in slow['output'] and 'BMRI' not in slow['output']
+
+    def test_compare_runs_in_daemon(self, daemon):
+        runner = CliRunner()
+        with patch.object(
+            daemon.services.finance_service,
+            'get_stock_data',
+            side_effect=make_stock_data,
+        ):
+            result = runner.invoke(compare, ['BBCA', 'BMRI'])
+
+        assert result.exit_code == 0
+        assert 'Comparing 2 stocks' in result.output
+        assert 'BMRI' in result.output
+
+    def test_machine_readable_output_via_daemon(self, daemon):
+        """Test --format json lewat daemon: stdout hanya berisi record."""
+        with patch.object(
+            daemon.services.finance_service,
+            'get_stock_data',
+            side_effect=make_stock_data,
+        ):
+            result = CliRunner().invoke(
+                compare, ['BBCA', 'XXXX', '--format', 'json'], catch_exceptions=False
+            )
+
+        records = json.loads(result.stdout)
+        # Record ditulis sesuai urutan fetch selesai
+        assert sorted(r['ticker'] for r in records) == ['BBCA.JK', 'XXXX.JK']
+
+    def test_output_uses_client_width(self, daemon):
+        """Test output di-render dengan lebar terminal client."""
+        with patch.object(
+            daemon.services.finance_service,
+            'get_stock_data',
+            side_effect=make_stock_data,
+        ):
+            output = client.run_remote(
+                'compare', {'tickers': ['BBCA', 'BMRI']}, width=60
+            ).output
+
+        assert max(len(line) for line in output.splitlines()) <= 60
+
+    @pytest.mark.parametrize(
+        'command,params',
+        [
+            ('screen', {'ticker': 'BBCA', 'news_sources': ('idx',)}),
+            ('screen', {'ticker': 'BBCA', 'news_store': True}),
+            ('compare', {'tickers': ['BBCA'], 'score_cache': True}),
+        ],
+    )
+    def test_fallback_when_daemon_config_differs(self, daemon, command, params):
+        """Test opsi yang tidak bisa dipenuhi daemon dijalankan in-process."""
+        with patch.object(
+            daemon.services.finance_service, 'get_stock_data'
+        ) as fetch:
+            assert client.run_remote(command, params) is None
+
+        fetch.assert_not_called()
+
+    def test_fallback_with_news_source_option(self, daemon):
+        runner = CliRunner()
+        with patch('src.cli.commands.YahooFinanceService') as service, patch(
+            'src.services.news_scraper_service.NewsScraperService'
+        ) as news_service:
+            service.return_value.get_stock_data.side_effect = make_stock_data
+            news_service.return_value.get_news.return_value = []
+            news_service.return_value.get_corporate_actions.return_value = []
+            news_service.return_value.get_sentiment_trend.return_value = []
+            result = runner.invoke(screen, ['BBCA', '--news-source', 'idx'])
+
+        assert result.exit_code == 0, result.output
+        service.return_value.get_stock_data.assert_called_once_with('BBCA')
+
+    def test_fallback_without_daemon(self, socket_path):
+        """Test screen berjalan in-process jika daemon tidak berjalan."""
+        runner = CliRunner()
+        with patch('src.cli.commands.YahooFinanceService') as service:
+            service.return_value.get_stock_data.side_effect = make_stock_data
+            result = runner.invoke(screen, ['BBCA', '--no-news'])
+
+        assert result.exit_code == 0
+        service.return_value.get_stock_data.assert_called_once_with('BBCA')
+
+    def test_second_daemon_refused(self, daemon, socket_path):
+        with pytest.raises(DaemonAlreadyRunning):
+            ScreenerDaemon(socket_path, ServiceContext(news_store=False))
+
+    def test_stale_socket_replaced(self, socket_path):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        server = ScreenerDaemon(socket_path, ServiceContext(news_store=False))
+        server.server_close()
+
+        assert not socket_path.exists()
+
+    def test_serve_status_and_stop(self, daemon):
+        runner = CliRunner()
+
+        result = runner.invoke(serve, ['--status'])
+        assert 'Screener daemon running' in result.output
+
+        result = runner.invoke(serve, ['--stop'])
+        assert 'Stopped screener daemon' in result.output
+
+    def test_serve_status_without_daemon(self, socket_path):
+        result = CliRunner().invoke(serve, ['--status'])
+
+        assert 'No screener daemon running' in result.output
@@ -0,0 +1,87 @@
+"""
+Tests untuk output machine-readable (src.cli.formats).
+"""
+
+import csv
+from datetime import datetime
+import io
+import json
+
+import pytest
+
+from src.cli.formats import CSV_COLUMNS, flat_record, open_writer
+from src.models.screening_result import (
+    CategoryScore,
+    Rating,
+    ScreeningMetrics,
+    ScreeningResult,
+)
+
+
+def make_result(ticker='BBCA.JK', score=72.5):
+    return ScreeningResult(
+        ticker=ticker,
+        company_name='Bank BCA',
+        rating=Rating.STRONG,
+        metrics=ScreeningMetrics(
+            total_score=score,
+            valuation_score=CategoryScore('Valuation', 65.0, weight=0.25),
+        ),
+        key_metrics={'pe_ratio': 8.5, 'roe': 0.18},
+        red_flags=['High debt', 'Negative FCF'],
+        screened_at=datetime(2024, 1, 2, 3, 4, 5),
+    )
+
+
+class TestFlatRecord:
+    """Tests untuk flat_record."""
+
+    def test_columns(self):
+        record = flat_record(make_result())
+
+        assert set(record) == set(CSV_COLUMNS)
+        assert record['rating'] == 'STRONG'
+        assert record['valuation_score'] == 65.0
+        assert record['pe_ratio'] == 8.5
+        assert record['dividend_yield'] is None
+        assert record['red_flags'] == 'High debt; Negative FCF'
+
+
+class TestWriters:
+    """Tests untuk RecordWriter."""
+
+    def test_table_has_no_writer(self):
+        assert open_writer('table', io.StringIO()) is None
+
+    def test_ndjson(self):
+        stream = io.StringIO()
+        with open_writer('ndjson', stream) as writer:
+            writer.write(make_result('BBCA.JK'))
+            assert stream.getvalue().count('\n') == 1
+            writer.write(make_result('BMRI.JK'))
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [r['ticker'] for r in records] == ['BBCA.JK', 'BMRI.JK']
+        assert records[0]['screened_at'] == '2024-01-02T03:04:05'
+
+    @pytest.mark.parametrize('count', [0, 1, 3])
+    def test_json_array(self, count):
+        stream = io.StringIO()
+        with open_writer('json', stream) as writer:
+            for index in range(count):
+                writer.write(make_result(score=float(index)))
+
+        records = json.loads(stream.getvalue())
+        assert [r['metrics']['total_score'] for r in records] == list(
+            map(float, range(count))
+        )
+
+    def test_csv(self):
+        stream = io.StringIO()
+        with open_writer('csv', stream) as writer:
+            writer.write(make_result())
+
+        (row,) = csv.DictReader(io.StringIO(stream.getvalue()))
+        assert tuple(row) == CSV_COLUMNS
+        assert row['ticker'] == 'BBCA.JK'
+        assert row['total_score'] == '72.5'
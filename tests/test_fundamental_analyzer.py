@@ -2,6 +2,8 @@
 Unit tests untuk FundamentalAnalyzer.
 """
 
+from datetime import datetime
+
 import pytest
 
 from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
@@ -9,9 +11,11 @@ from src.config.settings import ScreeningCriteria
 from src.models.screening_result import Rating
 from src.models.stock_data import (
     CompanyInfo,
+    CorporateAction,
     DividendMetrics,
     LeverageMetrics,
     ProfitabilityMetrics,
+    SentimentWindow,
     StockData,
     ValuationMetrics,
 )
@@ -235,3 +239,63 @@ class TestFundamentalAnalyzer:
 
         # Even good stock might not pass strict criteria
         assert result is not None
+
+    def test_corporate_action_insights(self, good_stock_data):
+        """Test corporate action events menjadi insights tanpa mengubah score."""
+        analyzer = FundamentalAnalyzer()
+        baseline = analyzer.analyze(good_stock_data).metrics.total_score
+
+        good_stock_data.corporate_actions = [
+            CorporateAction(
+                ticker='GOOD.JK',
+                action_type='dividend',
+                event_date=datetime(2024, 3, 18),
+                amount=150.0,
+            ),
+            CorporateAction(ticker='GOOD.JK', action_type='rights_issue', ratio='1:3'),
+            CorporateAction(ticker='GOOD.JK', action_type='delisting', title='Delisting'),
+        ]
+        result = analyzer.analyze(good_stock_data)
+
+        assert result.metrics.total_score == baseline
+        dividend = result.get_insights_by_category('Dividend')[-1]
+        assert dividend.description == 'Dividend: Rp 150 per saham, tanggal 2024-03-18'
+        assert any('Rights Issue: rasio 1:3' in w for w in result.weaknesses)
+        assert any('delisting' in f for f in result.red_flags)
+
+    def test_corporate_actions_change_fingerprint(self, good_stock_data):
+        """Test event baru menghasilkan fingerprint berbeda."""
+        analyzer = FundamentalAnalyzer()
+        before = analyzer.fingerprint(good_stock_data)
+
+        good_stock_data.corporate_actions = [
+            CorporateAction(ticker='GOOD.JK', action_type='buyback')
+        ]
+
+        assert analyzer.fingerprint(good_stock_data) != before
+
+    def test_sentiment_trend_insight(self, good_stock_data):
+        """Test rolling sentiment disalin ke result dan momentum dilaporkan."""
+        good_stock_data.sentiment_trend = [
+            SentimentWindow(days=7, negative=3, score=-3.0),
+            SentimentWindow(days=30, positive=5, negative=3, score=2.0),
+            SentimentWindow(days=90, positive=10, negative=4, score=6.0),
+        ]
+
+        result = FundamentalAnalyzer().analyze(good_stock_data)
+
+        assert [w.days for w in result.sentiment_trend] == [7, 30, 90]
+        (insight,) = result.get_insights_by_category('News')
+        assert insight.title == 'News tone deteriorating'
+        assert insight.severity == 'warning'
+
+    def test_sentiment_trend_needs_enough_news(self, good_stock_data):
+        """Test tidak ada insight jika berita di window pendek terlalu sedikit."""
+        good_stock_data.sentiment_trend = [
+            SentimentWindow(days=7, negative=1, score=-1.0),
+            SentimentWindow(days=90, positive=10, score=10.0),
+        ]
+
+        result = FundamentalAnalyzer().analyze(good_stock_data)
+
+        assert result.get_insights_by_category('News') == []
@@ -2,6 +2,8 @@
 Unit tests untuk helper functions.
 """
 
+from datetime import datetime, timedelta
+
 import pytest
 
 from src.utils.helpers import (
@@ -12,7 +14,10 @@ from src.utils.helpers import (
     format_ratio,
     get_ticker_without_suffix,
     is_growing_trend,
+    load_tickers,
     normalize_ticker,
+    parse_date_or_duration,
+    parse_duration,
     safe_float,
     safe_int,
 )
@@ -155,3 +160,35 @@ class TestTrendAnalysis:
         assert format_currency(500_000_000, currency="USD") == "$500.00M"
         assert format_currency(2_000_000, currency="USD") == "$2.00M"
         assert format_currency(5000, currency="USD") == "$5,000.00"
+
+
+class TestLoadTickers:
+    """Tests untuk load_tickers."""
+
+    def test_load_tickers(self, tmp_path):
+        """Test parsing file universe."""
+        path = tmp_path / "universe.txt"
+        path.write_text("# LQ45\nbbca\nBMRI, BBNI\n\nBBCA  # duplicate\n")
+
+        assert load_tickers(str(path)) == ['BBCA', 'BMRI', 'BBNI']
+
+
+class TestParseDuration:
+    """Tests untuk parse_duration dan parse_date_or_duration."""
+
+    def test_units(self):
+        assert parse_duration('30s') == timedelta(seconds=30)
+        assert parse_duration('15m') == timedelta(minutes=15)
+        assert parse_duration('12H') == timedelta(hours=12)
+        assert parse_duration('1.5d') == timedelta(days=1.5)
+        assert parse_duration('2w') == timedelta(weeks=2)
+
+    @pytest.mark.parametrize('value', ['', '30', 'd', '3y', '-1d'])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_duration(value)
+
+    def test_date_or_duration(self):
+        now = datetime(2024, 3, 31, 12)
+        assert parse_date_or_duration('2024-01-31', now) == datetime(2024, 1, 31)
+        assert parse_date_or_duration('30d', now) == datetime(2024, 3, 1, 12)
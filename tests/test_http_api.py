@@ -0,0 +1,283 @@
+"""
+Tests untuk HTTP/JSON API (src.server.http_api).
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import http.client
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.cli.context import ServiceContext
+from src.server.http_api import ScreeningAPI, start_server
+from tests.conftest import make_stock_data
+
+UPDATED = datetime(2024, 3, 1, 9, 0)
+
+
+def fetch_by_ticker(ticker):
+    """PE berbeda per ticker supaya ranking deterministik; XXXX gagal."""
+    if ticker == 'XXXX.JK':
+        return None
+    pe_ratio = {'BBCA.JK': 5.0, 'BMRI.JK': 12.0, 'TLKM.JK': 30.0}.get(ticker, 8.0)
+    return make_stock_data(ticker, pe_ratio, roe=0.18, last_updated=UPDATED)
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """ScreeningAPI di event loop background thread, port bebas."""
+    monkeypatch.setenv('FRIDAY_SCREENER_HOME', str(tmp_path))
+    services = ServiceContext(news_store=False, news_sources=('yahoo',))
+    api = ScreeningAPI(services)
+    loop = asyncio.new_event_loop()
+    http_server = loop.run_until_complete(start_server(api, '127.0.0.1', 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    with patch.object(
+        services.finance_service, 'get_stock_data', side_effect=fetch_by_ticker
+    ) as fetch:
+        yield SimpleNamespace(
+            api=api,
+            services=services,
+            fetch=fetch,
+            port=http_server.sockets[0].getsockname()[1],
+        )
+
+    async def shutdown():
+        http_server.close()
+        await http_server.wait_closed()
+        # Koneksi keep-alive yang masih idle
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(shutdown(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+    services.close()
+
+
+def request(server, path, method='GET', body=None, headers=None):
+    """Kirim satu request; return (status, headers, parsed body)."""
+    connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=10)
+    try:
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        data = response.read()
+        return (
+            response.status,
+            dict(response.getheaders()),
+            json.loads(data) if data else None,
+        )
+    finally:
+        connection.close()
+
+
+class TestScreenEndpoint:
+    """Test suite untuk /screen."""
+
+    def test_screen(self, server):
+        status, headers, body = request(server, '/screen/bbca')
+
+        assert status == 200
+        assert headers['Content-Type'].startswith('application/json')
+        assert body['ticker'] == 'BBCA.JK'
+        assert 'total_score' in body['metrics']
+        server.fetch.assert_called_once_with('BBCA.JK')
+
+    def test_etag_revalidation(self, server):
+        """Test If-None-Match yang cocok mendapat 304 tanpa analisis ulang."""
+        with patch.object(
+            server.services.analyzer,
+            'analyze',
+            wraps=server.services.analyzer.analyze,
+        ) as analyze:
+            _, headers, _ = request(server, '/screen/BBCA')
+            status, again, body = request(
+                server, '/screen/BBCA', headers={'If-None-Match': headers['ETag']}
+            )
+
+        assert status == 304
+        assert body is None
+        assert again['ETag'] == headers['ETag']
+        analyze.assert_called_once()
+
+    def test_analysis_runs_off_event_loop(self, server):
+        analyze = server.services.analyzer.analyze
+        loops = []
+
+        def record(stock_data):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return analyze(stock_data)
+
+        with patch.object(server.services.analyzer, 'analyze', side_effect=record):
+            status, _, _ = request(server, '/screen/BBCA')
+
+        assert status == 200
+        assert loops == [None]
+
+    def test_etag_follows_last_updated(self, server):
+        """Test data yang di-refresh setelah ttl menghasilkan ETag baru."""
+        server.api.ttl = 0
+        _, first, _ = request(server, '/screen/BBCA')
+        server.fetch.side_effect = lambda t: make_stock_data(
+            t, roe=0.18, last_updated=datetime(2024, 3, 2)
+        )
+        status, second, _ = request(
+            server, '/screen/BBCA', headers={'If-None-Match': first['ETag']}
+        )
+
+        assert status == 200
+        assert second['ETag'] != first['ETag']
+        assert server.fetch.call_count == 2
+
+    def test_concurrent_requests_coalesced(self, server):
+        """Test request bersamaan untuk ticker yang sama berbagi satu fetch."""
+        release = threading.Event()
+
+        def slow_fetch(ticker):
+            release.wait(5)
+            return make_stock_data(ticker, roe=0.18, last_updated=UPDATED)
+
+        server.fetch.side_effect = slow_fetch
+        with ThreadPoolExecutor(max_workers=50) as executor:
+            futures = [
+                executor.submit(request, server, '/screen/BBCA') for _ in range(50)
+            ]
+            threading.Timer(0.2, release.set).start()
+            statuses = [future.result()[0] for future in futures]
+
+        assert statuses == [200] * 50
+        server.fetch.assert_called_once_with('BBCA.JK')
+
+    def test_unknown_ticker(self, server):
+        status, _, body = request(server, '/screen/XXXX')
+
+        assert status == 404
+        assert 'XXXX.JK' in body['error']
+
+    def test_keep_alive(self, server):
+        """Test beberapa request dalam satu koneksi."""
+        connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=10)
+        try:
+            for ticker in ('BBCA', 'BMRI', 'BBCA'):
+                connection.request('GET', f'/screen/{ticker}')
+                response = connection.getresponse()
+                assert json.loads(response.read())['ticker'] == f'{ticker}.JK'
+        finally:
+            connection.close()
+
+
+class TestCompareAndBatch:
+    """Test suite untuk /compare dan /batch."""
+
+    def test_compare_ranked(self, server):
+        status, headers, body = request(server, '/compare?tickers=TLKM,BBCA,XXXX')
+
+        assert status == 200
+        assert 'ETag' in headers
+        assert [r['ticker'] for r in body['results']] == ['BBCA.JK', 'TLKM.JK']
+        assert body['failed'] == ['XXXX.JK']
+
+    def test_compare_needs_two_tickers(self, server):
+        status, _, body = request(server, '/compare?tickers=BBCA')
+
+        assert status == 400
+        assert 'error' in body
+
+    def test_batch_streams_top_n(self, server):
+        payload = json.dumps({'tickers': ['TLKM', 'BMRI', 'BBCA', 'XXXX'], 'top': 2})
+
+        status, headers, body = request(server, '/batch', method='POST', body=payload)
+
+        assert status == 200
+        assert headers['Transfer-Encoding'] == 'chunked'
+        assert body['analyzed'] == 3
+        assert body['failed'] == ['XXXX.JK']
+        assert [r['ticker'] for r in body['results']] == ['BBCA.JK', 'BMRI.JK']
+
+    def test_batch_query_and_etag(self, server):
+        _, headers, body = request(server, '/batch?tickers=BBCA,BMRI')
+        status, _, _ = request(
+            server,
+            '/batch?tickers=BBCA,BMRI',
+            headers={'If-None-Match': headers['ETag']},
+        )
+
+        assert len(body['results']) == 2
+        assert status == 304
+
+    @pytest.mark.parametrize(
+        'path,method,body,expected',
+        [
+            ('/batch', 'POST', 'not json', 400),
+            ('/batch?tickers=BBCA&top=0', 'GET', None, 400),
+            ('/batch', 'GET', None, 400),
+            ('/unknown', 'GET', None, 404),
+            ('/screen/BBCA', 'DELETE', None, 405),
+        ],
+    )
+    def test_errors(self, server, path, method, body, expected):
+        status, _, data = request(server, path, method=method, body=body)
+
+        assert status == expected
+        assert 'error' in data
+
+
+class TestNewsEndpoint:
+    """Test suite untuk /news dan /screen?news=1."""
+
+    @pytest.fixture
+    def yahoo_news(self):
+        ticker = MagicMock()
+        ticker.news = [
+            {
+                'uuid': 'a',
+                'title': 'BBCA bagikan dividen Rp 150 per saham',
+                'publisher': 'Reuters',
+                'providerPublishTime': 1704067200,
+            }
+        ]
+        with patch('yfinance.Ticker', return_value=ticker) as mock:
+            yield mock
+
+    def test_news(self, server, yahoo_news):
+        status, headers, body = request(server, '/news/BBCA')
+
+        assert status == 200
+        assert body['ticker'] == 'BBCA.JK'
+        assert [n['item_id'] for n in body['news']] == ['a']
+        assert body['corporate_actions'][0]['action_type'] == 'dividend'
+        assert [w['days'] for w in body['sentiment_trend']] == [7, 30, 90]
+        assert 'ETag' in headers
+
+    def test_news_refetched_after_ttl(self, server, yahoo_news):
+        request(server, '/news/BBCA')
+        request(server, '/news/BBCA')
+        fetches = yahoo_news.call_count
+
+        server.api.ttl = 0
+        status, _, _ = request(server, '/news/BBCA')
+
+        assert status == 200
+        assert yahoo_news.call_count > fetches
+
+    def test_screen_with_news(self, server, yahoo_news):
+        status, _, body = request(server, '/screen/BBCA?news=1')
+
+        assert status == 200
+        assert [w['days'] for w in body['sentiment_trend']] == [7, 30, 90]
+        # StockData bersama di ServiceContext tidak dimodifikasi
+        stock_data = server.services.get_stock_data('BBCA')
+        assert stock_data.news == []
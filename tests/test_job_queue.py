@@ -0,0 +1,191 @@
+"""
+Tests untuk job queue SQLite (src.services.job_queue).
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+import pytest
+
+from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+from src.cli.commands import queue_run, queue_status
+from src.config.settings import ScreeningCriteria
+from src.models.screening_result import ScreeningMetrics, ScreeningResult
+from src.services.job_queue import (
+    DONE,
+    FAILED,
+    LEASED,
+    PENDING,
+    JobQueue,
+    run_worker,
+)
+from tests.conftest import make_stock_data
+
+
+def fetch_stock_data(ticker):
+    """Fetch mock dengan PE berbeda per ticker supaya ranking deterministik."""
+    pe_ratio = {'BBCA.JK': 5.0, 'BMRI.JK': 12.0}.get(ticker, 30.0)
+    return make_stock_data(ticker, pe_ratio, price_to_book=1.0)
+
+
+def make_result(ticker, score):
+    return ScreeningResult(
+        ticker=ticker, company_name=ticker, metrics=ScreeningMetrics(total_score=score)
+    )
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return tmp_path / 'jobs.db'
+
+
+@pytest.fixture
+def queue(queue_path):
+    with JobQueue(queue_path) as queue:
+        yield queue
+
+
+class TestJobQueue:
+    """Test suite untuk JobQueue."""
+
+    def test_create_run(self, queue):
+        criteria = ScreeningCriteria()
+        criteria.valuation.pe_ratio_max = 10.0
+
+        run_id = queue.create_run(['BBCA', 'bmri', 'BBCA.JK'], criteria)
+
+        assert queue.counts(run_id) == {PENDING: 2, LEASED: 0, DONE: 0, FAILED: 0}
+        assert queue.criteria(run_id).valuation.pe_ratio_max == 10.0
+        assert queue.latest_run() == run_id
+
+    def test_lease_is_exclusive(self, queue):
+        run_id = queue.create_run(['BBCA', 'BMRI', 'TLKM'], ScreeningCriteria())
+
+        first = queue.lease(run_id, 'w1', limit=2)
+        second = queue.lease(run_id, 'w2', limit=2)
+
+        assert [job.ticker for job in first] == ['BBCA.JK', 'BMRI.JK']
+        assert [job.ticker for job in second] == ['TLKM.JK']
+        assert queue.lease(run_id, 'w3') == []
+
+    def test_expired_lease_reassigned(self, queue_path):
+        """Test job worker yang macet diambil alih; hasil lama diabaikan."""
+        with JobQueue(queue_path, lease_timeout=-1) as queue:
+            run_id = queue.create_run(['BBCA'], ScreeningCriteria())
+            (stuck,) = queue.lease(run_id, 'w1')
+            (retaken,) = queue.lease(run_id, 'w2')
+
+            assert retaken.attempts == 2
+            assert queue.complete(retaken, 'w2', make_result('BBCA.JK', 70.0))
+            assert not queue.complete(stuck, 'w1', make_result('BBCA.JK', 10.0))
+            assert queue.results(run_id)[0].metrics.total_score == 70.0
+
+    def test_expired_lease_fails_after_max_attempts(self, queue_path):
+        """Test job yang lease-nya terus habis tidak di-lease tanpa batas."""
+        with JobQueue(queue_path, lease_timeout=-1) as queue:
+            run_id = queue.create_run(['BBCA'], ScreeningCriteria(), max_attempts=2)
+            queue.lease(run_id, 'w1')
+            queue.lease(run_id, 'w2')
+
+            assert queue.lease(run_id, 'w3') == []
+            assert queue.is_finished(run_id)
+            assert queue.failures(run_id) == {'BBCA.JK': 'lease expired'}
+
+    def test_fail_after_lease_taken_over_ignored(self, queue_path):
+        """Test kegagalan dari worker yang kehilangan lease tidak di-retry."""
+        with JobQueue(queue_path, lease_timeout=-1) as queue:
+            run_id = queue.create_run(['BBCA'], ScreeningCriteria())
+            (stuck,) = queue.lease(run_id, 'w1')
+            queue.lease(run_id, 'w2')
+
+            assert not queue.fail(stuck, 'w1', 'timeout')
+            assert queue.counts(run_id)['leased'] == 1
+
+    def test_fail_retries_until_max_attempts(self, queue):
+        run_id = queue.create_run(['XXXX'], ScreeningCriteria(), max_attempts=2)
+
+        (job,) = queue.lease(run_id, 'w1')
+        assert queue.fail(job, 'w1', 'fetch failed')
+        (job,) = queue.lease(run_id, 'w1')
+        assert not queue.fail(job, 'w1', 'fetch failed')
+
+        assert queue.is_finished(run_id)
+        assert queue.failures(run_id) == {'XXXX.JK': 'fetch failed'}
+        assert queue.latest_run() is None
+
+    def test_results_ranked(self, queue):
+        run_id = queue.create_run(['BBCA', 'BMRI'], ScreeningCriteria())
+        for job in queue.lease(run_id, 'w1', limit=2):
+            score = 60.0 if job.ticker == 'BBCA.JK' else 80.0
+            queue.complete(job, 'w1', make_result(job.ticker, score))
+
+        assert [r.ticker for r in queue.results(run_id)] == ['BMRI.JK', 'BBCA.JK']
+
+
+class TestRunWorker:
+    """Test suite untuk run_worker."""
+
+    def test_concurrent_workers_share_run(self, queue, queue_path):
+        """Test beberapa worker (koneksi terpisah) memproses setiap job sekali."""
+        tickers = [f'T{i:03d}' for i in range(40)]
+        run_id = queue.create_run(tickers, ScreeningCriteria())
+        finance_service = MagicMock()
+        finance_service.get_stock_data.side_effect = fetch_stock_data
+        completed = []
+
+        def worker(name):
+            with JobQueue(queue_path) as own_queue:
+                completed.append(
+                    run_worker(
+                        own_queue,
+                        run_id,
+                        finance_service,
+                        FundamentalAnalyzer(),
+                        worker=name,
+                        batch_size=3,
+                    )
+                )
+
+        threads = [threading.Thread(target=worker, args=(f'w{i}',)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+
+        assert sum(completed) == 40
+        assert finance_service.get_stock_data.call_count == 40
+        assert queue.counts(run_id)[DONE] == 40
+
+    def test_failed_fetch_recorded(self, queue):
+        run_id = queue.create_run(['XXXX'], ScreeningCriteria(), max_attempts=2)
+        finance_service = MagicMock()
+        finance_service.get_stock_data.return_value = None
+
+        completed = run_worker(queue, run_id, finance_service, FundamentalAnalyzer())
+
+        assert completed == 0
+        assert finance_service.get_stock_data.call_count == 2
+        assert queue.failures(run_id) == {'XXXX.JK': 'fetch failed'}
+
+
+class TestQueueCommands:
+    """Test suite untuk command queue."""
+
+    @patch('src.cli.commands.YahooFinanceService')
+    def test_queue_run_in_process(self, mock_finance_service, queue_path):
+        mock_finance_service.return_value.get_stock_data.side_effect = (
+            lambda t: None if t == 'XXXX.JK' else fetch_stock_data(t)
+        )
+
+        result = CliRunner().invoke(
+            queue_run,
+            ['TLKM', 'BBCA', 'XXXX', '--workers', '0', '--queue', str(queue_path)],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert 'Analyzed 2 of 3 stocks (1 failed)' in result.output
+        assert result.output.index('BBCA') < result.output.index('TLKM')
+
+        status = CliRunner().invoke(queue_status, ['--queue', str(queue_path)])
+        assert 'No unfinished run' in status.output
@@ -0,0 +1,47 @@
+"""
+Tests untuk KeywordMatcher.
+"""
+
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test suite untuk KeywordMatcher."""
+
+    def test_matches_multiple_lexicons_in_one_pass(self):
+        """Test semua label terisi dari satu scan."""
+        matcher = KeywordMatcher(
+            {'positive': ['profit', 'growth'], 'negative': ['loss']}
+        )
+
+        found = matcher.match('Profit growth offsets earlier loss')
+
+        assert found == {'positive': ['profit', 'growth'], 'negative': ['loss']}
+
+    def test_word_boundary_at_start(self):
+        """Test term tidak match di tengah kata."""
+        matcher = KeywordMatcher({'positive': ['gain']})
+
+        assert matcher.match('Votes against the plan') == {'positive': []}
+        assert matcher.match('Shares gained 5%') == {'positive': ['gain']}
+
+    def test_overlapping_terms(self):
+        """Test term yang overlap tetap terdeteksi semua."""
+        matcher = KeywordMatcher({'action': ['dividend', 'stock dividend']})
+
+        found = matcher.match('Company announces Stock Dividend')
+
+        assert sorted(found['action']) == ['dividend', 'stock dividend']
+
+    def test_unique_terms_and_shared_labels(self):
+        """Test term berulang dihitung sekali, term bisa punya beberapa label."""
+        matcher = KeywordMatcher({'a': ['merger'], 'b': ['merger']})
+
+        found = matcher.match('merger merger merger')
+
+        assert found == {'a': ['merger'], 'b': ['merger']}
+
+    def test_empty_text_and_lexicon(self):
+        """Test empty input."""
+        assert KeywordMatcher({'a': ['x']}).match('') == {'a': []}
+        assert KeywordMatcher({'a': []}).match('anything') == {'a': []}
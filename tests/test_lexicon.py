@@ -0,0 +1,128 @@
+"""
+Tests untuk lexicon dan LexiconClassifier.
+"""
+
+import json
+
+import pytest
+
+from src.utils.lexicon import (
+    Lexicon,
+    LexiconClassifier,
+    get_classifier,
+    load_lexicon,
+)
+
+
+@pytest.fixture
+def lexicon_data():
+    """Lexicon kecil untuk testing."""
+    return {
+        'suffixes': ['s', 'ed', 'nya'],
+        'negation_window': 3,
+        'negations': [
+            {'term': 'not', 'lang': 'en'},
+            {'term': 'tidak', 'lang': 'id'},
+        ],
+        'terms': [
+            {'term': 'profit', 'lang': 'en', 'weight': 1.0},
+            {'term': 'miss', 'lang': 'en', 'weight': -1.0},
+            {'term': 'risk', 'lang': 'en', 'weight': -0.25},
+            {'term': 'laba', 'lang': 'id', 'weight': 1.0},
+            {'term': 'dividend', 'lang': 'en', 'weight': 0.5, 'action': 'dividend'},
+            {'term': 'stock split', 'lang': 'en', 'action': 'stock_split'},
+        ],
+    }
+
+
+@pytest.fixture
+def classifier(lexicon_data):
+    """Classifier dari lexicon kecil."""
+    return LexiconClassifier(Lexicon.from_dict(lexicon_data, version='test'))
+
+
+class TestLexiconClassifier:
+    """Tests untuk LexiconClassifier."""
+
+    def test_weights(self, classifier):
+        """Test bobot menentukan sentiment, bukan jumlah term."""
+        result = classifier.classify('Profit up despite risks')
+
+        assert result.sentiment == 'positive'
+        assert result.score == 0.75
+
+    def test_whole_word_with_suffix(self, classifier):
+        """Test term cocok dengan suffix tetapi tidak sebagai prefix kata lain."""
+        assert classifier.classify('Earnings missed estimates').sentiment == 'negative'
+        assert classifier.classify('Mission statement updated').sentiment == 'neutral'
+
+    def test_negation_flips_weight(self, classifier):
+        """Test negasi dalam window membalik bobot."""
+        assert classifier.classify('Perusahaan tidak mencatat laba').sentiment == 'negative'
+        assert classifier.classify('Did not miss estimates').sentiment == 'positive'
+
+    def test_negation_window(self, classifier):
+        """Test negasi di luar window tidak berpengaruh."""
+        text = 'Not a surprise that the profit grew'
+
+        assert classifier.classify(text).sentiment == 'positive'
+
+    def test_negated_corporate_action_ignored(self, classifier):
+        """Test corporate action yang dinegasikan tidak dihitung."""
+        assert classifier.classify('No plan, not stock split').corporate_action_types == []
+        assert classifier.classify('Approves stock split').corporate_action_types == [
+            'stock_split'
+        ]
+
+    def test_repeated_term_counted_once(self, classifier):
+        """Test term berulang tidak mendominasi score."""
+        result = classifier.classify('risk risk risk risk profit')
+
+        assert result.sentiment == 'positive'
+
+    def test_empty_text(self, classifier):
+        """Test text kosong."""
+        assert classifier.classify(None).sentiment == 'neutral'
+        assert classifier.classify('').corporate_action_types == []
+
+
+class TestLexicon:
+    """Tests untuk loading dan versioning lexicon."""
+
+    def test_version_follows_content(self, tmp_path, lexicon_data):
+        """Test versi berubah jika isi file berubah."""
+        path = tmp_path / 'lexicon.json'
+        path.write_text(json.dumps(lexicon_data))
+        first = load_lexicon(path)
+
+        assert load_lexicon(path).version == first.version
+
+        lexicon_data['terms'][0]['weight'] = 2.0
+        path.write_text(json.dumps(lexicon_data))
+
+        assert load_lexicon(path).version != first.version
+
+    def test_invalid_lang(self, lexicon_data):
+        """Test lang harus id atau en."""
+        lexicon_data['terms'].append({'term': 'gewinn', 'lang': 'de'})
+
+        with pytest.raises(ValueError):
+            Lexicon.from_dict(lexicon_data)
+
+    def test_filter_languages(self, lexicon_data):
+        """Test filter bahasa."""
+        lexicon = Lexicon.from_dict(lexicon_data, version='v').filter_languages(['id'])
+        classifier = LexiconClassifier(lexicon)
+
+        assert {t.lang for t in lexicon.terms} == {'id'}
+        assert classifier.classify('Profit naik').sentiment == 'neutral'
+        assert lexicon.version != 'v'
+
+    def test_bundled_lexicon(self):
+        """Test lexicon bawaan valid dan di-cache per process."""
+        classifier = get_classifier()
+
+        assert classifier is get_classifier()
+        assert len(classifier.version) == 12
+        assert classifier.classify('Laba bersih naik 20%').sentiment == 'positive'
+        assert classifier.classify('Emiten tidak membagikan dividen').sentiment == 'negative'
@@ -0,0 +1,97 @@
+"""
+Tests untuk near-duplicate detection.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.near_duplicates import (
+    MinHasher,
+    MinHashIndex,
+    NearDuplicateDetector,
+    normalize_text,
+    shingles,
+    similarity,
+)
+
+
+class TestMinHash:
+    """Tests untuk MinHasher dan similarity."""
+
+    def test_normalize_text(self):
+        """Test normalisasi case, tanda baca dan whitespace."""
+        assert normalize_text('[Revisi]  BBCA: Laba_Naik!') == 'revisi bbca laba naik'
+        assert normalize_text(None) == ''
+
+    def test_shingles(self):
+        """Test character shingles."""
+        assert shingles('abcde', size=4) == {'abcd', 'bcde'}
+        assert shingles('abc', size=4) == {'abc'}
+        assert shingles('', size=4) == set()
+
+    def test_signature_is_deterministic(self):
+        """Test signature stabil antar instance (bisa disimpan)."""
+        a = MinHasher().signature('BBCA laba naik')
+        b = MinHasher().signature('BBCA laba naik')
+
+        assert a.dtype == np.uint32
+        assert a.shape == (64,)
+        assert np.array_equal(a, b)
+        assert MinHasher().signature('  ') is None
+
+    def test_similarity_estimates_jaccard(self):
+        """Test estimasi similarity membedakan variasi kecil dan berita lain."""
+        hasher = MinHasher()
+        base = hasher.signature('BBCA posts strong Q4 earnings, profit up 15%')
+        variant = hasher.signature('BBCA Posts Strong Q4 Earnings; Profit Up 15%')
+        other = hasher.signature('Laporan Bulanan Registrasi Pemegang Efek')
+
+        assert similarity(base, variant) > 0.7
+        assert similarity(base, other) < 0.2
+
+
+class TestMinHashIndex:
+    """Tests untuk LSH index."""
+
+    def test_query(self):
+        """Test lookup near-duplicate dan non-duplicate."""
+        hasher = MinHasher()
+        index = MinHashIndex()
+        index.add('a', hasher.signature('Penyampaian Bukti Iklan Informasi Kepada Pemegang Saham'))
+        index.add('b', hasher.signature('Laporan Bulanan Registrasi Pemegang Efek'))
+
+        assert index.query(
+            hasher.signature('[Revisi] Penyampaian Bukti Iklan Informasi Kepada Pemegang Saham')
+        ) == 'a'
+        assert index.query(hasher.signature('BBCA umumkan stock split')) is None
+        assert len(index) == 2
+
+    def test_invalid_bands(self):
+        """Test num_perm harus habis dibagi bands."""
+        with pytest.raises(ValueError):
+            MinHashIndex(num_perm=64, bands=10)
+
+
+class TestNearDuplicateDetector:
+    """Tests untuk NearDuplicateDetector."""
+
+    def test_numbers_must_match(self):
+        """Test headline dengan angka berbeda bukan duplikat."""
+        detector = NearDuplicateDetector()
+        detector.add(1, detector.fingerprint('Laba BBCA naik 10% di kuartal III 2024'))
+
+        assert detector.find(detector.fingerprint('Laba BBCA naik 12% di kuartal III 2024')) is None
+        assert detector.find(detector.fingerprint('Laba BBCA Naik 10% di Kuartal III 2024!')) == 1
+
+    def test_reuses_stored_signature(self):
+        """Test fingerprint dari signature yang sudah disimpan."""
+        detector = NearDuplicateDetector()
+        fingerprint = detector.fingerprint('BBCA umumkan stock split 1:5')
+        detector.add('x', fingerprint)
+        stored = np.frombuffer(detector.signature('x').tobytes(), dtype=np.uint32)
+
+        restored = detector.fingerprint('BBCA umumkan stock split 1:5', stored)
+
+        assert restored.numbers == ('1', '5')
+        assert 'x' in detector
+        assert detector.find(restored) == 'x'
@@ -0,0 +1,130 @@
+"""
+Tests untuk batch news classifier.
+"""
+
+import pytest
+
+from src.services.news_classifier import (
+    ClassificationStats,
+    classify_headlines,
+    classify_record,
+    read_headlines,
+)
+from src.services.news_scraper_service import NewsScraperService
+
+HEADLINES = [
+    {'title': 'BBCA profit naik, laba tumbuh', 'ticker': 'BBCA'},
+    {'title': 'TLKM rugi, saham turun', 'summary': 'Kinerja melemah'},
+    {'title': 'ASII umumkan stock split'},
+    'Plain headline tanpa keyword',
+]
+
+
+class TestClassifyRecord:
+    """Tests untuk classify_record."""
+
+    def test_same_labels_as_scraper_service(self):
+        """Test hasil sama dengan _analyze_sentiment NewsScraperService."""
+        service = NewsScraperService()
+
+        for record in HEADLINES:
+            title = record['title'] if isinstance(record, dict) else record
+            summary = record.get('summary', '') if isinstance(record, dict) else ''
+            result = classify_record(record)
+
+            assert result['sentiment'] == service._analyze_sentiment(f'{title} {summary}')
+            assert result['sentiment_score'] == service.classifier.classify(
+                f'{title} {summary}'
+            ).score
+
+    def test_preserves_extra_fields(self):
+        """Test field lain dari record tetap ada di output."""
+        result = classify_record(HEADLINES[0])
+
+        assert result['ticker'] == 'BBCA'
+        assert result['sentiment'] == 'positive'
+        assert result['corporate_action_types'] == []
+
+    def test_corporate_action_types(self):
+        """Test tipe corporate action di output."""
+        assert classify_record(HEADLINES[2])['corporate_action_types'] == ['stock_split']
+
+    def test_current_version_passed_through(self):
+        """Test record dengan versi lexicon sekarang tidak diklasifikasi ulang."""
+        version = NewsScraperService().classifier.version
+        record = {'title': 'Laba naik', 'sentiment': 'negative', 'lexicon_version': version}
+
+        assert classify_record(record) == record
+        assert classify_record({**record, 'lexicon_version': 'old'})['sentiment'] == 'positive'
+
+
+class TestClassifyHeadlines:
+    """Tests untuk classify_headlines."""
+
+    def test_streams_in_order_with_stats(self):
+        """Test output mengikuti urutan input dan stats ter-update."""
+        stats = ClassificationStats()
+        records = HEADLINES * 5
+
+        results = list(classify_headlines(records, chunk_size=3, stats=stats))
+
+        assert [r['title'] for r in results] == [classify_record(r)['title'] for r in records]
+        assert stats.items == 20
+        assert stats.chunks == 7
+        assert stats.items_per_second > 0
+
+    def test_is_lazy(self):
+        """Test input hanya dibaca sesuai kebutuhan."""
+        consumed = []
+
+        def source():
+            for i in range(1000):
+                consumed.append(i)
+                yield f'headline {i}'
+
+        first = next(classify_headlines(source(), chunk_size=10))
+
+        assert first['title'] == 'headline 0'
+        assert len(consumed) == 10
+
+    def test_process_pool_matches_inline(self):
+        """Test hasil process pool sama dengan inline."""
+        records = HEADLINES * 10
+
+        inline = list(classify_headlines(records, chunk_size=4))
+        pooled = list(classify_headlines(records, chunk_size=4, workers=2))
+
+        assert pooled == inline
+
+    def test_invalid_chunk_size(self):
+        """Test chunk_size harus positif."""
+        with pytest.raises(ValueError):
+            list(classify_headlines(HEADLINES, chunk_size=0))
+
+
+class TestReadHeadlines:
+    """Tests untuk read_headlines."""
+
+    def test_jsonl_skips_invalid_lines(self, tmp_path):
+        """Test JSONL dengan baris rusak."""
+        path = tmp_path / 'news.jsonl'
+        path.write_text('{"title": "A"}\nnot json\n\n[1, 2]\n{"title": "B"}\n')
+
+        assert [r['title'] for r in read_headlines(path)] == ['A', 'B']
+
+    def test_csv(self, tmp_path):
+        """Test CSV dengan header."""
+        path = tmp_path / 'news.csv'
+        path.write_text('title,summary\nA,sa\nB,sb\n')
+
+        assert list(read_headlines(path)) == [
+            {'title': 'A', 'summary': 'sa'},
+            {'title': 'B', 'summary': 'sb'},
+        ]
+
+    def test_plain_text(self, tmp_path):
+        """Test plain text satu headline per baris."""
+        path = tmp_path / 'news.txt'
+        path.write_text('Headline A\n\nHeadline B\n')
+
+        assert list(read_headlines(path)) == [{'title': 'Headline A'}, {'title': 'Headline B'}]
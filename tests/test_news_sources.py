@@ -0,0 +1,269 @@
+"""
+Tests untuk news source registry dan concurrent aggregation.
+
+HTTP sources di-test terhadap local HTTP server yang menyajikan fixture.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from src.models.stock_data import NewsItem
+from src.services.news_scraper_service import NewsScraperService
+from src.services.news_sources import (
+    NEWS_SOURCES,
+    IdxSource,
+    InvestingSource,
+    NewsSource,
+    build_sources,
+    fetch_concurrently,
+)
+
+IDX_FIXTURE = {
+    'ResultCount': 2,
+    'Replies': [
+        {
+            'pengumuman': {
+                'Id2': '1001',
+                'TglPengumuman': '2024-01-05T17:02:36',
+                'JudulPengumuman': 'Jadwal Pembagian Dividen Tunai',
+                'PerihalPengumuman': 'Dividen tunai tahun buku 2023',
+            },
+            'attachments': [{'FullSavePath': 'https://example.com/1001.pdf'}],
+        },
+        {
+            'pengumuman': {
+                'Id2': '1002',
+                'TglPengumuman': '2024-01-03T08:00:00',
+                'JudulPengumuman': 'Laporan Bulanan Registrasi Pemegang Efek',
+            },
+            'attachments': [],
+        },
+    ],
+}
+
+INVESTING_FIXTURE = """
+<html><body>
+  <article>
+    <a href="/news/stock-market-news/bbca-laba-naik-1">BBCA laba naik 12%</a>
+    <p>Bank Central Asia mencatat laba bersih naik.</p>
+    <time datetime="2024-01-06T09:15:00Z">6 Jan</time>
+  </article>
+  <article><a href="/news/empty"></a></article>
+  <article>
+    <a href="https://other.example.com/bbca-2">BBCA umumkan stock split</a>
+  </article>
+</body></html>
+"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Handler yang menyajikan fixture berdasarkan path."""
+
+    def do_GET(self):
+        if self.path.startswith('/primary/ListedCompany/GetAnnouncement'):
+            assert 'kodeEmiten=BBCA' in self.path
+            body, content_type = json.dumps(IDX_FIXTURE), 'application/json'
+        elif self.path == '/equities/bbca-news':
+            body, content_type = INVESTING_FIXTURE, 'text/html'
+        elif self.path.startswith('/slow'):
+            time.sleep(1.0)
+            body, content_type = '{}', 'application/json'
+        else:
+            self.send_error(404)
+            return
+
+        encoded = body.encode('utf-8')
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client sudah menyerah (timeout test)
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def server_url():
+    """Local HTTP server untuk fixture pages."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class SlowSource(NewsSource):
+    """Source yang lebih lambat dari deadline-nya."""
+
+    name = 'slow'
+
+    def fetch(self, ticker, limit):
+        time.sleep(1.0)
+        return [NewsItem(title='late', source='slow', item_id='late')]
+
+
+class FailingSource(NewsSource):
+    """Source yang selalu error."""
+
+    name = 'failing'
+
+    def fetch(self, ticker, limit):
+        raise RuntimeError('boom')
+
+
+class StaticSource(NewsSource):
+    """Source dengan hasil tetap."""
+
+    name = 'static'
+
+    def __init__(self, items, timeout=None):
+        super().__init__(timeout)
+        self.items = items
+
+    def fetch(self, ticker, limit):
+        return self.items[:limit]
+
+
+class TestHttpSources:
+    """Tests untuk IDX dan Investing.com sources."""
+
+    def test_idx_source(self, server_url):
+        """Test parsing pengumuman IDX."""
+        items = IdxSource(timeout=2, base_url=server_url).fetch('BBCA.JK', limit=10)
+
+        assert [n.item_id for n in items] == ['idx:1001', 'idx:1002']
+        assert items[0].title == 'Jadwal Pembagian Dividen Tunai'
+        assert items[0].url == 'https://example.com/1001.pdf'
+        assert items[0].published_date.day == 5
+        assert items[1].url is None
+
+    def test_investing_source(self, server_url):
+        """Test parsing halaman news Investing.com."""
+        items = InvestingSource(timeout=2, base_url=server_url).fetch('BBCA.JK', limit=10)
+
+        assert [n.title for n in items] == ['BBCA laba naik 12%', 'BBCA umumkan stock split']
+        assert items[0].url == f'{server_url}/news/stock-market-news/bbca-laba-naik-1'
+        assert items[0].summary == 'Bank Central Asia mencatat laba bersih naik.'
+        assert items[0].published_date.hour == 9
+        assert items[1].published_date is None
+
+    def test_http_error_raises(self, server_url):
+        """Test HTTP error diteruskan ke aggregator."""
+        with pytest.raises(requests.HTTPError):
+            InvestingSource(timeout=2, base_url=server_url).fetch('XXXX.JK', limit=10)
+
+
+class TestFetchConcurrently:
+    """Tests untuk concurrent aggregation."""
+
+    def test_registry(self):
+        """Test sources terdaftar dan nama tidak dikenal ditolak."""
+        assert {'yahoo', 'idx', 'investing'} <= set(NEWS_SOURCES)
+        assert [s.name for s in build_sources(['idx'], timeouts={'idx': 3})] == ['idx']
+        assert build_sources(['idx'], timeouts={'idx': 3})[0].timeout == 3
+
+        with pytest.raises(ValueError):
+            build_sources(['unknown'])
+
+    def test_latency_bounded_by_deadline(self, server_url):
+        """Test source lambat ditinggalkan setelah deadline-nya."""
+        sources = [
+            IdxSource(timeout=2, base_url=server_url),
+            SlowSource(timeout=0.2),
+            FailingSource(),
+        ]
+
+        start = time.monotonic()
+        results = list(fetch_concurrently(sources, 'BBCA.JK', limit=10))
+        elapsed = time.monotonic() - start
+
+        assert [source.name for source, _ in results] == ['idx']
+        assert elapsed < 0.8
+
+    def test_http_timeout(self, server_url):
+        """Test HTTP source yang melewati deadline."""
+        source = IdxSource(timeout=0.2, base_url=f'{server_url}/slow')
+
+        assert list(fetch_concurrently([source], 'BBCA.JK', limit=10)) == []
+
+    def test_results_arrive_in_completion_order(self):
+        """Test hasil di-yield sesuai urutan selesai."""
+
+        class DelayedSource(StaticSource):
+            def fetch(self, ticker, limit):
+                time.sleep(0.2)
+                return super().fetch(ticker, limit)
+
+        fast = StaticSource([NewsItem(title='fast', source='a', item_id='1')])
+        slow = DelayedSource([NewsItem(title='slow', source='b', item_id='2')])
+
+        results = list(fetch_concurrently([slow, fast], 'BBCA.JK', limit=10))
+
+        assert [items[0].title for _, items in results] == ['fast', 'slow']
+
+
+class TestServiceSources:
+    """Tests untuk NewsScraperService dengan beberapa sources."""
+
+    def test_merges_and_deduplicates(self, server_url):
+        """Test hasil semua sumber digabung, duplikat dibuang, dan diklasifikasi."""
+        duplicate = NewsItem(title='Jadwal Pembagian Dividen Tunai', source='x', item_id='idx:1001')
+        service = NewsScraperService(
+            sources=[
+                IdxSource(timeout=2, base_url=server_url),
+                InvestingSource(timeout=2, base_url=server_url),
+                StaticSource([duplicate]),
+                SlowSource(timeout=0.2),
+            ]
+        )
+
+        news_items = service.get_news('BBCA')
+
+        assert len(news_items) == 4
+        assert len({n.item_id for n in news_items}) == 4
+        assert all(n.lexicon_version == service.classifier.version for n in news_items)
+        stock_split = [n for n in news_items if 'stock split' in n.title][0]
+        assert stock_split.corporate_action_types == ['stock_split']
+
+    def test_default_source_is_yahoo(self):
+        """Test default hanya Yahoo Finance."""
+        service = NewsScraperService()
+        ticker = MagicMock()
+        ticker.news = [{'title': 'BBCA laba naik', 'uuid': 'u1', 'providerPublishTime': 1704067200}]
+
+        with patch('yfinance.Ticker', return_value=ticker):
+            news_items = service.get_news('BBCA')
+
+        assert [s.name for s in service.sources] == ['yahoo']
+        assert [n.item_id for n in news_items] == ['u1']
+
+    def test_near_duplicates_across_sources_collapsed(self):
+        """Test judul near-duplicate dari sumber lain tidak diklasifikasi ulang."""
+        first = StaticSource(
+            [NewsItem(title='BBCA Umumkan Jadwal Dividen Tunai 2024', source='a', item_id='1')]
+        )
+        second = StaticSource(
+            [
+                NewsItem(title='[Revisi] BBCA umumkan jadwal dividen tunai 2024', source='b', item_id='2'),
+                NewsItem(title='BBCA umumkan stock split', source='b', item_id='3'),
+            ]
+        )
+        service = NewsScraperService(sources=[first, second])
+
+        news_items = service.get_news('BBCA')
+
+        assert len(news_items) == 2
+        assert 'BBCA umumkan stock split' in {n.title for n in news_items}
@@ -0,0 +1,388 @@
+"""
+Tests untuk NewsStore.
+"""
+
+from datetime import date, datetime, timedelta
+from random import Random
+import sqlite3
+
+import pytest
+
+from src.models.stock_data import NewsItem
+from src.services.news_store import NewsStore
+
+
+def make_item(item_id, day, **kwargs):
+    """Create NewsItem dengan tanggal 2024-01-<day>."""
+    return NewsItem(
+        title=kwargs.pop('title', f'News {item_id}'),
+        source='Test',
+        published_date=datetime(2024, 1, day),
+        item_id=item_id,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """NewsStore di direktori sementara."""
+    with NewsStore(tmp_path / 'news.db') as store:
+        yield store
+
+
+class TestNewsStore:
+    """Test suite untuk NewsStore."""
+
+    def test_add_and_get_round_trip(self, store):
+        """Test item tersimpan lengkap dan terurut terbaru lebih dulu."""
+        items = [
+            make_item('a', 1, sentiment='positive', corporate_action_types=['dividend']),
+            make_item('b', 3, sentiment='neutral', corporate_action_types=[]),
+            make_item('c', 2),
+        ]
+
+        assert store.add('BBCA.JK', items) == 3
+
+        stored = store.get('BBCA.JK')
+        assert [n.item_id for n in stored] == ['b', 'c', 'a']
+        assert stored[2] == items[0]
+        assert stored[1].corporate_action_types is None
+
+    def test_duplicates_ignored(self, store):
+        """Test item dengan id sama tidak disimpan dua kali."""
+        store.add('BBCA.JK', [make_item('a', 1)])
+
+        assert store.add('BBCA.JK', [make_item('a', 1), make_item('b', 2)]) == 1
+        assert store.count('BBCA.JK') == 2
+        assert store.count('TLKM.JK') == 0
+
+    def test_items_without_id_skipped(self, store):
+        """Test item tanpa item_id tidak disimpan."""
+        assert store.add('BBCA.JK', [make_item(None, 1)]) == 0
+
+    def test_high_water_mark_only_moves_forward(self, store):
+        """Test high-water mark tidak mundur."""
+        assert store.high_water_mark('BBCA.JK') is None
+
+        store.add('BBCA.JK', [make_item('a', 5)])
+        store.add('BBCA.JK', [make_item('b', 2)])
+
+        assert store.high_water_mark('BBCA.JK') == datetime(2024, 1, 5)
+
+    def test_last_refresh(self, store):
+        """Test waktu refresh disimpan walaupun tidak ada item baru."""
+        refreshed = datetime(2024, 2, 1, 9, 30)
+        store.add('BBCA.JK', [], refreshed_at=refreshed)
+
+        assert store.last_refresh('BBCA.JK') == refreshed
+        assert store.high_water_mark('BBCA.JK') is None
+
+    def test_get_limit_and_since(self, store):
+        """Test filter limit dan since."""
+        store.add('BBCA.JK', [make_item(str(day), day) for day in range(1, 6)])
+
+        assert [n.item_id for n in store.get('BBCA.JK', limit=2)] == ['5', '4']
+        assert [n.item_id for n in store.get('BBCA.JK', since=datetime(2024, 1, 4))] == [
+            '5',
+            '4',
+        ]
+
+    def test_update_classification(self, store):
+        """Test update hasil klasifikasi."""
+        store.add('BBCA.JK', [make_item('a', 1, sentiment='neutral')])
+        item = store.get('BBCA.JK')[0]
+        item.sentiment = 'positive'
+        item.corporate_action_types = ['merger']
+        item.lexicon_version = 'v2'
+
+        store.update_classification('BBCA.JK', [item])
+
+        assert store.get('BBCA.JK')[0] == item
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test data tetap ada setelah store dibuka ulang."""
+        path = tmp_path / 'sub' / 'news.db'
+        with NewsStore(path) as store:
+            store.add('BBCA.JK', [make_item('a', 1)])
+
+        with NewsStore(path) as store:
+            assert store.count() == 1
+
+    def test_migrates_old_schema(self, tmp_path):
+        """Test database lama tanpa kolom signature di-upgrade."""
+        path = tmp_path / 'old.db'
+        conn = sqlite3.connect(path)
+        conn.execute(
+            'CREATE TABLE news (ticker TEXT NOT NULL, item_id TEXT NOT NULL, '
+            'title TEXT NOT NULL, source TEXT NOT NULL, published_date TEXT, url TEXT, '
+            'summary TEXT, sentiment TEXT, corporate_action_types TEXT, '
+            'lexicon_version TEXT, PRIMARY KEY (ticker, item_id))'
+        )
+        conn.close()
+
+        with NewsStore(path) as store:
+            store.add('BBCA.JK', [make_item('a', 1)], signatures={'a': b'sig'})
+
+            assert store.signatures('BBCA.JK') == [('a', 'News a', b'sig')]
+
+    def test_migration_builds_search_index(self, tmp_path):
+        """Test berita lama tanpa postings di-index saat store dibuka."""
+        path = tmp_path / 'old.db'
+        with NewsStore(path) as store:
+            store.add('BBCA.JK', [make_item('a', 1, title='Rights issue BBCA')])
+            store._conn.execute('DELETE FROM postings')
+            store._conn.commit()
+
+        with NewsStore(path) as store:
+            assert [i.item_id for _, i in store.search(['rights issue'])] == ['a']
+
+
+class TestCorporateActionCalendar:
+    """Test suite untuk calendar corporate action di NewsStore."""
+
+    @pytest.fixture
+    def calendar(self, store):
+        store.add(
+            'BBCA.JK',
+            [
+                make_item(
+                    'a',
+                    1,
+                    title='BBCA dividen Rp 150 per saham, ex date 2024-01-10',
+                    corporate_action_types=['dividend'],
+                ),
+                make_item('b', 2, title='BBCA laba naik', corporate_action_types=[]),
+            ],
+        )
+        store.add(
+            'TLKM.JK',
+            [
+                make_item(
+                    'c',
+                    3,
+                    title='TLKM stock split 1:5 efektif 2024-01-08',
+                    corporate_action_types=['stock_split'],
+                ),
+                make_item(
+                    'd',
+                    20,
+                    title='TLKM dividen tunai',
+                    corporate_action_types=['dividend'],
+                ),
+            ],
+        )
+        return store
+
+    def test_range_query_sorted_by_event_date(self, calendar):
+        """Test event dalam range, urut tanggal event."""
+        events = calendar.corporate_actions(
+            since=datetime(2024, 1, 7), until=datetime(2024, 1, 14)
+        )
+
+        assert [(e.ticker, e.action_type, e.event_date.day) for e in events] == [
+            ('TLKM.JK', 'stock_split', 8),
+            ('BBCA.JK', 'dividend', 10),
+        ]
+        assert events[0].ratio == '1:5'
+        assert events[1].amount == 150.0
+        assert events[1].dates == {'ex': datetime(2024, 1, 10)}
+        assert events[1].title.startswith('BBCA dividen')
+
+    def test_filters(self, calendar):
+        """Test filter tipe dan ticker."""
+        dividends = calendar.corporate_actions(action_types=['dividend'])
+        tlkm = calendar.corporate_actions(tickers=['TLKM.JK'], limit=1)
+
+        assert [e.item_id for e in dividends] == ['a', 'd']
+        assert [e.item_id for e in tlkm] == ['c']
+
+    def test_reclassification_replaces_events(self, calendar):
+        """Test update_classification mengekstrak ulang event item."""
+        item = make_item('b', 2, title='BBCA buyback saham', corporate_action_types=['buyback'])
+        calendar.update_classification('BBCA.JK', [item])
+
+        assert [e.action_type for e in calendar.corporate_actions(tickers=['BBCA.JK'])] == [
+            'buyback',
+            'dividend',
+        ]
+
+    def test_migration_builds_calendar(self, tmp_path):
+        """Test store tanpa tabel calendar di-backfill saat dibuka."""
+        path = tmp_path / 'old.db'
+        with NewsStore(path) as store:
+            store.add(
+                'BBCA.JK',
+                [make_item('a', 1, title='Dividen', corporate_action_types=['dividend'])],
+            )
+            store._conn.execute('DROP TABLE corporate_actions')
+            store._conn.commit()
+
+        with NewsStore(path) as store:
+            assert [e.item_id for e in store.corporate_actions()] == ['a']
+
+
+class TestSentimentTimeSeries:
+    """Test suite untuk time series dan rolling window sentiment."""
+
+    @staticmethod
+    def news(item_id, published, sentiment, score=None):
+        return NewsItem(
+            title=f'News {item_id}',
+            source='Test',
+            published_date=published,
+            sentiment=sentiment,
+            sentiment_score=score,
+            item_id=item_id,
+        )
+
+    @staticmethod
+    def recompute(items, as_of, days):
+        """Agregat window dihitung ulang dari semua item (referensi)."""
+        window = [
+            item
+            for item in items
+            if 0 <= (as_of - item.published_date.date()).days < days
+        ]
+        return (
+            sum(i.sentiment == 'positive' for i in window),
+            sum(i.sentiment == 'negative' for i in window),
+            sum(i.sentiment == 'neutral' for i in window),
+            round(sum(i.weighted_sentiment() for i in window), 6),
+        )
+
+    def test_daily_series(self, store):
+        """Test bucket harian per sentiment dan total score."""
+        store.add(
+            'BBCA.JK',
+            [
+                self.news('a', datetime(2024, 1, 1, 9), 'positive', 1.5),
+                self.news('b', datetime(2024, 1, 1, 15), 'negative', -1.0),
+                self.news('c', datetime(2024, 1, 3), 'neutral', 0.0),
+                self.news('d', None, 'positive', 1.0),
+            ],
+        )
+
+        series = store.sentiment_series('BBCA.JK')
+
+        assert [(d.day.day, d.positive, d.negative, d.neutral, d.score) for d in series] == [
+            (1, 1, 1, 0, 0.5),
+            (3, 0, 0, 1, 0.0),
+        ]
+        assert [d.day.day for d in store.sentiment_series('BBCA.JK', since=date(2024, 1, 2))] == [3]
+
+    def test_incremental_windows_match_recomputation(self, store):
+        """Test window incremental sama dengan dihitung ulang, termasuk item out-of-order."""
+        random = Random(7)
+        items = []
+        start = datetime(2023, 1, 1)
+        for i in range(300):
+            published = start + timedelta(days=random.randint(0, 400), hours=random.randint(0, 23))
+            sentiment = random.choice(['positive', 'negative', 'neutral'])
+            items.append(self.news(str(i), published, sentiment, random.choice([None, 0.5, -2.0])))
+            store.add('BBCA.JK', [items[-1]])
+
+        for as_of in (date(2024, 2, 5), date(2024, 3, 1), date(2024, 6, 1), date(2023, 6, 1)):
+            trend = store.sentiment_trend('BBCA.JK', as_of=as_of)
+            assert [w.days for w in trend] == [7, 30, 90]
+            for window in trend:
+                assert (window.positive, window.negative, window.neutral, window.score) == (
+                    self.recompute(items, as_of, window.days)
+                ), (as_of, window.days)
+
+    def test_reclassification_adjusts_aggregates(self, store):
+        """Test klasifikasi ulang mengoreksi bucket harian dan window."""
+        store.add('BBCA.JK', [self.news('a', datetime(2024, 1, 1), 'positive', 1.0)])
+        store.update_classification(
+            'BBCA.JK', [self.news('a', datetime(2024, 1, 1), 'negative', -2.0)]
+        )
+
+        (day,) = store.sentiment_series('BBCA.JK')
+        week = store.sentiment_trend('BBCA.JK', as_of=date(2024, 1, 2))[0]
+
+        assert (day.positive, day.negative, day.score) == (0, 1, -2.0)
+        assert (week.positive, week.negative, week.score) == (0, 1, -2.0)
+
+    def test_empty_ticker(self, store):
+        """Test ticker tanpa berita menghasilkan window kosong."""
+        trend = store.sentiment_trend('BBCA.JK', as_of=date(2024, 1, 1))
+
+        assert [(w.days, w.count, w.average_score) for w in trend] == [
+            (7, 0, 0.0),
+            (30, 0, 0.0),
+            (90, 0, 0.0),
+        ]
+
+    def test_migration_builds_sentiment(self, tmp_path):
+        """Test store tanpa tabel sentiment di-backfill saat dibuka."""
+        path = tmp_path / 'old.db'
+        with NewsStore(path) as store:
+            store.add('BBCA.JK', [self.news('a', datetime(2024, 1, 1), 'positive', 1.0)])
+            store._conn.execute('DROP TABLE sentiment_daily')
+            store._conn.execute('DROP TABLE sentiment_windows')
+            store._conn.commit()
+
+        with NewsStore(path) as store:
+            week = store.sentiment_trend('BBCA.JK', as_of=date(2024, 1, 3))[0]
+            assert (week.positive, week.score) == (1, 1.0)
+
+
+class TestNewsStoreSearch:
+    """Test suite untuk full-text search NewsStore."""
+
+    @pytest.fixture
+    def corpus(self, store):
+        store.add(
+            'BBCA.JK',
+            [
+                make_item('a', 1, title='BBCA umumkan rights issue'),
+                make_item('b', 5, title='Issue rights ditunda'),
+                make_item('c', 9, title='BBCA bagi dividen', summary='Rights issue tahun depan'),
+            ],
+        )
+        store.add('TLKM.JK', [make_item('d', 3, title='TLKM rencanakan Rights-Issue')])
+        return store
+
+    def ids(self, results):
+        return [item.item_id for _, item in results]
+
+    def test_phrase_requires_order(self, corpus):
+        """Test kata phrase harus berurutan; hasil terbaru lebih dulu."""
+        assert self.ids(corpus.search(['rights issue'])) == ['c', 'd', 'a']
+
+    def test_single_token(self, corpus):
+        """Test query satu kata."""
+        assert self.ids(corpus.search(['ditunda'])) == ['b']
+
+    def test_multiple_phrases_or(self, corpus):
+        """Test beberapa phrase digabung OR."""
+        assert self.ids(corpus.search(['ditunda', 'dividen'])) == ['c', 'b']
+
+    def test_phrase_does_not_cross_title_and_summary(self, store):
+        """Test phrase tidak match di batas judul dan summary."""
+        store.add('BBCA.JK', [make_item('a', 1, title='Rencana rights', summary='Issue baru')])
+
+        assert store.search(['rights issue']) == []
+
+    def test_date_range(self, corpus):
+        """Test filter since/until inklusif."""
+        results = corpus.search(
+            ['rights issue'], since=datetime(2024, 1, 2), until=datetime(2024, 1, 3)
+        )
+
+        assert self.ids(results) == ['d']
+
+    def test_ticker_filter_and_limit(self, corpus):
+        """Test filter ticker dan limit."""
+        assert self.ids(corpus.search(['rights issue'], tickers=['BBCA.JK'], limit=1)) == ['c']
+
+    def test_unknown_token(self, corpus):
+        """Test token yang tidak ada di index."""
+        assert corpus.search(['rights offering']) == []
+        assert corpus.search(['']) == []
+
+    def test_reindex(self, corpus):
+        """Test reindex menghasilkan index yang sama."""
+        before = self.ids(corpus.search(['rights issue']))
+        corpus.reindex()
+
+        assert self.ids(corpus.search(['rights issue'])) == before
@@ -0,0 +1,192 @@
+"""
+Tests untuk pipeline bertahap (src.services.pipeline).
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+from src.models.stock_data import CorporateAction
+from src.services.pipeline import (
+    ANALYZE,
+    BUILD_MODEL,
+    FETCH_FUNDAMENTALS,
+    FETCH_NEWS,
+    SINK,
+    Pipeline,
+    Stage,
+    build_screening_pipeline,
+)
+from tests.conftest import make_stock_data
+
+
+def fetch_stock_data(ticker):
+    """Fetch mock; XXXX gagal."""
+    return None if ticker == 'XXXX' else make_stock_data(ticker)
+
+
+class TestPipeline:
+    """Test suite untuk Pipeline."""
+
+    def test_items_flow_through_stages(self):
+        received = []
+        pipeline = Pipeline(
+            [
+                Stage('double', lambda x: x * 2, workers=3),
+                Stage('odd', lambda x: x if x % 4 else None),
+                Stage('sink', received.append),
+            ]
+        )
+
+        pipeline.run(range(10))
+
+        assert sorted(received) == [2, 6, 10, 14, 18]
+        stats = {s.name: s for s in pipeline.stats()}
+        assert stats['double'].processed == 10
+        assert stats['odd'].dropped == 5
+        assert stats['sink'].processed == 5
+        assert all(s.queue_depth == 0 for s in stats.values())
+
+    def test_workers_run_concurrently(self):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fetch(item):
+            barrier.wait()  # Gagal (BrokenBarrierError) jika fetch berurutan
+            return item
+
+        received = []
+        pipeline = Pipeline(
+            [Stage('fetch', fetch, workers=4), Stage('sink', received.append)]
+        )
+        pipeline.run(range(8))
+
+        assert sorted(received) == list(range(8))
+
+    def test_slow_sink_applies_backpressure(self):
+        """Test sink yang macet menahan stage sebelumnya dan input."""
+        release = threading.Event()
+        consumed = []
+
+        def source():
+            for item in range(100):
+                consumed.append(item)
+                yield item
+
+        def sink(item):
+            release.wait(5)
+
+        pipeline = Pipeline(
+            [
+                Stage('fetch', lambda x: x, workers=2, queue_size=2),
+                Stage('sink', sink, queue_size=3),
+            ]
+        )
+        runner = threading.Thread(target=pipeline.run, args=(source(),))
+        runner.start()
+        try:
+            # Tunggu sampai semua queue penuh
+            for _ in range(100):
+                depths = [s.queue_depth for s in pipeline.stats()]
+                if depths == [2, 3]:
+                    break
+                release.wait(0.05)
+            stats = pipeline.stats()
+            # 1 di sink, 3 di queue sink, 2 di worker fetch, 2 di queue fetch,
+            # 1 di tangan source yang menunggu
+            assert len(consumed) <= 9
+            assert stats[0].queue_depth == 2
+            assert stats[1].peak_depth <= 3
+        finally:
+            release.set()
+            runner.join(10)
+
+        assert len(consumed) == 100
+        assert pipeline.stats()[1].processed == 100
+
+    def test_error_stops_input_and_finishes_in_flight(self):
+        started, failing = threading.Event(), threading.Event()
+        received = []
+
+        def fetch(item):
+            if item == 1:
+                started.set()
+                failing.wait(5)
+            if item == 2:
+                started.wait(5)
+                failing.set()
+                raise ValueError('boom')
+            return item
+
+        pipeline = Pipeline(
+            [Stage('fetch', fetch, workers=2), Stage('sink', received.append)]
+        )
+
+        with pytest.raises(ValueError, match='boom'):
+            pipeline.run(iter(range(1000)))
+
+        assert 1 in received  # Item yang sedang di-fetch tetap sampai sink
+        stats = pipeline.stats()
+        assert stats[0].failed == 1
+        assert stats[0].processed < 1000
+
+    def test_invalid_stages(self):
+        with pytest.raises(ValueError):
+            Pipeline([])
+        with pytest.raises(ValueError):
+            Pipeline([Stage('fetch', str, workers=0)])
+
+
+class TestScreeningPipeline:
+    """Test suite untuk build_screening_pipeline."""
+
+    def test_all_stages(self):
+        finance_service = MagicMock()
+        finance_service.get_stock_data.side_effect = fetch_stock_data
+        news_service = MagicMock()
+        news_service.get_news.return_value = []
+        news_service.get_corporate_actions.side_effect = lambda t, news: [
+            CorporateAction(ticker=t, action_type='dividend')
+        ]
+        news_service.get_sentiment_trend.return_value = []
+        items = []
+
+        pipeline = build_screening_pipeline(
+            finance_service,
+            items.append,
+            analyzer=FundamentalAnalyzer(),
+            news_service=news_service,
+        )
+        pipeline.run(['BBCA', 'XXXX', 'BMRI'])
+
+        assert [s.name for s in pipeline.stats()] == [
+            FETCH_FUNDAMENTALS,
+            FETCH_NEWS,
+            BUILD_MODEL,
+            ANALYZE,
+            SINK,
+        ]
+        by_ticker = {item.ticker: item for item in items}
+        assert by_ticker['XXXX'].failed and by_ticker['XXXX'].result is None
+        bbca = by_ticker['BBCA']
+        assert bbca.result.ticker == 'BBCA.JK'
+        assert [a.action_type for a in bbca.stock_data.corporate_actions] == [
+            'dividend'
+        ]
+        news_service.get_news.assert_any_call('BMRI')
+        assert news_service.get_news.call_count == 2
+        # Corporate actions dari berita yang sudah di-fetch, tanpa query ulang
+        news_service.get_corporate_actions.assert_any_call('BMRI', [])
+
+    def test_without_news_or_analyzer(self):
+        finance_service = MagicMock()
+        finance_service.get_stock_data.side_effect = fetch_stock_data
+        items = []
+
+        pipeline = build_screening_pipeline(finance_service, items.append)
+        pipeline.run(['BBCA'])
+
+        assert [s.name for s in pipeline.stats()] == [FETCH_FUNDAMENTALS, SINK]
+        assert items[0].result is None
+        assert items[0].stock_data.get_ticker() == 'BBCA.JK'
@@ -0,0 +1,124 @@
+"""
+Unit tests untuk PreFilter.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.analyzers.prefilter import FilterRule, PreFilter
+from src.config.settings import ScreeningCriteria
+from src.services.yahoo_finance_service import YahooFinanceService
+
+
+class TestFilterRule:
+    """Tests untuk FilterRule."""
+
+    def test_passes(self):
+        """Test evaluasi operator."""
+        rule = FilterRule('market_cap', 'market_cap', '>=', 100.0)
+        assert rule.passes({'market_cap': 150.0})
+        assert not rule.passes({'market_cap': 50.0})
+
+    def test_missing_metric(self):
+        """Test handling metrik yang tidak tersedia."""
+        lenient = FilterRule('dte', 'debt_to_equity', '<=', 1.0)
+        strict = FilterRule('div', 'dividend_yield', '>', 0.0, keep_missing=False)
+        assert lenient.passes({})
+        assert not strict.passes({'dividend_yield': None})
+
+    def test_invalid_operator(self):
+        """Test operator tidak valid."""
+        with pytest.raises(ValueError):
+            FilterRule('x', 'x', '==', 1.0)
+
+
+class TestPreFilter:
+    """Tests untuk PreFilter."""
+
+    def test_from_criteria(self):
+        """Test rules diturunkan dari ScreeningCriteria."""
+        criteria = ScreeningCriteria()
+        prefilter = PreFilter.from_criteria(criteria)
+
+        names = [rule.name for rule in prefilter.rules]
+        assert names == ['market_cap', 'dividend', 'debt_to_equity']
+        assert prefilter.rules[0].threshold == criteria.valuation.market_cap_min
+
+    def test_from_criteria_dividend_not_required(self):
+        """Test rule dividen tidak dibuat jika dividen tidak wajib."""
+        criteria = ScreeningCriteria()
+        criteria.dividend.require_dividend = False
+        prefilter = PreFilter.from_criteria(criteria, rules=['dividend'])
+        assert prefilter.rules == []
+
+    def test_from_criteria_unknown_rule(self):
+        """Test nama rule tidak dikenal."""
+        with pytest.raises(ValueError):
+            PreFilter.from_criteria(rules=['pe_ratio'])
+
+    def test_run_reports_pruned_per_stage(self):
+        """Test ticker dipangkas dan dilaporkan per rule."""
+        quotes = {
+            'BIG': {'market_cap': 5e12, 'dividend_yield': 0.03},
+            'SMALL': {'market_cap': 1e9, 'dividend_yield': 0.03},
+            'NODIV': {'market_cap': 5e12, 'dividend_yield': None},
+            'FAIL': None,
+        }
+        finance_service = MagicMock()
+        finance_service.get_quote.side_effect = lambda t: quotes[t]
+
+        prefilter = PreFilter.from_criteria(rules=['market_cap', 'dividend'])
+        survivors, report = prefilter.run(list(quotes), finance_service)
+
+        assert survivors == ['BIG']
+        assert report.total == 4
+        assert report.quote_failed == 1
+        assert report.pruned_by_rule == {'market_cap': 1, 'dividend': 1}
+        assert report.survivors == 1
+
+    def test_run_on_pruned_callback(self):
+        """Test callback dipanggil per ticker yang tidak lolos."""
+        quotes = {
+            'BIG': {'market_cap': 5e12, 'dividend_yield': 0.03},
+            'SMALL': {'market_cap': 1e9, 'dividend_yield': 0.03},
+            'FAIL': None,
+        }
+        finance_service = MagicMock()
+        finance_service.get_quote.side_effect = lambda t: quotes[t]
+        pruned = []
+
+        PreFilter.from_criteria(rules=['market_cap']).run(
+            list(quotes),
+            finance_service,
+            on_pruned=lambda ticker, rule: pruned.append(
+                (ticker, rule.name if rule else None)
+            ),
+        )
+
+        assert pruned == [('SMALL', 'market_cap'), ('FAIL', None)]
+
+    def test_run_discards_pruned_quote_info(self):
+        """Test info quote ticker yang dipangkas tidak tertinggal di cache."""
+        service = YahooFinanceService()
+        infos = {
+            'BIG.JK': {'symbol': 'BIG.JK', 'marketCap': 5e12},
+            'SMALL.JK': {'symbol': 'SMALL.JK', 'marketCap': 1e9},
+        }
+
+        with patch('yfinance.Ticker') as mock_yf:
+            mock_yf.side_effect = lambda t: MagicMock(info=infos[t])
+            survivors, _ = PreFilter.from_criteria(rules=['market_cap']).run(
+                ['BIG', 'SMALL'], service
+            )
+
+        assert survivors == ['BIG']
+        assert list(service.info_cache) == ['BIG.JK']
+
+    def test_run_without_rules_skips_quotes(self):
+        """Test pre-filter kosong tidak melakukan fetch quote."""
+        finance_service = MagicMock()
+        survivors, report = PreFilter([]).run(['A', 'B'], finance_service)
+
+        assert survivors == ['A', 'B']
+        finance_service.get_quote.assert_not_called()
@@ -0,0 +1,84 @@
+"""
+Unit tests untuk rank robustness analysis.
+"""
+
+import numpy as np
+import pytest
+
+from src.analyzers.robustness import (
+    analyze_robustness,
+    category_matrix,
+    sample_weights,
+)
+from src.config.settings import ScoringWeights
+from src.models.screening_result import CategoryScore, ScreeningMetrics, ScreeningResult
+
+
+class TestSampleWeights:
+    """Tests untuk sample_weights."""
+
+    def test_samples_on_simplex_around_base(self):
+        """Test sample berjumlah 1 dan rata-ratanya mendekati base."""
+        base = ScoringWeights()
+        weights = sample_weights(base, samples=20000, concentration=100, seed=1)
+
+        assert weights.shape == (20000, 4)
+        np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+        np.testing.assert_allclose(weights.mean(axis=0), [0.25, 0.35, 0.2, 0.2], atol=0.01)
+
+    def test_invalid_concentration(self):
+        """Test concentration harus positif."""
+        with pytest.raises(ValueError):
+            sample_weights(concentration=0)
+
+
+class TestAnalyzeRobustness:
+    """Tests untuk analyze_robustness."""
+
+    def test_dominant_stock_always_top(self):
+        """Test emiten yang unggul di semua kategori selalu rank 1."""
+        scores = np.array(
+            [
+                [90.0, 90.0, 90.0, 90.0],
+                [50.0, 60.0, 40.0, 30.0],
+                [10.0, 20.0, 30.0, 0.0],
+            ]
+        )
+        result = analyze_robustness(['A', 'B', 'C'], scores, samples=500, top_n=1, seed=7)
+
+        assert result.ranks.shape == (500, 3)
+        assert result.base_ranks.tolist() == [1, 2, 3]
+        assert result.top_probability().tolist() == [1.0, 0.0, 0.0]
+        assert result.rank_histogram('A') == {1: 500}
+
+    def test_sensitive_pair(self):
+        """Test dua emiten dengan profil berbeda saling bertukar rank."""
+        scores = np.array(
+            [
+                [100.0, 40.0, 50.0, 50.0],  # unggul valuation
+                [40.0, 70.0, 50.0, 50.0],  # unggul profitability
+            ]
+        )
+        result = analyze_robustness(
+            ['VALUE', 'QUALITY'], scores, samples=2000, top_n=1, concentration=5, seed=3
+        )
+        probability = dict(zip(result.tickers, result.top_probability(), strict=True))
+
+        assert 0 < probability['VALUE'] < 1
+        assert probability['VALUE'] + probability['QUALITY'] == pytest.approx(1.0)
+
+        summary = result.ticker_summary()
+        assert summary[0]['top_probability'] >= summary[1]['top_probability']
+        assert summary[0]['p5_rank'] <= summary[0]['p95_rank']
+
+    def test_category_matrix(self):
+        """Test extraksi category scores dari ScreeningResult."""
+        metrics = ScreeningMetrics(
+            valuation_score=CategoryScore('Valuation', 10.0),
+            profitability_score=CategoryScore('Profitability', 20.0),
+            risk_score=CategoryScore('Risk', 30.0),
+            dividend_score=CategoryScore('Dividend', 40.0),
+        )
+        result = ScreeningResult(ticker='A', company_name='A', metrics=metrics)
+
+        assert category_matrix([result]).tolist() == [[10.0, 20.0, 30.0, 40.0]]
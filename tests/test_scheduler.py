@@ -0,0 +1,130 @@
+"""
+Tests untuk FetchScheduler (src.services.scheduler).
+"""
+
+import threading
+
+import pytest
+
+from src.services.scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    WATCHLIST,
+    ClassStats,
+    FetchScheduler,
+)
+
+
+@pytest.fixture
+def gate():
+    """Event yang menahan task sampai test melepasnya."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def blocked(gate, value=None, started=None):
+    if started is not None:
+        started.set()
+    gate.wait(5)
+    return value
+
+
+class TestFetchScheduler:
+    """Test suite untuk FetchScheduler."""
+
+    def test_submit_returns_result(self):
+        scheduler = FetchScheduler(workers=2)
+        try:
+            assert scheduler.submit(INTERACTIVE, pow, 2, 10).result(5) == 1024
+            with pytest.raises(ZeroDivisionError):
+                scheduler.submit(BACKGROUND, divmod, 1, 0).result(5)
+        finally:
+            scheduler.shutdown()
+
+    def test_interactive_jumps_queue(self, gate):
+        """Test task interactive dijalankan sebelum antrian background."""
+        scheduler = FetchScheduler(workers=1)
+        order, started = [], threading.Event()
+        try:
+            scheduler.submit(BACKGROUND, blocked, gate, None, started)
+            assert started.wait(5)
+            futures = [
+                scheduler.submit(BACKGROUND, order.append, 'bg1'),
+                scheduler.submit(WATCHLIST, order.append, 'watch'),
+                scheduler.submit(BACKGROUND, order.append, 'bg2'),
+                scheduler.submit(INTERACTIVE, order.append, 'screen'),
+            ]
+            gate.set()
+            for future in futures:
+                future.result(5)
+        finally:
+            scheduler.shutdown()
+
+        assert order == ['screen', 'watch', 'bg1', 'bg2']
+
+    def test_background_share_leaves_spare_workers(self, gate):
+        """Test background dibatasi share-nya sehingga interactive tidak menunggu."""
+        scheduler = FetchScheduler(workers=4, shares={BACKGROUND: 0.5})
+        started = threading.Semaphore(0)
+
+        def background():
+            started.release()
+            gate.wait(5)
+
+        try:
+            for _ in range(4):
+                scheduler.submit(BACKGROUND, background)
+            assert started.acquire(timeout=5) and started.acquire(timeout=5)
+
+            assert scheduler.submit(INTERACTIVE, str.upper, 'bbca').result(5) == 'BBCA'
+            stats = scheduler.stats()
+            assert stats[BACKGROUND] == ClassStats(queued=2, running=2, completed=0)
+        finally:
+            gate.set()
+            scheduler.shutdown()
+
+    def test_promote_queued_task(self, gate):
+        scheduler = FetchScheduler(workers=1)
+        order, started = [], threading.Event()
+        try:
+            scheduler.submit(INTERACTIVE, blocked, gate, None, started)
+            assert started.wait(5)
+            first = scheduler.submit(WATCHLIST, order.append, 'watch')
+            second = scheduler.submit(BACKGROUND, order.append, 'bg')
+
+            assert scheduler.promote(second, INTERACTIVE)
+            assert not scheduler.promote(first, BACKGROUND)  # Tidak diturunkan
+            gate.set()
+            first.result(5)
+            second.result(5)
+        finally:
+            scheduler.shutdown()
+
+        assert order == ['bg', 'watch']
+        assert not scheduler.promote(second, INTERACTIVE)  # Sudah selesai
+
+    def test_shutdown_cancels_queued(self, gate):
+        scheduler = FetchScheduler(workers=1)
+        started = threading.Event()
+        running = scheduler.submit(BACKGROUND, blocked, gate, 'done', started)
+        assert started.wait(5)
+        queued = scheduler.submit(BACKGROUND, str, 'x')
+
+        scheduler.shutdown(wait=False, cancel_futures=True)
+        gate.set()
+
+        assert running.result(5) == 'done'
+        assert queued.cancelled()
+        with pytest.raises(RuntimeError):
+            scheduler.submit(INTERACTIVE, str, 'y')
+
+    def test_invalid_priority(self):
+        scheduler = FetchScheduler(workers=1)
+        try:
+            with pytest.raises(ValueError):
+                scheduler.submit('urgent', str, 'x')
+        finally:
+            scheduler.shutdown()
+        with pytest.raises(ValueError):
+            FetchScheduler(workers=2, shares={BACKGROUND: 0})
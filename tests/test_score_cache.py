@@ -0,0 +1,114 @@
+"""
+Unit tests untuk ScoreCache dan memoization di FundamentalAnalyzer.
+"""
+
+import pytest
+
+from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+from src.analyzers.score_cache import ScoreCache, hash_config
+from src.config.settings import ScoringWeights, ScreeningCriteria
+from src.models.screening_result import Rating
+from src.models.stock_data import (
+    CompanyInfo,
+    LeverageMetrics,
+    ProfitabilityMetrics,
+    StockData,
+    ValuationMetrics,
+)
+
+
+@pytest.fixture
+def stock_data():
+    """Create sample stock data."""
+    return StockData(
+        company_info=CompanyInfo(ticker="BBCA.JK", name="Bank Central Asia Tbk"),
+        valuation=ValuationMetrics(market_cap=5e14, pe_ratio=10.0, price_to_book=1.5),
+        profitability=ProfitabilityMetrics(
+            roe=0.2, gross_margin=0.35, eps_history={2022: 480, 2023: 500}
+        ),
+        leverage=LeverageMetrics(debt_to_equity=0.3, beta=0.9),
+        data_quality_score=90.0,
+    )
+
+
+class TestScoreCache:
+    """Tests untuk ScoreCache."""
+
+    def test_memoizes_unchanged_data(self, stock_data, mocker):
+        """Test data yang sama tidak dianalisis ulang."""
+        cache = ScoreCache()
+        analyzer = FundamentalAnalyzer(cache=cache)
+        spy = mocker.spy(analyzer, '_analyze_valuation')
+
+        first = analyzer.analyze(stock_data)
+        second = analyzer.analyze(stock_data)
+
+        assert spy.call_count == 1
+        assert second.metrics.total_score == first.metrics.total_score
+        assert second is not first
+        assert cache.hits == 1 and cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+    def test_changed_data_misses(self, stock_data):
+        """Test perubahan data menghasilkan key berbeda."""
+        analyzer = FundamentalAnalyzer(cache=ScoreCache())
+        key_before = analyzer.cache_key(stock_data)
+
+        stock_data.valuation.pe_ratio = 20.0
+        assert analyzer.cache_key(stock_data) != key_before
+
+    def test_unread_fields_do_not_change_fingerprint(self, stock_data):
+        """Test field yang tidak dibaca analyzer tidak mempengaruhi fingerprint."""
+        analyzer = FundamentalAnalyzer()
+        before = analyzer.fingerprint(stock_data)
+
+        stock_data.price.day_high = 10_500
+        stock_data.last_updated = stock_data.last_updated.replace(year=2000)
+
+        assert analyzer.fingerprint(stock_data) == before
+
+    def test_config_hash_depends_on_criteria_and_weights(self):
+        """Test hash berubah jika criteria atau weights berubah."""
+        criteria = ScreeningCriteria()
+        base = hash_config(criteria, ScoringWeights())
+
+        criteria.valuation.pe_ratio_max = 20.0
+        assert hash_config(criteria, ScoringWeights()) != base
+        assert hash_config(
+            ScreeningCriteria(), ScoringWeights(0.4, 0.2, 0.2, 0.2)
+        ) != base
+        assert hash_config(ScreeningCriteria(), ScoringWeights()) == base
+
+    def test_disk_persistence(self, stock_data, tmp_path):
+        """Test cache dipakai ulang lintas instance via disk."""
+        FundamentalAnalyzer(cache=ScoreCache(tmp_path)).analyze(stock_data)
+
+        cache = ScoreCache(tmp_path)
+        result = FundamentalAnalyzer(cache=cache).analyze(stock_data)
+
+        assert cache.hits == 1
+        assert isinstance(result.rating, Rating)
+        assert result.ticker == "BBCA.JK"
+
+    def test_corrupt_disk_entry_ignored(self, tmp_path):
+        """Test file cache rusak diabaikan."""
+        (tmp_path / "abc.json").write_text("{not json")
+        cache = ScoreCache(tmp_path)
+
+        assert cache.get("abc") is None
+        assert cache.misses == 1
+
+    def test_max_entries_evicts_least_recently_used(self, stock_data):
+        """Test cache memory dibatasi max_entries (LRU)."""
+        cache = ScoreCache(max_entries=2)
+        result = FundamentalAnalyzer().analyze(stock_data)
+        for key in ("a", "b"):
+            cache.put(key, result)
+
+        assert cache.get("a") is not None  # "b" sekarang paling lama
+        cache.put("c", result)
+
+        assert list(cache.memory) == ["a", "c"]
+        assert cache.get("b") is None
+        with pytest.raises(ValueError):
+            ScoreCache(max_entries=0)
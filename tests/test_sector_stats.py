@@ -0,0 +1,139 @@
+"""
+Unit tests untuk SectorStatistics dan sector-relative scoring.
+"""
+
+import pytest
+
+from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+from src.analyzers.score_cache import ScoreCache
+from src.analyzers.sector_stats import SectorStatistics
+from src.config.settings import ScreeningCriteria
+from src.models.stock_data import (
+    CompanyInfo,
+    ProfitabilityMetrics,
+    StockData,
+    ValuationMetrics,
+)
+
+
+def _stock(ticker, sector, pe, pbv=1.5, roe=0.15, gpm=0.3):
+    """Create StockData minimal untuk statistik sektor."""
+    return StockData(
+        company_info=CompanyInfo(ticker=ticker, name=ticker, sector=sector),
+        valuation=ValuationMetrics(pe_ratio=pe, price_to_book=pbv),
+        profitability=ProfitabilityMetrics(roe=roe, gross_margin=gpm),
+    )
+
+
+@pytest.fixture
+def banks():
+    """Sektor dengan PE tinggi (di atas threshold absolut 15)."""
+    return [_stock(f"BANK{i}", "Banks", pe) for i, pe in enumerate([18, 20, 22, 24, 26, 28])]
+
+
+@pytest.fixture
+def relative_criteria():
+    """Criteria dengan sector-relative scoring aktif."""
+    criteria = ScreeningCriteria()
+    criteria.sector_relative.enabled = True
+    return criteria
+
+
+class TestSectorStatistics:
+    """Tests untuk SectorStatistics."""
+
+    def test_percentile_binary_search(self, banks):
+        """Test percentile dari sorted array."""
+        stats = SectorStatistics.from_universe(banks)
+
+        assert stats.sector_size("Banks", "pe_ratio") == 6
+        assert stats.percentile("Banks", "pe_ratio", 18) == pytest.approx(0.5 / 6)
+        assert stats.percentile("Banks", "pe_ratio", 100) == 1.0
+        assert stats.percentile("Mining", "pe_ratio", 10) is None
+
+    def test_incremental_update_replaces_value(self, banks):
+        """Test refresh emiten memindahkan nilainya tanpa duplikasi."""
+        stats = SectorStatistics.from_universe(banks)
+        version = stats.version("Banks")
+
+        stats.update(_stock("BANK0", "Banks", 30))
+
+        assert stats.sector_size("Banks", "pe_ratio") == 6
+        assert stats.percentile("Banks", "pe_ratio", 29) == pytest.approx(5 / 6)
+        assert stats.version("Banks") > version
+
+    def test_remove_and_invalid_values(self):
+        """Test PE negatif tidak masuk statistik dan remove emiten."""
+        stats = SectorStatistics.from_universe(
+            [_stock("A", "Tech", -5.0), _stock("B", "Tech", 10.0), _stock("C", None, 3.0)]
+        )
+        assert stats.sector_size("Tech", "pe_ratio") == 1
+        assert stats.sectors() == ["Tech"]
+
+        stats.remove("B")
+        assert stats.sector_size("Tech", "pe_ratio") == 0
+        stats.remove("UNKNOWN")
+
+
+class TestSectorRelativeScoring:
+    """Tests untuk sector-relative mode di FundamentalAnalyzer."""
+
+    def test_cheapest_in_sector_scores_preferred(self, banks, relative_criteria):
+        """Test PE termurah di sektor mendapat poin penuh walau di atas 15."""
+        stats = SectorStatistics.from_universe(banks)
+        analyzer = FundamentalAnalyzer(criteria=relative_criteria, sector_stats=stats)
+
+        cheapest = analyzer.analyze(banks[0])
+        priciest = analyzer.analyze(banks[-1])
+        absolute = FundamentalAnalyzer().analyze(banks[0])
+
+        assert cheapest.metrics.valuation_score.details['pe_ratio_sector_percentile'] < 0.33
+        assert (
+            cheapest.metrics.valuation_score.score
+            > absolute.metrics.valuation_score.score
+        )
+        assert (
+            cheapest.metrics.valuation_score.score
+            > priciest.metrics.valuation_score.score
+        )
+        assert any('sektor' in s for s in cheapest.strengths)
+
+    def test_small_sector_falls_back_to_absolute(self, banks, relative_criteria):
+        """Test sektor dengan data sedikit memakai threshold absolut."""
+        stats = SectorStatistics.from_universe(banks[:3])
+        analyzer = FundamentalAnalyzer(criteria=relative_criteria, sector_stats=stats)
+
+        relative = analyzer.analyze(banks[0])
+        absolute = FundamentalAnalyzer().analyze(banks[0])
+
+        assert relative.metrics.total_score == absolute.metrics.total_score
+
+    def test_cache_invalidated_when_sector_changes(self, banks, relative_criteria):
+        """Test cache key berubah jika anggota sektor berubah."""
+        stats = SectorStatistics.from_universe(banks)
+        analyzer = FundamentalAnalyzer(
+            criteria=relative_criteria, sector_stats=stats, cache=ScoreCache()
+        )
+        key = analyzer.cache_key(banks[0])
+
+        stats.update(_stock("BANK9", "Banks", 10))
+        assert analyzer.cache_key(banks[0]) != key
+
+    def test_cache_key_stable_across_processes(self, banks, relative_criteria):
+        """Test cache key mengikuti isi sektor, bukan jumlah update."""
+        first = SectorStatistics.from_universe(banks)
+        same = SectorStatistics.from_universe(list(reversed(banks)))
+        other = SectorStatistics.from_universe(
+            [_stock(s.get_ticker(), "Banks", 40 + i) for i, s in enumerate(banks)]
+        )
+
+        def key(stats):
+            analyzer = FundamentalAnalyzer(
+                criteria=relative_criteria, sector_stats=stats
+            )
+            return analyzer.cache_key(banks[0])
+
+        # Jumlah update sama (version sama) tetapi nilai peer berbeda
+        assert first.version("Banks") == other.version("Banks")
+        assert key(first) == key(same)
+        assert key(first) != key(other)
@@ -0,0 +1,51 @@
+"""
+Unit tests untuk serialisasi model.
+"""
+
+from datetime import datetime
+
+from src.models.screening_result import (
+    CategoryScore,
+    Rating,
+    ScreeningMetrics,
+    ScreeningResult,
+)
+from src.models.serialization import from_dict, to_dict
+from src.models.stock_data import CompanyInfo, ProfitabilityMetrics, StockData
+
+
+class TestSerialization:
+    """Tests untuk to_dict/from_dict."""
+
+    def test_screening_result_roundtrip(self):
+        """Test ScreeningResult bolak-balik tanpa kehilangan data."""
+        result = ScreeningResult(
+            ticker='BBCA.JK',
+            company_name='Bank BCA',
+            rating=Rating.STRONG,
+            metrics=ScreeningMetrics(
+                total_score=72.5,
+                valuation_score=CategoryScore('Valuation', 65.0, weight=0.25),
+            ),
+            screened_at=datetime(2024, 1, 2, 3, 4, 5),
+        )
+        result.add_insight('Risk', 'neutral', 'Beta moderate', 'Beta 1.2')
+
+        data = to_dict(result)
+        assert data['rating'] == 'STRONG'
+        assert data['screened_at'] == '2024-01-02T03:04:05'
+
+        assert from_dict(ScreeningResult, data) == result
+
+    def test_stock_data_int_keys(self):
+        """Test key int (eps_history) dikembalikan dari string JSON."""
+        stock_data = StockData(
+            company_info=CompanyInfo(ticker='BBCA.JK', name='Bank BCA'),
+            profitability=ProfitabilityMetrics(eps_history={2023: 500.0}),
+        )
+        data = to_dict(stock_data)
+        data['profitability']['eps_history'] = {'2023': 500.0}
+
+        restored = from_dict(StockData, data)
+        assert restored.profitability.eps_history == {2023: 500.0}
+        assert restored.last_updated == stock_data.last_updated
@@ -0,0 +1,97 @@
+"""
+Tests untuk startup time CLI (import budget via python -X importtime).
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Dependency berat yang hanya boleh di-import di code path yang memakainya
+DEFERRED_MODULES = (
+    'yfinance',
+    'pandas',
+    'numpy',
+    'requests',
+    'bs4',
+    'curl_cffi',
+    'multiprocessing',
+    # Module project yang hanya dipakai sebagian command
+    'src.cli.context',
+    'src.server.client',
+    'src.services.news_scraper_service',
+    'src.services.news_store',
+    'src.analyzers.fundamental_analyzer',
+)
+
+# Budget cumulative import src.main (microseconds, termasuk overhead
+# -X importtime): ~1.3x dari ~130 ms yang terukur. Sebelum import ditunda
+# angkanya ~550 ms.
+IMPORT_BUDGET_US = 170_000
+
+# Import diukur beberapa kali dan diambil yang tercepat (noise scheduler)
+BUDGET_RUNS = 5
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """
+    Jalankan code di interpreter baru dan parse output -X importtime.
+
+    Returns:
+        Dict nama module -> cumulative import time (microseconds)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:') :].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope='module')
+def cli_import_times():
+    return import_times('import src.main')
+
+
+class TestStartup:
+    """Test suite untuk startup CLI."""
+
+    @pytest.mark.parametrize('module', DEFERRED_MODULES)
+    def test_heavy_dependency_deferred(self, cli_import_times, module):
+        """Test dependency berat tidak di-import saat CLI start."""
+        assert module not in cli_import_times
+
+    def test_import_budget(self, cli_import_times):
+        """Test import src.main masih dalam budget."""
+        fastest = min(
+            [cli_import_times['src.main']]
+            + [
+                import_times('import src.main')['src.main']
+                for _ in range(BUDGET_RUNS - 1)
+            ]
+        )
+        assert fastest < IMPORT_BUDGET_US
+
+    def test_version_command(self):
+        """Test command trivial berjalan tanpa dependency berat."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'src.main', '--version'],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert 'Friday Screener' in result.stdout
@@ -0,0 +1,206 @@
+"""
+Unit tests untuk criteria sweep engine.
+"""
+
+import copy
+import json
+import random
+
+import numpy as np
+import pytest
+
+from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+from src.analyzers.sweep import (
+    SweepVariant,
+    build_grid,
+    load_variants,
+    parse_grid_options,
+    rank_columns,
+    run_sweep,
+)
+from src.config.settings import ScoringWeights, ScreeningCriteria
+from src.models.stock_data import (
+    CashFlowMetrics,
+    CompanyInfo,
+    DividendMetrics,
+    LeverageMetrics,
+    ProfitabilityMetrics,
+    StockData,
+    ValuationMetrics,
+)
+
+
+def _maybe(rng, value):
+    """Return None kadang-kadang untuk mensimulasikan data tidak lengkap."""
+    return None if rng.random() < 0.15 else value
+
+
+@pytest.fixture
+def universe():
+    """Create universe sintetis dengan variasi metrik dan data kosong."""
+    rng = random.Random(42)
+    stocks = []
+    for i in range(60):
+        eps_history = {
+            2019 + y: rng.uniform(50, 500) for y in range(rng.choice([0, 2, 5]))
+        }
+        stocks.append(
+            StockData(
+                company_info=CompanyInfo(ticker=f"T{i:03d}.JK", name=f"Company {i}"),
+                valuation=ValuationMetrics(
+                    market_cap=_maybe(rng, rng.uniform(1e11, 5e14)),
+                    pe_ratio=_maybe(rng, rng.uniform(-5, 40)),
+                    price_to_book=_maybe(rng, rng.uniform(0.3, 5)),
+                ),
+                profitability=ProfitabilityMetrics(
+                    roe=_maybe(rng, rng.uniform(-0.1, 0.4)),
+                    gross_margin=_maybe(rng, rng.uniform(0.05, 0.6)),
+                    eps_history=eps_history,
+                ),
+                cash_flow=CashFlowMetrics(
+                    operating_cash_flow=_maybe(rng, rng.uniform(-1e11, 1e12)),
+                    free_cash_flow=_maybe(rng, rng.uniform(-1e11, 1e12)),
+                ),
+                leverage=LeverageMetrics(
+                    debt_to_equity=_maybe(rng, rng.uniform(0, 3)),
+                    beta=_maybe(rng, rng.uniform(0.3, 2.5)),
+                ),
+                dividend=DividendMetrics(
+                    dividend_yield=_maybe(rng, rng.choice([0.0, rng.uniform(0.001, 0.08)]))
+                ),
+            )
+        )
+    return stocks
+
+
+class TestSweep:
+    """Tests untuk run_sweep."""
+
+    def test_matches_analyzer(self, universe):
+        """Test hasil vectorized identik dengan FundamentalAnalyzer.analyze."""
+        grid = {
+            'valuation.pe_ratio_max': ['10', '20'],
+            'profitability.roe_min': ['5', '12'],
+            'dividend.require_dividend': ['true', 'false'],
+            'risk.beta_max': ['1.2', '2.0'],
+        }
+        variants, skipped = build_grid(grid)
+        variants.append(
+            SweepVariant('weights', ScreeningCriteria(), ScoringWeights(0.4, 0.3, 0.2, 0.1))
+        )
+        assert skipped == 0
+
+        result = run_sweep(universe, variants)
+
+        for v, variant in enumerate(variants):
+            analyzer = FundamentalAnalyzer(variant.criteria, variant.weights)
+            for n, stock in enumerate(universe):
+                expected = analyzer.analyze(stock)
+                scores = [s.score for s in expected.metrics.get_all_category_scores()]
+                np.testing.assert_allclose(result.category_scores[v, :, n], scores)
+                assert result.totals[v, n] == pytest.approx(
+                    expected.metrics.total_score, abs=0.01
+                )
+
+    def test_baseline_ranking_matches_batch_analyze(self, universe):
+        """Test ranking baseline sama dengan batch_analyze."""
+        result = run_sweep(universe, [SweepVariant('baseline')])
+        expected = [r.ticker for r in FundamentalAnalyzer().batch_analyze(universe)]
+
+        assert result.top(0, len(universe)) == expected
+
+    def test_rank_stability(self, universe):
+        """Test baseline stabil sempurna terhadap dirinya sendiri."""
+        variants, _ = build_grid({'valuation.pe_ratio_max': ['30']})
+        result = run_sweep(universe, variants)
+        stability = result.rank_stability(top_n=10)
+
+        assert stability[0]['spearman'] == pytest.approx(1.0)
+        assert stability[0]['top_overlap'] == 1.0
+        assert -1.0 <= stability[1]['spearman'] <= 1.0
+
+        per_ticker = result.ticker_stability(top_n=10)
+        assert len(per_ticker) == len(universe)
+        assert per_ticker[0]['mean_rank'] <= per_ticker[-1]['mean_rank']
+
+    def test_requires_variant(self, universe):
+        """Test sweep tanpa variant."""
+        with pytest.raises(ValueError):
+            run_sweep(universe, [])
+
+
+class TestGrid:
+    """Tests untuk grid dan variant loading."""
+
+    def test_build_grid_cartesian(self):
+        """Test cartesian product plus baseline."""
+        variants, skipped = build_grid(
+            {'valuation.pe_ratio_max': ['10', '15'], 'risk.debt_to_equity_max': ['1', '2']}
+        )
+        assert len(variants) == 5
+        assert skipped == 0
+        assert variants[0].name == 'baseline'
+        assert variants[-1].criteria.risk.debt_to_equity_max == 2.0
+
+    def test_build_grid_does_not_mutate_base(self):
+        """Test base criteria tidak berubah."""
+        base = ScreeningCriteria()
+        before = copy.deepcopy(base)
+        build_grid({'valuation.pe_ratio_max': ['99']}, base_criteria=base)
+        assert base == before
+
+    def test_build_grid_skips_invalid_weights(self):
+        """Test kombinasi weights yang tidak berjumlah 1 dilewati."""
+        variants, skipped = build_grid(
+            {
+                'weights.valuation_weight': ['0.25', '0.35'],
+                'weights.profitability_weight': ['0.25', '0.35'],
+            }
+        )
+        # Hanya 0.35/0.25 dan 0.25/0.35 yang berjumlah 1.0 dengan risk+dividend 0.4
+        assert skipped == 2
+        assert len(variants) == 3
+
+    def test_build_grid_unknown_parameter(self):
+        """Test parameter tidak dikenal."""
+        with pytest.raises(ValueError):
+            build_grid({'valuation.unknown': ['1']})
+        with pytest.raises(ValueError):
+            build_grid({'foo.bar': ['1']})
+
+    def test_parse_grid_options(self):
+        """Test parsing opsi CLI."""
+        assert parse_grid_options(['valuation.pe_ratio_max=10, 15']) == {
+            'valuation.pe_ratio_max': ['10', '15']
+        }
+        with pytest.raises(ValueError):
+            parse_grid_options(['valuation.pe_ratio_max'])
+
+    def test_load_variants(self, tmp_path):
+        """Test load variants dari JSON."""
+        path = tmp_path / "variants.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {
+                        'name': 'value-tilt',
+                        'criteria': {'valuation': {'pe_ratio_max': 10}},
+                        'weights': {'valuation_weight': 0.45, 'profitability_weight': 0.15},
+                    }
+                ]
+            )
+        )
+        variants = load_variants(str(path))
+
+        assert [v.name for v in variants] == ['baseline', 'value-tilt']
+        assert variants[1].criteria.valuation.pe_ratio_max == 10
+        assert variants[1].weights.valuation_weight == 0.45
+
+
+class TestRankColumns:
+    """Tests untuk rank_columns."""
+
+    def test_ties_keep_universe_order(self):
+        """Test tie dipecah sesuai urutan."""
+        ranks = rank_columns(np.array([[50.0, 70.0, 50.0]]))
+        assert ranks.tolist() == [[2, 1, 3]]
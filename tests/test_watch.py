@@ -0,0 +1,186 @@
+"""
+Tests untuk watch mode (src.cli.watch).
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.analyzers.fundamental_analyzer import FundamentalAnalyzer
+from src.cli.watch import Watcher, diff_results
+from src.models.screening_result import Rating, ScreeningMetrics, ScreeningResult
+from src.models.stock_data import CorporateAction, PriceMetrics
+from src.services.yahoo_finance_service import YahooFinanceService
+from tests.conftest import make_stock_data
+
+
+class FakeClock:
+    """Clock yang dimajukan manual oleh test."""
+
+    def __init__(self):
+        self.now = datetime(2024, 3, 1, 9, 0)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def finance_service():
+    """YahooFinanceService dengan fetch fundamental dan harga di-mock."""
+    service = YahooFinanceService()
+
+    def fetch(ticker, use_cache=True):
+        return make_stock_data(
+            ticker,
+            price_to_book=1.0,
+            roe=0.2,
+            gross_margin=0.4,
+            current_price=1000.0,
+        )
+
+    with patch.object(service, 'get_stock_data', side_effect=fetch), patch.object(
+        service, 'get_price', return_value=PriceMetrics(current_price=1000.0)
+    ):
+        yield service
+
+
+@pytest.fixture
+def watcher(finance_service, clock):
+    return Watcher(
+        ['BBCA', 'BMRI'],
+        finance_service,
+        FundamentalAnalyzer(),
+        fundamentals_interval=timedelta(hours=6),
+        clock=clock,
+    )
+
+
+class TestWatcher:
+    """Test suite untuk Watcher."""
+
+    def test_first_tick_reports_snapshot(self, watcher, finance_service):
+        changes = watcher.tick()
+
+        assert [(c.ticker, c.kind) for c in changes] == [
+            ('BBCA.JK', 'new'),
+            ('BMRI.JK', 'new'),
+        ]
+        finance_service.get_stock_data.assert_any_call('BBCA.JK', use_cache=False)
+
+    def test_unchanged_price_skips_analysis(self, watcher, finance_service, clock):
+        """Test tick dengan harga sama: hanya fetch harga, tanpa analisis."""
+        watcher.tick()
+        clock.advance(minutes=5)
+
+        assert watcher.tick() == []
+        assert watcher.analyzed == 2
+        assert finance_service.get_stock_data.call_count == 2
+        assert finance_service.get_price.call_count == 2
+
+    def test_price_move_reports_score_change(self, watcher, finance_service, clock):
+        """Test harga naik 4x (PE 8 -> 32) dilaporkan sebagai perubahan."""
+        watcher.tick()
+        before = watcher.result('BBCA').metrics.total_score
+        finance_service.get_price.return_value = PriceMetrics(current_price=4000.0)
+        clock.advance(minutes=5)
+
+        changes = watcher.tick()
+
+        kinds = {c.kind for c in changes if c.ticker == 'BBCA.JK'}
+        assert 'score' in kinds
+        assert watcher.result('BBCA').metrics.total_score < before
+        assert watcher.analyzed == 4
+
+    def test_fundamentals_refreshed_on_slow_cadence(
+        self, watcher, finance_service, clock
+    ):
+        watcher.tick()
+        clock.advance(hours=5)
+        watcher.tick()
+        assert finance_service.get_stock_data.call_count == 2
+
+        clock.advance(hours=1)
+        watcher.tick()
+        assert finance_service.get_stock_data.call_count == 4
+
+    def test_failure_reported_once(self, finance_service, clock):
+        finance_service.get_stock_data.side_effect = lambda t, use_cache=True: None
+        watcher = Watcher(['XXXX'], finance_service, FundamentalAnalyzer(), clock=clock)
+
+        assert [c.kind for c in watcher.tick()] == ['failed']
+        assert watcher.tick() == []
+
+    def test_new_corporate_action(self, finance_service, clock):
+        """Test corporate action baru dari berita dan cadence refresh berita."""
+        news_service = MagicMock()
+        news_service.get_news.return_value = []
+        news_service.get_corporate_actions.return_value = []
+        news_service.get_sentiment_trend.return_value = []
+        watcher = Watcher(
+            ['BBCA'],
+            finance_service,
+            FundamentalAnalyzer(),
+            news_service=news_service,
+            news_interval=timedelta(minutes=30),
+            clock=clock,
+        )
+        watcher.tick()
+
+        news_service.get_corporate_actions.return_value = [
+            CorporateAction(
+                ticker='BBCA.JK', action_type='dividend', title='BBCA bagikan dividen'
+            )
+        ]
+        clock.advance(minutes=5)
+        assert watcher.tick() == []  # Berita belum di-refresh
+
+        clock.advance(minutes=30)
+        changes = watcher.tick()
+
+        assert news_service.get_news.call_count == 2
+        # Corporate actions dari berita yang sudah di-fetch (tanpa query ulang)
+        news_service.get_corporate_actions.assert_called_with('BBCA.JK', [])
+        assert ('corporate_action', 'New corporate action: BBCA bagikan dividen') in [
+            (c.kind, c.message) for c in changes
+        ]
+
+
+class TestDiffResults:
+    """Test suite untuk diff_results."""
+
+    @staticmethod
+    def make_result(score, rating, red_flags=()):
+        return ScreeningResult(
+            ticker='BBCA.JK',
+            company_name='BBCA',
+            rating=rating,
+            metrics=ScreeningMetrics(total_score=score),
+            red_flags=list(red_flags),
+        )
+
+    def test_rating_and_red_flag(self):
+        old = self.make_result(72.0, Rating.STRONG, ['PE tinggi'])
+        new = self.make_result(58.0, Rating.FAIR, ['PE tinggi', 'ROE turun'])
+
+        changes = diff_results('BBCA.JK', old, new)
+
+        assert [(c.kind, c.message) for c in changes] == [
+            ('rating', 'Rating STRONG -> FAIR'),
+            ('score', 'Score 72.0 -> 58.0 (-14.0)'),
+            ('red_flag', 'New red flag: ROE turun'),
+        ]
+
+    def test_small_score_move_ignored(self):
+        old = self.make_result(72.0, Rating.STRONG)
+        new = self.make_result(73.5, Rating.STRONG)
+
+        assert diff_results('BBCA.JK', old, new, score_threshold=2.0) == []
@@ -121,6 +121,63 @@ class TestYahooFinanceService:
             # Same object from cache
             assert result1 is result2
 
+    def test_get_quote_reused_by_get_stock_data(self, service, mock_ticker):
+        """Test quote murah dan info-nya dipakai ulang oleh get_stock_data."""
+        with patch('yfinance.Ticker', return_value=mock_ticker):
+            quote = service.get_quote('BBCA')
+
+            assert quote['market_cap'] == 1234567890000
+            assert quote['dividend_yield'] == 0.025
+            assert quote['debt_to_equity'] == 45.5
+
+            type(mock_ticker).info = property(
+                lambda self: pytest.fail('info fetched twice')
+            )
+            result = service.get_stock_data('BBCA')
+            assert result.valuation.market_cap == 1234567890000
+
+    def test_get_quote_from_cached_stock_data(self, service, mock_ticker):
+        """Test quote diambil dari cache StockData tanpa network call."""
+        with patch('yfinance.Ticker', return_value=mock_ticker) as mock_yf:
+            service.get_stock_data('BBCA')
+            quote = service.get_quote('BBCA')
+
+            assert mock_yf.call_count == 1
+            assert quote['current_price'] == 10000
+
+    def test_get_quote_failure(self, service):
+        """Test get_quote ketika fetch gagal."""
+        with patch('yfinance.Ticker', side_effect=Exception('API Error')):
+            assert service.get_quote('BBCA') is None
+
+    def test_refresh_price(self, service, mock_ticker):
+        """Test refresh harga menyesuaikan rasio valuasi tanpa fetch info."""
+        mock_ticker.fast_info.last_price = 12500
+        mock_ticker.fast_info.previous_close = 12000
+        mock_ticker.fast_info.last_volume = 1000
+        with patch('yfinance.Ticker', return_value=mock_ticker):
+            stock_data = service.get_stock_data('BBCA')
+            type(mock_ticker).info = property(
+                lambda self: pytest.fail('info fetched on price refresh')
+            )
+            refreshed = service.refresh_price(stock_data)
+
+        assert refreshed.price.current_price == 12500
+        assert refreshed.price.volume == 1000
+        assert refreshed.valuation.pe_ratio == pytest.approx(12.5 * 1.25)
+        assert refreshed.valuation.price_to_book == pytest.approx(3.2 * 1.25)
+        assert refreshed.dividend.dividend_yield == pytest.approx(0.025 / 1.25)
+        assert refreshed.profitability.roe == 0.18
+        # StockData asli tidak berubah, cache berisi versi terbaru
+        assert stock_data.valuation.pe_ratio == 12.5
+        assert service.cache['BBCA.JK'] is refreshed
+
+    def test_refresh_price_failure(self, service, mock_ticker):
+        mock_ticker.fast_info.last_price = None
+        with patch('yfinance.Ticker', return_value=mock_ticker):
+            stock_data = service.get_stock_data('BBCA')
+            assert service.refresh_price(stock_data) is None
+
     def test_cache_bypass(self, service, mock_ticker):
         """Test that cache can be bypassed."""
         with patch('yfinance.Ticker', return_value=mock_ticker) as mock_yf: